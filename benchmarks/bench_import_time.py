@@ -0,0 +1,118 @@
+"""Benchmark for the import time and memory of each `mirascope` entry point.
+
+Run with `python benchmarks/bench_import_time.py`. Each entry point is imported in a
+fresh interpreter, and the median time it takes to import and the maximum resident set
+size of the interpreter are reported. Providers whose SDK isn't installed are skipped.
+Pass `--importtime <entry point>` to print the slowest modules it imports according to
+`python -X importtime`.
+
+Pass `--max-ms` and/or `--max-rss-mb` to exit with an error if importing
+`mirascope.core` exceeds them, e.g. to catch a provider SDK that's imported eagerly
+again.
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+REPEAT = 5
+
+ENTRY_POINTS = {
+    "mirascope": "import mirascope",
+    "mirascope.core": "import mirascope.core",
+    **{
+        f"core.{provider}": f"from mirascope.core import {provider}"
+        for provider in [
+            "anthropic",
+            "azure",
+            "bedrock",
+            "cohere",
+            "gemini",
+            "groq",
+            "litellm",
+            "mistral",
+            "openai",
+            "vertex",
+        ]
+    },
+    "integrations": "import mirascope.integrations",
+}
+
+_IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)")
+_SCRIPT = """
+import resource, time
+start = time.perf_counter()
+{statement}
+print((time.perf_counter() - start) * 1000)
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def _measure(statement: str) -> tuple[float, float]:
+    """Returns the import time (in ms) and the max RSS (in MB) of `statement`."""
+    result = subprocess.run(
+        [sys.executable, "-c", _SCRIPT.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_time, max_rss = result.stdout.split()
+    # `ru_maxrss` is in kilobytes on Linux and in bytes on macOS.
+    return float(import_time), int(max_rss) / (
+        2**20 if sys.platform == "darwin" else 2**10
+    )
+
+
+def _print_importtime(statement: str, top: int = 20) -> None:
+    """Prints the modules imported by `statement` that took the longest to import."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = [
+        (int(match.group(1)), match.group(2))
+        for line in result.stderr.splitlines()
+        if (match := _IMPORT_TIME.match(line))
+    ]
+    print(f"{'module':<60}{'self (ms)':>12}")
+    for self_time, module in sorted(times, reverse=True)[:top]:
+        print(f"{module:<60}{self_time / 1000:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-ms", type=float, default=None)
+    parser.add_argument("--max-rss-mb", type=float, default=None)
+    parser.add_argument("--importtime", choices=ENTRY_POINTS, default=None)
+    args = parser.parse_args()
+    if args.importtime:
+        _print_importtime(ENTRY_POINTS[args.importtime])
+        return
+
+    print(f"{'entry point':<20}{'import (ms)':>14}{'max rss (MB)':>14}")
+    results = {}
+    for name, statement in ENTRY_POINTS.items():
+        try:
+            measurements = [_measure(statement) for _ in range(REPEAT)]
+        except subprocess.CalledProcessError as e:
+            error = e.stderr.strip().splitlines()[-1]
+            print(f"{name:<20}skipped ({error})")
+            continue
+        import_time = statistics.median(time for time, _ in measurements)
+        rss = max(rss for _, rss in measurements)
+        results[name] = (import_time, rss)
+        print(f"{name:<20}{import_time:>14.1f}{rss:>14.1f}")
+
+    import_time, rss = results["mirascope.core"]
+    if args.max_ms is not None and import_time > args.max_ms:
+        sys.exit(f"`import mirascope.core` took {import_time:.1f}ms > {args.max_ms}ms")
+    if args.max_rss_mb is not None and rss > args.max_rss_mb:
+        sys.exit(f"`import mirascope.core` used {rss:.1f}MB > {args.max_rss_mb}MB")
+
+
+if __name__ == "__main__":
+    main()
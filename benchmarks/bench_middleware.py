@@ -0,0 +1,69 @@
+"""Benchmark for wrapping streams with stacked middlewares.
+
+Run with `python benchmarks/bench_middleware.py`. Makes many streamed calls through
+three stacked `middleware_factory` middlewares, iterating over a single chunk each, and
+reports the time per call along with the number of distinct classes the streams ended up
+with (which used to be a new class per middleware per call).
+"""
+
+import time
+
+from openai.types.chat import ChatCompletionChunk
+
+from mirascope.core.openai import OpenAICallParams, OpenAICallResponse
+from mirascope.core.openai.call_response_chunk import OpenAICallResponseChunk
+from mirascope.core.openai.stream import OpenAIStream
+from mirascope.integrations import middleware_factory
+
+NUM_CALLS = 20_000
+CHUNK = OpenAICallResponseChunk(
+    chunk=ChatCompletionChunk.model_validate(
+        {
+            "id": "id",
+            "choices": [{"index": 0, "delta": {"content": "content"}}],
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "object": "chat.completion.chunk",
+        }
+    )
+)
+
+
+def _stream() -> OpenAIStream:
+    return OpenAIStream(
+        stream=(chunk for chunk in [(CHUNK, None)]),
+        metadata={},
+        tool_types=None,
+        call_response_type=OpenAICallResponse,
+        model="gpt-4o-mini",
+        prompt_template=None,
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params=OpenAICallParams(),
+        call_kwargs={},
+    )
+
+
+def _handle_stream(result: OpenAIStream, fn: object, context: object) -> None: ...
+
+
+def main() -> None:
+    fn = _stream
+    for _ in range(3):
+        fn = middleware_factory(handle_stream=_handle_stream)(fn)
+
+    classes = set()
+    start = time.perf_counter()
+    for _ in range(NUM_CALLS):
+        stream = fn()
+        classes.add(type(stream))
+        for _ in stream:
+            ...
+    elapsed = time.perf_counter() - start
+    print(f"{'calls':<14}{'us / call':>12}{'stream classes':>16}")
+    print(f"{NUM_CALLS:<14}{elapsed / NUM_CALLS * 1e6:>12.1f}{len(classes):>16}")
+
+
+if __name__ == "__main__":
+    main()
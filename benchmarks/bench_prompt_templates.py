@@ -0,0 +1,89 @@
+"""Micro-benchmark for rendering prompt templates into messages.
+
+Run with `python benchmarks/bench_prompt_templates.py`. Each template is rendered with
+`parse_prompt_messages` as it would be on every call. The "cold" column clears the
+compiled template caches before every render to approximate the previous behavior of
+re-parsing the template on every call.
+"""
+
+import timeit
+
+from mirascope.core.base._utils import (
+    _format_template,
+    _parse_content_template,
+    parse_prompt_messages,
+)
+from mirascope.core.base._utils import _parse_prompt_messages as parse_module
+
+NUMBER = 2000
+ROLES = ["system", "user", "assistant"]
+
+SIMPLE = "Recommend a {genre} book."
+
+LISTS = """
+SYSTEM: You are a librarian. Here are the books in stock:
+{books:list}
+
+Grouped by shelf:
+{shelves:lists}
+USER: Recommend a {genre} book that is not one of {previous:list}
+"""
+
+MANY_ROLES = (
+    "\n".join(
+        f"""
+    USER: Recommend a {{genre}} book (turn {i}). Previous picks: {{previous:list}}
+    ASSISTANT: I recommend {{self.title}} by {{author}}.
+    """
+        for i in range(20)
+    )
+    + "\nMESSAGES: {history}\nUSER: {question}"
+)
+
+
+class _Self:
+    title = "The Name of the Wind"
+
+
+ATTRS = {
+    "self": _Self(),
+    "genre": "fantasy",
+    "author": "Patrick Rothfuss",
+    "books": [f"Book {i}" for i in range(50)],
+    "shelves": [[f"Book {i}-{j}" for j in range(10)] for i in range(5)],
+    "previous": ["Dune", "Mistborn", "The Hobbit"],
+    "history": [],
+    "question": "Anything else?",
+}
+
+
+def _clear_caches() -> None:
+    parse_module._compile_role_segments.cache_clear()
+    _parse_content_template._compile_parts.cache_clear()
+    _format_template.compile_format_template.cache_clear()
+
+
+def _bench(template: str, cold: bool) -> float:
+    def run() -> None:
+        if cold:
+            _clear_caches()
+        parse_prompt_messages(ROLES, template, dict(ATTRS))
+
+    run()  # warm up caches
+    return min(timeit.repeat(run, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main() -> None:
+    templates: dict[str, str] = {
+        "simple": SIMPLE,
+        "lists": LISTS,
+        "many roles": MANY_ROLES,
+    }
+    print(f"{'template':<12}{'cold (us)':>12}{'warm (us)':>12}{'speedup':>10}")
+    for name, template in templates.items():
+        cold, warm = _bench(template, cold=True), _bench(template, cold=False)
+        print(f"{name:<12}{cold:>12.1f}{warm:>12.1f}{cold / warm:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Micro-benchmark for the per-call overhead of each provider's `setup_call`.
+
+Run with `python benchmarks/bench_setup_call.py`. No network requests are made; each
+provider's `setup_call` is given a pre-constructed client so that only the client-side
+setup work (template rendering, tool conversion, message conversion) is measured.
+
+The "cold" column clears the tool type and tool schema caches before every call to
+approximate the previous behavior of re-converting every tool on every call.
+"""
+
+import importlib
+import os
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import Field
+
+from mirascope.core import BaseTool, prompt_template
+from mirascope.core.base._utils import (
+    _convert_base_model_to_base_tool,
+    _convert_function_to_base_tool,
+)
+from mirascope.core.base._utils import _setup_call as base_setup_call
+
+NUMBER = 200
+
+
+def format_book(title: str, author: str, year: int = 2024) -> str:
+    """Returns the title and author nicely formatted.
+
+    Args:
+        title: The title of the book.
+        author: The author of the book.
+        year: The year the book was published.
+    """
+    return f"{title} by {author} ({year})"
+
+
+class GetWeather(BaseTool):
+    """Returns the weather for a location."""
+
+    location: str = Field(..., description="The location.")
+    unit: str = Field("celsius", description="The unit of temperature.")
+
+    def call(self) -> str:
+        return f"It's sunny in {self.location}"
+
+
+@prompt_template(
+    """
+    SYSTEM: You are a librarian with a specialty in {genre}.
+    USER: Recommend {count} {genre} books. Previous picks: {previous:list}
+    """
+)
+def recommend(genre: str, count: int, previous: list[str]) -> None: ...
+
+
+FN_ARGS = {"genre": "fantasy", "count": 3, "previous": ["Dune", "Mistborn"]}
+TOOLS: list[type[BaseTool] | Callable] = [format_book, GetWeather]
+
+
+def _clients() -> dict[str, Callable[[], Any]]:
+    os.environ.setdefault("GOOGLE_API_KEY", "NOT_USED")
+    return {
+        "anthropic": lambda: importlib.import_module("anthropic").Anthropic(
+            api_key="NOT_USED"
+        ),
+        "azure": lambda: importlib.import_module(
+            "azure.ai.inference"
+        ).ChatCompletionsClient(
+            endpoint="https://example.com",
+            credential=importlib.import_module(
+                "azure.core.credentials"
+            ).AzureKeyCredential("NOT_USED"),
+        ),
+        "bedrock": lambda: importlib.import_module("boto3").client(
+            "bedrock-runtime",
+            region_name="us-east-1",
+            aws_access_key_id="NOT_USED",
+            aws_secret_access_key="NOT_USED",
+        ),
+        "cohere": lambda: importlib.import_module("cohere").Client(api_key="NOT_USED"),
+        "gemini": lambda: importlib.import_module(
+            "google.generativeai"
+        ).GenerativeModel(model_name="gemini-1.5-flash"),
+        "groq": lambda: importlib.import_module("groq").Groq(api_key="NOT_USED"),
+        "litellm": lambda: None,
+        "mistral": lambda: importlib.import_module("mistralai.client").MistralClient(
+            api_key="NOT_USED"
+        ),
+        "openai": lambda: importlib.import_module("openai").OpenAI(api_key="NOT_USED"),
+        "vertex": lambda: importlib.import_module(
+            "vertexai.generative_models"
+        ).GenerativeModel(model_name="gemini-1.5-flash"),
+    }
+
+
+def _clear_caches() -> None:
+    base_setup_call._tool_schemas.clear()
+    for tool in TOOLS:
+        _convert_base_model_to_base_tool._tool_types.clear(tool)
+        _convert_function_to_base_tool._tool_types.clear(tool)
+
+
+def _bench(setup_call: Callable, client: Any, cold: bool) -> float:  # noqa: ANN401
+    call_params = (
+        {"max_tokens": 1000}
+        if client.__class__.__module__.startswith("anthropic")
+        else {}
+    )
+
+    def run() -> None:
+        if cold:
+            _clear_caches()
+        setup_call(
+            model="model",
+            client=client,
+            fn=recommend,
+            fn_args=dict(FN_ARGS),
+            dynamic_config=None,
+            tools=TOOLS,
+            json_mode=False,
+            call_params=call_params,
+            extract=False,
+        )
+
+    run()  # warm up imports and caches
+    return min(timeit.repeat(run, number=NUMBER, repeat=5)) / NUMBER * 1e6
+
+
+def main() -> None:
+    print(f"{'provider':<12}{'cold (us)':>12}{'warm (us)':>12}{'speedup':>10}")
+    for provider, get_client in _clients().items():
+        try:
+            module = importlib.import_module(f"mirascope.core.{provider}._utils")
+            client = get_client()
+        except Exception as e:  # noqa: BLE001
+            print(f"{provider:<12}skipped ({type(e).__name__}: {e})")
+            continue
+        cold = _bench(module.setup_call, client, cold=True)
+        warm = _bench(module.setup_call, client, cold=False)
+        print(f"{provider:<12}{cold:>12.1f}{warm:>12.1f}{cold / warm:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""Benchmark for accumulating a stream of many small chunks.
+
+Run with `python benchmarks/bench_stream.py`. Streams 100k small chunks of content
+through `OpenAIStream` and 100k small deltas of a single tool call's arguments through
+the OpenAI `handle_stream`. The "previous" column re-materializes the accumulated
+string after every chunk as the stream internals used to with `+=`. For the arguments,
+it only times the `+=` on the tool call's `Function` that `_handle_chunk` used to do,
+without the rest of the stream handling.
+"""
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+from openai.types.chat import ChatCompletionChunk
+from openai.types.chat.chat_completion_message_tool_call import Function
+
+from mirascope.core.openai import OpenAICallParams, OpenAICallResponse, OpenAITool
+from mirascope.core.openai._utils import handle_stream
+from mirascope.core.openai.call_response_chunk import OpenAICallResponseChunk
+from mirascope.core.openai.stream import OpenAIStream
+
+NUM_CHUNKS = 100_000
+DELTA = "abcd"
+
+
+class FormatBook(OpenAITool):
+    title: str
+
+    def call(self) -> str:
+        return self.title
+
+
+def _content_chunk(content: str) -> ChatCompletionChunk:
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "id",
+            "choices": [{"index": 0, "delta": {"content": content}}],
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "object": "chat.completion.chunk",
+        }
+    )
+
+
+def _tool_chunk(arguments: str, id: str | None = None) -> ChatCompletionChunk:
+    function = {"arguments": arguments, "name": "FormatBook" if id else None}
+    return ChatCompletionChunk.model_validate(
+        {
+            "id": "id",
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": {
+                        "tool_calls": [{"index": 0, "id": id, "function": function}]
+                    },
+                }
+            ],
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "object": "chat.completion.chunk",
+        }
+    )
+
+
+class _PreviousOpenAIStream(OpenAIStream):
+    def _update_properties(self, chunk: OpenAICallResponseChunk) -> None:
+        super()._update_properties(chunk)
+        self.content = self.content
+
+
+def _previous_content(chunks: list[OpenAICallResponseChunk]) -> int:
+    return _stream_content(chunks, _PreviousOpenAIStream)
+
+
+def _stream_content(
+    chunks: list[OpenAICallResponseChunk], stream_type: type = OpenAIStream
+) -> int:
+    stream = stream_type(
+        stream=((chunk, None) for chunk in chunks),
+        metadata={},
+        tool_types=None,
+        call_response_type=OpenAICallResponse,
+        model="gpt-4o-mini",
+        prompt_template=None,
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params=OpenAICallParams(),
+        call_kwargs={},  # pyright: ignore [reportArgumentType]
+    )
+    for _ in stream:
+        pass
+    return len(stream.content)
+
+
+def _previous_arguments(chunks: list[ChatCompletionChunk]) -> int:
+    function = Function(arguments="", name="FormatBook")
+    for chunk in chunks:
+        if tool_calls := chunk.choices[0].delta.tool_calls:
+            function.arguments += tool_calls[0].function.arguments  # pyright: ignore [reportOptionalMemberAccess, reportOperatorIssue]
+    return len(function.arguments)
+
+
+def _stream_arguments(chunks: list[ChatCompletionChunk]) -> int:
+    tools = [tool for _, tool in handle_stream(iter(chunks), [FormatBook]) if tool]
+    return len(tools[0].title)  # pyright: ignore [reportAttributeAccessIssue]
+
+
+def _time(fn: Callable[[Any], int], chunks: list) -> float:
+    start = time.perf_counter()
+    fn(chunks)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    content_chunks = [
+        OpenAICallResponseChunk(chunk=_content_chunk(DELTA)) for _ in range(NUM_CHUNKS)
+    ]
+    tool_chunks = [
+        _tool_chunk('{"title": "', id="call_id"),
+        *(_tool_chunk(DELTA) for _ in range(NUM_CHUNKS)),
+        _tool_chunk('"}'),
+        _content_chunk(""),
+    ]
+    assert _stream_content(content_chunks) == _previous_content(content_chunks)
+    assert _stream_arguments(tool_chunks) == len(DELTA) * NUM_CHUNKS
+    assert _previous_arguments(tool_chunks) == len(DELTA) * NUM_CHUNKS + 13
+
+    print(f"{'benchmark':>12}{'previous (s)':>15}{'current (s)':>14}{'speedup':>10}")
+    for name, previous, current, chunks in [
+        ("content", _previous_content, _stream_content, content_chunks),
+        ("arguments", _previous_arguments, _stream_arguments, tool_chunks),
+    ]:
+        previous_time, current_time = _time(previous, chunks), _time(current, chunks)
+        print(
+            f"{name:>12}{previous_time:>15.2f}{current_time:>14.2f}"
+            f"{previous_time / current_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
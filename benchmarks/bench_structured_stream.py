@@ -0,0 +1,85 @@
+"""Benchmark for streaming a large structured output with `BaseStructuredStream`.
+
+Run with `python benchmarks/bench_structured_stream.py`. A JSON array of records is
+streamed a few characters ("tokens") at a time, yielding a partial model per chunk. The
+"previous" column re-parses and re-validates the accumulated output on every chunk as
+`BaseStructuredStream` used to, and is only run for the smaller sizes since it grows
+quadratically with the length of the output.
+"""
+
+import json
+import time
+from collections.abc import Callable, Iterator
+
+from pydantic import BaseModel
+
+from mirascope.core.base._utils import (
+    IncrementalToolReturnExtractor,
+    extract_tool_return,
+)
+
+CHARS_PER_TOKEN = 4
+SIZES = [1_000, 5_000, 50_000]
+MAX_PREVIOUS_SIZE = 5_000
+
+
+class Record(BaseModel):
+    title: str = ""
+    author: str = ""
+    year: int = 0
+
+
+class Catalog(BaseModel):
+    records: list[Record]
+
+
+def _tokens(num_tokens: int) -> Iterator[str]:
+    records, text = [], ""
+    while len(text) < num_tokens * CHARS_PER_TOKEN:
+        i = len(records)
+        records.append({"title": f"Book {i}", "author": f"Author {i}", "year": i})
+        text = json.dumps({"records": records})
+    for i in range(0, len(text), CHARS_PER_TOKEN):
+        yield text[i : i + CHARS_PER_TOKEN]
+
+
+def _previous(tokens: list[str]) -> Catalog:
+    json_output = ""
+    for token in tokens:
+        json_output += token
+        extract_tool_return(Catalog, json_output, True, {})
+    return extract_tool_return(Catalog, json_output, False, {})
+
+
+def _incremental(tokens: list[str]) -> Catalog:
+    extractor = IncrementalToolReturnExtractor(Catalog, {})
+    for token in tokens:
+        extractor.feed(token)
+        extractor.partial()
+    return extractor.complete()
+
+
+def _time(fn: Callable[[list[str]], Catalog], tokens: list[str]) -> float:
+    start = time.perf_counter()
+    fn(tokens)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"{'tokens':>8}{'previous (s)':>15}{'incremental (s)':>18}{'speedup':>10}")
+    for size in SIZES:
+        tokens = list(_tokens(size))
+        assert _incremental(tokens) == Catalog.model_validate_json("".join(tokens))
+        incremental = _time(_incremental, tokens)
+        if size > MAX_PREVIOUS_SIZE:
+            print(f"{len(tokens):>8}{'-':>15}{incremental:>18.2f}{'-':>10}")
+            continue
+        previous = _time(_previous, tokens)
+        print(
+            f"{len(tokens):>8}{previous:>15.2f}{incremental:>18.2f}"
+            f"{previous / incremental:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
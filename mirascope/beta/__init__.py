@@ -1,3 +1,28 @@
-from . import openai
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import openai
+
+# `openai` is imported on first access so that importing `mirascope.beta` (e.g. for
+# `mirascope.beta.rag`) doesn't require the audio libraries of the realtime API.
+_SUBMODULES = frozenset(["openai"])
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _SUBMODULES:
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} ({e})"
+            ) from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES})
+
 
 __all__ = ["openai"]
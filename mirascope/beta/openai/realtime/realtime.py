@@ -385,12 +385,16 @@ class Realtime:
 
     async def _process_receiver(self, conn: ClientConnection) -> None:
         try:
-            audio_chunks: defaultdict[ResponseId, bytes] = defaultdict(bytes)
-            text_chunks: defaultdict[ResponseId, str] = defaultdict(str)
-            audio_transcript_chunks: defaultdict[ResponseId, str] = defaultdict(str)
+            # Deltas are collected in buffers that are only joined once complete so
+            # that long responses don't take quadratic time to accumulate.
+            audio_chunks: defaultdict[ResponseId, bytearray] = defaultdict(bytearray)
+            text_chunks: defaultdict[ResponseId, list[str]] = defaultdict(list)
+            audio_transcript_chunks: defaultdict[ResponseId, list[str]] = defaultdict(
+                list
+            )
             function_call_arguments_chunks: defaultdict[
-                ResponseId, defaultdict[CallId, str]
-            ] = defaultdict(lambda: defaultdict(str))
+                ResponseId, defaultdict[CallId, list[str]]
+            ] = defaultdict(lambda: defaultdict(list))
             async for data in conn:
                 message = json.loads(data)  # type: RawMessage
                 match message["type"]:  # type:
@@ -408,7 +412,7 @@ class Realtime:
                         await self._create_session_update(conn)
                     case "response.audio.done":
                         audio = audio_chunk_to_audio_segment(
-                            audio_chunks.pop(message["response_id"])
+                            bytes(audio_chunks.pop(message["response_id"]))
                         )
                         await self._process_specific_receiver(audio, "audio")
                     case "response.audio.delta":
@@ -418,29 +422,29 @@ class Realtime:
                         await self._process_specific_receiver(message, "audio_chunk")
                     case "response.text.done":
                         await self._process_specific_receiver(
-                            text_chunks.pop(message["response_id"]), "text"
+                            "".join(text_chunks.pop(message["response_id"])), "text"
                         )
                         self._text_message_received = True
                     case "response.text.delta":
-                        text_chunks[message["response_id"]] += message["delta"]
+                        text_chunks[message["response_id"]].append(message["delta"])
                         await self._process_specific_receiver(message, "text_chunk")
                     case "response.audio_transcript.done":
                         await self._process_specific_receiver(
-                            audio_transcript_chunks[message["response_id"]],
+                            "".join(audio_transcript_chunks[message["response_id"]]),
                             "audio_transcript",
                         )
                         self._audio_transcript_received = True
                     case "response.audio_transcript.delta":
-                        audio_transcript_chunks[message["response_id"]] += message[
-                            "delta"
-                        ]
+                        audio_transcript_chunks[message["response_id"]].append(
+                            message["delta"]
+                        )
                         await self._process_specific_receiver(
                             message, "audio_transcript_chunk"
                         )
                     case "response.function_call_arguments.delta":
                         function_call_arguments_chunks[message["response_id"]][
                             message["call_id"]
-                        ] += message["delta"]
+                        ].append(message["delta"])
                         await self._process_specific_receiver(message, "tool_chunk")
                     case "response.function_call_arguments.done":
                         tool_name, response_id, call_id = (
@@ -456,9 +460,9 @@ class Realtime:
                             tool_type, tool_schema = tool_type_and_tool_schemas.pop(0)
                         else:
                             tool_type, tool_schema = self._tool_schemas[tool_name]
-                        function_call_arguments = function_call_arguments_chunks[
-                            response_id
-                        ].pop(call_id)
+                        function_call_arguments = "".join(
+                            function_call_arguments_chunks[response_id].pop(call_id)
+                        )
                         if not function_call_arguments_chunks[response_id]:
                             del function_call_arguments_chunks[response_id]
                         tool = tool_type.from_tool_call(
@@ -0,0 +1,346 @@
+"""A response cache that reuses the responses of semantically similar calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+from pydantic import BaseModel
+
+from mirascope.core.base.response_cache import BaseCacheBackend, ResponseCache
+
+from .embedders import BaseEmbedder
+
+# The keyword arguments in which each provider's API call takes the messages of the call,
+# and the one that holds the text of the last user message, if it's passed separately.
+_MESSAGE_KWARGS: dict[str, tuple[tuple[str, ...], str | None]] = {
+    "cohere": (("chat_history", "message"), "message"),
+    "gemini": (("contents",), None),
+    "vertex": (("contents",), None),
+}
+_DEFAULT_MESSAGE_KWARGS: tuple[tuple[str, ...], str | None] = (("messages",), None)
+
+
+def _is_user_message(message: object) -> bool:
+    role = (
+        message.get("role")
+        if isinstance(message, Mapping)
+        else getattr(message, "role", None)
+    )
+    return isinstance(role, str) and role.lower() == "user"
+
+
+def _get_text(value: object) -> str:
+    if isinstance(value, str):
+        # Base64 encoded media can't be meaningfully compared as text.
+        return "" if value.startswith("data:") else value
+    if isinstance(value, Mapping):
+        return " ".join(
+            _get_text(item)
+            for key, item in value.items()
+            if key not in ("role", "type")
+        ).strip()
+    if isinstance(value, list | tuple):
+        return " ".join(_get_text(item) for item in value).strip()
+    if isinstance(value, BaseModel):
+        return _get_text(value.__dict__)
+    text = getattr(value, "text", None)
+    return text if isinstance(text, str) else ""
+
+
+class EmbeddingIndex:
+    """An in-process nearest neighbor index over normalized embeddings.
+
+    Embeddings are stored as the rows of a NumPy matrix so that a search is a single
+    matrix-vector product. The matrix is preallocated with spare rows that are filled
+    as entries are added, and it's only reallocated (with twice the rows) once they run
+    out, so adding an entry takes amortized constant time. Entries are evicted once
+    they are older than `ttl` or once the index holds more than `max_size` entries,
+    oldest first.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None) -> None:
+        """Initializes an instance of `EmbeddingIndex`.
+
+        Args:
+            max_size: The maximum number of entries to keep.
+            ttl: The number of seconds an entry is kept, if it should expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._vectors: np.ndarray | None = None
+        self._start = 0
+        self._keys: list[str] = []
+        self._partitions: list[str] = []
+        self._added: list[float] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _evict(self, now: float) -> None:
+        num_evicted = max(len(self._keys) - self.max_size, 0)
+        if self.ttl is not None:
+            while (
+                num_evicted < len(self._added)
+                and self._added[num_evicted] <= now - self.ttl
+            ):
+                num_evicted += 1
+        if num_evicted:
+            self._start += num_evicted
+            del self._keys[:num_evicted]
+            del self._partitions[:num_evicted]
+            del self._added[:num_evicted]
+
+    def _grow(self, vector: np.ndarray) -> None:
+        """Moves the entries' embeddings to a new matrix with room for as many more."""
+        size = len(self._keys)
+        vectors = np.empty((max(2 * size, 16), len(vector)), dtype=vector.dtype)
+        if self._vectors is not None:
+            vectors[:size] = self._vectors[self._start : self._start + size]
+        self._vectors, self._start = vectors, 0
+
+    def add(self, vector: np.ndarray, partition: str, key: str) -> None:
+        """Adds the normalized `vector` of the entry `key` to the index.
+
+        Args:
+            vector: The normalized embedding of the entry.
+            partition: The partition of the entry, which only matches searches in the
+                same partition.
+            key: The key of the entry.
+        """
+        with self._lock:
+            now = time.monotonic()
+            end = self._start + len(self._keys)
+            if self._vectors is None or end == len(self._vectors):
+                self._grow(vector)
+                end = len(self._keys)
+            self._vectors[end] = vector  # pyright: ignore [reportOptionalSubscript]
+            self._keys.append(key)
+            self._partitions.append(partition)
+            self._added.append(now)
+            self._evict(now)
+
+    def search(
+        self, vector: np.ndarray, partition: str, threshold: float, k: int = 4
+    ) -> list[tuple[str, float]]:
+        """Returns the `k` entries most similar to the normalized `vector`.
+
+        Args:
+            vector: The normalized embedding to search for.
+            partition: The partition to search in.
+            threshold: The minimum cosine similarity of the returned entries.
+            k: The maximum number of entries to return.
+
+        Returns:
+            The keys of the entries and their similarity, most similar first.
+        """
+        with self._lock:
+            self._evict(time.monotonic())
+            if self._vectors is None or not self._keys:
+                return []
+            scores = self._vectors[self._start : self._start + len(self._keys)] @ vector
+            scores[np.asarray(self._partitions) != partition] = -np.inf
+            k = min(k, len(scores))
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [
+                (self._keys[index], float(scores[index]))
+                for index in top
+                if scores[index] >= threshold
+            ]
+
+
+class SemanticResponseCache(ResponseCache):
+    """Returns cached responses for calls that are semantically similar to previous
+    ones.
+
+    Calls first look for a cached response of an identical call. If there is none,
+    the call's most recent user message is embedded and compared to the embedded user
+    messages of previous calls with the same provider, model, previous messages, tools,
+    and call params. The response of the most similar previous call is returned if its
+    cosine similarity is at least `threshold`.
+
+    Example:
+
+    ```python
+    from mirascope.beta.rag.base.semantic_cache import SemanticResponseCache
+    from mirascope.beta.rag.openai import OpenAIEmbedder
+    from mirascope.core import openai
+
+    cache = SemanticResponseCache(OpenAIEmbedder(), threshold=0.92)
+
+
+    @cache
+    @openai.call("gpt-4o-mini")
+    def answer(question: str) -> str:
+        return question
+
+
+    answer("How do I reset my password?")  # calls the API
+    answer("How can I reset my password?")  # returns the cached response
+    print(cache.hits, cache.semantic_hits, cache.misses)
+    # > 1 1 1
+    ```
+
+    Attributes:
+        embedder: The embedder used to embed user messages.
+        threshold: The minimum cosine similarity for a cached response to be reused.
+        index: The index of the embedded user messages.
+        semantic_hits: The number of hits that were similar but not identical calls.
+    """
+
+    def __init__(
+        self,
+        embedder: BaseEmbedder,
+        *,
+        threshold: float = 0.95,
+        max_size: int = 1024,
+        ttl: float | None = None,
+        backend: BaseCacheBackend | None = None,
+    ) -> None:
+        """Initializes an instance of `SemanticResponseCache`.
+
+        Args:
+            embedder: The embedder used to embed user messages.
+            threshold: The minimum cosine similarity for a cached response to be reused.
+            max_size: The maximum number of embedded user messages to keep.
+            ttl: The number of seconds embedded user messages are kept, if they should
+                expire.
+            backend: The backend that stores the cached responses. Defaults to an
+                in-memory LRU cache.
+        """
+        super().__init__(backend)
+        self.embedder = embedder
+        self.threshold = threshold
+        self.index = EmbeddingIndex(max_size=max_size, ttl=ttl)
+        self.semantic_hits = 0
+        self._pending: OrderedDict[str, tuple[str, np.ndarray]] = OrderedDict()
+
+    def _get_query(
+        self,
+        provider: str,
+        model: str,
+        messages: list[Any],
+        call_kwargs: object,
+        stream: bool,
+        client: object,
+    ) -> tuple[str, str] | None:
+        """Returns the partition and text to embed of a call, if it ends with a user
+        message with text.
+
+        The partition is the key of everything but the last user message: the previous
+        messages and the rest of the keyword arguments of the API call.
+        """
+        if (
+            not messages
+            or not _is_user_message(messages[-1])
+            or not isinstance(call_kwargs, Mapping)
+        ):
+            return None
+        message_kwargs, text_kwarg = _MESSAGE_KWARGS.get(
+            provider, _DEFAULT_MESSAGE_KWARGS
+        )
+        text = _get_text(call_kwargs[text_kwarg] if text_kwarg else messages[-1])
+        if not text:
+            return None
+        context = {
+            name: value
+            for name, value in call_kwargs.items()
+            if name not in message_kwargs
+        }
+        partition = self._get_key(
+            provider, model, [messages[:-1], context], stream, client
+        )
+        return (partition, text) if partition is not None else None
+
+    def _search(
+        self,
+        key: str,
+        partition: str,
+        embeddings: list[list[float]] | list[list[int]] | None,
+    ) -> Any | None:  # noqa: ANN401
+        """Returns the cached response most similar to the embedded user message.
+
+        The embedding is kept until the response of the call is cached so that it can
+        be added to the index.
+        """
+        if not embeddings:
+            return None
+        vector = np.asarray(embeddings[0], dtype=np.float32)
+        vector /= np.linalg.norm(vector) or 1.0
+        for similar_key, _ in self.index.search(vector, partition, self.threshold):
+            if (value := self.backend.get(similar_key)) is not None:
+                with self._lock:
+                    self.semantic_hits += 1
+                return value
+        with self._lock:
+            self._pending[key] = (partition, vector)
+            while len(self._pending) > self.index.max_size:
+                self._pending.popitem(last=False)
+        return None
+
+    def lookup(
+        self,
+        provider: str,
+        model: str,
+        messages: list[Any],
+        call_kwargs: object,
+        stream: bool,
+        client: object = None,
+    ) -> tuple[str | None, Any | None]:
+        if (key := self._get_key(provider, model, call_kwargs, stream, client)) is None:
+            self._count(None)
+            return None, None
+        value = self.backend.get(key)
+        if value is None and (
+            query := self._get_query(
+                provider, model, messages, call_kwargs, stream, client
+            )
+        ):
+            partition, text = query
+            value = self._search(key, partition, self.embedder.embed([text]).embeddings)
+        self._count(value)
+        return key, value
+
+    async def lookup_async(
+        self,
+        provider: str,
+        model: str,
+        messages: list[Any],
+        call_kwargs: object,
+        stream: bool,
+        client: object = None,
+    ) -> tuple[str | None, Any | None]:
+        if (key := self._get_key(provider, model, call_kwargs, stream, client)) is None:
+            self._count(None)
+            return None, None
+        value = self.backend.get(key)
+        if value is None and (
+            query := self._get_query(
+                provider, model, messages, call_kwargs, stream, client
+            )
+        ):
+            partition, text = query
+            response = await self.embedder.embed_async([text])
+            value = self._search(key, partition, response.embeddings)
+        self._count(value)
+        return key, value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        super().set(key, value)
+        with self._lock:
+            pending = self._pending.pop(key, None)
+        if pending is not None:
+            self.index.add(pending[1], pending[0], key)
+
+    def clear(self) -> None:
+        super().clear()
+        with self._lock:
+            self._pending.clear()
+            self.semantic_hits = 0
+        self.index = EmbeddingIndex(max_size=self.index.max_size, ttl=self.index.ttl)
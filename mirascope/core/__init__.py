@@ -1,6 +1,8 @@
 """The Mirascope Core Functionality."""
 
-from contextlib import suppress
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from . import base
 from .base import (
@@ -9,40 +11,68 @@ from .base import (
     BasePrompt,
     BaseTool,
     BaseToolKit,
+    BatchResult,
+    BudgetExceededError,
+    CallTimings,
     FromCallArgs,
+    MediaCache,
+    MediaLoader,
     Messages,
+    RateLimiter,
+    ResponseCache,
     ResponseModelConfigDict,
+    UsageLedger,
+    batch,
+    batch_async,
     metadata,
     prompt_template,
     toolkit_tool,
 )
 
-with suppress(ImportError):
-    from . import anthropic as anthropic
+if TYPE_CHECKING:
+    from . import (
+        anthropic,
+        azure,
+        cohere,
+        gemini,
+        groq,
+        litellm,
+        mistral,
+        openai,
+        vertex,
+    )
 
-with suppress(ImportError):
-    from . import cohere as cohere
-
-with suppress(ImportError):
-    from . import gemini as gemini
-
-with suppress(ImportError):
-    from . import groq as groq
+# Providers are imported on first access so that importing `mirascope.core` doesn't
+# import the SDK of every installed provider.
+_PROVIDERS = frozenset(
+    [
+        "anthropic",
+        "azure",
+        "cohere",
+        "gemini",
+        "groq",
+        "litellm",
+        "mistral",
+        "openai",
+        "vertex",
+    ]
+)
 
-with suppress(ImportError):
-    from . import litellm as litellm
 
-with suppress(ImportError):
-    from . import mistral as mistral
+def __getattr__(name: str) -> ModuleType:
+    if name in _PROVIDERS:
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} ({e})"
+            ) from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-with suppress(ImportError):
-    from . import openai as openai
 
-with suppress(ImportError):
-    from . import vertex as vertex
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_PROVIDERS})
 
-with suppress(ImportError):
-    from . import azure as azure
 
 __all__ = [
     "anthropic",
@@ -53,8 +83,15 @@ __all__ = [
     "BasePrompt",
     "BaseTool",
     "BaseToolKit",
+    "batch",
+    "batch_async",
+    "BatchResult",
+    "BudgetExceededError",
+    "CallTimings",
     "cohere",
     "FromCallArgs",
+    "MediaCache",
+    "MediaLoader",
     "gemini",
     "groq",
     "litellm",
@@ -63,7 +100,10 @@ __all__ = [
     "mistral",
     "openai",
     "prompt_template",
+    "RateLimiter",
+    "ResponseCache",
     "ResponseModelConfigDict",
     "toolkit_tool",
+    "UsageLedger",
     "vertex",
 ]
@@ -1,5 +1,46 @@
 """Calculate the cost of a completion using the Anthropic API."""
 
+from ...base.pricing import ModelPricing, pricing_registry
+
+pricing_registry.register(
+    "anthropic",
+    {
+        "claude-instant-1.2": ModelPricing(input=0.000_000_8, output=0.000_002_4),
+        "claude-2.0": ModelPricing(input=0.000_008, output=0.000_024),
+        "claude-2.1": ModelPricing(input=0.000_008, output=0.000_024),
+        "claude-3-haiku-20240307": ModelPricing(input=0.000_002_5, output=0.000_012_5),
+        "claude-3-sonnet-20240229": ModelPricing(input=0.000_003, output=0.000_015),
+        "claude-3-opus-20240229": ModelPricing(input=0.000_015, output=0.000_075),
+        "claude-3-5-sonnet-20240620": ModelPricing(input=0.000_003, output=0.000_015),
+        # Bedrock models
+        "anthropic.claude-3-haiku-20240307-v1:0": ModelPricing(
+            input=0.000_002_5, output=0.000_012_5
+        ),
+        "anthropic.claude-3-sonnet-20240229-v1:0": ModelPricing(
+            input=0.000_003, output=0.000_015
+        ),
+        "anthropic.claude-3-opus-20240229-v1:0": ModelPricing(
+            input=0.000_015, output=0.000_075
+        ),
+        "anthropic.claude-3-5-sonnet-20240620-v1:0": ModelPricing(
+            input=0.000_003, output=0.000_015
+        ),
+        # Vertex AI models
+        "claude-3-haiku@20240307": ModelPricing(input=0.000_002_5, output=0.000_012_5),
+        "claude-3-sonnet@20240229": ModelPricing(input=0.000_003, output=0.000_015),
+        "claude-3-opus@20240229": ModelPricing(input=0.000_015, output=0.000_075),
+        "claude-3-5-sonnet@20240620": ModelPricing(input=0.000_003, output=0.000_015),
+    },
+)
+for _model in [
+    "claude-3-haiku-20240307",
+    "claude-3-sonnet-20240229",
+    "claude-3-opus-20240229",
+    "claude-3-5-sonnet-20240620",
+]:
+    # Newer snapshots (including on Bedrock and Vertex AI) use the undated prices.
+    pricing_registry.register_alias("anthropic", _model.rsplit("-", 1)[0], _model)
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -17,81 +58,6 @@ def calculate_cost(
     claude-3-sonnet           $3.00 / 1M tokens   $15.00 / 1M tokens
     claude-3-opus             $15.00 / 1M tokens   $75.00 / 1M tokens
     """
-    pricing = {
-        "claude-instant-1.2": {
-            "prompt": 0.000_000_8,
-            "completion": 0.000_002_4,
-        },
-        "claude-2.0": {
-            "prompt": 0.000_008,
-            "completion": 0.000_024,
-        },
-        "claude-2.1": {
-            "prompt": 0.000_008,
-            "completion": 0.000_024,
-        },
-        "claude-3-haiku-20240307": {
-            "prompt": 0.000_002_5,
-            "completion": 0.000_012_5,
-        },
-        "claude-3-sonnet-20240229": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-        "claude-3-opus-20240229": {
-            "prompt": 0.000_015,
-            "completion": 0.000_075,
-        },
-        "claude-3-5-sonnet-20240620": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-        # Bedrock models
-        "anthropic.claude-3-haiku-20240307-v1:0": {
-            "prompt": 0.000_002_5,
-            "completion": 0.000_012_5,
-        },
-        "anthropic.claude-3-sonnet-20240229-v1:0": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-        "anthropic.claude-3-opus-20240229-v1:0": {
-            "prompt": 0.000_015,
-            "completion": 0.000_075,
-        },
-        "anthropic.claude-3-5-sonnet-20240620-v1:0": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-        # Vertex AI models
-        "claude-3-haiku@20240307": {
-            "prompt": 0.000_002_5,
-            "completion": 0.000_012_5,
-        },
-        "claude-3-sonnet@20240229": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-        "claude-3-opus@20240229": {
-            "prompt": 0.000_015,
-            "completion": 0.000_075,
-        },
-        "claude-3-5-sonnet@20240620": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-    }
-
-    if input_tokens is None or output_tokens is None:
-        return None
-
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
-        return None
-
-    prompt_cost = input_tokens * model_pricing["prompt"]
-    completion_cost = output_tokens * model_pricing["completion"]
-    total_cost = prompt_cost + completion_cost
-
-    return total_cost
+    return pricing_registry.calculate_cost(
+        "anthropic", model, input_tokens, output_tokens
+    )
@@ -5,30 +5,35 @@ from collections.abc import AsyncGenerator, Generator
 import jiter
 from anthropic.types import MessageStreamEvent, ToolUseBlock
 
+from ...base._utils import get_tool_types_by_name
 from ..call_response_chunk import AnthropicCallResponseChunk
 from ..tool import AnthropicTool
 
 
 def _handle_chunk(
-    buffer: str,
+    buffer: list[str],
     chunk: MessageStreamEvent,
     current_tool_call: ToolUseBlock,
     current_tool_type: type[AnthropicTool] | None,
-    tool_types: list[type[AnthropicTool]] | None,
+    tool_types_by_name: dict[str, type[AnthropicTool]] | None,
 ) -> tuple[
-    str,
+    list[str],
     AnthropicTool | None,
     ToolUseBlock,
     type[AnthropicTool] | None,
 ]:
-    """Handles a chunk of the stream."""
-    if not tool_types:
+    """Handles a chunk of the stream.
+
+    The partial JSON of the current tool call's input is collected in `buffer` and only
+    joined and parsed once the tool call's content block stops.
+    """
+    if not tool_types_by_name:
         return buffer, None, current_tool_call, current_tool_type
 
     if chunk.type == "content_block_stop" and current_tool_type and buffer:
-        current_tool_call.input = jiter.from_json(buffer.encode())
+        current_tool_call.input = jiter.from_json("".join(buffer).encode())
         return (
-            "",
+            [],
             current_tool_type.from_tool_call(current_tool_call),
             ToolUseBlock(id="", input={}, name="", type="tool_use"),
             None,
@@ -38,17 +43,13 @@ def _handle_chunk(
         chunk.content_block, ToolUseBlock
     ):
         content_block = chunk.content_block
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == content_block.name:
-                current_tool_type = tool_type
-                break
+        current_tool_type = tool_types_by_name.get(content_block.name)
         if current_tool_type is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {content_block.name}."
             )  # pragma: no cover
         return (
-            "",
+            [],
             None,
             ToolUseBlock(
                 id=content_block.id, input={}, name=content_block.name, type="tool_use"
@@ -57,7 +58,7 @@ def _handle_chunk(
         )
 
     if chunk.type == "content_block_delta" and chunk.delta.type == "input_json_delta":
-        buffer += chunk.delta.partial_json
+        buffer.append(chunk.delta.partial_json)
 
     return buffer, None, current_tool_call, current_tool_type
 
@@ -67,11 +68,12 @@ def handle_stream(
     tool_types: list[type[AnthropicTool]] | None,
 ) -> Generator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type, buffer = None, []
     for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
-            buffer, chunk, current_tool_call, current_tool_type, tool_types
+            buffer, chunk, current_tool_call, current_tool_type, tool_types_by_name
         )
         yield AnthropicCallResponseChunk(chunk=chunk), tool
 
@@ -80,10 +82,11 @@ async def handle_stream_async(
     stream: AsyncGenerator[MessageStreamEvent, None],
     tool_types: list[type[AnthropicTool]] | None,
 ) -> AsyncGenerator[tuple[AnthropicCallResponseChunk, AnthropicTool | None], None]:
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ToolUseBlock(id="", input={}, name="", type="tool_use")
-    current_tool_type, buffer = None, ""
+    current_tool_type, buffer = None, []
     async for chunk in stream:
         buffer, tool, current_tool_call, current_tool_type = _handle_chunk(
-            buffer, chunk, current_tool_call, current_tool_type, tool_types
+            buffer, chunk, current_tool_call, current_tool_type, tool_types_by_name
         )
         yield AnthropicCallResponseChunk(chunk=chunk), tool
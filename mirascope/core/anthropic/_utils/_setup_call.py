@@ -15,13 +15,15 @@ from anthropic import (
 from anthropic.types import Message, MessageParam, MessageStreamEvent
 
 from ...base import BaseMessageParam, BaseTool, _utils
-from ...base._utils import AsyncCreateFn, CreateFn
+from ...base._utils import AsyncCreateFn, CreateFn, get_default_client
 from ..call_kwargs import AnthropicCallKwargs
 from ..call_params import AnthropicCallParams
 from ..dynamic_config import AnthropicDynamicConfig
 from ..tool import AnthropicTool
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("ANTHROPIC_API_KEY", "ANTHROPIC_AUTH_TOKEN", "ANTHROPIC_BASE_URL")
+
 
 @overload
 def setup_call(
@@ -120,6 +122,10 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncAnthropic() if inspect.iscoroutinefunction(fn) else Anthropic()
+        client = (
+            get_default_client(AsyncAnthropic, is_async=True, env_vars=_ENV_VARS)
+            if inspect.iscoroutinefunction(fn)
+            else get_default_client(Anthropic, env_vars=_ENV_VARS)
+        )
     create = client.messages.create
     return create, prompt_template, messages, tool_types, call_kwargs
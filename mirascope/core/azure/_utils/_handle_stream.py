@@ -9,6 +9,7 @@ from azure.ai.inference.models import (
     StreamingChatCompletionsUpdate,
 )
 
+from ...base._utils import get_tool_types_by_name
 from ..call_response_chunk import AzureCallResponseChunk
 from ..tool import AzureTool
 
@@ -17,15 +18,20 @@ def _handle_chunk(
     chunk: StreamingChatCompletionsUpdate,
     current_tool_call: ChatCompletionsToolCall,
     current_tool_type: type[AzureTool] | None,
-    tool_types: list[type[AzureTool]] | None,
+    tool_types_by_name: dict[str, type[AzureTool]] | None,
+    arguments: list[str],
 ) -> tuple[
     AzureTool | None,
     ChatCompletionsToolCall,
     type[AzureTool] | None,
 ]:
-    """Handles a chunk of the stream."""
+    """Handles a chunk of the stream.
+
+    The argument deltas of the current tool call are collected in `arguments` and only
+    joined into the tool call's arguments once the tool call is complete.
+    """
     if (
-        not tool_types
+        not tool_types_by_name
         or not chunk.choices
         or not (tool_calls := chunk.choices[0].delta.tool_calls)
     ):
@@ -34,6 +40,8 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
+        current_tool_call.function.arguments = "".join(arguments)
+        arguments.clear()
         previous_tool_call = copy.deepcopy(current_tool_call)
         previous_tool_type = current_tool_type
         current_tool_call = ChatCompletionsToolCall(
@@ -43,11 +51,7 @@ def _handle_chunk(
                 name=tool_call.function.name if tool_call.function.name else "",
             ),
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
+        current_tool_type = tool_types_by_name.get(current_tool_call.function.name)
         if current_tool_type is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
@@ -65,7 +69,7 @@ def _handle_chunk(
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -75,13 +79,16 @@ def handle_stream(
     tool_types: list[type[AzureTool]] | None,
 ) -> Generator[tuple[AzureCallResponseChunk, AzureTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ChatCompletionsToolCall(
         id="", function=FunctionCall(arguments="", name="")
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, []
     for chunk in stream:
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = "".join(arguments)
+                arguments.clear()
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -93,7 +100,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield AzureCallResponseChunk(chunk=chunk), tool
@@ -104,13 +112,16 @@ async def handle_stream_async(
     tool_types: list[type[AzureTool]] | None,
 ) -> AsyncGenerator[tuple[AzureCallResponseChunk, AzureTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ChatCompletionsToolCall(
         id="", function=FunctionCall(arguments="", name="")
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = "".join(arguments)
+                arguments.clear()
                 yield (
                     AzureCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -122,7 +133,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield AzureCallResponseChunk(chunk=chunk), tool
@@ -18,7 +18,13 @@ from azure.ai.inference.models import (
 from azure.core.credentials import AzureKeyCredential
 
 from ...base import BaseMessageParam, BaseTool, _utils
-from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
+from ...base._utils import (
+    AsyncCreateFn,
+    CreateFn,
+    get_async_create_fn,
+    get_create_fn,
+    get_default_client,
+)
 from ..call_kwargs import AzureCallKwargs
 from ..call_params import AzureCallParams
 from ..dynamic_config import AzureDynamicConfig
@@ -26,6 +32,8 @@ from ..tool import AzureTool, GenerateAzureStrictToolJsonSchema
 from ._convert_message_params import convert_message_params
 from ._get_credential import get_credential
 
+_ENV_VARS = ("AZURE_INFERENCE_CREDENTIAL",)
+
 
 @overload
 def setup_call(
@@ -127,12 +135,25 @@ def setup_call(
 
     if client is None:
         endpoint = os.environ["AZURE_INFERENCE_ENDPOINT"]
-        credential = cast(AzureKeyCredential, get_credential())
-
         client = (
-            AsyncChatCompletionsClient(endpoint=endpoint, credential=credential)
+            get_default_client(
+                lambda: AsyncChatCompletionsClient(
+                    endpoint=endpoint,
+                    credential=cast(AzureKeyCredential, get_credential()),
+                ),
+                key=(AsyncChatCompletionsClient, endpoint),
+                is_async=True,
+                env_vars=_ENV_VARS,
+            )
             if inspect.iscoroutinefunction(fn)
-            else ChatCompletionsClient(endpoint=endpoint, credential=credential)
+            else get_default_client(
+                lambda: ChatCompletionsClient(
+                    endpoint=endpoint,
+                    credential=cast(AzureKeyCredential, get_credential()),
+                ),
+                key=(ChatCompletionsClient, endpoint),
+                env_vars=_ENV_VARS,
+            )
         )
     create = (
         get_async_create_fn(
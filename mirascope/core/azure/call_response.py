@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from azure.ai.inference.models import (
     AssistantMessage,
     ChatCompletions,
@@ -15,6 +17,7 @@ from azure.ai.inference.models import (
 from pydantic import SerializeAsAny, SkipValidation, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._utils import calculate_cost
 from .call_params import AzureCallParams
 from .dynamic_config import AzureDynamicConfig
@@ -101,7 +104,7 @@ class AzureCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> SerializeAsAny[AssistantMessage]:
         """Returns the assistants's response as a message parameter."""
         message_param = self.response.choices[0].message
@@ -110,7 +113,7 @@ class AzureCallResponse(
         )
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[AzureTool] | None:
         """Returns any available tool calls as their `AzureTool` definition.
 
@@ -124,17 +127,16 @@ class AzureCallResponse(
         if not self.tool_types or not tool_calls:
             return None
 
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools = []
         for tool_call in tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.function.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
+            if tool_type := tool_types_by_name.get(tool_call.function.name):
+                extracted_tools.append(tool_type.from_tool_call(tool_call))
 
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> AzureTool | None:
         """Returns the 0th tool for the 0th choice message.
 
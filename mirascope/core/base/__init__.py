@@ -2,13 +2,16 @@
 
 from . import _partial, _utils
 from ._call_factory import call_factory
-from ._utils import BaseType
+from ._utils import BaseType, aclose_default_clients, close_default_clients
+from .batch import BatchResult, batch, batch_async
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .call_response_chunk import BaseCallResponseChunk
 from .dynamic_config import BaseDynamicConfig
 from .from_call_args import FromCallArgs
+from .media_cache import MediaCache
+from .media_loader import MediaLoader
 from .message_param import (
     AudioPart,
     BaseMessageParam,
@@ -18,15 +21,21 @@ from .message_param import (
 )
 from .messages import Messages
 from .metadata import Metadata
+from .pricing import ModelPricing, pricing_registry
 from .prompt import BasePrompt, metadata, prompt_template
+from .rate_limiter import RateLimiter
+from .response_cache import ResponseCache
 from .response_model_config_dict import ResponseModelConfigDict
 from .stream import BaseStream
 from .structured_stream import BaseStructuredStream
+from .timings import CallTimings
 from .tool import BaseTool, GenerateJsonSchemaNoTitles, ToolConfig
 from .toolkit import BaseToolKit, toolkit_tool
 from .types import AudioSegment
+from .usage_ledger import BudgetExceededError, UsageLedger
 
 __all__ = [
+    "aclose_default_clients",
     "AudioPart",
     "AudioSegment",
     "BaseCallKwargs",
@@ -41,19 +50,32 @@ __all__ = [
     "BaseTool",
     "BaseToolKit",
     "BaseType",
+    "batch",
+    "batch_async",
+    "BatchResult",
+    "BudgetExceededError",
     "CacheControlPart",
     "call_factory",
+    "CallTimings",
+    "close_default_clients",
     "FromCallArgs",
     "GenerateJsonSchemaNoTitles",
     "ImagePart",
+    "MediaCache",
+    "MediaLoader",
     "metadata",
+    "ModelPricing",
     "Messages",
     "Metadata",
+    "pricing_registry",
     "prompt_template",
+    "RateLimiter",
+    "ResponseCache",
     "ResponseModelConfigDict",
     "TextPart",
     "ToolConfig",
     "toolkit_tool",
+    "UsageLedger",
     "_partial",
     "_utils",
 ]
@@ -132,6 +132,7 @@ def call_factory(  # noqa: ANN202
         | _SyncBaseClientT
         | None = None,
         call_params: BaseCallParams | None = None,
+        iterable: bool = False,
     ) -> (
         AsyncLLMFunctionDecorator[
             _BaseDynamicConfigT,
@@ -165,6 +166,10 @@ def call_factory(  # noqa: ANN202
     ):
         if stream and output_parser:
             raise ValueError("Cannot use `output_parser` with `stream=True`.")
+        if iterable and not (stream and response_model):
+            raise ValueError(
+                "Cannot use `iterable` without `stream=True` and a `response_model`."
+            )
 
         if call_params is None:
             call_params = default_call_params
@@ -185,6 +190,7 @@ def call_factory(  # noqa: ANN202
                     json_mode=json_mode,
                     client=client,
                     call_params=call_params,
+                    iterable=iterable,
                 )  # pyright: ignore [reportReturnType, reportCallIssue]
             else:
                 return partial(
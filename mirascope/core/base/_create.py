@@ -1,6 +1,7 @@
 """The `create_factory` method for generating provider specific create decorators."""
 
 import datetime
+import time
 from collections.abc import Awaitable, Callable, Coroutine
 from functools import wraps
 from typing import Any, ParamSpec, TypeVar, cast, overload
@@ -8,19 +9,27 @@ from typing import Any, ParamSpec, TypeVar, cast, overload
 from ._utils import (
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
+    bind_context_var,
+    capture_default_clients,
     fn_is_async,
     get_dynamic_configuration,
     get_fn_args,
     get_metadata,
     get_possible_user_message_param,
     is_prompt_template,
+    load_prompt_media_async,
+    preloaded_media,
 )
 from .call_params import BaseCallParams
 from .call_response import BaseCallResponse
 from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .prompt import prompt_template
+from .rate_limiter import current_rate_limiter
+from .response_cache import current_response_cache
+from .timings import CallTimings, current_timings
 from .tool import BaseTool
+from .usage_ledger import current_usage_ledger
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
 _SameSyncAndAsyncClientT = TypeVar("_SameSyncAndAsyncClientT", contravariant=True)
@@ -155,24 +164,74 @@ def create_factory(  # noqa: ANN202
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
-                dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
-                    model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
-                    fn=fn,
-                    fn_args=fn_args,
-                    dynamic_config=dynamic_config,
-                    tools=tools,
-                    json_mode=json_mode,
-                    call_params=call_params,
-                    extract=False,
+                timings = CallTimings()
+                with timings.measure("bind_args"):
+                    fn_args = get_fn_args(fn, args, kwargs)
+                with timings.measure("dynamic_config"):
+                    dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
+                with timings.measure("media_loading"):
+                    media = await load_prompt_media_async(fn, fn_args, dynamic_config)
+                with (
+                    timings.measure("message_conversion"),
+                    capture_default_clients() as default_clients,
+                ):
+                    create, prompt_template, messages, tool_types, call_kwargs = (
+                        bind_context_var(
+                            bind_context_var(setup_call, preloaded_media, media),
+                            current_timings,
+                            timings,
+                        )(  # pyright: ignore [reportCallIssue]
+                            model=model,
+                            client=client,  # pyright: ignore [reportArgumentType]
+                            fn=fn,
+                            fn_args=fn_args,
+                            dynamic_config=dynamic_config,
+                            tools=tools,
+                            json_mode=json_mode,
+                            call_params=call_params,
+                            extract=False,
+                        )
+                    )
+                call_client = client
+                if call_client is None and default_clients:
+                    call_client = default_clients[-1]
+                cache, cache_key, response = current_response_cache.get(), None, None
+                if cache:
+                    cache_key, response = await cache.lookup_async(
+                        TCallResponse._provider,
+                        model,
+                        messages,
+                        call_kwargs,
+                        stream=False,
+                        client=call_client,
+                    )
+                metadata = get_metadata(fn, dynamic_config)
+                ledger = current_usage_ledger.get() if response is None else None
+                if ledger:
+                    ledger.check(metadata.get("tags", ()))
+                rate_limiter = current_rate_limiter.get()
+                reservation = (
+                    await rate_limiter.acquire_async(
+                        TCallResponse._provider, model, call_client, messages
+                    )
+                    if rate_limiter and response is None
+                    else None
                 )
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = await create(stream=False, **call_kwargs)
+                with timings.measure("request"):
+                    if response is None:
+                        try:
+                            response = await create(stream=False, **call_kwargs)
+                        except BaseException:
+                            if reservation:
+                                reservation.release()
+                            raise
+                        if cache and cache_key:
+                            cache.set(cache_key, response)
                 end_time = datetime.datetime.now().timestamp() * 1000
+                parse_start = time.perf_counter_ns()
                 output = TCallResponse(
-                    metadata=get_metadata(fn, dynamic_config),
+                    metadata=metadata,
                     response=response,
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
                     prompt_template=prompt_template,
@@ -186,7 +245,14 @@ def create_factory(  # noqa: ANN202
                     end_time=end_time,
                 )
                 output._model = model
-                return output if not output_parser else output_parser(output)
+                output._timings = timings
+                if reservation:
+                    reservation.reconcile(output.input_tokens, output.output_tokens)
+                if ledger:
+                    ledger.record_response(output)
+                parsed_output = output if not output_parser else output_parser(output)
+                timings.add("response_parsing", time.perf_counter_ns() - parse_start)
+                return parsed_output
 
             return inner_async
         else:
@@ -195,24 +261,68 @@ def create_factory(  # noqa: ANN202
             def inner(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> TCallResponse | _ParsedOutputT:
-                fn_args = get_fn_args(fn, args, kwargs)
-                dynamic_config = get_dynamic_configuration(fn, args, kwargs)
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
-                    model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
-                    fn=fn,
-                    fn_args=fn_args,
-                    dynamic_config=dynamic_config,
-                    tools=tools,
-                    json_mode=json_mode,
-                    call_params=call_params,
-                    extract=False,
+                timings = CallTimings()
+                with timings.measure("bind_args"):
+                    fn_args = get_fn_args(fn, args, kwargs)
+                with timings.measure("dynamic_config"):
+                    dynamic_config = get_dynamic_configuration(fn, args, kwargs)
+                with (
+                    timings.measure("message_conversion"),
+                    capture_default_clients() as default_clients,
+                ):
+                    create, prompt_template, messages, tool_types, call_kwargs = (
+                        bind_context_var(setup_call, current_timings, timings)(  # pyright: ignore [reportCallIssue]
+                            model=model,
+                            client=client,  # pyright: ignore [reportArgumentType]
+                            fn=fn,
+                            fn_args=fn_args,
+                            dynamic_config=dynamic_config,
+                            tools=tools,
+                            json_mode=json_mode,
+                            call_params=call_params,
+                            extract=False,
+                        )
+                    )
+                call_client = client
+                if call_client is None and default_clients:
+                    call_client = default_clients[-1]
+                cache, cache_key, response = current_response_cache.get(), None, None
+                if cache:
+                    cache_key, response = cache.lookup(
+                        TCallResponse._provider,
+                        model,
+                        messages,
+                        call_kwargs,
+                        stream=False,
+                        client=call_client,
+                    )
+                metadata = get_metadata(fn, dynamic_config)
+                ledger = current_usage_ledger.get() if response is None else None
+                if ledger:
+                    ledger.check(metadata.get("tags", ()))
+                rate_limiter = current_rate_limiter.get()
+                reservation = (
+                    rate_limiter.acquire(
+                        TCallResponse._provider, model, call_client, messages
+                    )
+                    if rate_limiter and response is None
+                    else None
                 )
                 start_time = datetime.datetime.now().timestamp() * 1000
-                response = create(stream=False, **call_kwargs)
+                with timings.measure("request"):
+                    if response is None:
+                        try:
+                            response = create(stream=False, **call_kwargs)
+                        except BaseException:
+                            if reservation:
+                                reservation.release()
+                            raise
+                        if cache and cache_key:
+                            cache.set(cache_key, response)
                 end_time = datetime.datetime.now().timestamp() * 1000
+                parse_start = time.perf_counter_ns()
                 output = TCallResponse(
-                    metadata=get_metadata(fn, dynamic_config),
+                    metadata=metadata,
                     response=response,
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
                     prompt_template=prompt_template,
@@ -226,7 +336,14 @@ def create_factory(  # noqa: ANN202
                     end_time=end_time,
                 )
                 output._model = model
-                return output if not output_parser else output_parser(output)
+                output._timings = timings
+                if reservation:
+                    reservation.reconcile(output.input_tokens, output.output_tokens)
+                if ledger:
+                    ledger.record_response(output)
+                parsed_output = output if not output_parser else output_parser(output)
+                timings.add("response_parsing", time.perf_counter_ns() - parse_start)
+                return parsed_output
 
             return inner
 
@@ -1,5 +1,6 @@
 """The `extract_factory` method for generating provider specific create decorators."""
 
+import time
 from collections.abc import Awaitable, Callable
 from functools import wraps
 from typing import ParamSpec, TypeVar, overload
@@ -108,14 +109,15 @@ def extract_factory(  # noqa: ANN202
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
         tool = setup_extract_tool(response_model, TToolType)
-        create_decorator_kwargs = {
-            "model": model,
-            "tools": [tool],
-            "output_parser": None,
-            "json_mode": json_mode,
-            "client": client,
-            "call_params": call_params,
-        }
+        call = create_decorator(
+            fn=fn,
+            model=model,
+            tools=[tool],
+            output_parser=None,
+            json_mode=json_mode,
+            client=client,
+            call_params=call_params,
+        )
 
         if fn_is_async(fn):
 
@@ -123,22 +125,26 @@ def extract_factory(  # noqa: ANN202
             async def inner_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> _ResponseModelT:
+                bind_start = time.perf_counter_ns()
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = await create_decorator(
-                    fn=fn, **create_decorator_kwargs
-                )(*args, **kwargs)
-                json_output = get_json_output(call_response, json_mode)
-                try:
-                    output = extract_tool_return(
-                        response_model, json_output, False, fields_from_call_args
-                    )
-                except ValidationError as e:
-                    e._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
-                    raise e
+                bind_ns = time.perf_counter_ns() - bind_start
+                call_response = await call(*args, **kwargs)
+                timings = call_response.timings
+                timings.add("bind_args", bind_ns)
+                with timings.measure("validation"):
+                    json_output = get_json_output(call_response, json_mode)
+                    try:
+                        output = extract_tool_return(
+                            response_model, json_output, False, fields_from_call_args
+                        )
+                    except ValidationError as e:
+                        e._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                        raise e
                 if isinstance(output, BaseModel):
                     output._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                    output._timings = timings  # pyright: ignore [reportAttributeAccessIssue]
                 return output if not output_parser else output_parser(output)  # pyright: ignore [reportArgumentType, reportReturnType]
 
             return inner_async
@@ -146,22 +152,26 @@ def extract_factory(  # noqa: ANN202
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> _ResponseModelT:
+                bind_start = time.perf_counter_ns()
                 fields_from_call_args = get_fields_from_call_args(
                     response_model, fn, args, kwargs
                 )
-                call_response = create_decorator(fn=fn, **create_decorator_kwargs)(
-                    *args, **kwargs
-                )
-                json_output = get_json_output(call_response, json_mode)
-                try:
-                    output = extract_tool_return(
-                        response_model, json_output, False, fields_from_call_args
-                    )
-                except ValidationError as e:
-                    e._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
-                    raise e
+                bind_ns = time.perf_counter_ns() - bind_start
+                call_response = call(*args, **kwargs)
+                timings = call_response.timings
+                timings.add("bind_args", bind_ns)
+                with timings.measure("validation"):
+                    json_output = get_json_output(call_response, json_mode)
+                    try:
+                        output = extract_tool_return(
+                            response_model, json_output, False, fields_from_call_args
+                        )
+                    except ValidationError as e:
+                        e._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                        raise e
                 if isinstance(output, BaseModel):
                     output._response = call_response  # pyright: ignore [reportAttributeAccessIssue]
+                    output._timings = timings  # pyright: ignore [reportAttributeAccessIssue]
                 return output if not output_parser else output_parser(output)  # pyright: ignore [reportReturnType, reportArgumentType]
 
             return inner
@@ -14,8 +14,12 @@ from typing import TypeVar
 from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
+from ._utils._source_cache import SourceCache
+
 Model = TypeVar("Model", bound=BaseModel)
 
+_partial_models: SourceCache[type[BaseModel]] = SourceCache("partial_models")
+
 
 def partial(wrapped_class: type[Model]) -> type[Model]:
     """Generate a new class with all attributes optionals.
@@ -33,7 +37,12 @@ def partial(wrapped_class: type[Model]) -> type[Model]:
 
     user = User(name="None")
     ```
+
+    The generated class is cached per wrapped class, so calling `partial` repeatedly
+    with the same class returns the same partial class.
     """
+    if (partial_model := _partial_models.get(wrapped_class)) is not None:
+        return partial_model  # pyright: ignore [reportReturnType]
 
     def _make_field_optional(
         field: FieldInfo,
@@ -51,7 +60,7 @@ def partial(wrapped_class: type[Model]) -> type[Model]:
             tmp_field.default = None
         return tmp_field.annotation, tmp_field
 
-    return create_model(
+    partial_model = create_model(
         f"Partial{wrapped_class.__name__}",
         __base__=wrapped_class,
         __module__=wrapped_class.__module__,
@@ -64,3 +73,4 @@ def partial(wrapped_class: type[Model]) -> type[Model]:
             for field_name, field_info in wrapped_class.model_fields.items()
         },
     )
+    return _partial_models.set(wrapped_class, None, partial_model)
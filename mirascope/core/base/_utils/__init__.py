@@ -1,13 +1,33 @@
 """Internal Utilities."""
 
 from ._base_type import BaseType, is_base_type
+from ._bind_context_var import bind_context_var
 from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
 from ._convert_base_type_to_base_tool import convert_base_type_to_base_tool
 from ._convert_function_to_base_tool import convert_function_to_base_tool
+from ._default_clients import (
+    aclose_default_clients,
+    capture_default_clients,
+    close_default_clients,
+    get_default_client,
+)
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._encode_media_base64 import encode_media_base64
+from ._execute_tools import (
+    call_tool,
+    call_tool_async,
+    execute_tools,
+    execute_tools_async,
+    get_tool_outputs,
+    get_tool_outputs_async,
+)
 from ._extract_tool_return import extract_tool_return
 from ._fn_is_async import fn_is_async
-from ._format_template import format_template
+from ._format_template import (
+    CompiledFormatTemplate,
+    compile_format_template,
+    format_template,
+)
 from ._get_audio_type import get_audio_type
 from ._get_create_fn_or_async_create_fn import get_async_create_fn, get_create_fn
 from ._get_dynamic_configuration import get_dynamic_configuration
@@ -18,12 +38,21 @@ from ._get_possible_user_message_param import get_possible_user_message_param
 from ._get_prompt_template import get_prompt_template
 from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
+from ._get_tool_types_by_name import get_tool_types_by_name
 from ._get_unsupported_tool_config_keys import get_unsupported_tool_config_keys
+from ._incremental_item_extractor import IncrementalItemExtractor
+from ._incremental_json_parser import IncrementalJsonParser
+from ._incremental_tool_return_extractor import IncrementalToolReturnExtractor
 from ._is_prompt_template import is_prompt_template
 from ._json_mode_content import json_mode_content
 from ._messages_decorator import MessagesDecorator, messages_decorator
 from ._parse_content_template import parse_content_template
-from ._parse_prompt_messages import parse_prompt_messages
+from ._parse_prompt_messages import (
+    load_prompt_media_async,
+    parse_prompt_messages,
+    parse_prompt_messages_async,
+    preloaded_media,
+)
 from ._protocols import (
     AsyncCreateFn,
     CalculateCost,
@@ -40,15 +69,26 @@ from ._setup_call import setup_call
 from ._setup_extract_tool import setup_extract_tool
 
 __all__ = [
+    "aclose_default_clients",
     "AsyncCreateFn",
     "SameSyncAndAsyncClientSetupCall",
     "BaseType",
+    "bind_context_var",
     "CalculateCost",
+    "call_tool",
+    "call_tool_async",
+    "capture_default_clients",
+    "close_default_clients",
+    "CompiledFormatTemplate",
+    "compile_format_template",
     "convert_base_model_to_base_tool",
     "convert_base_type_to_base_tool",
     "convert_function_to_base_tool",
     "CreateFn",
     "DEFAULT_TOOL_DOCSTRING",
+    "encode_media_base64",
+    "execute_tools",
+    "execute_tools_async",
     "extract_tool_return",
     "fn_is_async",
     "format_template",
@@ -56,6 +96,7 @@ __all__ = [
     "get_audio_type",
     "get_async_create_fn",
     "get_create_fn",
+    "get_default_client",
     "get_dynamic_configuration",
     "get_fn_args",
     "get_image_type",
@@ -64,17 +105,26 @@ __all__ = [
     "get_prompt_template",
     "get_template_values",
     "get_template_variables",
+    "get_tool_outputs",
+    "get_tool_outputs_async",
+    "get_tool_types_by_name",
     "get_unsupported_tool_config_keys",
     "HandleStream",
     "HandleStreamAsync",
+    "IncrementalItemExtractor",
+    "IncrementalJsonParser",
+    "IncrementalToolReturnExtractor",
     "is_base_type",
     "is_prompt_template",
     "json_mode_content",
+    "load_prompt_media_async",
     "LLMFunctionDecorator",
     "MessagesDecorator",
     "messages_decorator",
     "parse_content_template",
     "parse_prompt_messages",
+    "parse_prompt_messages_async",
+    "preloaded_media",
     "SetupCall",
     "setup_call",
     "setup_extract_tool",
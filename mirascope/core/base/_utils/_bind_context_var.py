@@ -0,0 +1,59 @@
+"""This module contains the `bind_context_var` function."""
+
+from collections.abc import Awaitable, Callable
+from contextvars import ContextVar
+from functools import wraps
+from typing import ParamSpec, TypeVar, overload
+
+from ._fn_is_async import fn_is_async
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+
+@overload
+def bind_context_var(
+    fn: Callable[_P, Awaitable[_R]], context_var: ContextVar[_T], value: _T
+) -> Callable[_P, Awaitable[_R]]: ...
+
+
+@overload
+def bind_context_var(
+    fn: Callable[_P, _R], context_var: ContextVar[_T], value: _T
+) -> Callable[_P, _R]: ...
+
+
+def bind_context_var(
+    fn: Callable[_P, Awaitable[_R]] | Callable[_P, _R],
+    context_var: ContextVar[_T],
+    value: _T,
+) -> Callable[_P, Awaitable[_R]] | Callable[_P, _R]:
+    """Returns `fn` wrapped to set `context_var` to `value` while it runs.
+
+    Args:
+        fn: The function to wrap.
+        context_var: The context variable to set.
+        value: The value of the context variable while `fn` runs.
+    """
+    if fn_is_async(fn):
+
+        @wraps(fn)
+        async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            token = context_var.set(value)
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                context_var.reset(token)
+
+        return inner_async
+
+    @wraps(fn)
+    def inner(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+        token = context_var.set(value)
+        try:
+            return fn(*args, **kwargs)  # pyright: ignore [reportReturnType]
+        finally:
+            context_var.reset(token)
+
+    return inner
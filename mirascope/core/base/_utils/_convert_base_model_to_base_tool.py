@@ -8,9 +8,12 @@ from pydantic import BaseModel, create_model
 
 from ..from_call_args import is_from_call_args
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._source_cache import SourceCache
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
+_tool_types: SourceCache[type[BaseModel]] = SourceCache("model_tool_types")
+
 
 def convert_base_model_to_base_tool(
     model: type[BaseModel], base: type[BaseToolT]
@@ -26,8 +29,12 @@ def convert_base_model_to_base_tool(
         base: The base type to extend with the `BaseModel` fields.
 
     Returns:
-        The constructed `BaseModelT` type.
+        The constructed `BaseModelT` type. The same type is returned for repeated
+        conversions of the same `model` to the same `base`.
     """
+    if (cached := _tool_types.get(model, base)) is not None:
+        return cast(type[BaseToolT], cached)
+
     field_definitions = {
         field_name: (field_info.annotation, field_info)
         for field_name, field_info in model.model_fields.items()
@@ -45,4 +52,4 @@ def convert_base_model_to_base_tool(
     for name, value in inspect.getmembers(model):
         if not hasattr(tool_type, name) or name in ["_name", "_description", "call"]:
             setattr(tool_type, name, value)
-    return update_abstractmethods(tool_type)
+    return _tool_types.set(model, base, update_abstractmethods(tool_type))
@@ -6,19 +6,35 @@ from pydantic import BaseModel, create_model
 
 from ._base_type import BaseType
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._weak_lru_cache import WeakLRUCache
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
+_tool_types: WeakLRUCache[type[BaseModel]] = WeakLRUCache()
+
 
 def convert_base_type_to_base_tool(
     schema: type[BaseType], base: type[BaseToolT]
 ) -> type[BaseToolT]:
-    """Converts a `BaseType` to a `BaseToolT` type."""
+    """Converts a `BaseType` to a `BaseToolT` type.
+
+    The converted type is cached per `schema` and `base`, so repeated conversions of
+    the same type return the same class. Types that can't be hashed (e.g. `Annotated`
+    types with unhashable metadata) are converted without being cached.
+    """
     if get_origin(schema) == Annotated:
         schema.__name__ = get_args(schema)[0].__name__
-    return create_model(
+    try:
+        tool_type = _tool_types.get(schema, base)
+        cacheable = True
+    except TypeError:  # e.g. `Annotated` with unhashable metadata
+        tool_type, cacheable = None, False
+    if tool_type is not None:
+        return tool_type  # pyright: ignore [reportReturnType]
+    tool_type = create_model(
         schema.__name__,
         __base__=base,
         __doc__=DEFAULT_TOOL_DOCSTRING,
         value=(schema, ...),
     )
+    return _tool_types.set(schema, base, tool_type) if cacheable else tool_type
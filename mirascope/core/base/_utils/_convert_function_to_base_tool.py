@@ -9,15 +9,20 @@ from pydantic import BaseModel, create_model
 from pydantic.fields import FieldInfo
 
 from ._default_tool_docstring import DEFAULT_TOOL_DOCSTRING
+from ._source_cache import SourceCache
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 
+_tool_types: SourceCache[type[BaseModel]] = SourceCache("function_tool_types")
+
 
 def convert_function_to_base_tool(
     fn: Callable,
     base: type[BaseToolT],
     __doc__: str | None = None,
     __namespace__: str | None = None,
+    *,
+    use_cache: bool = True,
 ) -> type[BaseToolT]:
     """Constructs a `BaseToolT` type from the given function.
 
@@ -30,6 +35,9 @@ def convert_function_to_base_tool(
         base: The `BaseToolT` type to which the function is converted.
         __doc__: The docstring to use for the constructed `BaseToolT` type.
         __namespace__: The namespace to use for the constructed `BaseToolT` type.
+        use_cache: Whether to return a previously constructed type for the same `fn`,
+            `base`, `__doc__`, and `__namespace__` instead of constructing a new one.
+            Callers that mutate the returned type must set this to `False`.
 
     Returns:
         The constructed `BaseToolT` type.
@@ -41,6 +49,10 @@ def convert_function_to_base_tool(
         ValueError: if a given function's parameter is in the docstring args section but
             doesn't have a docstring description.
     """
+    cache_key = (base, __doc__, __namespace__)
+    if use_cache and (cached := _tool_types.get(fn, cache_key)) is not None:
+        return cast(type[BaseToolT], cached)
+
     docstring, examples = None, []
     func_doc = __doc__ or fn.__doc__
     if func_doc:
@@ -123,4 +135,5 @@ def convert_function_to_base_tool(
         model.call = call_async  # pyright: ignore [reportAttributeAccessIssue]
     else:
         model.call = call  # pyright: ignore [reportAttributeAccessIssue]
-    return update_abstractmethods(model)
+    model = update_abstractmethods(model)
+    return _tool_types.set(fn, cache_key, model) if use_cache else model
@@ -0,0 +1,122 @@
+"""This module contains the process-wide registry of default provider clients.
+
+When no `client` is provided to a call, each provider falls back to a default client.
+Constructing a new client on every call throws away its connection pool, so we share a
+single default client per provider and configuration instead.
+"""
+
+import asyncio
+import atexit
+import inspect
+import os
+import threading
+from collections.abc import Callable, Generator, Hashable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
+
+_ClientT = TypeVar("_ClientT")
+
+_lock = threading.RLock()
+_sync_clients: dict[Hashable, Any] = {}
+_async_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, Any]] = (
+    WeakKeyDictionary()
+)
+_captured_clients: ContextVar[list[Any] | None] = ContextVar(
+    "_captured_clients", default=None
+)
+
+
+def get_default_client(
+    factory: Callable[[], _ClientT],
+    *,
+    key: Hashable = None,
+    is_async: bool = False,
+    env_vars: tuple[str, ...] = (),
+) -> _ClientT:
+    """Returns the shared default client for `key`, creating it with `factory` once.
+
+    Clients are keyed by `key` (defaulting to `factory`) and the current values of
+    `env_vars`, which should include any credentials or configuration the client reads
+    from the environment so that changing them results in a new client. Async clients
+    are bound to the event loop they were created in, so they are additionally isolated
+    per running loop and are never shared when there is no running loop.
+
+    Args:
+        factory: The function to call to construct a new client.
+        key: The key identifying the client. Defaults to `factory`.
+        is_async: Whether the client is an async client.
+        env_vars: The environment variables the client reads its configuration from.
+
+    Returns:
+        The shared default client.
+    """
+    cache_key = (
+        factory if key is None else key,
+        tuple(os.environ.get(env_var) for env_var in env_vars),
+    )
+    with _lock:
+        try:
+            clients = (
+                _async_clients.setdefault(asyncio.get_running_loop(), {})
+                if is_async
+                else _sync_clients
+            )
+        except RuntimeError:
+            client = factory()
+        else:
+            if cache_key not in clients:
+                clients[cache_key] = factory()
+            client = clients[cache_key]
+    if (captured_clients := _captured_clients.get()) is not None:
+        captured_clients.append(client)
+    return client
+
+
+@contextmanager
+def capture_default_clients() -> Generator[list[Any], None, None]:
+    """Collects the default clients returned by `get_default_client` in the block.
+
+    This lets a call that wasn't given a client find out which default client its
+    provider used, e.g. to apply the rate limits of the client's API key.
+
+    Yields:
+        The list to which the default clients are appended as they're returned.
+    """
+    clients: list[Any] = []
+    token = _captured_clients.set(clients)
+    try:
+        yield clients
+    finally:
+        _captured_clients.reset(token)
+
+
+def close_default_clients() -> None:
+    """Closes and removes all shared default sync clients.
+
+    Default async clients can only be closed from within their event loop, so they are
+    dropped without being closed. Use `aclose_default_clients` from within a running
+    loop to close them. This is registered to run automatically on interpreter exit.
+    """
+    with _lock:
+        clients = list(_sync_clients.values())
+        _sync_clients.clear()
+        _async_clients.clear()
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close):
+            close()
+
+
+async def aclose_default_clients() -> None:
+    """Closes and removes all shared default async clients of the running event loop."""
+    with _lock:
+        clients = list(_async_clients.pop(asyncio.get_running_loop(), {}).values())
+    for client in clients:
+        close = getattr(client, "close", None)
+        if callable(close) and inspect.isawaitable(result := close()):
+            await result
+
+
+atexit.register(close_default_clients)
@@ -0,0 +1,18 @@
+"""Utility for base64 encoding media, reusing the encoding of cached media."""
+
+import base64
+
+from ..media_loader import get_media_loader
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode("utf-8")
+
+
+def encode_media_base64(data: bytes) -> str:
+    """Returns the base64 encoding of media `data`.
+
+    The encoding is memoized by the current media loader's cache, if any, so the same
+    media is only encoded once across calls.
+    """
+    return get_media_loader().derive(data, "base64", _b64encode)
@@ -0,0 +1,188 @@
+"""This module contains utilities for calling tools concurrently."""
+
+import asyncio
+import concurrent.futures
+import inspect
+import time
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from ..tool import BaseTool
+
+_BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
+
+
+def call_tool(tool: BaseTool) -> Any:  # noqa: ANN401
+    """Calls `tool`, running it to completion if its `call` method is async."""
+    output = tool.call()
+    if inspect.isawaitable(output):
+        return asyncio.run(output)  # pyright: ignore [reportArgumentType]
+    return output
+
+
+async def call_tool_async(
+    tool: BaseTool, semaphore: asyncio.Semaphore | None = None
+) -> Any:  # noqa: ANN401
+    """Calls `tool`, running it in a thread if its `call` method is sync.
+
+    Args:
+        tool: The tool to call.
+        semaphore: A semaphore to acquire while the tool is called, if any.
+    """
+    if semaphore is not None:
+        async with semaphore:
+            return await call_tool_async(tool)
+    if inspect.iscoroutinefunction(tool.call):
+        return await tool.call()
+    return await asyncio.to_thread(tool.call)
+
+
+def _timeout_error(tool: BaseTool, timeout: float) -> TimeoutError:
+    return TimeoutError(f"Tool `{tool._name()}` timed out after {timeout} seconds")
+
+
+def get_tool_outputs(
+    tools: Sequence[_BaseToolT],
+    futures: Sequence[concurrent.futures.Future],
+    timeout: float | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Waits for the `futures` of the `tools`' calls and returns their outputs.
+
+    Args:
+        tools: The tools that were called.
+        futures: The futures of the tools' calls, in the order of `tools`.
+        timeout: The number of seconds each tool has to return, counted from when
+            `get_tool_outputs` is called.
+
+    Returns:
+        The list of tools paired with their outputs, in the order of `tools`.
+
+    Raises:
+        TimeoutError: If a tool doesn't return within `timeout`.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    tools_and_outputs = []
+    for tool, future in zip(tools, futures, strict=True):
+        remaining = (
+            max(deadline - time.monotonic(), 0) if deadline is not None else None
+        )
+        try:
+            tools_and_outputs.append((tool, future.result(timeout=remaining)))
+        except concurrent.futures.TimeoutError:
+            raise _timeout_error(tool, timeout) from None  # pyright: ignore [reportArgumentType]
+    return tools_and_outputs
+
+
+async def get_tool_outputs_async(
+    tools: Sequence[_BaseToolT],
+    futures: Sequence[asyncio.Future | concurrent.futures.Future],
+    timeout: float | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Awaits the `futures` of the `tools`' calls and returns their outputs.
+
+    Args:
+        tools: The tools that were called.
+        futures: The futures of the tools' calls, in the order of `tools`.
+        timeout: The number of seconds each tool has to return, counted from when
+            `get_tool_outputs_async` is called.
+
+    Returns:
+        The list of tools paired with their outputs, in the order of `tools`.
+
+    Raises:
+        TimeoutError: If a tool doesn't return within `timeout`.
+    """
+
+    async def get_output(
+        tool: _BaseToolT, future: asyncio.Future | concurrent.futures.Future
+    ) -> Any:  # noqa: ANN401
+        if isinstance(future, concurrent.futures.Future):
+            future = asyncio.wrap_future(future)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise _timeout_error(tool, timeout) from None  # pyright: ignore [reportArgumentType]
+
+    outputs = await asyncio.gather(
+        *(get_output(tool, future) for tool, future in zip(tools, futures, strict=True))
+    )
+    return list(zip(tools, outputs, strict=True))
+
+
+def execute_tools(
+    tools: Sequence[_BaseToolT],
+    *,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Calls the `tools` concurrently on a thread pool and returns their outputs.
+
+    Tools with an async `call` method are run to completion in their worker thread, so
+    they can be called even when the caller is already running an event loop.
+
+    Args:
+        tools: The tools to call.
+        max_workers: The maximum number of tools to call at once. Defaults to calling
+            every tool at once.
+        timeout: The number of seconds each tool has to return, counted from when
+            `execute_tools` is called. Tools waiting for a free worker because of
+            `max_workers` use up their timeout while they wait.
+
+    Returns:
+        The list of tools paired with their outputs, in the order of `tools`.
+
+    Raises:
+        TimeoutError: If a tool doesn't return within `timeout`.
+    """
+    if not tools:
+        return []
+    if (
+        len(tools) == 1
+        and timeout is None
+        and not inspect.iscoroutinefunction(tools[0].call)
+    ):
+        return [(tools[0], call_tool(tools[0]))]
+
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_workers or len(tools), thread_name_prefix="mirascope-tool"
+    )
+    try:
+        futures = [executor.submit(call_tool, tool) for tool in tools]
+        return get_tool_outputs(tools, futures, timeout)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def execute_tools_async(
+    tools: Sequence[_BaseToolT],
+    *,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+) -> list[tuple[_BaseToolT, Any]]:
+    """Calls the `tools` concurrently and returns their outputs.
+
+    Tools with an async `call` method are awaited together with `asyncio.gather`, and
+    tools with a sync `call` method are run in threads so they don't block the loop. If
+    a tool raises or times out, the tools that are still running are cancelled.
+
+    Args:
+        tools: The tools to call.
+        max_workers: The maximum number of tools to call at once. Defaults to calling
+            every tool at once.
+        timeout: The number of seconds each tool has to return, counted from when
+            `execute_tools_async` is called. Tools waiting for their turn because of
+            `max_workers` use up their timeout while they wait.
+
+    Returns:
+        The list of tools paired with their outputs, in the order of `tools`.
+
+    Raises:
+        TimeoutError: If a tool doesn't return within `timeout`.
+    """
+    semaphore = asyncio.Semaphore(max_workers) if max_workers else None
+    tasks = [asyncio.ensure_future(call_tool_async(tool, semaphore)) for tool in tools]
+    try:
+        return await get_tool_outputs_async(tools, tasks, timeout)
+    finally:
+        for task in tasks:
+            task.cancel()
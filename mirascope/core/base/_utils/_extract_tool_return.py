@@ -5,7 +5,7 @@ from typing import Any, TypeAlias, TypeVar
 import jiter
 from pydantic import BaseModel
 
-from .._partial import partial
+from .. import _partial
 from ._base_type import BaseType, is_base_type
 from ._convert_base_type_to_base_tool import convert_base_type_to_base_tool
 
@@ -32,11 +32,11 @@ def extract_tool_return(
     if is_base_type(response_model):
         temp_model = convert_base_type_to_base_tool(response_model, BaseModel)
         if allow_partial:
-            return partial(temp_model).model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
+            return _partial.partial(temp_model).model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
         return temp_model.model_validate(json_obj).value  # pyright: ignore [reportAttributeAccessIssue]
     if fields_from_call_args and isinstance(json_obj, dict):
         # Support only top-level dict
         json_obj.update(fields_from_call_args)
     if allow_partial:
-        return partial(response_model).model_validate(json_obj)
+        return _partial.partial(response_model).model_validate(json_obj)
     return response_model.model_validate(json_obj)
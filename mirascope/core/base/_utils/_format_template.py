@@ -1,29 +1,56 @@
 """This module contains the `format_template` function."""
 
 import inspect
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 from ._get_template_values import get_template_values
 from ._get_template_variables import get_template_variables
 
 
-def format_template(template: str, attrs: dict[str, Any]) -> str:
-    """Formats the given prompt `template`
+class CompiledFormatTemplate(NamedTuple):
+    """A dedented format string along with the template variables it references."""
+
+    format_string: str
+    template_vars: list[tuple[str, str | None]]
+
+    def render(self, attrs: dict[str, Any]) -> str:
+        """Returns the compiled template formatted with the given `attrs`."""
+        values = get_template_values(self.template_vars, attrs)
+        return self.format_string.format(**values).strip()
+
+
+@lru_cache(maxsize=1024)
+def compile_format_template(template: str) -> CompiledFormatTemplate:
+    """Returns the given prompt `template` compiled for repeated formatting.
+
+    Dedenting the template and parsing its variables only depends on the template
+    string, so we do it once per template and cache the result.
 
     Args:
-        template: The template to format.
-        attrs: The attributes to use for formatting.
+        template: The template to compile.
 
     Returns:
-        The formatted template.
-
+        The compiled template.
     """
     dedented_template = inspect.cleandoc(template).strip()
     template_vars = get_template_variables(dedented_template, True)
 
-    values = get_template_values(template_vars, attrs)
-
     # Remove any special format specs that are actually invalid normally
     dedented_template = dedented_template.replace(":lists", "").replace(":list", "")
 
-    return dedented_template.format(**values).strip()
+    return CompiledFormatTemplate(dedented_template, template_vars)
+
+
+def format_template(template: str, attrs: dict[str, Any]) -> str:
+    """Formats the given prompt `template`
+
+    Args:
+        template: The template to format.
+        attrs: The attributes to use for formatting.
+
+    Returns:
+        The formatted template.
+
+    """
+    return compile_format_template(template).render(attrs)
@@ -9,6 +9,10 @@ from pydantic import BaseModel
 from mirascope.core.base._utils import get_fn_args
 from mirascope.core.base.from_call_args import is_from_call_args
 
+from ._weak_lru_cache import WeakLRUCache
+
+_call_args_fields: WeakLRUCache[frozenset[str]] = WeakLRUCache()
+
 
 def get_fields_from_call_args(
     response_model: object,
@@ -20,11 +24,19 @@ def get_fields_from_call_args(
         response_model = origin
     if not (inspect.isclass(response_model) and issubclass(response_model, BaseModel)):
         return {}
-    call_args_fields = {
-        name
-        for name, field in response_model.model_fields.items()
-        if is_from_call_args(field)
-    }
+    call_args_fields = _call_args_fields.get(response_model)
+    if call_args_fields is None:
+        call_args_fields = _call_args_fields.set(
+            response_model,
+            None,
+            frozenset(
+                name
+                for name, field in response_model.model_fields.items()
+                if is_from_call_args(field)
+            ),
+        )
+    if not call_args_fields:
+        return {}
 
     fn_args = get_fn_args(fn, args, kwargs)
     if not call_args_fields.issubset(fn_args.keys()):
@@ -4,20 +4,98 @@ import inspect
 from collections.abc import Callable
 from typing import Any
 
+from ._weak_lru_cache import WeakLRUCache
+
+_Parameter = inspect.Parameter
+
+
+class _FnArgsBinder:
+    """Binds `args` and `kwargs` to a precomputed function signature.
+
+    This mirrors `Signature.bind_partial` followed by `BoundArguments.apply_defaults`,
+    flattening any `**kwargs` into the resulting dictionary. Anything the fast path
+    doesn't handle (e.g. too many or duplicate arguments) falls back to `inspect`, so
+    errors are identical to binding the signature directly.
+    """
+
+    def __init__(self, fn: Callable) -> None:
+        self.signature = inspect.signature(fn)
+        parameters = list(self.signature.parameters.values())
+        self.parameters = [
+            (param.name, param.kind, param.default) for param in parameters
+        ]
+        self.positional_names = [
+            param.name
+            for param in parameters
+            if param.kind
+            in (_Parameter.POSITIONAL_ONLY, _Parameter.POSITIONAL_OR_KEYWORD)
+        ]
+        self.keyword_names = {
+            param.name
+            for param in parameters
+            if param.kind in (_Parameter.POSITIONAL_OR_KEYWORD, _Parameter.KEYWORD_ONLY)
+        }
+        self.has_var_positional = any(
+            param.kind == _Parameter.VAR_POSITIONAL for param in parameters
+        )
+        self.has_var_keyword = any(
+            param.kind == _Parameter.VAR_KEYWORD for param in parameters
+        )
+
+    def bind(self, args: tuple[object, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Returns the `args` and `kwargs` as a dictionary bound by the signature."""
+        extra_args = args[len(self.positional_names) :]
+        if extra_args and not self.has_var_positional:
+            return self._bind_slow(args, kwargs)
+
+        values = dict(zip(self.positional_names, args, strict=False))
+        extra_kwargs = {}
+        for name, value in kwargs.items():
+            if name in self.keyword_names:
+                if name in values:
+                    return self._bind_slow(args, kwargs)
+                values[name] = value
+            elif self.has_var_keyword:
+                extra_kwargs[name] = value
+            else:
+                return self._bind_slow(args, kwargs)
+
+        fn_args = {}
+        for name, kind, default in self.parameters:
+            if kind == _Parameter.VAR_POSITIONAL:
+                fn_args[name] = extra_args
+            elif kind == _Parameter.VAR_KEYWORD:
+                fn_args.update(extra_kwargs)
+            elif name in values:
+                fn_args[name] = values[name]
+            elif default is not _Parameter.empty:
+                fn_args[name] = default
+        return fn_args
+
+    def _bind_slow(
+        self, args: tuple[object, ...], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        bound_args = self.signature.bind_partial(*args, **kwargs)
+        bound_args.apply_defaults()
+
+        fn_args = {}
+        for name, value in bound_args.arguments.items():
+            if self.signature.parameters[name].kind == _Parameter.VAR_KEYWORD:
+                fn_args.update(value)
+            else:
+                fn_args[name] = value
+
+        return fn_args
+
+
+_binders: WeakLRUCache[_FnArgsBinder] = WeakLRUCache()
+
 
 def get_fn_args(
     fn: Callable, args: tuple[object, ...], kwargs: dict[str, Any]
 ) -> dict[str, Any]:
     """Returns the `args` and `kwargs` as a dictionary bound by `fn`'s signature."""
-    signature = inspect.signature(fn)
-    bound_args = signature.bind_partial(*args, **kwargs)
-    bound_args.apply_defaults()
-
-    fn_args = {}
-    for name, value in bound_args.arguments.items():
-        if signature.parameters[name].kind == inspect.Parameter.VAR_KEYWORD:
-            fn_args.update(value)
-        else:
-            fn_args[name] = value
-
-    return fn_args
+    binder = _binders.get(fn)
+    if binder is None:
+        binder = _binders.set(fn, None, _FnArgsBinder(fn))
+    return binder.bind(args, kwargs)
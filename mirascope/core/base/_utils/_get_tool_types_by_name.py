@@ -0,0 +1,21 @@
+"""This module contains the `get_tool_types_by_name` function."""
+
+from typing import TypeVar
+
+from ..tool import BaseTool
+
+_BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
+
+
+def get_tool_types_by_name(
+    tool_types: list[type[_BaseToolT]],
+) -> dict[str, type[_BaseToolT]]:
+    """Returns the tool types indexed by their names.
+
+    If multiple tool types share the same name, the first one is used so that looking a
+    tool type up by name matches searching through `tool_types` in order.
+    """
+    tool_types_by_name: dict[str, type[_BaseToolT]] = {}
+    for tool_type in tool_types:
+        tool_types_by_name.setdefault(tool_type._name(), tool_type)
+    return tool_types_by_name
@@ -0,0 +1,93 @@
+"""This module contains the `IncrementalItemExtractor` class."""
+
+import inspect
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+from ._base_type import BaseType
+from ._incremental_json_parser import IncrementalJsonParser
+
+_ItemT = TypeVar("_ItemT", bound=BaseModel | BaseType)
+
+_ARRAY_KEY = "value"
+
+
+class IncrementalItemExtractor(Generic[_ItemT]):
+    """Extracts each item of a streamed sequence of items as soon as it's complete.
+
+    The items can either be streamed as the `{"value": [...]}` array that the tool for
+    `list[item_model]` expects or, for `BaseModel` items, as a sequence of top-level JSON
+    objects (e.g. newline-delimited JSON) with one item per object. Items of a
+    `BaseModel` that has its own `value` field can only be streamed as top-level objects.
+
+    Every item is validated on its own exactly once, and its parsed JSON is released as
+    soon as it has been validated so the parser only holds the item being streamed.
+    """
+
+    def __init__(
+        self, item_model: type[_ItemT], fields_from_call_args: dict[str, Any]
+    ) -> None:
+        self.item_model = item_model
+        self.fields_from_call_args = fields_from_call_args
+        self._parser = IncrementalJsonParser()
+        self._num_items = 0
+        self._validate: Callable[[Any], Any]
+        if inspect.isclass(item_model) and issubclass(item_model, BaseModel):
+            self._validate = self._validate_model
+            self._item_objects = True
+            self._array_key = (
+                None if _ARRAY_KEY in item_model.model_fields else _ARRAY_KEY
+            )
+        else:
+            self._validate = TypeAdapter(item_model).validate_python
+            self._item_objects = False
+            self._array_key = _ARRAY_KEY
+
+    def feed(self, chunk: str) -> list[_ItemT]:
+        """Parses the next `chunk` and returns the items it completed, in order."""
+        items = []
+        while chunk:
+            consumed = self._parser.feed(chunk)
+            items += self._extract_items()
+            if not self._parser.done:
+                break
+            chunk = chunk[consumed:]
+            self._parser, self._num_items = IncrementalJsonParser(), 0
+        return items
+
+    def complete(self) -> None:
+        """Checks that the streamed output didn't end partway through an object.
+
+        Raises:
+            ValueError: If the output ended before the current object was closed.
+        """
+        if self._parser.started:
+            raise ValueError("Invalid JSON: the streamed output ended unexpectedly")
+
+    def _extract_items(self) -> list[_ItemT]:
+        root = self._parser.value
+        if root is None:
+            return []
+        array = root.get(self._array_key) if self._array_key else None
+        if not isinstance(array, list):
+            if self._parser.done and self._item_objects:
+                return [self._validate(root)]
+            return []
+
+        num_complete = len(array)
+        open_path = self._parser.open_path
+        if len(open_path) > 1 and open_path[0] == self._array_key:
+            num_complete = open_path[1]
+        items = []
+        for i in range(self._num_items, num_complete):  # pyright: ignore [reportArgumentType]
+            items.append(self._validate(array[i]))
+            array[i] = None
+        self._num_items = max(self._num_items, num_complete)  # pyright: ignore [reportAttributeAccessIssue]
+        return items
+
+    def _validate_model(self, item: object) -> _ItemT:
+        if self.fields_from_call_args and isinstance(item, dict):
+            item = item | self.fields_from_call_args
+        return self.item_model.model_validate(item)  # pyright: ignore [reportAttributeAccessIssue]
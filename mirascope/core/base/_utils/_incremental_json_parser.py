@@ -0,0 +1,312 @@
+"""This module contains the `IncrementalJsonParser` class."""
+
+import re
+from typing import Any
+
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_NUMBER_CHARS = frozenset("+-.0123456789eE")
+_LITERALS = {"true": True, "false": False, "null": None}
+_WHITESPACE = frozenset(" \t\n\r")
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+# What the parser expects next inside the innermost open container.
+_KEY_OR_END, _KEY, _COLON, _VALUE, _VALUE_OR_END, _COMMA_OR_END = range(6)
+
+
+class _Frame:
+    __slots__ = ("container", "key", "expect", "path_key")
+
+    def __init__(
+        self,
+        container: dict[str, Any] | list[Any],
+        expect: int,
+        path_key: str | int | None,
+    ) -> None:
+        self.container = container
+        self.key: str | None = None
+        self.expect = expect
+        self.path_key = path_key
+
+
+class IncrementalJsonParser:
+    """Parses a streamed JSON object incrementally, one chunk at a time.
+
+    Each call to `feed` only does work proportional to the size of the chunk. The
+    partially parsed object is available at any point through `value` and matches what
+    `jiter.from_json(..., partial_mode="trailing-strings")` returns for the JSON
+    received so far: incomplete strings are included as far as they've been received,
+    while incomplete keys, numbers, and literals are omitted.
+
+    Any text before the first `{` and after the matching closing `}` is ignored.
+
+    Note that `value` is updated in place as more chunks are fed, so it should be copied
+    (or validated into a new object) before feeding more chunks if it needs to be kept.
+    """
+
+    def __init__(self) -> None:
+        self._root: dict[str, Any] | None = None
+        self._stack: list[_Frame] = []
+        self._done = False
+        # The scalar token currently being parsed, if any.
+        self._token: str | None = None  # "string", "key", "number", or "literal"
+        self._parts: list[str] = []
+        self._escape = ""
+        self._high_surrogate = ""
+        # Where the in-progress value is currently (provisionally) stored, if anywhere.
+        self._provisional: tuple[dict[str, Any] | list[Any], str | int] | None = None
+
+    @property
+    def started(self) -> bool:
+        """Whether the root object has started."""
+        return self._root is not None
+
+    @property
+    def done(self) -> bool:
+        """Whether the root object has been completely parsed."""
+        return self._done
+
+    @property
+    def value(self) -> dict[str, Any] | None:
+        """The object parsed so far, or `None` if the root object hasn't started."""
+        if self._token in ("string", "number", "literal"):
+            self._update_provisional()
+        return self._root
+
+    @property
+    def open_path(self) -> list[str | int]:
+        """The keys and indices from the root to the innermost incomplete value in
+        `value`.
+
+        Everything in `value` that is not on this path is complete and won't change.
+        """
+        path = [frame.path_key for frame in self._stack[1:]]
+        if self._provisional is not None:
+            path.append(self._provisional[1])
+        return path  # pyright: ignore [reportReturnType]
+
+    def feed(self, chunk: str) -> int:
+        """Parses the next `chunk` of the streamed JSON.
+
+        Returns the number of characters of `chunk` that were consumed, which is only
+        less than `len(chunk)` when the root object closed before the end of the chunk.
+        """
+        i, length = 0, len(chunk)
+        while i < length and not self._done:
+            if self._token == "string" or self._token == "key":
+                i = self._feed_string(chunk, i)
+                continue
+            char = chunk[i]
+            if self._token == "number":
+                if char in _NUMBER_CHARS:
+                    self._parts.append(char)
+                    i += 1
+                    continue
+                self._finish_number()
+                continue
+            if self._token == "literal":
+                if char.isalpha():
+                    self._parts.append(char)
+                    i += 1
+                    continue
+                self._finish_literal()
+                continue
+            i += 1
+            if self._root is None:
+                if char == "{":
+                    self._root = {}
+                    self._stack.append(_Frame(self._root, _KEY_OR_END, None))
+                continue
+            if char in _WHITESPACE:
+                continue
+            self._feed_structural(char)
+        return i
+
+    def _feed_structural(self, char: str) -> None:
+        frame = self._stack[-1]
+        expect = frame.expect
+        if expect in (_KEY_OR_END, _KEY):
+            if char == '"':
+                self._start_token("key")
+            elif char == "}" and expect == _KEY_OR_END:
+                self._close()
+            else:
+                self._error(char)
+        elif expect == _COLON:
+            if char != ":":
+                self._error(char)
+            frame.expect = _VALUE
+        elif expect == _COMMA_OR_END:
+            if char == ",":
+                is_dict = isinstance(frame.container, dict)
+                frame.expect = _KEY if is_dict else _VALUE
+            elif char == ("}" if isinstance(frame.container, dict) else "]"):
+                self._close()
+            else:
+                self._error(char)
+        elif char == "]" and expect == _VALUE_OR_END:
+            self._close()
+        elif char == "{" or char == "[":
+            container = {} if char == "{" else []
+            path_key = (
+                frame.key if isinstance(frame.container, dict) else len(frame.container)
+            )
+            self._add_value(container)
+            self._stack.append(
+                _Frame(
+                    container, _KEY_OR_END if char == "{" else _VALUE_OR_END, path_key
+                )
+            )
+        elif char == '"':
+            self._start_token("string")
+        elif char == "-" or char.isdigit():
+            self._start_token("number")
+            self._parts.append(char)
+        elif char in "tfn":
+            self._start_token("literal")
+            self._parts.append(char)
+        else:
+            self._error(char)
+
+    def _feed_string(self, chunk: str, i: int) -> int:
+        if self._escape:
+            return self._feed_escape(chunk, i)
+        match = _STRING_SPECIAL.search(chunk, i)
+        end = match.start() if match else len(chunk)
+        if end > i:
+            self._flush_high_surrogate()
+            self._parts.append(chunk[i:end])
+        if match is None:
+            return end
+        if match.group() == "\\":
+            self._escape = "\\"
+            return end + 1
+        self._flush_high_surrogate()
+        value = "".join(self._parts)
+        if self._token == "key":
+            self._token, self._parts = None, []
+            frame = self._stack[-1]
+            frame.key, frame.expect = value, _COLON
+        else:
+            self._finish_token(value)
+        return end + 1
+
+    def _feed_escape(self, chunk: str, i: int) -> int:
+        # Escapes are at most 6 characters long (a `\u` followed by 4 hex digits), so
+        # we consume the escape one character at a time until it's complete.
+        self._escape += chunk[i]
+        if self._escape[1] == "u":
+            if len(self._escape) < 6:
+                return i + 1
+            code = int(self._escape[2:], 16)
+            self._escape = ""
+            if 0xD800 <= code < 0xDC00:
+                self._flush_high_surrogate()
+                self._high_surrogate = chr(code)
+            elif 0xDC00 <= code < 0xE000 and self._high_surrogate:
+                high = ord(self._high_surrogate) - 0xD800
+                self._high_surrogate = ""
+                self._parts.append(chr(0x10000 + (high << 10) + (code - 0xDC00)))
+            else:
+                self._flush_high_surrogate()
+                self._parts.append(chr(code))
+            return i + 1
+        if self._escape[1] not in _ESCAPES:
+            self._error(self._escape)
+        self._flush_high_surrogate()
+        self._parts.append(_ESCAPES[self._escape[1]])
+        self._escape = ""
+        return i + 1
+
+    def _flush_high_surrogate(self) -> None:
+        if self._high_surrogate:
+            self._parts.append(self._high_surrogate)
+            self._high_surrogate = ""
+
+    def _start_token(self, token: str) -> None:
+        self._token, self._parts = token, []
+
+    def _finish_number(self) -> None:
+        number = self._parse_number("".join(self._parts))
+        if number is None:
+            self._error("".join(self._parts))
+        self._finish_token(number)
+
+    def _finish_literal(self) -> None:
+        literal = "".join(self._parts)
+        if literal not in _LITERALS:
+            self._error(literal)
+        self._finish_token(_LITERALS[literal])
+
+    def _finish_token(self, value: object) -> None:
+        self._token, self._parts = None, []
+        if self._provisional is not None:
+            container, key = self._provisional
+            self._provisional = None
+            if isinstance(container, list):
+                container.pop()
+        self._add_value(value)
+
+    def _update_provisional(self) -> None:
+        if self._token == "string":
+            self._parts = ["".join(self._parts)]
+            value, has_value = self._parts[0], True
+        elif self._token == "number":
+            value = self._parse_number("".join(self._parts))
+            has_value = value is not None
+        else:
+            literal = "".join(self._parts)
+            value, has_value = _LITERALS.get(literal), literal in _LITERALS
+        frame = self._stack[-1]
+        if self._provisional is None and has_value:
+            if isinstance(frame.container, dict):
+                self._provisional = (frame.container, frame.key)  # pyright: ignore [reportAttributeAccessIssue]
+                frame.container[frame.key] = value  # pyright: ignore [reportArgumentType]
+            else:
+                self._provisional = (frame.container, len(frame.container))
+                frame.container.append(value)
+        elif self._provisional is not None:
+            container, key = self._provisional
+            if has_value:
+                container[key] = value  # pyright: ignore [reportArgumentType, reportCallIssue]
+            else:
+                self._provisional = None
+                if isinstance(container, list):
+                    container.pop()
+                else:
+                    del container[key]  # pyright: ignore [reportArgumentType]
+
+    def _add_value(self, value: object) -> None:
+        frame = self._stack[-1]
+        if isinstance(frame.container, dict):
+            frame.container[frame.key] = value  # pyright: ignore [reportArgumentType]
+            frame.key = None
+        else:
+            frame.container.append(value)
+        frame.expect = _COMMA_OR_END
+
+    def _close(self) -> None:
+        self._stack.pop()
+        if not self._stack:
+            self._done = True
+
+    @staticmethod
+    def _parse_number(number: str) -> int | float | None:
+        if not _NUMBER.fullmatch(number):
+            return None
+        if "." in number or "e" in number or "E" in number:
+            return float(number)
+        return int(number)
+
+    @staticmethod
+    def _error(token: str) -> None:
+        raise ValueError(f"Invalid JSON: unexpected {token!r}")
@@ -0,0 +1,185 @@
+"""This module contains the `IncrementalToolReturnExtractor` class."""
+
+import inspect
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel, TypeAdapter
+
+from .. import _partial
+from ._base_type import BaseType
+from ._extract_tool_return import extract_tool_return
+from ._incremental_json_parser import IncrementalJsonParser
+
+_ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel | BaseType)
+
+
+def _supports_field_level_validation(model: type[BaseModel]) -> bool:
+    """Returns whether `model` can be validated one field at a time.
+
+    Validating fields independently only matches validating the model as a whole when
+    there are no validators that look at more than a single field and no aliases or
+    config options that change how the input maps to fields.
+    """
+    decorators = model.__pydantic_decorators__
+    config = model.model_config
+    return (
+        not decorators.model_validators
+        and not decorators.root_validators
+        and not decorators.field_validators
+        and not decorators.validators
+        and config.get("extra", None) in (None, "ignore")
+        and not config.get("frozen", False)
+        and all(
+            field.alias is None and field.validation_alias is None
+            for field in model.model_fields.values()
+        )
+    )
+
+
+def _get_item_validators(
+    model: type[BaseModel], name: str
+) -> tuple[Callable[[Any], Any], Callable[[Any], Any]] | None:
+    """Returns validators for complete and incomplete items of a `list[X]` field.
+
+    Returns `None` if field `name` of `model` is not a plain `list[X]` field whose items
+    can be validated independently of the list.
+    """
+    field = model.model_fields[name]
+    args = get_args(field.annotation)
+    annotation = next((arg for arg in args if arg is not type(None)), None)
+    if get_origin(annotation) is not list or field.metadata:
+        return None
+    (item_type,) = get_args(annotation) or (Any,)
+    if inspect.isclass(item_type) and issubclass(item_type, BaseModel):
+        return item_type.model_validate, _partial.partial(item_type).model_validate
+    if model.model_config.get("strict", None) is not None:
+        return None
+    validate_item = TypeAdapter(item_type).validate_python
+    return validate_item, validate_item
+
+
+class IncrementalToolReturnExtractor(Generic[_ResponseModelT]):
+    """Extracts partial response models from a streamed JSON output incrementally.
+
+    Calling `extract_tool_return(..., allow_partial=True)` on the accumulated output of
+    every chunk re-parses and re-validates the entire output each time. Instead, this
+    parses the output incrementally as chunks arrive and, whenever possible, validates
+    each top-level field only once it stops changing. Only the field currently being
+    streamed is re-validated, and for a `list` field only its incomplete last item is,
+    so each partial model costs time proportional to the chunk rather than the output.
+    Incomplete items of a `list` of models are returned as partial models.
+
+    The completed response model is always validated in full with `extract_tool_return`.
+    """
+
+    def __init__(
+        self,
+        response_model: type[_ResponseModelT],
+        fields_from_call_args: dict[str, Any],
+    ) -> None:
+        self.response_model = response_model
+        self.fields_from_call_args = fields_from_call_args
+        self._parser = IncrementalJsonParser()
+        self._chunks: list[str] = []
+        self._partial_model: type[BaseModel] | None = None
+        if inspect.isclass(response_model) and issubclass(response_model, BaseModel):
+            partial_model = _partial.partial(response_model)
+            if _supports_field_level_validation(partial_model):
+                self._partial_model = partial_model
+                self._scratch = partial_model.model_construct()
+                self._closed_fields: dict[str, Any] = {
+                    name: self._validate_field(name, value)
+                    for name, value in fields_from_call_args.items()
+                    if name in partial_model.model_fields
+                }
+                self._items: dict[str, list[Any]] = {}
+                self._item_validators: dict[
+                    str, tuple[Callable[[Any], Any], Callable[[Any], Any]] | None
+                ] = {}
+
+    @property
+    def started(self) -> bool:
+        """Whether the JSON output has started."""
+        return self._parser.started
+
+    def feed(self, chunk: str) -> None:
+        """Parses the next `chunk` of the streamed JSON output."""
+        self._chunks.append(chunk)
+        self._parser.feed(chunk)
+
+    def partial(self) -> _ResponseModelT:
+        """Returns the partial response model for the output streamed so far."""
+        json_obj = self._parser.value
+        if self._partial_model is None or json_obj is None:
+            return extract_tool_return(
+                self.response_model,
+                dict(json_obj) if json_obj is not None else "",
+                True,
+                self.fields_from_call_args,
+            )
+
+        open_path = self._parser.open_path
+        open_name = open_path[0] if open_path else None
+        model_fields = self._partial_model.model_fields
+        values = {}
+        for name, value in json_obj.items():
+            if name not in model_fields or name in self.fields_from_call_args:
+                continue
+            if name == open_name:
+                values[name] = self._validate_open_field(name, value, open_path[1:])
+            elif name in self._closed_fields:
+                values[name] = self._closed_fields[name]
+            else:
+                self._items.pop(name, None)
+                values[name] = self._closed_fields[name] = self._validate_field(
+                    name, value
+                )
+        for name in self.fields_from_call_args:
+            if name in model_fields:
+                values[name] = self._closed_fields[name]
+        return self._partial_model.model_construct(set(values), **values)  # pyright: ignore [reportReturnType]
+
+    def complete(self) -> _ResponseModelT:
+        """Returns the response model validated from the complete streamed output."""
+        if self._parser.done:
+            return extract_tool_return(
+                self.response_model,
+                dict(self._parser.value),  # pyright: ignore [reportArgumentType]
+                False,
+                self.fields_from_call_args,
+            )
+        json_output = "".join(self._chunks)
+        json_start = json_output.find("{")
+        json_output = json_output[json_start:] if json_start != -1 else ""
+        if json_output:
+            json_output = json_output[: json_output.rfind("}") + 1]
+        return extract_tool_return(
+            self.response_model, json_output, False, self.fields_from_call_args
+        )
+
+    def _validate_field(self, name: str, value: object) -> object:
+        model = self._partial_model
+        model.__pydantic_validator__.validate_assignment(self._scratch, name, value)  # pyright: ignore [reportOptionalMemberAccess]
+        return self._scratch.__dict__[name]
+
+    def _validate_open_field(
+        self, name: str, value: object, open_path: list[str | int]
+    ) -> object:
+        if name not in self._item_validators:
+            self._item_validators[name] = _get_item_validators(
+                self._partial_model,  # pyright: ignore [reportArgumentType]
+                name,
+            )
+        item_validators = self._item_validators[name]
+        if item_validators is None or not isinstance(value, list):
+            return self._validate_field(name, value)
+
+        validate_item, validate_open_item = item_validators
+        items = self._items.setdefault(name, [])
+        num_complete = open_path[0] if open_path else len(value)
+        for item in value[len(items) : num_complete]:  # pyright: ignore [reportOperatorIssue]
+            items.append(validate_item(item))
+        if num_complete == len(value):
+            return list(items)
+        return [*items, validate_open_item(value[-1])]
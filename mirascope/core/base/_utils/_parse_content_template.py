@@ -1,11 +1,13 @@
 """This module provides a function to parse content parts from a prompt template."""
 
 import re
-import urllib.request
+from collections.abc import Mapping
+from functools import lru_cache
 from typing import Any, Literal, cast
 
 from typing_extensions import TypedDict
 
+from ..media_loader import get_media_loader
 from ..message_param import (
     AudioPart,
     BaseMessageParam,
@@ -13,7 +15,7 @@ from ..message_param import (
     ImagePart,
     TextPart,
 )
-from ._format_template import format_template
+from ._format_template import CompiledFormatTemplate, compile_format_template
 from ._get_audio_type import get_audio_type
 from ._get_image_type import get_image_type
 
@@ -26,6 +28,11 @@ class _Part(TypedDict):
     options: dict[str, str] | None
 
 
+class _CompiledPart(TypedDict):
+    part: _Part
+    text: CompiledFormatTemplate | None
+
+
 def _parse_parts(template: str) -> list[_Part]:
     # \{ and \} match the literal curly braces.
     #
@@ -61,54 +68,73 @@ def _parse_parts(template: str) -> list[_Part]:
     return parts
 
 
-def _load_media(source: str | bytes) -> bytes:
-    try:
-        # Some typing weirdness here where checking `isinstance(source, bytes)` results
-        # in a type hint of `str | bytearray | memoryview` for source in the else.
-        if isinstance(source, bytes | bytearray | memoryview):
-            data = source
-        elif source.startswith(("http://", "https://", "data:", "file://")):
-            with urllib.request.urlopen(source) as response:
-                data = response.read()
-        else:
-            with open(source, "rb") as f:
-                data = f.read()
-        return data
-    except Exception as e:  # pragma: no cover
-        raise ValueError(
-            f"Failed to load or encode data from {source}"
-        ) from e  # pragma: no cover
+@lru_cache(maxsize=1024)
+def _compile_parts(template: str) -> tuple[_CompiledPart, ...]:
+    """Returns the parts of `template` with each text part's format string compiled."""
+    return tuple(
+        _CompiledPart(
+            part=part,
+            text=compile_format_template(part["template"].strip())
+            if part["type"] == "text"
+            else None,
+        )
+        for part in _parse_parts(template)
+    )
+
+
+def get_media_sources(template: str, attrs: dict[str, Any]) -> list[str]:
+    """Returns the URLs and file paths of the media referenced by `template`."""
+    sources = []
+    for compiled_part in _compile_parts(template):
+        part = compiled_part["part"]
+        if part["type"] in ("image", "audio"):
+            source = attrs.get(part["template"])
+            sources += [source] if isinstance(source, str) else []
+        elif part["type"] in ("images", "audios"):
+            part_sources = attrs.get(part["template"])
+            if isinstance(part_sources, list):
+                sources += [
+                    source for source in part_sources if isinstance(source, str)
+                ]
+    return sources
+
+
+def _load_media(source: str | bytes, media: Mapping[str, bytes]) -> bytes:
+    if isinstance(source, str) and source in media:
+        return media[source]
+    return get_media_loader().load(source)
 
 
 def _construct_image_part(
-    source: str | bytes, options: dict[str, str] | None
+    source: str | bytes, options: dict[str, str] | None, media: Mapping[str, bytes]
 ) -> ImagePart:
-    image = _load_media(source)
+    image = _load_media(source, media)
     detail = None
     if options:
         detail = options.get("detail", None)
+    image_type = get_media_loader().derive(image, "image_type", get_image_type)
     return ImagePart(
         type="image",
-        media_type=f"image/{get_image_type(image)}",
+        media_type=f"image/{image_type}",
         image=image,
         detail=detail,
     )
 
 
-def _construct_audio_part(source: str | bytes) -> AudioPart:
+def _construct_audio_part(source: str | bytes, media: Mapping[str, bytes]) -> AudioPart:
     # Note: audio does not currently support additional options, at least for now.
-    audio = _load_media(source)
-    return AudioPart(
-        type="audio", media_type=f"audio/{get_audio_type(audio)}", audio=audio
-    )
+    audio = _load_media(source, media)
+    audio_type = get_media_loader().derive(audio, "audio_type", get_audio_type)
+    return AudioPart(type="audio", media_type=f"audio/{audio_type}", audio=audio)
 
 
 def _construct_parts(
-    part: _Part, attrs: dict[str, Any]
+    compiled_part: _CompiledPart, attrs: dict[str, Any], media: Mapping[str, bytes]
 ) -> list[TextPart] | list[ImagePart] | list[AudioPart] | list[CacheControlPart]:
+    part = compiled_part["part"]
     if part["type"] == "image":
         source = attrs[part["template"]]
-        return [_construct_image_part(source, part["options"])] if source else []
+        return [_construct_image_part(source, part["options"], media)] if source else []
     elif part["type"] == "images":
         sources = attrs[part["template"]]
         if not isinstance(sources, list):
@@ -116,20 +142,27 @@ def _construct_parts(
                 f"When using 'images' template, '{part['template']}' must be a list."
             )
         return (
-            [_construct_image_part(source, part["options"]) for source in sources]
+            [
+                _construct_image_part(source, part["options"], media)
+                for source in sources
+            ]
             if sources
             else []
         )
     elif part["type"] == "audio":
         source = attrs[part["template"]]
-        return [_construct_audio_part(source)] if source else []
+        return [_construct_audio_part(source, media)] if source else []
     elif part["type"] == "audios":
         sources = attrs[part["template"]]
         if not isinstance(sources, list):
             raise ValueError(
                 f"When using 'audios' template, '{part['template']}' must be a list."
             )
-        return [_construct_audio_part(source) for source in sources] if sources else []
+        return (
+            [_construct_audio_part(source, media) for source in sources]
+            if sources
+            else []
+        )
     elif part["type"] == "cache_control":
         return [
             CacheControlPart(
@@ -140,23 +173,34 @@ def _construct_parts(
             )
         ]
     else:  # text type
-        formatted_template = format_template(part["template"].strip(), attrs)
+        formatted_template = cast(CompiledFormatTemplate, compiled_part["text"]).render(
+            attrs
+        )
         if not formatted_template:
             return []
         return [TextPart(type="text", text=formatted_template)]
 
 
 def parse_content_template(
-    role: str, template: str, attrs: dict[str, Any]
+    role: str,
+    template: str,
+    attrs: dict[str, Any],
+    media: Mapping[str, bytes] | None = None,
 ) -> BaseMessageParam | None:
-    """Returns the content template parsed and formatted as a message parameter."""
+    """Returns the content template parsed and formatted as a message parameter.
+
+    Media that isn't in the already loaded `media` is loaded concurrently with the
+    current `MediaLoader`.
+    """
     if not template:
         return None
 
+    if media is None:
+        media = get_media_loader().load_all(get_media_sources(template, attrs))
     parts = [
         item
-        for part in _parse_parts(template)
-        for item in _construct_parts(part, attrs)
+        for part in _compile_parts(template)
+        for item in _construct_parts(part, attrs, media)
     ]
 
     if not parts:
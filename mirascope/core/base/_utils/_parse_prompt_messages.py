@@ -1,62 +1,180 @@
 """This module provides a function to parse messages from a prompt template."""
 
 import re
+from collections.abc import Callable, Mapping
+from contextvars import ContextVar
+from functools import lru_cache
 from typing import Any, TypeVar
 
 from pydantic import BaseModel
 
 from ..call_params import BaseCallParams
 from ..dynamic_config import BaseDynamicConfig
+from ..media_loader import get_media_loader
 from ..message_param import BaseMessageParam
+from ._get_prompt_template import get_prompt_template
 from ._get_template_variables import get_template_variables
-from ._parse_content_template import parse_content_template
+from ._parse_content_template import get_media_sources, parse_content_template
 
 BaseToolT = TypeVar("BaseToolT", bound=BaseModel)
 _MessageParamT = TypeVar("_MessageParamT", bound=Any)
 _CallParamsT = TypeVar("_CallParamsT", bound=BaseCallParams)
 
+preloaded_media: ContextVar[Mapping[str, bytes] | None] = ContextVar(
+    "preloaded_media", default=None
+)
 
-def parse_prompt_messages(
-    roles: list[str],
-    template: str,
-    attrs: dict[str, Any],
-    dynamic_config: BaseDynamicConfig[_MessageParamT, _CallParamsT] = None,
-) -> list[BaseMessageParam]:
-    """Returns messages parsed from the provided prompt `template`.
 
-    Raises:
-        ValueError: if `MESSAGES` keyword is used with a non-list attribute.
+@lru_cache(maxsize=1024)
+def _compile_role_segments(
+    roles: tuple[str, ...], template: str
+) -> tuple[tuple[str, str], ...]:
+    """Returns the `(role, content)` segments of `template` for the given `roles`.
+
+    For `MESSAGES` segments the content is the name of the referenced attribute.
     """
-    if dynamic_config is not None:
-        computed_fields = dynamic_config.get("computed_fields", None)
-        if computed_fields:
-            attrs |= computed_fields
-    messages = []
+    segments = []
     re_roles = "|".join([role.upper() for role in roles] + ["MESSAGES"])
     for match in re.finditer(rf"({re_roles}):((.|\n)+?)(?=({re_roles}):|\Z)", template):
         role, content_template = match.group(1).lower(), match.group(2).strip()
         if role == "messages":
-            template_variables = get_template_variables(content_template, False)
-            if template_variables[0].startswith("self"):
+            content_template = get_template_variables(content_template, False)[0]
+        segments.append((role, content_template))
+    return tuple(segments)
+
+
+def _get_media_sources(
+    roles: list[str], template: str, attrs: dict[str, Any]
+) -> list[str]:
+    """Returns the URLs and file paths of the media referenced by `template`."""
+    content_templates = [
+        content_template
+        for role, content_template in _compile_role_segments(tuple(roles), template)
+        if role != "messages"
+    ]
+    return [
+        source
+        for content_template in content_templates or [template]
+        for source in get_media_sources(content_template, attrs)
+    ]
+
+
+def _parse_prompt_messages(
+    roles: list[str],
+    template: str,
+    attrs: dict[str, Any],
+    media: Mapping[str, bytes],
+) -> list[BaseMessageParam]:
+    messages = []
+    for role, content_template in _compile_role_segments(tuple(roles), template):
+        if role == "messages":
+            if content_template.startswith("self"):
                 if "self" not in attrs:
                     raise ValueError(
                         "MESSAGES keyword used with `self.` but `self` was not found."
                     )
-                attr = getattr(attrs["self"], template_variables[0][5:])
+                attr = getattr(attrs["self"], content_template[5:])
             else:
-                attr = attrs[template_variables[0]]
+                attr = attrs[content_template]
             if attr is None or not isinstance(attr, list):
                 raise ValueError(
-                    f"MESSAGES keyword used with attribute `{template_variables[0]}`"
+                    f"MESSAGES keyword used with attribute `{content_template}`"
                     ", which is not a `list` of messages."
                 )
             messages += attr
         else:
-            content = parse_content_template(role, content_template, attrs)
+            content = parse_content_template(role, content_template, attrs, media)
             if content:
                 messages.append(content)
     if len(messages) == 0:
-        content = parse_content_template("user", template, attrs)
+        content = parse_content_template("user", template, attrs, media)
         if content:
             messages.append(content)
     return messages
+
+
+def parse_prompt_messages(
+    roles: list[str],
+    template: str,
+    attrs: dict[str, Any],
+    dynamic_config: BaseDynamicConfig[_MessageParamT, _CallParamsT] = None,
+) -> list[BaseMessageParam]:
+    """Returns messages parsed from the provided prompt `template`.
+
+    The media referenced by the template is loaded concurrently with the current
+    `MediaLoader`, except for the media that was already loaded into `preloaded_media`.
+
+    Raises:
+        ValueError: if `MESSAGES` keyword is used with a non-list attribute.
+    """
+    if dynamic_config is not None:
+        computed_fields = dynamic_config.get("computed_fields", None)
+        if computed_fields:
+            attrs |= computed_fields
+    media = preloaded_media.get() or {}
+    sources = _get_media_sources(roles, template, attrs)
+    if any(source not in media for source in sources):
+        media = {
+            **media,
+            **get_media_loader().load_all(
+                source for source in sources if source not in media
+            ),
+        }
+    return _parse_prompt_messages(roles, template, attrs, media)
+
+
+async def parse_prompt_messages_async(
+    roles: list[str],
+    template: str,
+    attrs: dict[str, Any],
+    dynamic_config: BaseDynamicConfig[_MessageParamT, _CallParamsT] = None,
+) -> list[BaseMessageParam]:
+    """Returns messages parsed from the provided prompt `template`.
+
+    The media referenced by the template is loaded concurrently with the current
+    `MediaLoader` without blocking the event loop.
+
+    Raises:
+        ValueError: if `MESSAGES` keyword is used with a non-list attribute.
+    """
+    if dynamic_config is not None:
+        computed_fields = dynamic_config.get("computed_fields", None)
+        if computed_fields:
+            attrs |= computed_fields
+    sources = _get_media_sources(roles, template, attrs)
+    media = await get_media_loader().load_all_async(sources) if sources else {}
+    return _parse_prompt_messages(roles, template, attrs, media)
+
+
+async def load_prompt_media_async(
+    fn: Callable,
+    fn_args: dict[str, Any],
+    dynamic_config: BaseDynamicConfig[_MessageParamT, _CallParamsT],
+) -> dict[str, bytes]:
+    """Loads the media of the prompt template of a call without blocking the event loop.
+
+    The loaded media should be set as the `preloaded_media` while the call is set up so
+    that the media isn't loaded again while the prompt is parsed.
+
+    Args:
+        fn: The prompt template function of the call.
+        fn_args: The arguments of the call.
+        dynamic_config: The dynamic configuration of the call.
+
+    Returns:
+        The data of each media source.
+    """
+    computed_fields = None
+    if dynamic_config is not None:
+        if dynamic_config.get("messages", None):
+            return {}
+        computed_fields = dynamic_config.get("computed_fields", None)
+    try:
+        template = get_prompt_template(fn)
+    except ValueError:
+        # The missing template is reported when the call is set up.
+        return {}
+    sources = _get_media_sources(
+        ["system", "user", "assistant"], template, fn_args | (computed_fields or {})
+    )
+    return await get_media_loader().load_all_async(sources) if sources else {}
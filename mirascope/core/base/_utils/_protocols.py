@@ -648,6 +648,7 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SameSyncAndAsyncClientT | None = None,
         call_params: _BaseCallParamsT | None = None,
+        iterable: bool = False,
     ) -> LLMFunctionDecorator[
         _BaseDynamicConfigT, Iterable[_ResponseModelT], AsyncIterable[_ResponseModelT]
     ]: ...
@@ -664,6 +665,7 @@ class CallDecorator(
         json_mode: bool = False,
         client: _AsyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        iterable: bool = False,
     ) -> AsyncLLMFunctionDecorator[
         _BaseDynamicConfigT, AsyncIterable[_ResponseModelT]
     ]: ...
@@ -680,6 +682,7 @@ class CallDecorator(
         json_mode: bool = False,
         client: _SyncBaseClientT = ...,
         call_params: _BaseCallParamsT | None = None,
+        iterable: bool = False,
     ) -> SyncLLMFunctionDecorator[_BaseDynamicConfigT, Iterable[_ResponseModelT]]: ...
 
     @overload
@@ -719,6 +722,7 @@ class CallDecorator(
         | _SyncBaseClientT
         | None = None,
         call_params: _BaseCallParamsT | None = None,
+        iterable: bool = False,
     ) -> (
         AsyncLLMFunctionDecorator[
             _BaseDynamicConfigT,
@@ -15,14 +15,39 @@ from ..call_kwargs import BaseCallKwargs
 from ..call_params import BaseCallParams
 from ..dynamic_config import BaseDynamicConfig
 from ..message_param import BaseMessageParam
+from ..timings import measure
 from ..tool import BaseTool
 from . import get_prompt_template, parse_prompt_messages
 from ._convert_base_model_to_base_tool import convert_base_model_to_base_tool
 from ._convert_function_to_base_tool import convert_function_to_base_tool
+from ._weak_lru_cache import WeakLRUCache
 
 _BaseToolT = TypeVar("_BaseToolT", bound=BaseTool)
 _BaseDynamicConfigT = TypeVar("_BaseDynamicConfigT", bound=BaseDynamicConfig)
 
+_tool_schemas: WeakLRUCache[Any] = WeakLRUCache()
+
+
+def _get_tool_schema(tool_type: type[BaseTool]) -> Any:  # noqa: ANN401
+    """Returns the memoized `tool_schema()` of the given (generated) tool type."""
+    if (tool_schema := _tool_schemas.get(tool_type)) is None:
+        tool_schema = _tool_schemas.set(tool_type, None, tool_type.tool_schema())
+    return tool_schema
+
+
+def _convert_tools(
+    tools: list[type[BaseTool] | Callable],
+    tool_type: type[_BaseToolT],
+) -> tuple[list[type[_BaseToolT]], list[Any]]:
+    """Returns the `tools` converted to `tool_type` along with their tool schemas."""
+    tool_types = [
+        convert_base_model_to_base_tool(tool, tool_type)
+        if inspect.isclass(tool)
+        else convert_function_to_base_tool(tool, tool_type)
+        for tool in tools
+    ]
+    return tool_types, [_get_tool_schema(tool_type) for tool_type in tool_types]
+
 
 def setup_call(
     fn: Callable[..., _BaseDynamicConfigT | Awaitable[_BaseDynamicConfigT]]
@@ -42,7 +67,8 @@ def setup_call(
     call_kwargs = cast(BaseCallKwargs[_BaseToolT], dict(call_params))
     prompt_template, messages = None, None
     if dynamic_config is not None:
-        tools = dynamic_config.get("tools", tools)
+        if "tools" in dynamic_config:
+            tools = dynamic_config["tools"]
         messages = dynamic_config.get("messages", None)
         dynamic_call_params = dynamic_config.get("call_params", None)
         if dynamic_call_params:
@@ -51,21 +77,18 @@ def setup_call(
     if not messages:
         prompt_template = get_prompt_template(fn)
         assert prompt_template is not None, "The function must have a prompt template."
-        messages = parse_prompt_messages(
-            roles=["system", "user", "assistant"],
-            template=prompt_template,
-            attrs=fn_args,
-            dynamic_config=dynamic_config,
-        )
+        with measure("template_rendering"):
+            messages = parse_prompt_messages(
+                roles=["system", "user", "assistant"],
+                template=prompt_template,
+                attrs=fn_args,
+                dynamic_config=dynamic_config,
+            )
 
     tool_types = None
     if tools:
-        tool_types = [
-            convert_base_model_to_base_tool(tool, tool_type)
-            if inspect.isclass(tool)
-            else convert_function_to_base_tool(tool, tool_type)
-            for tool in tools
-        ]
-        call_kwargs["tools"] = [tool_type.tool_schema() for tool_type in tool_types]
+        with measure("tool_schemas"):
+            tool_types, tool_schemas = _convert_tools(tools, tool_type)
+        call_kwargs["tools"] = tool_schemas
 
     return prompt_template, messages, tool_types, call_kwargs
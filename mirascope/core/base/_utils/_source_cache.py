@@ -0,0 +1,54 @@
+"""A cache of values derived from a source object that is stored on the source."""
+
+import inspect
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+_ValueT = TypeVar("_ValueT")
+
+
+class SourceCache(Generic[_ValueT]):
+    """A cache of values derived from a source object (e.g. a function or class).
+
+    Derived values often reference their source (e.g. a tool type that calls the
+    function it was generated from or subclasses the model it was converted from), so
+    a cache that holds them would keep their sources alive forever even if it only
+    references the sources weakly. Instead, the entries are stored in an attribute of
+    the source itself, which ties their lifetime to the source: once the source is no
+    longer referenced, it is garbage collected along with its entries.
+
+    Only the source's own attribute is used, so subclasses of a cached class don't
+    share its entries. Sources that don't support attributes (e.g. bound methods, which
+    are re-created on every access, or builtins) are never cached.
+
+    Note that the cache is keyed by identity of the source, so mutating a source after
+    it has been cached will not invalidate its entry.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.attribute = f"__mirascope_{name}__"
+
+    def get(self, source: object, key: Hashable = None) -> _ValueT | None:
+        """Returns the cached value for `source` and `key` or `None` if missing."""
+        if inspect.ismethod(source):
+            return None
+        entries = getattr(source, "__dict__", {}).get(self.attribute, None)
+        return entries.get(key, None) if entries is not None else None
+
+    def set(self, source: object, key: Hashable, value: _ValueT) -> _ValueT:
+        """Caches `value` for `source` and `key` (if possible) and returns it."""
+        if inspect.ismethod(source):
+            return value
+        entries = getattr(source, "__dict__", {}).get(self.attribute, None)
+        if entries is None:
+            try:
+                setattr(source, self.attribute, entries := {})
+            except (AttributeError, TypeError, ValueError):
+                return value
+        entries[key] = value
+        return value
+
+    def clear(self, source: object) -> None:
+        """Removes all entries for `source` from the cache."""
+        if self.attribute in getattr(source, "__dict__", {}):
+            delattr(source, self.attribute)
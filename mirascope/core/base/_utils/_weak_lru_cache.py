@@ -0,0 +1,77 @@
+"""A bounded, thread-safe LRU cache keyed by weak references to a source object."""
+
+import inspect
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any, Generic, TypeVar
+
+_ValueT = TypeVar("_ValueT")
+
+
+def _weak_key(source: object, callback: Any = None) -> Hashable:  # noqa: ANN401
+    """Returns a weak reference to `source` or `source` itself if it can't be weakly
+    referenced.
+
+    Bound methods are re-created on every attribute access, so we reference them with a
+    `WeakMethod` that stays alive (and compares equal) for as long as the underlying
+    instance and function do.
+    """
+    try:
+        if inspect.ismethod(source):
+            return weakref.WeakMethod(source, callback)
+        return weakref.ref(source, callback)
+    except TypeError:
+        return source  # pyright: ignore [reportReturnType]
+
+
+class WeakLRUCache(Generic[_ValueT]):
+    """A bounded LRU cache whose keys are (weakly referenced) source objects.
+
+    Each entry is keyed by a source object (e.g. a function or class) plus any hashable
+    extra key. The source is referenced weakly, so entries are dropped as soon as their
+    source is garbage collected, and the cache never holds more than `maxsize` entries,
+    evicting the least recently used entry first.
+
+    Note that the cache is keyed by identity of the source, so mutating a source after
+    it has been cached will not invalidate its entry.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[Hashable, Hashable], _ValueT] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, source: object, key: Hashable = None) -> _ValueT | None:
+        """Returns the cached value for `source` and `key` or `None` if missing."""
+        cache_key = (_weak_key(source), key)
+        with self._lock:
+            value = self._entries.get(cache_key, None)
+            if value is not None:
+                self._entries.move_to_end(cache_key)
+            return value
+
+    def set(self, source: object, key: Hashable, value: _ValueT) -> _ValueT:
+        """Caches `value` for `source` and `key` and returns it."""
+        cache_key = (_weak_key(source, self._remove_source), key)
+        with self._lock:
+            self._entries[cache_key] = value
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remove_source(self, ref: weakref.ref) -> None:
+        """Removes all entries for a source that has been garbage collected."""
+        with self._lock:
+            for cache_key in [k for k in self._entries if k[0] is ref]:
+                del self._entries[cache_key]
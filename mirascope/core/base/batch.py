@@ -0,0 +1,279 @@
+"""This module contains functions for running a call over many inputs concurrently."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import inspect
+from collections.abc import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Mapping,
+    Sized,
+)
+from itertools import islice
+from typing import Any, Generic, TypeVar, overload
+
+from pydantic import BaseModel, ConfigDict, SkipValidation
+
+_R = TypeVar("_R")
+
+BatchArgs = tuple[Any, ...] | Mapping[str, Any]
+
+
+class BatchResult(BaseModel, Generic[_R]):
+    """The result of running a call on a single input of a batch.
+
+    Attributes:
+        index: The index of the input in the batch.
+        args: The positional arguments tuple or keyword arguments mapping of the input.
+        output: The output of the call, or `None` if it raised an exception.
+        error: The exception raised by the call, or `None` if it succeeded.
+    """
+
+    index: int
+    args: SkipValidation[BatchArgs]
+    output: SkipValidation[_R | None] = None
+    error: SkipValidation[Exception | None] = None
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+
+def _call(fn: Callable[..., Any], args: BatchArgs) -> Any:  # noqa: ANN401
+    if isinstance(args, Mapping):
+        return fn(**args)
+    return fn(*args)
+
+
+def _call_sync(fn: Callable[..., Any], args: BatchArgs) -> Any:  # noqa: ANN401
+    output = _call(fn, args)
+    if inspect.isawaitable(output):
+        return asyncio.run(output)  # pyright: ignore [reportArgumentType]
+    return output
+
+
+async def _call_async(fn: Callable[..., Any], args: BatchArgs) -> Any:  # noqa: ANN401
+    if inspect.iscoroutinefunction(fn):
+        return await _call(fn, args)
+    output = await asyncio.to_thread(_call, fn, args)
+    if inspect.isawaitable(output):
+        return await output
+    return output
+
+
+def _result(
+    index: int, args: BatchArgs, future: asyncio.Future | concurrent.futures.Future
+) -> BatchResult:
+    if (error := future.exception()) is not None:
+        if not isinstance(error, Exception):
+            raise error
+        return BatchResult(index=index, args=args, error=error)
+    return BatchResult(index=index, args=args, output=future.result())
+
+
+def _capacity(max_concurrency: int, pending: Sized, completed: Sized) -> int:
+    """Returns the number of inputs that can be scheduled.
+
+    Results that completed ahead of an earlier input are buffered until they can be
+    yielded in order, so we stop scheduling inputs once `max_concurrency` results are
+    buffered to keep a slow input from growing the buffer without bound.
+    """
+    if len(completed) >= max_concurrency:
+        return 0
+    return max_concurrency - len(pending)
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    if max_concurrency < 1:
+        raise ValueError("`max_concurrency` must be at least 1.")
+
+
+@overload
+def batch(
+    fn: Callable[..., Awaitable[_R]],
+    inputs: Iterable[BatchArgs],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> Generator[BatchResult[_R], None, None]: ...
+
+
+@overload
+def batch(
+    fn: Callable[..., _R],
+    inputs: Iterable[BatchArgs],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> Generator[BatchResult[_R], None, None]: ...
+
+
+def batch(
+    fn: Callable[..., Awaitable[_R]] | Callable[..., _R],
+    inputs: Iterable[BatchArgs],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> Generator[BatchResult[_R], None, None]:
+    """Runs `fn` over every input on a thread pool and yields the results.
+
+    Example:
+
+    ```python
+    from mirascope.core import batch, openai
+
+
+    @openai.call("gpt-4o-mini")
+    def classify(text: str) -> str:
+        return f"Classify the sentiment of this text: {text}"
+
+
+    for result in batch(classify, [(text,) for text in texts], max_concurrency=16):
+        if result.error is None:
+            print(result.index, result.output.content)
+    ```
+
+    Inputs are read lazily so that only `max_concurrency` calls are in flight at once,
+    and an exception raised by a call is returned in its result instead of stopping
+    the batch. Calls with an async `fn` are run to completion in their worker thread.
+
+    Args:
+        fn: The (decorated) function to call.
+        inputs: The inputs to call `fn` with. Tuples are passed as positional arguments
+            and mappings as keyword arguments.
+        max_concurrency: The maximum number of calls to run at once.
+        ordered: Whether to yield the results in the order of `inputs`. If `False`,
+            results are yielded as soon as their calls complete. If `True`, at most
+            `max_concurrency` results that completed ahead of a slower input are
+            buffered, after which no new calls are started until it completes.
+
+    Yields:
+        The `BatchResult` of each input.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+    _validate_max_concurrency(max_concurrency)
+    indexed_inputs = enumerate(inputs)
+    pending: dict[concurrent.futures.Future, tuple[int, BatchArgs]] = {}
+    completed: dict[int, BatchResult[_R]] = {}
+    next_index = 0
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="mirascope-batch"
+    )
+    try:
+        while True:
+            capacity = _capacity(max_concurrency, pending, completed)
+            for index, args in islice(indexed_inputs, capacity):
+                pending[executor.submit(_call_sync, fn, args)] = (index, args)
+            if not pending:
+                return
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                result = _result(*pending.pop(future), future)
+                if not ordered:
+                    yield result
+                    continue
+                completed[result.index] = result
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+@overload
+def batch_async(
+    fn: Callable[..., Awaitable[_R]],
+    inputs: Iterable[BatchArgs],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncGenerator[BatchResult[_R], None]: ...
+
+
+@overload
+def batch_async(
+    fn: Callable[..., _R],
+    inputs: Iterable[BatchArgs],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncGenerator[BatchResult[_R], None]: ...
+
+
+async def batch_async(
+    fn: Callable[..., Awaitable[_R]] | Callable[..., _R],
+    inputs: Iterable[BatchArgs],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = True,
+) -> AsyncGenerator[BatchResult[_R], None]:
+    """Runs `fn` over every input concurrently and yields the results.
+
+    Example:
+
+    ```python
+    from mirascope.core import batch_async, openai
+
+
+    @openai.call("gpt-4o-mini")
+    async def classify(text: str) -> str:
+        return f"Classify the sentiment of this text: {text}"
+
+
+    async for result in batch_async(classify, [(text,) for text in texts]):
+        if result.error is None:
+            print(result.index, result.output.content)
+    ```
+
+    Inputs are read lazily so that only `max_concurrency` calls are in flight at once,
+    and an exception raised by a call is returned in its result instead of stopping
+    the batch. Calls with a sync `fn` are run in threads so they don't block the loop.
+
+    Args:
+        fn: The (decorated) function to call.
+        inputs: The inputs to call `fn` with. Tuples are passed as positional arguments
+            and mappings as keyword arguments.
+        max_concurrency: The maximum number of calls to run at once.
+        ordered: Whether to yield the results in the order of `inputs`. If `False`,
+            results are yielded as soon as their calls complete. If `True`, at most
+            `max_concurrency` results that completed ahead of a slower input are
+            buffered, after which no new calls are started until it completes.
+
+    Yields:
+        The `BatchResult` of each input.
+
+    Raises:
+        ValueError: If `max_concurrency` is less than 1.
+    """
+    _validate_max_concurrency(max_concurrency)
+    indexed_inputs = enumerate(inputs)
+    pending: dict[asyncio.Future, tuple[int, BatchArgs]] = {}
+    completed: dict[int, BatchResult[_R]] = {}
+    next_index = 0
+    try:
+        while True:
+            capacity = _capacity(max_concurrency, pending, completed)
+            for index, args in islice(indexed_inputs, capacity):
+                pending[asyncio.ensure_future(_call_async(fn, args))] = (index, args)
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                result = _result(*pending.pop(future), future)
+                if not ordered:
+                    yield result
+                    continue
+                completed[result.index] = result
+            while next_index in completed:
+                yield completed.pop(next_index)
+                next_index += 1
+    finally:
+        for future in pending:
+            future.cancel()
@@ -3,21 +3,27 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from functools import cached_property
 from typing import Any, ClassVar, Generic, TypeVar
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     FieldSerializationInfo,
+    PrivateAttr,
     SkipValidation,
     computed_field,
     field_serializer,
 )
+from typing_extensions import Self
 
+from . import _utils
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
 from .dynamic_config import BaseDynamicConfig
 from .metadata import Metadata
+from .timings import CallTimings
 from .tool import BaseTool
 
 _ResponseT = TypeVar("_ResponseT", bound=Any)
@@ -44,6 +50,10 @@ class BaseCallResponse(
 ):
     """A base abstract interface for LLM call responses.
 
+    Properties that are derived from the response and are expensive to compute, such as
+    `message_param`, `tools`, and `tool`, are computed once on first access and then
+    reused, so the `response` should not be mutated once they have been accessed.
+
     Attributes:
         metadata: The metadata pulled from the call that was made.
         response: The original response from whichever model response this wraps.
@@ -58,6 +68,7 @@ class BaseCallResponse(
             message. Otherwise `None`.
         start_time: The start time of the completion in ms.
         end_time: The end time of the completion in ms.
+        timings: The time spent in each phase of the call that was made.
     """
 
     metadata: Metadata
@@ -75,6 +86,7 @@ class BaseCallResponse(
 
     _provider: ClassVar[str] = "NO PROVIDER"
     _model: str = "NO MODEL"
+    _timings: CallTimings = PrivateAttr(default_factory=CallTimings)
 
     model_config = ConfigDict(extra="allow", arbitrary_types_allowed=True)
 
@@ -88,6 +100,25 @@ class BaseCallResponse(
         """Returns the string content of the response."""
         return self.content
 
+    @property
+    def timings(self) -> CallTimings:
+        """Returns the time spent in each phase of the call that was made."""
+        return self._timings
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Returns a copy of the call response.
+
+        Memoized properties are not copied so that they are recomputed from the copy.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        for cls in type(self).__mro__:
+            for name, value in vars(cls).items():
+                if isinstance(value, cached_property):
+                    copied.__dict__.pop(name, None)
+        return copied
+
     @property
     @abstractmethod
     def content(self) -> str:
@@ -190,3 +221,54 @@ class BaseCallResponse(
                 message parameters should be constructed.
         """
         ...
+
+    def execute_tools(
+        self, *, max_workers: int | None = None, timeout: float | None = None
+    ) -> list[Any]:
+        """Calls the response's tools concurrently and returns their message params.
+
+        Sync tools are called on a thread pool so that the turn takes as long as the
+        slowest tool rather than the sum of all of them.
+
+        Args:
+            max_workers: The maximum number of tools to call at once. Defaults to calling
+                every tool at once.
+            timeout: The number of seconds each tool has to return.
+
+        Returns:
+            The tool message parameters for the tools' outputs, in call order.
+
+        Raises:
+            TimeoutError: If a tool doesn't return within `timeout`.
+        """
+        if not self.tools:
+            return []
+        tools_and_outputs = _utils.execute_tools(
+            self.tools, max_workers=max_workers, timeout=timeout
+        )
+        return self.tool_message_params(tools_and_outputs)
+
+    async def execute_tools_async(
+        self, *, max_workers: int | None = None, timeout: float | None = None
+    ) -> list[Any]:
+        """Calls the response's tools concurrently and returns their message params.
+
+        Async tools are awaited together and sync tools are run in threads.
+
+        Args:
+            max_workers: The maximum number of tools to call at once. Defaults to calling
+                every tool at once.
+            timeout: The number of seconds each tool has to return.
+
+        Returns:
+            The tool message parameters for the tools' outputs, in call order.
+
+        Raises:
+            TimeoutError: If a tool doesn't return within `timeout`.
+        """
+        if not self.tools:
+            return []
+        tools_and_outputs = await _utils.execute_tools_async(
+            self.tools, max_workers=max_workers, timeout=timeout
+        )
+        return self.tool_message_params(tools_and_outputs)
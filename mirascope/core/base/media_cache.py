@@ -0,0 +1,224 @@
+"""This module contains the `MediaCache` class for reusing loaded and encoded media."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple, TypeVar
+
+_T = TypeVar("_T")
+
+_MAX_SOURCES = 16_384
+
+
+class MediaValidators(NamedTuple):
+    """The HTTP validators of a loaded URL, used to revalidate it when it's reused."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class _Source(NamedTuple):
+    digest: str
+    validators: MediaValidators
+
+
+class _Blob:
+    """A piece of media, stored once per content hash, with its derived values."""
+
+    def __init__(self, digest: str, data: bytes) -> None:
+        self.digest = digest
+        self.data = data
+        self.derived: dict[str, Any] = {}
+        self.size = len(data)
+
+
+class MediaCache:
+    """Caches loaded media and their encodings across calls.
+
+    Media is stored once per content hash (i.e. SHA-256 of its bytes), together with
+    its detected media type and provider-specific encodings such as base64 strings, so
+    that the same image isn't downloaded, sniffed, or encoded again in every call of a
+    conversation. Sources are keyed on their file path and modification time, or on
+    their URL. URLs with an `ETag` or `Last-Modified` header are revalidated with a
+    conditional request when they are reused, and other URLs are assumed not to change.
+
+    When the cached media exceeds `max_size` bytes, the least recently used media is
+    evicted from memory. If a `directory` is set, evicted media is written to it and
+    loaded from disk the next time it's used instead of being loaded from its source.
+
+    Example:
+
+    ```python
+    from mirascope.core import MediaCache, MediaLoader, openai
+
+    media_loader = MediaLoader(cache=MediaCache(max_size=512 * 2**20))
+
+
+    @media_loader
+    @openai.call("gpt-4o-mini")
+    def describe(url: str) -> str:
+        return "Describe this image: {url:image}"
+    ```
+    """
+
+    def __init__(
+        self, max_size: int = 256 * 2**20, directory: str | Path | None = None
+    ) -> None:
+        """Initializes an instance of `MediaCache`.
+
+        Args:
+            max_size: The maximum number of bytes of media and encodings to keep in
+                memory.
+            directory: The directory to spill evicted media to, if any.
+        """
+        self.max_size = max_size
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.size = 0
+        self._sources: OrderedDict[tuple[str, ...], _Source] = OrderedDict()
+        self._blobs: OrderedDict[str, _Blob] = OrderedDict()
+        self._blobs_by_id: dict[int, _Blob] = {}
+        self._lock = threading.RLock()
+
+    def _source_key(self, source: str) -> tuple[str, ...] | None:
+        if source.startswith("data:"):
+            # Data URIs contain their media, so there is nothing to save by caching.
+            return None
+        if source.startswith(("http://", "https://")):
+            return ("url", source)
+        path = (
+            urllib.request.url2pathname(urllib.parse.urlparse(source).path)
+            if source.startswith("file://")
+            else source
+        )
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return ("file", os.path.abspath(path), str(stat.st_mtime_ns), str(stat.st_size))
+
+    def _spill_path(self, digest: str) -> Path | None:
+        return self.directory / digest if self.directory is not None else None
+
+    def _evict(self) -> None:
+        while self.size > self.max_size and len(self._blobs) > 1:
+            _, blob = self._blobs.popitem(last=False)
+            self._blobs_by_id.pop(id(blob.data), None)
+            self.size -= blob.size
+            if (
+                path := self._spill_path(blob.digest)
+            ) is not None and not path.exists():
+                path.write_bytes(blob.data)
+
+    def _add_blob(self, data: bytes, digest: str | None = None) -> _Blob:
+        digest = digest or hashlib.sha256(data).hexdigest()
+        if (blob := self._blobs.get(digest)) is None:
+            blob = _Blob(digest, data)
+            self._blobs[digest] = blob
+            self._blobs_by_id[id(data)] = blob
+            self.size += blob.size
+            self._evict()
+        self._blobs.move_to_end(digest)
+        return blob
+
+    def _get_blob(self, digest: str) -> _Blob | None:
+        if (blob := self._blobs.get(digest)) is not None:
+            self._blobs.move_to_end(digest)
+            return blob
+        if (path := self._spill_path(digest)) is not None and path.exists():
+            return self._add_blob(path.read_bytes(), digest)
+        return None
+
+    def load(
+        self,
+        source: str,
+        read: Callable[[str, MediaValidators], tuple[bytes | None, MediaValidators]],
+    ) -> bytes:
+        """Returns the data of the media `source`, reading it only if it's not cached.
+
+        Args:
+            source: The URL or file path of the media.
+            read: The function that reads the media. It's given the validators of the
+                cached media (for conditional requests) and returns the data, or
+                `None` if the cached media is still valid, and the new validators.
+
+        Returns:
+            The data of the media. The same `bytes` object is returned for the same
+            content, so that its derived values can be looked up without hashing it.
+        """
+        key = self._source_key(source)
+        if key is None:
+            data, _ = read(source, MediaValidators())
+            return data or b""
+        with self._lock:
+            cached = self._sources.get(key)
+            blob = self._get_blob(cached.digest) if cached is not None else None
+        if cached is not None and blob is not None:
+            if key[0] == "file" or cached.validators == MediaValidators():
+                with self._lock:
+                    self._sources.move_to_end(key)
+                return blob.data
+            data, validators = read(source, cached.validators)
+            if data is None:
+                return blob.data
+        else:
+            data, validators = read(source, MediaValidators())
+            data = data or b""
+        with self._lock:
+            blob = self._add_blob(data)
+            self._sources[key] = _Source(blob.digest, validators)
+            self._sources.move_to_end(key)
+            while len(self._sources) > _MAX_SOURCES:
+                self._sources.popitem(last=False)
+            return blob.data
+
+    def derive(self, data: bytes, name: str, derive: Callable[[bytes], _T]) -> _T:
+        """Returns a value derived from `data` (e.g. an encoding), computing it once.
+
+        Args:
+            data: The media data.
+            name: The name of the derived value, e.g. "base64".
+            derive: The function that computes the value from the data.
+
+        Returns:
+            The derived value. Its size (its length for `str` and `bytes`, or
+            `sys.getsizeof` otherwise) counts toward `max_size`.
+        """
+        with self._lock:
+            blob = self._blobs_by_id.get(id(data))
+            if blob is None or blob.data is not data:
+                blob = self._add_blob(data)
+            if name in blob.derived:
+                self._blobs.move_to_end(blob.digest)
+                return blob.derived[name]
+        value = derive(data)
+        with self._lock:
+            if name not in blob.derived:
+                blob.derived[name] = value
+                if blob.digest in self._blobs:
+                    size = (
+                        len(value)
+                        if isinstance(value, str | bytes)
+                        else sys.getsizeof(value)
+                    )
+                    blob.size += size
+                    self.size += size
+                    self._evict()
+        return value
+
+    def clear(self) -> None:
+        """Removes all media from memory (but not from the spill directory)."""
+        with self._lock:
+            self._sources.clear()
+            self._blobs.clear()
+            self._blobs_by_id.clear()
+            self.size = 0
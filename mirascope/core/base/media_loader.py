@@ -0,0 +1,194 @@
+"""This module contains the `MediaLoader` class for loading the media of prompts."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import urllib.error
+import urllib.request
+from collections.abc import Awaitable, Callable, Iterable
+from contextvars import ContextVar
+from typing import ParamSpec, TypeVar, overload
+
+from ._utils._bind_context_var import bind_context_var
+from .media_cache import MediaCache, MediaValidators
+from .timings import measure
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+_T = TypeVar("_T")
+
+current_media_loader: ContextVar[MediaLoader | None] = ContextVar(
+    "current_media_loader", default=None
+)
+
+
+class MediaLoader:
+    """Loads the images and audio referenced by `:image(s)` and `:audio(s)` template
+    parts.
+
+    Every media source of a prompt is loaded at once: sync calls load them concurrently
+    in threads and async calls load them concurrently without blocking the event loop.
+    Functions decorated with a media loader load their media with its options, and all
+    other functions use the default options. Set a `MediaCache` to reuse loaded media
+    and their encodings across calls.
+
+    Example:
+
+    ```python
+    from mirascope.core import MediaLoader, openai
+
+
+    @MediaLoader(max_concurrency=16, timeout=10)
+    @openai.call("gpt-4o-mini")
+    async def describe(urls: list[str]) -> str:
+        return "Describe these images: {urls:images}"
+    ```
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        timeout: float | None = None,
+        cache: MediaCache | None = None,
+    ) -> None:
+        """Initializes an instance of `MediaLoader`.
+
+        Args:
+            max_concurrency: The maximum number of media sources to load at once.
+            timeout: The number of seconds to wait for each URL, if it should time out.
+                It only applies to `http://` and `https://` URLs; local files are read
+                without a timeout.
+            cache: The cache of loaded media and their encodings, if any.
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache = cache
+
+    def _read(
+        self, source: str, validators: MediaValidators
+    ) -> tuple[bytes | None, MediaValidators]:
+        if not source.startswith(("http://", "https://", "data:", "file://")):
+            with open(source, "rb") as f:
+                return f.read(), MediaValidators()
+        headers = {}
+        if validators.etag:
+            headers["If-None-Match"] = validators.etag
+        if validators.last_modified:
+            headers["If-Modified-Since"] = validators.last_modified
+        try:
+            with urllib.request.urlopen(
+                urllib.request.Request(source, headers=headers) if headers else source,
+                **({"timeout": self.timeout} if self.timeout is not None else {}),
+            ) as response:
+                return response.read(), MediaValidators(
+                    response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None, validators
+            raise
+
+    def load(self, source: str | bytes) -> bytes:
+        """Returns the data of a media `source`.
+
+        Args:
+            source: The raw data, URL, or file path of the media.
+
+        Raises:
+            ValueError: If the media can't be loaded.
+        """
+        # Some typing weirdness here where checking `isinstance(source, bytes)` results
+        # in a type hint of `str | bytearray | memoryview` for source in the else.
+        if isinstance(source, bytes | bytearray | memoryview):
+            return source
+        try:
+            if self.cache is not None:
+                return self.cache.load(source, self._read)
+            return self._read(source, MediaValidators())[0] or b""
+        except Exception as e:
+            raise ValueError(f"Failed to load or encode data from {source}") from e
+
+    def derive(self, data: bytes, name: str, derive: Callable[[bytes], _T]) -> _T:
+        """Returns a value derived from media `data`, reusing it from the cache if any.
+
+        Args:
+            data: The media data.
+            name: The name of the derived value, e.g. "base64".
+            derive: The function that computes the value from the data.
+        """
+        if self.cache is None:
+            return derive(data)
+        return self.cache.derive(data, name, derive)
+
+    def load_all(self, sources: Iterable[str]) -> dict[str, bytes]:
+        """Loads the `sources` concurrently in threads.
+
+        Args:
+            sources: The URLs and file paths of the media to load.
+
+        Returns:
+            The data of each source.
+
+        Raises:
+            ValueError: If any of the media can't be loaded.
+        """
+        unique_sources = list(dict.fromkeys(sources))
+        with measure("media_loading"):
+            if len(unique_sources) <= 1 or self.max_concurrency <= 1:
+                return {source: self.load(source) for source in unique_sources}
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(self.max_concurrency, len(unique_sources)),
+                thread_name_prefix="mirascope-media",
+            ) as executor:
+                return dict(
+                    zip(
+                        unique_sources,
+                        executor.map(self.load, unique_sources),
+                        strict=True,
+                    )
+                )
+
+    async def load_all_async(self, sources: Iterable[str]) -> dict[str, bytes]:
+        """Loads the `sources` concurrently without blocking the event loop.
+
+        Args:
+            sources: The URLs and file paths of the media to load.
+
+        Returns:
+            The data of each source.
+
+        Raises:
+            ValueError: If any of the media can't be loaded.
+        """
+        unique_sources = list(dict.fromkeys(sources))
+        semaphore = asyncio.Semaphore(max(self.max_concurrency, 1))
+
+        async def load(source: str) -> bytes:
+            async with semaphore:
+                return await asyncio.to_thread(self.load, source)
+
+        data = await asyncio.gather(*(load(source) for source in unique_sources))
+        return dict(zip(unique_sources, data, strict=True))
+
+    @overload
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]]
+    ) -> Callable[_P, Awaitable[_R]]: ...
+
+    @overload
+    def __call__(self, fn: Callable[_P, _R]) -> Callable[_P, _R]: ...
+
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]] | Callable[_P, _R]
+    ) -> Callable[_P, Awaitable[_R]] | Callable[_P, _R]:
+        """Loads the media of the prompts rendered by `fn` with this media loader."""
+        return bind_context_var(fn, current_media_loader, self)
+
+
+_default_media_loader = MediaLoader()
+
+
+def get_media_loader() -> MediaLoader:
+    """Returns the media loader of the current context, or the default one."""
+    return current_media_loader.get() or _default_media_loader
@@ -0,0 +1,216 @@
+"""This module contains the `PricingRegistry` class for looking up model prices."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import NamedTuple
+
+# A date or version suffix of a model name, e.g. "-2024-08-06", "@20240229", "-2407",
+# "-latest", or "-v1:0", which is stripped to find the prices of an undated model.
+_DATED_SUFFIX = re.compile(
+    r"(?:[-@](?:\d{4}-\d{2}-\d{2}|\d{8}|\d{4}|latest)|-v\d+:\d+)$"
+)
+# A vendor prefix of a model name, e.g. "anthropic." or "us.anthropic." on Bedrock.
+_VENDOR_PREFIX = re.compile(r"^[a-z]+\.(?=[a-z])")
+
+
+class ModelPricing(NamedTuple):
+    """The prices of a model in dollars per token.
+
+    Attributes:
+        input: The price of an input token.
+        output: The price of an output token.
+        cached_input: The price of an input token read from the provider's prompt
+            cache. Defaults to the input price.
+        audio_input: The price of an input audio token. Defaults to the input price.
+        audio_output: The price of an output audio token. Defaults to the output
+            price.
+    """
+
+    input: float
+    output: float
+    cached_input: float | None = None
+    audio_input: float | None = None
+    audio_output: float | None = None
+
+
+class PricingRegistry:
+    """The prices of every provider's models, used to calculate the cost of calls.
+
+    Providers register their prices when they are imported, and prices loaded with
+    `load` (e.g. negotiated rates or fine-tuned models) take precedence over them.
+    Models are looked up by exact name, then by alias, and then with their date or
+    version suffixes and vendor prefixes stripped, so that e.g. "gpt-4o-2024-11-20" is
+    priced as "gpt-4o". Lookups are memoized, so calculating the cost of a call is a
+    single dictionary lookup after the first call to a model.
+
+    Example:
+
+    ```python
+    from mirascope.core.base.pricing import ModelPricing, pricing_registry
+
+    pricing_registry.register(
+        "openai", {"ft:gpt-4o-mini:my-org": ModelPricing(3e-7, 1.2e-6)}, override=True
+    )
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initializes an instance of `PricingRegistry`."""
+        self._prices: dict[str, dict[str, ModelPricing]] = {}
+        self._overrides: dict[str, dict[str, ModelPricing]] = {}
+        self._aliases: dict[str, dict[str, str]] = {}
+        self._resolved: dict[tuple[str, str], ModelPricing | None] = {}
+        self._lock = threading.Lock()
+
+    def register(
+        self,
+        provider: str,
+        prices: Mapping[str, ModelPricing],
+        *,
+        override: bool = False,
+    ) -> None:
+        """Registers the prices of a provider's models.
+
+        Args:
+            provider: The provider, e.g. "openai".
+            prices: The prices of each model.
+            override: Whether the prices take precedence over the provider's own prices
+                (i.e. they are user overrides).
+        """
+        registry = self._overrides if override else self._prices
+        with self._lock:
+            registry.setdefault(provider, {}).update(prices)
+            self._resolved.clear()
+
+    def register_alias(self, provider: str, alias: str, model: str) -> None:
+        """Registers `alias` as another name of the provider's `model`.
+
+        Args:
+            provider: The provider, e.g. "openai".
+            alias: The other name of the model.
+            model: The name of the model whose prices the alias uses.
+        """
+        with self._lock:
+            self._aliases.setdefault(provider, {})[alias] = model
+            self._resolved.clear()
+
+    def load(self, path: str | Path) -> None:
+        """Loads price overrides from a JSON file.
+
+        The file maps each provider to its models, and each model to either its prices
+        or the name of the model it's an alias of:
+
+        ```json
+        {
+            "openai": {
+                "ft:gpt-4o-mini:my-org": {"input": 3e-7, "output": 1.2e-6},
+                "my-deployment": "gpt-4o"
+            }
+        }
+        ```
+
+        Args:
+            path: The path of the JSON file.
+
+        Raises:
+            ValueError: If the file doesn't contain valid prices.
+        """
+        with open(path) as f:
+            providers = json.load(f)
+        try:
+            for provider, models in providers.items():
+                prices = {
+                    model: ModelPricing(**value)
+                    for model, value in models.items()
+                    if not isinstance(value, str)
+                }
+                self.register(provider, prices, override=True)
+                for model, value in models.items():
+                    if isinstance(value, str):
+                        self.register_alias(provider, model, value)
+        except (AttributeError, TypeError) as e:
+            raise ValueError(f"Invalid prices in {path}") from e
+
+    def _lookup(self, provider: str, model: str) -> ModelPricing | None:
+        model = self._aliases.get(provider, {}).get(model, model)
+        for registry in (self._overrides, self._prices):
+            if (pricing := registry.get(provider, {}).get(model)) is not None:
+                return pricing
+        return None
+
+    def resolve(self, provider: str, model: str) -> ModelPricing | None:
+        """Returns the prices of the provider's `model`, if known.
+
+        Args:
+            provider: The provider, e.g. "openai".
+            model: The name of the model.
+        """
+        key = (provider, model)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        with self._lock:
+            pricing, name = self._lookup(provider, model), model
+            while pricing is None:
+                stripped = _VENDOR_PREFIX.sub("", _DATED_SUFFIX.sub("", name), count=1)
+                if stripped == name:
+                    break
+                pricing, name = self._lookup(provider, stripped), stripped
+            self._resolved[key] = pricing
+        return pricing
+
+    def calculate_cost(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int | float | None,
+        output_tokens: int | float | None,
+        *,
+        cached_input_tokens: int | float | None = None,
+        audio_input_tokens: int | float | None = None,
+        audio_output_tokens: int | float | None = None,
+    ) -> float | None:
+        """Returns the cost of a call in dollars, if the model's prices are known.
+
+        Args:
+            provider: The provider of the call.
+            model: The model of the call.
+            input_tokens: The total number of input tokens.
+            output_tokens: The total number of output tokens.
+            cached_input_tokens: How many of the input tokens were read from the
+                provider's prompt cache.
+            audio_input_tokens: How many of the input tokens were audio tokens.
+            audio_output_tokens: How many of the output tokens were audio tokens.
+        """
+        if input_tokens is None or output_tokens is None:
+            return None
+        if (pricing := self.resolve(provider, model)) is None:
+            return None
+        cached_input_tokens = cached_input_tokens or 0
+        audio_input_tokens = audio_input_tokens or 0
+        audio_output_tokens = audio_output_tokens or 0
+        input_cost = (
+            (input_tokens - cached_input_tokens - audio_input_tokens) * pricing.input
+            + cached_input_tokens * _or(pricing.cached_input, pricing.input)
+            + audio_input_tokens * _or(pricing.audio_input, pricing.input)
+        )
+        output_cost = (output_tokens - audio_output_tokens) * pricing.output + (
+            audio_output_tokens * _or(pricing.audio_output, pricing.output)
+        )
+        return input_cost + output_cost
+
+
+def _or(price: float | None, default: float) -> float:
+    return default if price is None else price
+
+
+pricing_registry = PricingRegistry()
+if pricing_file := os.environ.get("MIRASCOPE_PRICING_FILE"):
+    pricing_registry.load(pricing_file)
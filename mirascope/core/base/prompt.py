@@ -23,6 +23,7 @@ from ._utils import (
     get_prompt_template,
     messages_decorator,
     parse_prompt_messages,
+    parse_prompt_messages_async,
 )
 from .call_response import BaseCallResponse
 from .dynamic_config import BaseDynamicConfig
@@ -403,7 +404,7 @@ def prompt_template(
             async def get_base_message_params_async(
                 *args: _P.args, **kwargs: _P.kwargs
             ) -> list[BaseMessageParam]:
-                return parse_prompt_messages(
+                return await parse_prompt_messages_async(
                     roles=SUPPORTED_MESSAGE_ROLES,
                     template=template,
                     attrs=get_fn_args(prompt, args, kwargs),
@@ -0,0 +1,310 @@
+"""This module contains the `RateLimiter` class for pacing calls to LLM providers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar, overload
+
+from pydantic import BaseModel
+
+from ._utils import bind_context_var
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+current_rate_limiter: ContextVar[RateLimiter | None] = ContextVar(
+    "current_rate_limiter", default=None
+)
+
+_CHARS_PER_TOKEN = 4
+_TOKENS_PER_MESSAGE = 4
+
+
+def _count_chars(value: object) -> int:
+    if isinstance(value, str):
+        # Base64 encoded media is billed by its dimensions or duration, not length.
+        return 0 if value.startswith("data:") else len(value)
+    if isinstance(value, Mapping):
+        return sum(_count_chars(item) for item in value.values())
+    if isinstance(value, list | tuple):
+        return sum(_count_chars(item) for item in value)
+    if isinstance(value, BaseModel):
+        return _count_chars(value.__dict__)
+    return 0
+
+
+def estimate_tokens(messages: list[Any]) -> int:
+    """Roughly estimates the number of input tokens of provider-specific messages.
+
+    Counts one token per four characters of text plus a few tokens of overhead per
+    message. Binary and base64 encoded media are not counted.
+
+    Args:
+        messages: The provider-specific messages that will be sent.
+
+    Returns:
+        The estimated number of input tokens.
+    """
+    num_chars = sum(_count_chars(message) for message in messages)
+    return num_chars // _CHARS_PER_TOKEN + _TOKENS_PER_MESSAGE * len(messages)
+
+
+class _Budget:
+    """A per-minute budget that refills continuously (i.e. a token bucket).
+
+    Amounts are taken immediately even when the budget runs out, so its level can go
+    negative. The time it takes to refill back to zero is how long the caller has to
+    wait, which queues callers in the order in which they took from the budget.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = per_minute
+        self.per_second = per_minute / 60
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.level = min(self.capacity, self.level + elapsed * self.per_second)
+        self.updated = now
+
+    def take(self, amount: float, now: float) -> tuple[float, float]:
+        """Takes `amount` from the budget, but at most its capacity.
+
+        Returns:
+            The amount taken and how long to wait before using it.
+        """
+        self._refill(now)
+        taken = min(amount, self.capacity)
+        self.level -= taken
+        return taken, max(-self.level / self.per_second, 0)
+
+    def give(self, amount: float, now: float) -> None:
+        """Gives `amount` back to the budget (or takes it if negative)."""
+        self._refill(now)
+        self.level = min(self.capacity, self.level + amount)
+
+
+class RateLimitReservation:
+    """A call's reservation of a `RateLimiter`'s budgets."""
+
+    def __init__(
+        self,
+        lock: threading.Lock,
+        tokens_budget: _Budget | None,
+        tokens: float,
+        delay: float,
+    ) -> None:
+        self._lock = lock
+        self._tokens_budget = tokens_budget
+        self.tokens = tokens
+        self.delay = delay
+
+    def reconcile(
+        self, input_tokens: int | float | None, output_tokens: int | float | None
+    ) -> None:
+        """Corrects the reserved tokens with the actual usage of the call.
+
+        The reservation is kept as is if the call's usage is unknown.
+
+        Args:
+            input_tokens: The actual number of input tokens, if known.
+            output_tokens: The actual number of output tokens, if known.
+        """
+        if self._tokens_budget is None or not (input_tokens or output_tokens):
+            return
+        used = (input_tokens or 0) + (output_tokens or 0)
+        with self._lock:
+            self._tokens_budget.give(self.tokens - used, time.monotonic())
+        self.tokens = int(used)
+
+    def release(self) -> None:
+        """Gives the reserved tokens back, e.g. because the call failed to be sent."""
+        if self._tokens_budget is None or not self.tokens:
+            return
+        with self._lock:
+            self._tokens_budget.give(self.tokens, time.monotonic())
+        self.tokens = 0
+
+
+class RateLimiter:
+    """Paces calls to stay within requests and tokens per minute budgets.
+
+    Budgets are set per provider and optionally per model and API key, and each
+    `(provider, model, api key)` gets its own budget. Calls made by functions decorated
+    with the rate limiter reserve their estimated input tokens before sending and wait
+    until the budgets allow it, and the reservation is corrected with the call's actual
+    usage once it completes (or once a stream is exhausted). If the call fails to be
+    sent, its reserved tokens are given back. Waiting calls are served in the order in
+    which they were made, across both threads and async tasks. Calls that use their
+    provider's default client are limited by the API key of the default client.
+
+    Example:
+
+    ```python
+    from mirascope.core import RateLimiter, openai
+
+    rate_limiter = RateLimiter()
+    rate_limiter.set_limits(
+        "openai", "gpt-4o-mini", requests_per_minute=500, tokens_per_minute=200_000
+    )
+
+
+    @rate_limiter
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+    ```
+    """
+
+    def __init__(
+        self, estimate_tokens: Callable[[list[Any]], int] = estimate_tokens
+    ) -> None:
+        """Initializes an instance of `RateLimiter`.
+
+        Args:
+            estimate_tokens: The function that estimates the number of input tokens of
+                the provider-specific messages of a call before it's sent.
+        """
+        self.estimate_tokens = estimate_tokens
+        self._limits: dict[
+            tuple[str, str | None, str | None], tuple[float | None, float | None]
+        ] = {}
+        self._budgets: dict[
+            tuple[str, str, str | None], tuple[_Budget | None, _Budget | None]
+        ] = {}
+        self._lock = threading.Lock()
+
+    def set_limits(
+        self,
+        provider: str,
+        model: str | None = None,
+        *,
+        api_key: str | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ) -> None:
+        """Sets the budgets of calls to `provider`.
+
+        Args:
+            provider: The provider, e.g. "openai".
+            model: The model the limits apply to. Defaults to every model that doesn't
+                have its own limits.
+            api_key: The API key the limits apply to. Defaults to every API key that
+                doesn't have its own limits.
+            requests_per_minute: The maximum number of requests per minute.
+            tokens_per_minute: The maximum number of input and output tokens per minute.
+        """
+        with self._lock:
+            self._limits[(provider, model, api_key)] = (
+                requests_per_minute,
+                tokens_per_minute,
+            )
+            self._budgets.clear()
+
+    def _get_budgets(
+        self, provider: str, model: str, api_key: str | None
+    ) -> tuple[_Budget | None, _Budget | None]:
+        key = (provider, model, api_key)
+        if (budgets := self._budgets.get(key)) is not None:
+            return budgets
+        requests_per_minute, tokens_per_minute = next(
+            (
+                self._limits[limits_key]
+                for limits_key in [
+                    key,
+                    (provider, model, None),
+                    (provider, None, api_key),
+                    (provider, None, None),
+                ]
+                if limits_key in self._limits
+            ),
+            (None, None),
+        )
+        self._budgets[key] = budgets = (
+            _Budget(requests_per_minute) if requests_per_minute else None,
+            _Budget(tokens_per_minute) if tokens_per_minute else None,
+        )
+        return budgets
+
+    def _reserve(
+        self, provider: str, model: str, client: object, messages: list[Any]
+    ) -> RateLimitReservation:
+        api_key = getattr(client, "api_key", None)
+        api_key = api_key if isinstance(api_key, str) else None
+        with self._lock:
+            requests_budget, tokens_budget = self._get_budgets(provider, model, api_key)
+            tokens = self.estimate_tokens(messages) if tokens_budget else 0
+            now, delay = time.monotonic(), 0.0
+            if requests_budget is not None:
+                _, delay = requests_budget.take(1, now)
+            if tokens_budget is not None:
+                # Calls estimated above the budget only reserve all of it, so only that
+                # is given back once the call completes.
+                tokens, tokens_delay = tokens_budget.take(tokens, now)
+                delay = max(delay, tokens_delay)
+        return RateLimitReservation(self._lock, tokens_budget, tokens, delay)
+
+    def acquire(
+        self, provider: str, model: str, client: object, messages: list[Any]
+    ) -> RateLimitReservation:
+        """Reserves the budgets for a call, waiting until they allow it.
+
+        Args:
+            provider: The provider of the call.
+            model: The model of the call.
+            client: The client used to make the call, if any.
+            messages: The provider-specific messages of the call.
+
+        Returns:
+            The reservation, to be reconciled with the call's usage once it completes.
+        """
+        reservation = self._reserve(provider, model, client, messages)
+        if reservation.delay:
+            try:
+                time.sleep(reservation.delay)
+            except BaseException:
+                reservation.release()
+                raise
+        return reservation
+
+    async def acquire_async(
+        self, provider: str, model: str, client: object, messages: list[Any]
+    ) -> RateLimitReservation:
+        """Reserves the budgets for a call, waiting until they allow it.
+
+        Args:
+            provider: The provider of the call.
+            model: The model of the call.
+            client: The client used to make the call, if any.
+            messages: The provider-specific messages of the call.
+
+        Returns:
+            The reservation, to be reconciled with the call's usage once it completes.
+        """
+        reservation = self._reserve(provider, model, client, messages)
+        if reservation.delay:
+            try:
+                await asyncio.sleep(reservation.delay)
+            except BaseException:
+                reservation.release()
+                raise
+        return reservation
+
+    @overload
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]]
+    ) -> Callable[_P, Awaitable[_R]]: ...
+
+    @overload
+    def __call__(self, fn: Callable[_P, _R]) -> Callable[_P, _R]: ...
+
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]] | Callable[_P, _R]
+    ) -> Callable[_P, Awaitable[_R]] | Callable[_P, _R]:
+        """Paces the calls made by `fn` with this rate limiter."""
+        return bind_context_var(fn, current_rate_limiter, self)
@@ -0,0 +1,411 @@
+"""This module contains the `ResponseCache` class for reusing LLM responses."""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import pickle
+import re
+import sqlite3
+import threading
+import time
+import warnings
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+)
+from contextvars import ContextVar
+from enum import Enum
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar, overload
+
+from pydantic import BaseModel
+
+from ._utils import bind_context_var
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+current_response_cache: ContextVar[ResponseCache | None] = ContextVar(
+    "current_response_cache", default=None
+)
+
+
+class BaseCacheBackend(ABC):
+    """The interface for storing cached responses by key."""
+
+    @abstractmethod
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Returns the value stored for `key`, or `None` if there is none."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Stores `value` for `key`."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Removes every stored value."""
+        ...
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """Stores responses in memory, evicting the least recently used ones.
+
+    Responses are stored as is, so they are shared by every call that hits the cache.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float | None = None) -> None:
+        """Initializes an instance of `MemoryCacheBackend`.
+
+        Args:
+            max_size: The maximum number of responses to keep.
+            ttl: The number of seconds a response is kept, if it should expire.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._values: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        with self._lock:
+            if (item := self._values.get(key)) is None:
+                return None
+            value, expires_at = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._values[key] = (value, expires_at)
+            self._values.move_to_end(key)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class SQLiteCacheBackend(BaseCacheBackend):
+    """Stores pickled responses in a SQLite database so they can be reused across
+    processes.
+
+    Responses that can't be pickled are not cached.
+    """
+
+    def __init__(
+        self, path: str | Path = ".mirascope_cache.sqlite", ttl: float | None = None
+    ) -> None:
+        """Initializes an instance of `SQLiteCacheBackend`.
+
+        Args:
+            path: The path of the SQLite database file.
+            ttl: The number of seconds a response is kept, if it should expire.
+        """
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL)"
+            )
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            with self._lock, self._connection:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None
+        return pickle.loads(value)
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        try:
+            pickled = pickle.dumps(value)
+        except Exception as e:
+            warnings.warn(f"Not caching a response that can't be pickled: {e}")
+            return
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, pickled, expires_at),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM responses")
+
+
+_MEMORY_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _to_json(value: object) -> object:
+    """Returns a JSON serializable representation of the content of `value`.
+
+    Raises:
+        TypeError: If `value` has no representation of its content, e.g. because its
+            `repr` includes its memory address, which would never match another call.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, bytes | bytearray):
+        return hashlib.sha256(value).hexdigest()
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=lambda item: json.dumps(item, default=_to_json))
+    if isinstance(value, Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if callable(to_dict := getattr(type(value), "to_dict", None)):  # e.g. protobufs
+        return to_dict(value)
+    if callable(to_proto := getattr(value, "to_proto", None)):  # e.g. Gemini tools
+        return _to_json(to_proto())
+    if hasattr(value, "DESCRIPTOR") and hasattr(value, "SerializeToString"):
+        from google.protobuf.json_format import MessageToDict
+
+        return MessageToDict(value)  # pyright: ignore [reportArgumentType]
+    text = repr(value)
+    if type(value).__repr__ is object.__repr__ or _MEMORY_ADDRESS.search(text):
+        raise TypeError(f"Can't serialize the content of {text} for a cache key")
+    return text
+
+
+def _get_endpoint(client: object) -> str | None:
+    """Returns the URL of the API the `client` sends its requests to, if known."""
+    for name in ("base_url", "endpoint", "_endpoint"):
+        if (endpoint := getattr(client, name, None)) is not None:
+            return str(endpoint)
+    return None
+
+
+class ResponseCache:
+    """Returns cached provider responses for calls that have already been made.
+
+    Calls made by functions decorated with the cache are keyed on their provider, model,
+    the URL of the client's API, and the keyword arguments of the provider API call
+    (i.e. the rendered messages, the tools' schemas, and the call params). Calls with
+    arguments that can't be serialized by their content are not cached. A cached
+    response skips the API call entirely and is wrapped in a new call response, so it
+    works for calls, `response_model` extractions, and streams, which replay their
+    cached chunks through the provider's stream.
+
+    Example:
+
+    ```python
+    from mirascope.core import ResponseCache, openai
+    from mirascope.core.base.response_cache import SQLiteCacheBackend
+
+    cache = ResponseCache(SQLiteCacheBackend("evals.sqlite"))
+
+
+    @cache
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")  # calls the API
+    recommend_book("fantasy")  # returns the cached response
+    print(cache.hits, cache.misses)
+    # > 1 1
+    ```
+
+    Attributes:
+        backend: The backend that stores the cached responses.
+        hits: The number of calls that returned a cached response.
+        misses: The number of calls that had to call the API.
+    """
+
+    def __init__(self, backend: BaseCacheBackend | None = None) -> None:
+        """Initializes an instance of `ResponseCache`.
+
+        Args:
+            backend: The backend that stores the cached responses. Defaults to an
+                in-memory LRU cache.
+        """
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(
+        self,
+        provider: str,
+        model: str,
+        call_kwargs: object,
+        stream: bool,
+        endpoint: str | None = None,
+    ) -> str:
+        """Returns the key of a call's response.
+
+        Args:
+            provider: The provider of the call.
+            model: The model of the call.
+            call_kwargs: The keyword arguments of the provider API call.
+            stream: Whether the call is streamed.
+            endpoint: The URL of the API the call is sent to, if known.
+
+        Raises:
+            TypeError: If a value of `call_kwargs` can't be serialized by its content.
+        """
+        serialized = json.dumps(
+            [provider, model, stream, endpoint, call_kwargs],
+            sort_keys=True,
+            default=_to_json,
+        )
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def _get_key(
+        self,
+        provider: str,
+        model: str,
+        call_kwargs: object,
+        stream: bool,
+        client: object,
+    ) -> str | None:
+        """Returns the key of a call's response, or `None` if it can't be cached."""
+        try:
+            return self.key(provider, model, call_kwargs, stream, _get_endpoint(client))
+        except TypeError as e:
+            warnings.warn(f"Not caching a call that can't be keyed: {e}")
+            return None
+
+    def _count(self, value: object) -> None:
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+    def get(self, key: str) -> Any | None:  # noqa: ANN401
+        """Returns the cached response for `key` and counts the hit or miss."""
+        value = self.backend.get(key)
+        self._count(value)
+        return value
+
+    def lookup(
+        self,
+        provider: str,
+        model: str,
+        messages: list[Any],
+        call_kwargs: object,
+        stream: bool,
+        client: object = None,
+    ) -> tuple[str | None, Any | None]:
+        """Returns the key of a call's response and the cached response, if any.
+
+        Calls whose keyword arguments can't be serialized by their content are not
+        cached, in which case the key is `None`.
+
+        Args:
+            provider: The provider of the call.
+            model: The model of the call.
+            messages: The provider-specific messages of the call.
+            call_kwargs: The keyword arguments of the provider API call.
+            stream: Whether the call is streamed.
+            client: The client used to make the call, if any.
+        """
+        if (key := self._get_key(provider, model, call_kwargs, stream, client)) is None:
+            self._count(None)
+            return None, None
+        return key, self.get(key)
+
+    async def lookup_async(
+        self,
+        provider: str,
+        model: str,
+        messages: list[Any],
+        call_kwargs: object,
+        stream: bool,
+        client: object = None,
+    ) -> tuple[str | None, Any | None]:
+        """Returns the key of a call's response and the cached response, if any.
+
+        Caches that need to make network calls for lookups (e.g. to embed messages)
+        override this method so that async calls don't block the event loop.
+
+        Args:
+            provider: The provider of the call.
+            model: The model of the call.
+            messages: The provider-specific messages of the call.
+            call_kwargs: The keyword arguments of the provider API call.
+            stream: Whether the call is streamed.
+            client: The client used to make the call, if any.
+        """
+        return self.lookup(provider, model, messages, call_kwargs, stream, client)
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """Caches the response `value` for `key`."""
+        self.backend.set(key, value)
+
+    def record_stream(
+        self, key: str, chunks: Iterable[_R]
+    ) -> Generator[_R, None, None]:
+        """Yields the `chunks` of a streamed response and caches them once exhausted."""
+        recorded = []
+        for chunk in chunks:
+            recorded.append(chunk)
+            yield chunk
+        self.set(key, recorded)
+
+    async def record_stream_async(
+        self, key: str, chunks: AsyncIterable[_R]
+    ) -> AsyncGenerator[_R, None]:
+        """Yields the `chunks` of a streamed response and caches them once exhausted."""
+        recorded = []
+        async for chunk in chunks:
+            recorded.append(chunk)
+            yield chunk
+        self.set(key, recorded)
+
+    def clear(self) -> None:
+        """Removes every cached response and resets the hit and miss counters."""
+        self.backend.clear()
+        with self._lock:
+            self.hits = self.misses = 0
+
+    @overload
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]]
+    ) -> Callable[_P, Awaitable[_R]]: ...
+
+    @overload
+    def __call__(self, fn: Callable[_P, _R]) -> Callable[_P, _R]: ...
+
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]] | Callable[_P, _R]
+    ) -> Callable[_P, Awaitable[_R]] | Callable[_P, _R]:
+        """Caches the responses of the calls made by `fn`."""
+        return bind_context_var(fn, current_response_cache, self)
+
+
+def replay_stream(chunks: Iterable[_R]) -> Generator[_R, None, None]:
+    """Yields the cached `chunks` of a streamed response."""
+    yield from chunks
+
+
+async def replay_stream_async(chunks: Iterable[_R]) -> AsyncGenerator[_R, None]:
+    """Yields the cached `chunks` of a streamed response asynchronously."""
+    for chunk in chunks:
+        yield chunk
@@ -1,6 +1,9 @@
 """This module contains the base classes for streaming responses from LLMs."""
 
+import asyncio
+import concurrent.futures
 import datetime
+import time
 from abc import ABC, abstractmethod
 from collections.abc import AsyncGenerator, Awaitable, Callable, Coroutine, Generator
 from functools import wraps
@@ -14,17 +17,29 @@ from typing import (
     overload,
 )
 
+from typing_extensions import Self
+
 from ._utils import (
     HandleStream,
     HandleStreamAsync,
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
+    bind_context_var,
+    call_tool,
+    call_tool_async,
+    capture_default_clients,
+    execute_tools,
+    execute_tools_async,
     fn_is_async,
     get_dynamic_configuration,
     get_fn_args,
     get_metadata,
     get_possible_user_message_param,
+    get_tool_outputs,
+    get_tool_outputs_async,
     is_prompt_template,
+    load_prompt_media_async,
+    preloaded_media,
 )
 from .call_kwargs import BaseCallKwargs
 from .call_params import BaseCallParams
@@ -34,7 +49,15 @@ from .dynamic_config import BaseDynamicConfig
 from .messages import Messages
 from .metadata import Metadata
 from .prompt import prompt_template
+from .rate_limiter import current_rate_limiter
+from .response_cache import (
+    current_response_cache,
+    replay_stream,
+    replay_stream_async,
+)
+from .timings import CallTimings, current_timings
 from .tool import BaseTool
+from .usage_ledger import current_usage_ledger
 
 _BaseCallResponseT = TypeVar("_BaseCallResponseT", bound=BaseCallResponse)
 _BaseCallResponseChunkT = TypeVar(
@@ -77,7 +100,6 @@ class BaseStream(
             None,
         ]
     )
-    content: str
     metadata: Metadata
     tool_types: list[type[_BaseToolT]] | None
     call_response_type: type[_BaseCallResponseT]
@@ -90,12 +112,15 @@ class BaseStream(
     call_kwargs: BaseCallKwargs[_ToolSchemaT]
     user_message_param: _UserMessageParamT | None = None
     message_param: _AssistantMessageParamT
+    tools: list[_BaseToolT]
+    tool_futures: list[concurrent.futures.Future | asyncio.Future]
     input_tokens: int | float | None = None
     output_tokens: int | float | None = None
     id: str | None = None
     finish_reasons: list[_FinishReason] | None = None
     start_time: float = 0
     end_time: float = 0
+    timings: CallTimings
 
     _provider: ClassVar[str] = "NO PROVIDER"
 
@@ -119,7 +144,12 @@ class BaseStream(
         call_kwargs: BaseCallKwargs[_ToolSchemaT],
     ) -> None:
         """Initializes an instance of `BaseStream`."""
-        self.content = ""
+        self._content_chunks: list[str] = []
+        self.timings = CallTimings()
+        self.tools = []
+        self.tool_futures = []
+        self._execute_tools_eagerly = False
+        self._max_tool_workers: int | None = None
         self.stream = stream
         self.metadata = metadata
         self.tool_types = tool_types
@@ -140,15 +170,33 @@ class BaseStream(
         assert isinstance(
             self.stream, Generator
         ), "Stream must be a generator for __iter__"
-        self.content, tool_calls = "", []
+        self.content, self.tools, self.tool_futures, tool_calls = "", [], [], []
+        executor = (
+            concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_tool_workers, thread_name_prefix="mirascope-tool"
+            )
+            if self._execute_tools_eagerly
+            else None
+        )
         self.start_time = datetime.datetime.now().timestamp() * 1000
-        for chunk, tool in self.stream:
-            self._update_properties(chunk)
-            if tool:
-                tool_call = getattr(tool, "tool_call", _DEFAULT)
-                if tool_call != _DEFAULT:
-                    tool_calls.append(tool_call)
-            yield chunk, tool
+        exhausted = False
+        try:
+            for chunk, tool in self.stream:
+                self._update_properties(chunk)
+                if tool:
+                    self.tools.append(tool)
+                    if executor is not None:
+                        self.tool_futures.append(executor.submit(call_tool, tool))
+                    tool_call = getattr(tool, "tool_call", _DEFAULT)
+                    if tool_call != _DEFAULT:
+                        tool_calls.append(tool_call)
+                yield chunk, tool
+            exhausted = True
+        finally:
+            # The tools of a stream that was abandoned early will never be awaited, so
+            # the ones that haven't started yet are cancelled instead of left queued.
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=not exhausted)
         self.end_time = datetime.datetime.now().timestamp() * 1000
         self.message_param = self._construct_message_param(
             tool_calls or None, self.content
@@ -158,7 +206,7 @@ class BaseStream(
         self,
     ) -> AsyncGenerator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None]:
         """Iterates over the stream and stores useful information."""
-        self.content = ""
+        self.content, self.tools, self.tool_futures = "", [], []
 
         async def generator() -> (
             AsyncGenerator[tuple[_BaseCallResponseChunkT, _BaseToolT | None], None]
@@ -167,22 +215,54 @@ class BaseStream(
                 self.stream, AsyncGenerator
             ), "Stream must be an async generator for __aiter__"
             tool_calls = []
-            async for chunk, tool in self.stream:
-                self._update_properties(chunk)
-                if tool:
-                    tool_call = getattr(tool, "tool_call", _DEFAULT)
-                    if tool_call != _DEFAULT:
-                        tool_calls.append(tool_call)
-                yield chunk, tool
+            semaphore = (
+                asyncio.Semaphore(self._max_tool_workers)
+                if self._execute_tools_eagerly and self._max_tool_workers
+                else None
+            )
+            exhausted = False
+            try:
+                async for chunk, tool in self.stream:
+                    self._update_properties(chunk)
+                    if tool:
+                        self.tools.append(tool)
+                        if self._execute_tools_eagerly:
+                            self.tool_futures.append(
+                                asyncio.ensure_future(call_tool_async(tool, semaphore))
+                            )
+                        tool_call = getattr(tool, "tool_call", _DEFAULT)
+                        if tool_call != _DEFAULT:
+                            tool_calls.append(tool_call)
+                    yield chunk, tool
+                exhausted = True
+            finally:
+                if not exhausted:
+                    for future in self.tool_futures:
+                        future.cancel()
             self.message_param = self._construct_message_param(
                 tool_calls or None, self.content
             )
 
         return generator()
 
+    @property
+    def content(self) -> str:
+        """The content streamed so far.
+
+        Chunks of content are only joined when the content is read so that streaming
+        many small chunks takes linear rather than quadratic time.
+        """
+        if len(self._content_chunks) > 1:
+            self._content_chunks = ["".join(self._content_chunks)]
+        return self._content_chunks[0] if self._content_chunks else ""
+
+    @content.setter
+    def content(self, content: str) -> None:
+        self._content_chunks = [content]
+
     def _update_properties(self, chunk: _BaseCallResponseChunkT) -> None:
         """Updates the properties of the stream."""
-        self.content += chunk.content
+        self._content_chunks.append(chunk.content)
         if chunk.input_tokens is not None:
             self.input_tokens = (
                 chunk.input_tokens
@@ -226,6 +306,97 @@ class BaseStream(
         """
         return self.call_response_type.tool_message_params(tools_and_outputs)
 
+    def execute_tools_eagerly(self, *, max_workers: int | None = None) -> Self:
+        """Calls each tool as soon as it's streamed rather than once the stream ends.
+
+        The tools are called in the background while the rest of the response streams,
+        and their futures are added to `tool_futures`. Sync iteration calls the tools
+        on a thread pool, and async iteration calls them in tasks. Once the stream has
+        been exhausted, `execute_tools` or `execute_tools_async` wait for the outputs of
+        the tools that are already running instead of calling them again.
+
+        Args:
+            max_workers: The maximum number of tools to call at once. Defaults to the
+                default number of workers of a `ThreadPoolExecutor` for sync iteration
+                and to calling every tool at once for async iteration.
+
+        Returns:
+            The stream, so that this can be chained before iterating over it.
+        """
+        self._execute_tools_eagerly = True
+        self._max_tool_workers = max_workers
+        return self
+
+    def execute_tools(
+        self, *, max_workers: int | None = None, timeout: float | None = None
+    ) -> list[_ToolMessageParamT]:
+        """Calls the streamed tools concurrently and returns their message params.
+
+        This should be called once the stream has been exhausted. If the tools have been
+        called eagerly while streaming, this waits for their outputs instead.
+
+        Args:
+            max_workers: The maximum number of tools to call at once. Defaults to calling
+                every tool at once.
+            timeout: The number of seconds each tool has to return.
+
+        Returns:
+            The tool message parameters for the tools' outputs, in call order.
+
+        Raises:
+            TimeoutError: If a tool doesn't return within `timeout`.
+            ValueError: If the tools were called eagerly by async iteration.
+        """
+        if not self.tools:
+            return []
+        if self.tool_futures:
+            if isinstance(self.tool_futures[0], asyncio.Future):
+                raise ValueError(
+                    "Tools called eagerly by an async stream must be awaited with "
+                    "`execute_tools_async`."
+                )
+            tools_and_outputs = get_tool_outputs(
+                self.tools,
+                self.tool_futures,  # pyright: ignore [reportArgumentType]
+                timeout,
+            )
+        else:
+            tools_and_outputs = execute_tools(
+                self.tools, max_workers=max_workers, timeout=timeout
+            )
+        return self.tool_message_params(tools_and_outputs)
+
+    async def execute_tools_async(
+        self, *, max_workers: int | None = None, timeout: float | None = None
+    ) -> list[_ToolMessageParamT]:
+        """Calls the streamed tools concurrently and returns their message params.
+
+        This should be called once the stream has been exhausted. If the tools have been
+        called eagerly while streaming, this awaits their outputs instead.
+
+        Args:
+            max_workers: The maximum number of tools to call at once. Defaults to calling
+                every tool at once.
+            timeout: The number of seconds each tool has to return.
+
+        Returns:
+            The tool message parameters for the tools' outputs, in call order.
+
+        Raises:
+            TimeoutError: If a tool doesn't return within `timeout`.
+        """
+        if not self.tools:
+            return []
+        if self.tool_futures:
+            tools_and_outputs = await get_tool_outputs_async(
+                self.tools, self.tool_futures, timeout
+            )
+        else:
+            tools_and_outputs = await execute_tools_async(
+                self.tools, max_workers=max_workers, timeout=timeout
+            )
+        return self.tool_message_params(tools_and_outputs)
+
     @abstractmethod
     def construct_call_response(self) -> _BaseCallResponseT:
         """Constructs the call response."""
@@ -345,33 +516,97 @@ def stream_factory(  # noqa: ANN201
 
             @wraps(fn)
             async def inner_async(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
-                dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
-                    model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
-                    fn=fn,
-                    fn_args=fn_args,
-                    dynamic_config=dynamic_config,
-                    tools=tools,
-                    json_mode=json_mode,
-                    call_params=call_params,
-                    extract=False,
-                )
+                timings = CallTimings()
+                with timings.measure("bind_args"):
+                    fn_args = get_fn_args(fn, args, kwargs)
+                with timings.measure("dynamic_config"):
+                    dynamic_config = await get_dynamic_configuration(fn, args, kwargs)
+                with timings.measure("media_loading"):
+                    media = await load_prompt_media_async(fn, fn_args, dynamic_config)
+                with (
+                    timings.measure("message_conversion"),
+                    capture_default_clients() as default_clients,
+                ):
+                    create, prompt_template, messages, tool_types, call_kwargs = (
+                        bind_context_var(
+                            bind_context_var(setup_call, preloaded_media, media),
+                            current_timings,
+                            timings,
+                        )(  # pyright: ignore [reportCallIssue]
+                            model=model,
+                            client=client,  # pyright: ignore [reportArgumentType]
+                            fn=fn,
+                            fn_args=fn_args,
+                            dynamic_config=dynamic_config,
+                            tools=tools,
+                            json_mode=json_mode,
+                            call_params=call_params,
+                            extract=False,
+                        )
+                    )
+                call_client = client
+                if call_client is None and default_clients:
+                    call_client = default_clients[-1]
+                rate_limiter = current_rate_limiter.get()
+                cache = current_response_cache.get()
+                ledger = current_usage_ledger.get()
+                metadata = get_metadata(fn, dynamic_config)
 
                 async def generator() -> (
                     AsyncGenerator[
                         tuple[_BaseCallResponseChunkT, _BaseToolT | None], None
                     ]
                 ):
-                    async for chunk, tool in handle_stream_async(
-                        await create(stream=True, **call_kwargs), tool_types
-                    ):
+                    cache_key, cached_chunks = None, None
+                    if cache:
+                        cache_key, cached_chunks = await cache.lookup_async(
+                            TCallResponse._provider,
+                            model,
+                            messages,
+                            call_kwargs,
+                            stream=True,
+                            client=call_client,
+                        )
+                    if ledger and cached_chunks is None:
+                        ledger.check(metadata.get("tags", ()))
+                    reservation = (
+                        await rate_limiter.acquire_async(
+                            TCallResponse._provider, model, call_client, messages
+                        )
+                        if rate_limiter and cached_chunks is None
+                        else None
+                    )
+                    request_start = time.perf_counter_ns()
+                    if cached_chunks is not None:
+                        chunks = replay_stream_async(cached_chunks)
+                    else:
+                        try:
+                            chunks = await create(stream=True, **call_kwargs)
+                        except BaseException:
+                            if reservation:
+                                reservation.release()
+                            raise
+                        if cache and cache_key:
+                            chunks = cache.record_stream_async(cache_key, chunks)
+                    input_tokens = output_tokens = 0
+                    async for chunk, tool in handle_stream_async(chunks, tool_types):
+                        if request_start:
+                            timings.add(
+                                "request", time.perf_counter_ns() - request_start
+                            )
+                            request_start = 0
+                        if reservation:
+                            input_tokens += chunk.input_tokens or 0
+                            output_tokens += chunk.output_tokens or 0
                         yield chunk, tool
+                    if reservation:
+                        reservation.reconcile(input_tokens, output_tokens)
+                    if ledger and cached_chunks is None:
+                        ledger.record_response(stream)
 
-                return TStream(
+                stream = TStream(
                     stream=generator(),
-                    metadata=get_metadata(fn, dynamic_config),
+                    metadata=metadata,
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
                     call_response_type=TCallResponse,
                     model=model,
@@ -382,25 +617,43 @@ def stream_factory(  # noqa: ANN201
                     call_params=call_params,
                     call_kwargs=call_kwargs,
                 )
+                stream.timings = timings
+                return stream
 
             return inner_async
         else:
 
             @wraps(fn)
             def inner(*args: _P.args, **kwargs: _P.kwargs) -> BaseStream:
-                fn_args = get_fn_args(fn, args, kwargs)
-                dynamic_config = get_dynamic_configuration(fn, args, kwargs)
-                create, prompt_template, messages, tool_types, call_kwargs = setup_call(  # pyright: ignore [reportCallIssue]
-                    model=model,
-                    client=client,  # pyright: ignore [reportArgumentType]
-                    fn=fn,
-                    fn_args=fn_args,
-                    dynamic_config=dynamic_config,
-                    tools=tools,
-                    json_mode=json_mode,
-                    call_params=call_params,
-                    extract=False,
-                )
+                timings = CallTimings()
+                with timings.measure("bind_args"):
+                    fn_args = get_fn_args(fn, args, kwargs)
+                with timings.measure("dynamic_config"):
+                    dynamic_config = get_dynamic_configuration(fn, args, kwargs)
+                with (
+                    timings.measure("message_conversion"),
+                    capture_default_clients() as default_clients,
+                ):
+                    create, prompt_template, messages, tool_types, call_kwargs = (
+                        bind_context_var(setup_call, current_timings, timings)(  # pyright: ignore [reportCallIssue]
+                            model=model,
+                            client=client,  # pyright: ignore [reportArgumentType]
+                            fn=fn,
+                            fn_args=fn_args,
+                            dynamic_config=dynamic_config,
+                            tools=tools,
+                            json_mode=json_mode,
+                            call_params=call_params,
+                            extract=False,
+                        )
+                    )
+                call_client = client
+                if call_client is None and default_clients:
+                    call_client = default_clients[-1]
+                rate_limiter = current_rate_limiter.get()
+                cache = current_response_cache.get()
+                ledger = current_usage_ledger.get()
+                metadata = get_metadata(fn, dynamic_config)
 
                 def generator() -> (
                     Generator[
@@ -409,13 +662,56 @@ def stream_factory(  # noqa: ANN201
                         None,
                     ]
                 ):
-                    yield from handle_stream(
-                        create(stream=True, **call_kwargs), tool_types
+                    cache_key, cached_chunks = None, None
+                    if cache:
+                        cache_key, cached_chunks = cache.lookup(
+                            TCallResponse._provider,
+                            model,
+                            messages,
+                            call_kwargs,
+                            stream=True,
+                            client=call_client,
+                        )
+                    if ledger and cached_chunks is None:
+                        ledger.check(metadata.get("tags", ()))
+                    reservation = (
+                        rate_limiter.acquire(
+                            TCallResponse._provider, model, call_client, messages
+                        )
+                        if rate_limiter and cached_chunks is None
+                        else None
                     )
+                    request_start = time.perf_counter_ns()
+                    if cached_chunks is not None:
+                        chunks = replay_stream(cached_chunks)
+                    else:
+                        try:
+                            chunks = create(stream=True, **call_kwargs)
+                        except BaseException:
+                            if reservation:
+                                reservation.release()
+                            raise
+                        if cache and cache_key:
+                            chunks = cache.record_stream(cache_key, chunks)
+                    input_tokens = output_tokens = 0
+                    for chunk, tool in handle_stream(chunks, tool_types):
+                        if request_start:
+                            timings.add(
+                                "request", time.perf_counter_ns() - request_start
+                            )
+                            request_start = 0
+                        if reservation:
+                            input_tokens += chunk.input_tokens or 0
+                            output_tokens += chunk.output_tokens or 0
+                        yield chunk, tool
+                    if reservation:
+                        reservation.reconcile(input_tokens, output_tokens)
+                    if ledger and cached_chunks is None:
+                        ledger.record_response(stream)
 
-                return TStream(
+                stream = TStream(
                     stream=generator(),
-                    metadata=get_metadata(fn, dynamic_config),
+                    metadata=metadata,
                     tool_types=tool_types,  # pyright: ignore [reportArgumentType]
                     call_response_type=TCallResponse,
                     model=model,
@@ -426,6 +722,8 @@ def stream_factory(  # noqa: ANN201
                     call_params=call_params,
                     call_kwargs=call_kwargs,
                 )
+                stream.timings = timings
+                return stream
 
             return inner
 
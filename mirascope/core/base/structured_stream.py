@@ -23,9 +23,10 @@ from pydantic import BaseModel
 from ._utils import (
     BaseType,
     GetJsonOutput,
+    IncrementalItemExtractor,
+    IncrementalToolReturnExtractor,
     SameSyncAndAsyncClientSetupCall,
     SetupCall,
-    extract_tool_return,
     fn_is_async,
     setup_extract_tool,
 )
@@ -50,11 +51,18 @@ _ResponseModelT = TypeVar("_ResponseModelT", bound=BaseModel | BaseType)
 
 
 class BaseStructuredStream(Generic[_ResponseModelT]):
-    """A base class for streaming structured outputs from LLMs."""
+    """A base class for streaming structured outputs from LLMs.
+
+    By default, iterating yields a partial response model for every chunk followed by
+    the complete response model. If `iterable` is set, the output is instead a sequence
+    of `response_model` items, and iterating yields each item once as soon as it's
+    complete. The list of all items is then the `constructed_response_model`.
+    """
 
     stream: BaseStream
     response_model: type[_ResponseModelT]
     constructed_response_model: _ResponseModelT
+    iterable: bool
 
     def __init__(
         self,
@@ -62,67 +70,81 @@ class BaseStructuredStream(Generic[_ResponseModelT]):
         stream: BaseStream,
         response_model: type[_ResponseModelT],
         fields_from_call_args: dict[str, Any],
+        iterable: bool = False,
     ) -> None:
         """Initializes an instance of `BaseStructuredStream`."""
         self.stream = stream
         self.response_model = response_model
         self.fields_from_call_args = fields_from_call_args
+        self.iterable = iterable
 
     def __iter__(self) -> Generator[_ResponseModelT, None, None]:
         """Iterates over the stream and extracts structured outputs."""
-        json_output = ""
+        if self.iterable:
+            yield from self._iter_items()
+            return
+        extractor = IncrementalToolReturnExtractor(
+            self.response_model, self.fields_from_call_args
+        )
         for chunk, _ in self.stream:
-            json_output += chunk.content
-            if json_output and json_output[0] != "{":
-                try:
-                    json_start = json_output.index("{")
-                    json_output = json_output[json_start:]
-                except ValueError:
-                    json_output = ""
+            extractor.feed(chunk.content)
             if chunk.model is not None:
                 self.stream.model = chunk.model
-            if json_output:
-                yield extract_tool_return(
-                    self.response_model, json_output, True, self.fields_from_call_args
-                )
-        if json_output:
-            json_output = json_output[: json_output.rfind("}") + 1]
-        self.constructed_response_model = extract_tool_return(
-            self.response_model, json_output, False, self.fields_from_call_args
-        )
+            if extractor.started:
+                yield extractor.partial()
+        self.constructed_response_model = extractor.complete()
         yield self.constructed_response_model
 
     def __aiter__(self) -> AsyncGenerator[_ResponseModelT, None]:
         """Iterates over the stream and extracts structured outputs."""
 
         async def generator() -> AsyncGenerator[_ResponseModelT, None]:
-            json_output = ""
+            if self.iterable:
+                async for item in self._aiter_items():
+                    yield item
+                return
+            extractor = IncrementalToolReturnExtractor(
+                self.response_model, self.fields_from_call_args
+            )
             async for chunk, _ in self.stream:
-                json_output += chunk.content
-                if json_output and json_output[0] != "{":
-                    try:
-                        json_start = json_output.index("{")
-                        json_output = json_output[json_start:]
-                    except ValueError:
-                        json_output = ""
+                extractor.feed(chunk.content)
                 if chunk.model is not None:
                     self.stream.model = chunk.model
-                if json_output:
-                    yield extract_tool_return(
-                        self.response_model,
-                        json_output,
-                        True,
-                        self.fields_from_call_args,
-                    )
-            if json_output:
-                json_output = json_output[: json_output.rfind("}") + 1]
-            self.constructed_response_model = extract_tool_return(
-                self.response_model, json_output, False, self.fields_from_call_args
-            )
+                if extractor.started:
+                    yield extractor.partial()
+            self.constructed_response_model = extractor.complete()
             yield self.constructed_response_model
 
         return generator()
 
+    def _iter_items(self) -> Generator[_ResponseModelT, None, None]:
+        extractor = IncrementalItemExtractor(
+            self.response_model, self.fields_from_call_args
+        )
+        items = []
+        for chunk, _ in self.stream:
+            if chunk.model is not None:
+                self.stream.model = chunk.model
+            for item in extractor.feed(chunk.content):
+                items.append(item)
+                yield item
+        extractor.complete()
+        self.constructed_response_model = items  # pyright: ignore [reportAttributeAccessIssue]
+
+    async def _aiter_items(self) -> AsyncGenerator[_ResponseModelT, None]:
+        extractor = IncrementalItemExtractor(
+            self.response_model, self.fields_from_call_args
+        )
+        items = []
+        async for chunk, _ in self.stream:
+            if chunk.model is not None:
+                self.stream.model = chunk.model
+            for item in extractor.feed(chunk.content):
+                items.append(item)
+                yield item
+        extractor.complete()
+        self.constructed_response_model = items  # pyright: ignore [reportAttributeAccessIssue]
+
 
 _BaseDynamicConfigT = TypeVar("_BaseDynamicConfigT", bound=BaseDynamicConfig)
 _SameSyncAndAsyncClientT = TypeVar("_SameSyncAndAsyncClientT", contravariant=True)
@@ -179,6 +201,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        iterable: bool = False,
     ) -> Callable[
         _P,
         Iterable[_ResponseModelT],
@@ -192,6 +215,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        iterable: bool = False,
     ) -> Callable[
         _P,
         Awaitable[AsyncIterable[_ResponseModelT]],
@@ -205,6 +229,7 @@ def structured_stream_factory(  # noqa: ANN201
         json_mode: bool,
         client: _SameSyncAndAsyncClientT | _SyncBaseClientT | _AsyncBaseClientT | None,
         call_params: _BaseCallParamsT,
+        iterable: bool = False,
     ) -> Callable[
         _P,
         Iterable[_ResponseModelT] | Awaitable[AsyncIterable[_ResponseModelT]],
@@ -243,14 +268,18 @@ def structured_stream_factory(  # noqa: ANN201
             handle_stream_async=handle_stream_async,
         )
 
-        tool = setup_extract_tool(response_model, TToolType)
-        stream_decorator_kwargs = {
-            "model": model,
-            "tools": [tool],
-            "json_mode": json_mode,
-            "client": client,
-            "call_params": call_params,
-        }
+        tool = setup_extract_tool(
+            list[response_model] if iterable else response_model,  # pyright: ignore [reportArgumentType, reportGeneralTypeIssues]
+            TToolType,
+        )
+        stream = stream_decorator(
+            fn=fn,
+            model=model,
+            tools=[tool],
+            json_mode=json_mode,
+            client=client,
+            call_params=call_params,
+        )
         fn._model = model  # pyright: ignore [reportFunctionMemberAccess]
         fn.__mirascope_call__ = True  # pyright: ignore [reportFunctionMemberAccess]
         if fn_is_async(fn):
@@ -263,11 +292,10 @@ def structured_stream_factory(  # noqa: ANN201
                     response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=await stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=await stream(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
+                    iterable=iterable,
                 )
 
             return inner_async
@@ -279,11 +307,10 @@ def structured_stream_factory(  # noqa: ANN201
                     response_model, fn, args, kwargs
                 )
                 return BaseStructuredStream[_ResponseModelT](
-                    stream=stream_decorator(fn=fn, **stream_decorator_kwargs)(
-                        *args, **kwargs
-                    ),
+                    stream=stream(*args, **kwargs),
                     response_model=response_model,
                     fields_from_call_args=fields_from_call_args,
+                    iterable=iterable,
                 )
 
             return inner
@@ -0,0 +1,108 @@
+"""This module contains the `CallTimings` class for timing the phases of a call."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Generator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+current_timings: ContextVar[CallTimings | None] = ContextVar(
+    "current_timings", default=None
+)
+
+
+class CallTimings:
+    """The time spent in each phase of a call, measured with `time.perf_counter_ns`.
+
+    The phases of a call are:
+
+    - `bind_args`: binding the arguments of the call to the function's parameters.
+    - `dynamic_config`: running the function to get its dynamic configuration.
+    - `media_loading`: loading the images, audio, etc. referenced by the prompt.
+    - `template_rendering`: rendering the prompt template into messages.
+    - `tool_schemas`: converting the tools and generating their schemas.
+    - `message_conversion`: converting the messages into the provider's format and
+        building the rest of the request.
+    - `request`: sending the request until the response (or the first chunk of a
+        stream) is received.
+    - `response_parsing`: wrapping the response, accounting for its usage, and running
+        the `output_parser`.
+    - `validation`: parsing and validating the response model of an extraction.
+
+    Phases that are timed within another phase (e.g. loading media while rendering the
+    template) are excluded from it, so the phases never overlap and add up to the
+    overhead of the call. Phases that didn't happen are not included.
+
+    Example:
+
+    ```python
+    from mirascope.core import openai
+
+
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    response = recommend_book("fantasy")
+    print(response.timings.as_ms())
+    # > {'bind_args': 0.01, 'dynamic_config': 0.02, 'template_rendering': 0.03, ...}
+    ```
+    """
+
+    def __init__(self) -> None:
+        """Initializes an instance of `CallTimings` with no recorded phases."""
+        self.phases: dict[str, int] = {}
+        self._nested = 0
+
+    def add(self, phase: str, duration_ns: int) -> None:
+        """Adds `duration_ns` nanoseconds to the time spent in `phase`."""
+        self.phases[phase] = self.phases.get(phase, 0) + duration_ns
+
+    @contextmanager
+    def measure(self, phase: str) -> Generator[None, None, None]:
+        """Adds the time spent in the `with` block to `phase`.
+
+        The time spent in the phases measured within the block is excluded.
+        """
+        outer_nested, self._nested = self._nested, 0
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            self.add(phase, elapsed - self._nested)
+            self._nested = outer_nested + elapsed
+
+    @property
+    def total_ns(self) -> int:
+        """The total time spent in all of the phases in nanoseconds."""
+        return sum(self.phases.values())
+
+    def as_ms(self) -> dict[str, float]:
+        """Returns the time spent in each phase in milliseconds."""
+        return {phase: duration / 1e6 for phase, duration in self.phases.items()}
+
+    def __getitem__(self, phase: str) -> int:
+        """Returns the time spent in `phase` in nanoseconds, or 0 if it didn't happen."""
+        return self.phases.get(phase, 0)
+
+    def __repr__(self) -> str:
+        """Returns the time spent in each phase in milliseconds."""
+        phases = ", ".join(f"{phase}={ms:.3f}ms" for phase, ms in self.as_ms().items())
+        return f"CallTimings({phases})"
+
+
+@contextmanager
+def measure(phase: str) -> Generator[None, None, None]:
+    """Adds the time spent in the `with` block to `phase` of the `current_timings`.
+
+    Does nothing when the block doesn't run within a timed call.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    with timings.measure(phase):
+        yield
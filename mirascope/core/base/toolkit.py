@@ -84,8 +84,14 @@ class BaseToolKit(BaseModel, ABC):
                 # Replace non-self template variables with escaped double brackets so
                 # that templating `self` results in a future templateable string.
                 template = template.replace(f"{{{var}}}", f"{{{{{var}}}}}")
+            # Each toolkit instance sets its own state on the converted tool type, so
+            # the type must not be shared through the tool type cache.
             converted_method = convert_function_to_base_tool(
-                method, BaseTool, template.format(self=self), self.__namespace__
+                method,
+                BaseTool,
+                template.format(self=self),
+                self.__namespace__,
+                use_cache=False,
             )
             for key, value in self:
                 setattr(converted_method, key, value)
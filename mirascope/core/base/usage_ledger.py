@@ -0,0 +1,271 @@
+"""This module contains the `UsageLedger` class for accounting the usage of calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, NamedTuple, ParamSpec, TypeVar, overload
+
+from ._utils import bind_context_var
+
+if TYPE_CHECKING:
+    from .call_response import BaseCallResponse
+    from .stream import BaseStream
+
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+current_usage_ledger: ContextVar[UsageLedger | None] = ContextVar(
+    "current_usage_ledger", default=None
+)
+
+_TOTAL = ("total",)
+
+
+class Usage(NamedTuple):
+    """The aggregated usage of a set of calls.
+
+    Attributes:
+        calls: The number of calls.
+        input_tokens: The total number of input tokens.
+        output_tokens: The total number of output tokens.
+        cost: The total cost in dollars of the calls with a known cost.
+        unpriced_calls: The number of calls without a known cost (e.g. models that
+            aren't in the pricing registry), which `cost` doesn't include.
+    """
+
+    calls: int = 0
+    input_tokens: float = 0
+    output_tokens: float = 0
+    cost: float = 0.0
+    unpriced_calls: int = 0
+
+
+class BudgetExceededError(RuntimeError):
+    """Raised when a call is made after a `UsageLedger`'s budget has been spent."""
+
+    def __init__(self, spent: float, budget: float, tag: str | None = None) -> None:
+        self.spent = spent
+        self.budget = budget
+        self.tag = tag
+        scope = f"tag '{tag}'" if tag is not None else "all calls"
+        super().__init__(
+            f"The budget of ${budget:.2f} per window for {scope} has been spent "
+            f"(${spent:.2f})."
+        )
+
+
+class UsageLedger:
+    """Aggregates the tokens and cost of calls, and enforces spend budgets.
+
+    Calls made by functions decorated with the ledger are recorded once they complete
+    (or once a stream is exhausted), using the cost that the provider's response
+    calculates from the pricing registry. Usage is aggregated in total, per
+    `(provider, model)`, per `metadata` tag, and per fixed time window of `window`
+    seconds (the last `max_windows` of which are kept). Responses returned from a
+    `ResponseCache` cost nothing and are not recorded.
+
+    If a `budget` is set, calls raise `BudgetExceededError` before they are sent once
+    the cost of the current window reaches it. `tag_budgets` do the same for the calls
+    with each tag. Budgets only count the calls with a known cost, so calls to models
+    without pricing are never stopped by them; check `unpriced_calls` to find them.
+    Recording and checking only hold a lock for a few dictionary updates, so one
+    ledger can be shared by many threads and async tasks.
+
+    Example:
+
+    ```python
+    from mirascope.core import UsageLedger, openai
+
+    ledger = UsageLedger(window=3600, budget=50.0, tag_budgets={"batch": 10.0})
+
+
+    @ledger
+    @openai.call("gpt-4o-mini")
+    def recommend_book(genre: str) -> str:
+        return f"Recommend a {genre} book"
+
+
+    recommend_book("fantasy")
+    print(ledger.total())
+    # > Usage(calls=1, input_tokens=14, output_tokens=30, cost=2.01e-05, unpriced_calls=0)
+    ```
+    """
+
+    def __init__(
+        self,
+        window: float = 3600.0,
+        max_windows: int = 24,
+        budget: float | None = None,
+        tag_budgets: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initializes an instance of `UsageLedger`.
+
+        Args:
+            window: The number of seconds of each time window.
+            max_windows: The number of most recent time windows to keep.
+            budget: The maximum cost in dollars of all calls per window, if any.
+            tag_budgets: The maximum cost in dollars per window of the calls with each
+                tag.
+        """
+        self.window = window
+        self.max_windows = max_windows
+        self.budget = budget
+        self.tag_budgets = dict(tag_budgets or {})
+        self._totals: dict[tuple[str, ...], list[float]] = {}
+        self._windows: OrderedDict[float, dict[tuple[str, ...], list[float]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def _window_start(self, now: float) -> float:
+        return now - now % self.window
+
+    def _current_window(self, now: float) -> dict[tuple[str, ...], list[float]]:
+        start = self._window_start(now)
+        if (usages := self._windows.get(start)) is None:
+            usages = self._windows[start] = {}
+            while len(self._windows) > self.max_windows:
+                self._windows.popitem(last=False)
+        return usages
+
+    def record(
+        self,
+        provider: str,
+        model: str,
+        input_tokens: int | float | None,
+        output_tokens: int | float | None,
+        cost: float | None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """Records the usage of a call.
+
+        Args:
+            provider: The provider of the call.
+            model: The model of the call.
+            input_tokens: The number of input tokens, if known.
+            output_tokens: The number of output tokens, if known.
+            cost: The cost of the call in dollars, if known. Calls without a known
+                cost are counted in `unpriced_calls` rather than as free.
+            tags: The tags of the call.
+        """
+        values = (
+            1,
+            input_tokens or 0,
+            output_tokens or 0,
+            cost or 0.0,
+            int(cost is None),
+        )
+        keys = [_TOTAL, ("model", provider, model), *(("tag", tag) for tag in tags)]
+        with self._lock:
+            window = self._current_window(time.time())
+            for usages in (self._totals, window):
+                for key in keys:
+                    if (usage := usages.get(key)) is None:
+                        usages[key] = list(values)
+                    else:
+                        for index, value in enumerate(values):
+                            usage[index] += value
+
+    def record_response(self, response: BaseCallResponse | BaseStream) -> None:
+        """Records the usage of a call response or exhausted stream.
+
+        Args:
+            response: The call response or stream.
+        """
+        self.record(
+            response._provider,
+            response.model or "",
+            response.input_tokens,
+            response.output_tokens,
+            response.cost,
+            response.metadata.get("tags", ()),
+        )
+
+    def check(self, tags: Iterable[str] = ()) -> None:
+        """Checks that a call with `tags` is within the budgets of the current window.
+
+        Args:
+            tags: The tags of the call.
+
+        Raises:
+            BudgetExceededError: If the budget of all calls or of one of the tags has
+                been spent.
+        """
+        if self.budget is None and not self.tag_budgets:
+            return
+        with self._lock:
+            window = self._windows.get(self._window_start(time.time()), {})
+            if self.budget is not None:
+                spent = window[_TOTAL][3] if _TOTAL in window else 0.0
+                if spent >= self.budget:
+                    raise BudgetExceededError(spent, self.budget)
+            for tag in tags:
+                if (budget := self.tag_budgets.get(tag)) is None:
+                    continue
+                usage = window.get(("tag", tag))
+                if (spent := usage[3] if usage else 0.0) >= budget:
+                    raise BudgetExceededError(spent, budget, tag)
+
+    def total(self) -> Usage:
+        """Returns the usage of all recorded calls."""
+        with self._lock:
+            usage = self._totals.get(_TOTAL)
+            return Usage(*usage) if usage else Usage()  # pyright: ignore [reportArgumentType]
+
+    def by_model(self) -> dict[tuple[str, str], Usage]:
+        """Returns the usage of the recorded calls per `(provider, model)`."""
+        with self._lock:
+            return {
+                (key[1], key[2]): Usage(*usage)  # pyright: ignore [reportArgumentType]
+                for key, usage in self._totals.items()
+                if key[0] == "model"
+            }
+
+    def by_tag(self) -> dict[str, Usage]:
+        """Returns the usage of the recorded calls per tag."""
+        with self._lock:
+            return {
+                key[1]: Usage(*usage)  # pyright: ignore [reportArgumentType]
+                for key, usage in self._totals.items()
+                if key[0] == "tag"
+            }
+
+    def by_window(self) -> dict[float, Usage]:
+        """Returns the usage of the recorded calls per window, keyed by the Unix time
+        at which each window started.
+        """
+        with self._lock:
+            return {
+                start: Usage(*usages[_TOTAL])  # pyright: ignore [reportArgumentType]
+                for start, usages in self._windows.items()
+            }
+
+    def current_window(self) -> Usage:
+        """Returns the usage of the calls recorded in the current window."""
+        with self._lock:
+            usage = self._windows.get(self._window_start(time.time()), {}).get(_TOTAL)
+            return Usage(*usage) if usage else Usage()  # pyright: ignore [reportArgumentType]
+
+    def clear(self) -> None:
+        """Removes all recorded usage."""
+        with self._lock:
+            self._totals.clear()
+            self._windows.clear()
+
+    @overload
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]]
+    ) -> Callable[_P, Awaitable[_R]]: ...
+
+    @overload
+    def __call__(self, fn: Callable[_P, _R]) -> Callable[_P, _R]: ...
+
+    def __call__(
+        self, fn: Callable[_P, Awaitable[_R]] | Callable[_P, _R]
+    ) -> Callable[_P, Awaitable[_R]] | Callable[_P, _R]:
+        """Records the calls made by `fn` in this ledger and enforces its budgets."""
+        return bind_context_var(fn, current_usage_ledger, self)
@@ -61,6 +61,8 @@ Args:
     client (object): An optional custom client to use in place of the default client.
     call_params (BedrockCallParams): The `BedrockCallParams` call parameters to use in the
         API call.
+    iterable (bool): Whether to stream a sequence of `response_model` items, yielding
+        each item once as soon as it's complete. Requires `stream=True`.
 
 Returns:
     decorator (Callable): The decorator for turning a typed function into an Bedrock API
@@ -8,6 +8,7 @@ from mypy_boto3_bedrock_runtime.type_defs import (
 )
 from typing_extensions import TypedDict
 
+from ...base._utils import get_tool_types_by_name
 from .._types import (
     AsyncStreamOutputChunk,
     StreamOutputChunk,
@@ -27,14 +28,14 @@ class ToolUseChunk(TypedDict):
 def _handle_chunk(
     chunk: StreamOutputChunk | AsyncStreamOutputChunk,
     current_tool_use_chunk: ToolUseChunk | None,
-    tool_types: list[type[BedrockTool]] | None,
+    tool_types_by_name: dict[str, type[BedrockTool]] | None,
 ) -> tuple[
     BedrockCallResponseChunk | None,
     BedrockTool | None,
     ToolUseChunk | None,
 ]:
     """Handles a chunk of the stream."""
-    if not tool_types:
+    if not tool_types_by_name:
         return BedrockCallResponseChunk(chunk=chunk), None, None
     elif (content_block_start := chunk.get("contentBlockStart")) and (
         tool_use := content_block_start["start"].get("toolUse")
@@ -56,21 +57,23 @@ def _handle_chunk(
     elif "contentBlockStop" in chunk and current_tool_use_chunk:
         current_tool_use_chunk["stop"] = True
         return None, None, current_tool_use_chunk
-    elif current_tool_use_chunk and current_tool_use_chunk["stop"]:
-        for tool_type in tool_types:
-            if current_tool_use_chunk["name"] == tool_type._name():
-                current_tool_use = ToolUseBlockContentTypeDef(
-                    toolUse=ToolUseBlockOutputTypeDef(
-                        toolUseId=current_tool_use_chunk["tool_use_id"],
-                        input=json.loads(current_tool_use_chunk["input_chunk"]),
-                        name=current_tool_use_chunk["name"],
-                    )
-                )
-                return (
-                    BedrockCallResponseChunk(chunk=chunk),
-                    tool_type.from_tool_call(current_tool_use),
-                    None,
-                )
+    elif (
+        current_tool_use_chunk
+        and current_tool_use_chunk["stop"]
+        and (tool_type := tool_types_by_name.get(current_tool_use_chunk["name"]))
+    ):
+        current_tool_use = ToolUseBlockContentTypeDef(
+            toolUse=ToolUseBlockOutputTypeDef(
+                toolUseId=current_tool_use_chunk["tool_use_id"],
+                input=json.loads(current_tool_use_chunk["input_chunk"]),
+                name=current_tool_use_chunk["name"],
+            )
+        )
+        return (
+            BedrockCallResponseChunk(chunk=chunk),
+            tool_type.from_tool_call(current_tool_use),
+            None,
+        )
     return BedrockCallResponseChunk(chunk=chunk), None, current_tool_use_chunk
 
 
@@ -79,10 +82,11 @@ def handle_stream(
     tool_types: list[type[BedrockTool]] | None,
 ) -> Generator[tuple[BedrockCallResponseChunk, BedrockTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_use_chunk = None
     for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_types_by_name
         )
         if call_response:
             yield call_response, tool
@@ -93,10 +97,11 @@ async def handle_stream_async(
     tool_types: list[type[BedrockTool]] | None,
 ) -> AsyncGenerator[tuple[BedrockCallResponseChunk, BedrockTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_use_chunk = None
     async for chunk in stream:
         call_response, tool, current_tool_use_chunk = _handle_chunk(
-            chunk, current_tool_use_chunk, tool_types
+            chunk, current_tool_use_chunk, tool_types_by_name
         )
         if call_response:
             yield call_response, tool
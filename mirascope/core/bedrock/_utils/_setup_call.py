@@ -34,6 +34,7 @@ from ...base._utils import (
     fn_is_async,
     get_async_create_fn,
     get_create_fn,
+    get_default_client,
 )
 from .._types import (
     AsyncStreamOutputChunk,
@@ -47,6 +48,14 @@ from ..tool import BedrockTool
 from ._convert_message_params import convert_message_params
 
 _P = ParamSpec("_P")
+_AWS_ENV_VARS = (
+    "AWS_PROFILE",
+    "AWS_REGION",
+    "AWS_DEFAULT_REGION",
+    "AWS_ACCESS_KEY_ID",
+    "AWS_SECRET_ACCESS_KEY",
+    "AWS_SESSION_TOKEN",
+)
 
 
 def _extract_sync_stream_fn(
@@ -82,9 +91,52 @@ def _extract_async_stream_fn(
     return _inner
 
 
-async def _get_async_client(session: AioSession) -> AsyncBedrockRuntimeClient:
+async def _async_client_lifespan(
+    session: AioSession,
+) -> AsyncGenerator[AsyncBedrockRuntimeClient, None]:
     async with session.create_client("bedrock-runtime") as client:
-        return client
+        yield client
+
+
+class _AsyncClientProvider:
+    """Lazily creates the default async client for the event loop it is used in.
+
+    Creating an aiobotocore client must be awaited, so we can't create it in the
+    synchronous `setup_call`. Instead, the client is created on the first request and
+    reused for all subsequent requests in the same event loop. The client lives inside
+    an async generator, which the event loop closes on shutdown (e.g. at the end of
+    `asyncio.run`), so the client is closed along with its loop.
+    """
+
+    def __init__(self) -> None:
+        self._client: AsyncBedrockRuntimeClient | None = None
+        self._lifespan: AsyncGenerator[AsyncBedrockRuntimeClient, None] | None = None
+        self._lock = asyncio.Lock()
+
+    async def get_client(self) -> AsyncBedrockRuntimeClient:
+        if self._client is None:
+            async with self._lock:
+                if self._client is None:
+                    self._lifespan = _async_client_lifespan(get_session())
+                    self._client = await anext(self._lifespan)
+        return self._client
+
+    async def converse(
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncConverseResponseTypeDef:
+        return await (await self.get_client()).converse(**kwargs)
+
+    async def converse_stream(
+        self,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncConverseStreamResponseTypeDef:
+        return await (await self.get_client()).converse_stream(**kwargs)
+
+    async def close(self) -> None:
+        if self._lifespan is not None:
+            lifespan, self._client, self._lifespan = self._lifespan, None, None
+            await lifespan.aclose()
 
 
 @overload
@@ -189,14 +241,22 @@ def setup_call(
 
     call_kwargs |= cast(BedrockCallKwargs, {"modelId": model, "messages": messages})
 
-    if client is None:
-        if fn_is_async(fn):
-            session = get_session()
-            client = asyncio.run(_get_async_client(session))
-        else:
-            session = Session()
-            client = session.client("bedrock-runtime")
+    if client is None and fn_is_async(fn):
+        provider = get_default_client(
+            _AsyncClientProvider, is_async=True, env_vars=_AWS_ENV_VARS
+        )
+        create = get_async_create_fn(
+            provider.converse,
+            _extract_async_stream_fn(provider.converse_stream, model),
+        )
+        return create, prompt_template, messages, tool_types, call_kwargs
 
+    if client is None:
+        client = get_default_client(
+            lambda: Session().client("bedrock-runtime"),
+            key=(Session, "bedrock-runtime"),
+            env_vars=_AWS_ENV_VARS,
+        )
     create = (
         get_async_create_fn(
             client.converse, _extract_async_stream_fn(client.converse_stream, model)
@@ -3,6 +3,7 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
 from typing import cast
 
 from mypy_boto3_bedrock_runtime.type_defs import (
@@ -14,6 +15,7 @@ from types_aiobotocore_bedrock_runtime.type_defs import (
 )
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._types import (
     AssistantMessageTypeDef,
     AsyncMessageTypeDef,
@@ -125,7 +127,7 @@ class BedrockCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> SerializeAsAny[AssistantMessageTypeDef]:
         """Returns the assistants's response as a message parameter."""
         message = self.message
@@ -134,7 +136,7 @@ class BedrockCallResponse(
         return AssistantMessageTypeDef(role="assistant", content=message["content"])
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[BedrockTool] | None:
         """Returns any available tool calls as their `BedrockTool` definition.
 
@@ -150,21 +152,20 @@ class BedrockCallResponse(
         if not self.tool_types or not tool_uses:
             return None
 
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools = []
         for tool_use in tool_uses:
-            for tool_type in self.tool_types:
-                if tool_use["name"] == tool_type._name():
-                    extracted_tools.append(
-                        tool_type.from_tool_call(
-                            cast(ToolUseBlockContentTypeDef, {"toolUse": tool_use})
-                        )
+            if tool_type := tool_types_by_name.get(tool_use["name"]):
+                extracted_tools.append(
+                    tool_type.from_tool_call(
+                        cast(ToolUseBlockContentTypeDef, {"toolUse": tool_use})
                     )
-                    break
+                )
 
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> BedrockTool | None:
         """Returns the 0th tool for the 0th choice message.
 
@@ -1,5 +1,15 @@
 """Calculate the cost of a completion using the Cohere API."""
 
+from ...base.pricing import ModelPricing, pricing_registry
+
+pricing_registry.register(
+    "cohere",
+    {
+        "command-r": ModelPricing(input=0.000_000_5, output=0.000_001_5),
+        "command-r-plus": ModelPricing(input=0.000_003, output=0.000_015),
+    },
+)
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -14,26 +24,4 @@ def calculate_cost(
     command-r          $0.5 / 1M tokens	   $1.5 / 1M tokens
     command-r-plus     $3 / 1M tokens	   $15 / 1M tokens
     """
-    pricing = {
-        "command-r": {
-            "prompt": 0.000_000_5,
-            "completion": 0.000_001_5,
-        },
-        "command-r-plus": {
-            "prompt": 0.000_003,
-            "completion": 0.000_015,
-        },
-    }
-    if input_tokens is None or output_tokens is None:
-        return None
-
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
-        return None
-
-    prompt_cost = input_tokens * model_pricing["prompt"]
-    completion_cost = output_tokens * model_pricing["completion"]
-    total_cost = prompt_cost + completion_cost
-
-    return total_cost
+    return pricing_registry.calculate_cost("cohere", model, input_tokens, output_tokens)
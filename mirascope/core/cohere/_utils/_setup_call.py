@@ -24,6 +24,7 @@ from ...base._utils import (
     CreateFn,
     get_async_create_fn,
     get_create_fn,
+    get_default_client,
 )
 from ..call_kwargs import CohereCallKwargs
 from ..call_params import CohereCallParams
@@ -31,6 +32,8 @@ from ..dynamic_config import CohereDynamicConfig
 from ..tool import CohereTool
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("CO_API_KEY", "CO_API_URL")
+
 
 @overload
 def setup_call(
@@ -128,7 +131,11 @@ def setup_call(
     }
 
     if client is None:
-        client = AsyncClient() if inspect.iscoroutinefunction(fn) else Client()
+        client = (
+            get_default_client(AsyncClient, is_async=True, env_vars=_ENV_VARS)
+            if inspect.iscoroutinefunction(fn)
+            else get_default_client(Client, env_vars=_ENV_VARS)
+        )
 
     create_or_stream = (
         get_async_create_fn(client.chat, client.chat_stream)
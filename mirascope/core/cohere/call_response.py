@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from cohere.types import (
     ApiMetaBilledUnits,
     ChatMessage,
@@ -13,6 +15,7 @@ from cohere.types import (
 from pydantic import SkipValidation, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._utils import calculate_cost
 from .call_params import CohereCallParams
 from .dynamic_config import CohereDynamicConfig
@@ -105,7 +108,7 @@ class CohereCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> ChatMessage:
         """Returns the assistant's response as a message parameter."""
         return ChatMessage(
@@ -115,7 +118,7 @@ class CohereCallResponse(
         )
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[CohereTool] | None:
         """Returns the tools for the 0th choice message.
 
@@ -124,16 +127,15 @@ class CohereCallResponse(
         """
         if not self.tool_types or not self.response.tool_calls:
             return None
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools: list[CohereTool] = []
         for tool_call in self.response.tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
+            if tool_type := tool_types_by_name.get(tool_call.name):
+                extracted_tools.append(tool_type.from_tool_call(tool_call))
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> CohereTool | None:
         """Returns the 0th tool for the 0th choice message.
 
@@ -60,6 +60,8 @@ Args:
     client (object): An optional custom client to use in place of the default client.
     call_params (GeminiCallParams): The `GeminiCallParams` call parameters to use in the
         API call.
+    iterable (bool): Whether to stream a sequence of `response_model` items, yielding
+        each item once as soon as it's complete. Requires `stream=True`.
 
 Returns:
     decorator (Callable): The decorator for turning a typed function into a Gemini API
@@ -6,6 +6,17 @@ import PIL.Image
 from google.generativeai.types import ContentDict
 
 from ...base import BaseMessageParam
+from ...base._utils import get_image_type
+from ...base.media_loader import get_media_loader
+
+
+def _is_image_type(image: bytes, media_type: str) -> bool:
+    """Returns whether the `image` data is actually of the type `media_type`."""
+    try:
+        image_type = get_media_loader().derive(image, "image_type", get_image_type)
+    except ValueError:
+        return False
+    return media_type == f"image/{image_type}"
 
 
 def convert_message_params(
@@ -51,8 +62,14 @@ def convert_message_params(
                             "Gemini currently only supports JPEG, PNG, WebP, HEIC, "
                             "and HEIF images."
                         )
-                    image = PIL.Image.open(io.BytesIO(part.image))
-                    converted_content.append(image)
+                    if _is_image_type(part.image, part.media_type):
+                        converted_content.append(
+                            {"mime_type": part.media_type, "data": part.image}
+                        )
+                    else:
+                        # Let Pillow detect the actual type of the data.
+                        image = PIL.Image.open(io.BytesIO(part.image))
+                        converted_content.append(image)
                 elif part.type == "audio":
                     if part.media_type not in [
                         "audio/wav",
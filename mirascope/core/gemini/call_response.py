@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from google.generativeai.protos import FunctionResponse
 from google.generativeai.types import (
     AsyncGenerateContentResponse,
@@ -14,6 +16,7 @@ from google.generativeai.types import (
 from pydantic import computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._utils import calculate_cost
 from .call_params import GeminiCallParams
 from .dynamic_config import GeminiDynamicConfig
@@ -120,30 +123,29 @@ class GeminiCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> ContentDict:
         """Returns the models's response as a message parameter."""
         return {"role": "model", "parts": self.response.parts}  # pyright: ignore [reportReturnType]
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[GeminiTool] | None:
         """Returns the list of tools for the 0th candidate's 0th content part."""
         if self.tool_types is None:
             return None
 
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools = []
         for part in self.response.candidates[0].content.parts:
             tool_call = part.function_call
-            for tool_type in self.tool_types:
-                if tool_call.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
+            if tool_type := tool_types_by_name.get(tool_call.name):
+                extracted_tools.append(tool_type.from_tool_call(tool_call))
 
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> GeminiTool | None:
         """Returns the 0th tool for the 0th candidate's 0th content part.
 
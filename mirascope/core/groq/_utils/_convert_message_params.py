@@ -1,10 +1,9 @@
 """Utility for converting `BaseMessageParam` to `ChatCompletionMessageParam`"""
 
-import base64
-
 from groq.types.chat import ChatCompletionMessageParam
 
 from ...base import BaseMessageParam
+from ...base._utils import encode_media_base64
 
 
 def convert_message_params(
@@ -32,7 +31,7 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. Groq"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    data = encode_media_base64(part.image)
                     converted_content.append(
                         {
                             "type": "image_url",
@@ -12,13 +12,21 @@ from groq.types.chat import (
 )
 
 from ...base import BaseMessageParam, BaseTool, _utils
-from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
+from ...base._utils import (
+    AsyncCreateFn,
+    CreateFn,
+    get_async_create_fn,
+    get_create_fn,
+    get_default_client,
+)
 from ..call_kwargs import GroqCallKwargs
 from ..call_params import GroqCallParams
 from ..dynamic_config import GroqDynamicConfig
 from ..tool import GroqTool
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("GROQ_API_KEY", "GROQ_BASE_URL")
+
 
 @overload
 def setup_call(
@@ -111,7 +119,11 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncGroq() if inspect.iscoroutinefunction(fn) else Groq()
+        client = (
+            get_default_client(AsyncGroq, is_async=True, env_vars=_ENV_VARS)
+            if inspect.iscoroutinefunction(fn)
+            else get_default_client(Groq, env_vars=_ENV_VARS)
+        )
 
     create = (
         get_async_create_fn(client.chat.completions.create)
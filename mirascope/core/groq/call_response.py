@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from groq.types.chat import (
     ChatCompletion,
     ChatCompletionAssistantMessageParam,
@@ -15,6 +17,7 @@ from groq.types.completion_usage import CompletionUsage
 from pydantic import SerializeAsAny, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._utils import calculate_cost
 from .call_params import GroqCallParams
 from .dynamic_config import GroqDynamicConfig
@@ -98,7 +101,7 @@ class GroqCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> SerializeAsAny[ChatCompletionAssistantMessageParam]:
         """Returns the assistants's response as a message parameter."""
         message_param = self.response.choices[0].message.model_dump(
@@ -107,7 +110,7 @@ class GroqCallResponse(
         return ChatCompletionAssistantMessageParam(**message_param)
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[GroqTool] | None:
         """Returns any available tool calls as their `GroqTool` definition.
 
@@ -118,17 +121,16 @@ class GroqCallResponse(
         if not self.tool_types or not tool_calls:
             return None
 
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools = []
         for tool_call in tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.function.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
+            if tool_type := tool_types_by_name.get(tool_call.function.name):
+                extracted_tools.append(tool_type.from_tool_call(tool_call))
 
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> GroqTool | None:
         """Returns the 0th tool for the 0th choice message.
 
@@ -62,6 +62,8 @@ Args:
     client (None): LiteLLM does not support a custom client.
     call_params (OpenAICallParams): The `OpenAICallParams` call parameters to use in the
         API call.
+    iterable (bool): Whether to stream a sequence of `response_model` items, yielding
+        each item once as soon as it's complete. Requires `stream=True`.
 
 Returns:
     decorator (Callable): The decorator for turning a typed function into a LiteLLM
@@ -8,7 +8,7 @@ from openai import OpenAI
 from openai.types.chat import ChatCompletion, ChatCompletionMessageParam
 
 from ...base import BaseTool
-from ...base._utils import fn_is_async
+from ...base._utils import fn_is_async, get_default_client
 from ...openai import OpenAICallParams, OpenAIDynamicConfig, OpenAITool
 from ...openai._utils import setup_call as setup_call_openai
 from ...openai.call_kwargs import OpenAICallKwargs
@@ -76,7 +76,7 @@ def setup_call(
 ]:
     _, prompt_template, messages, tool_types, call_kwargs = setup_call_openai(
         model=model,  # pyright: ignore [reportCallIssue]
-        client=OpenAI(api_key="NOT_USED"),
+        client=get_default_client(lambda: OpenAI(api_key="NOT_USED"), key=OpenAI),
         fn=fn,  # pyright: ignore [reportArgumentType]
         fn_args=fn_args,  # pyright: ignore [reportArgumentType]
         dynamic_config=dynamic_config,
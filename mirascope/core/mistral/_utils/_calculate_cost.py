@@ -1,5 +1,25 @@
 """Calculate the cost of a completion using the Mistral API."""
 
+from ...base.pricing import ModelPricing, pricing_registry
+
+pricing_registry.register(
+    "mistral",
+    {
+        "open-mistral-nemo": ModelPricing(input=0.000_000_3, output=0.000_000_3),
+        "open-mistral-nemo-2407": ModelPricing(input=0.000_000_3, output=0.000_000_3),
+        "mistral-large-latest": ModelPricing(input=0.000_003, output=0.000_009),
+        "mistral-large-2407": ModelPricing(input=0.000_003, output=0.000_009),
+        "open-mistral-7b": ModelPricing(input=0.000_000_25, output=0.000_000_25),
+        "open-mixtral-8x7b": ModelPricing(input=0.000_000_7, output=0.000_000_7),
+        "open-mixtral-8x22b": ModelPricing(input=0.000_002, output=0.000_006),
+        "mistral-small-latest": ModelPricing(input=0.000_002, output=0.000_006),
+        "mistral-medium-latest": ModelPricing(input=0.000_002_75, output=0.000_008_1),
+    },
+)
+for _model in ["mistral-large", "mistral-small", "mistral-medium"]:
+    # Dated versions (e.g. "mistral-large-2411") use the prices of the latest version.
+    pricing_registry.register_alias("mistral", _model, f"{_model}-latest")
+
 
 def calculate_cost(
     input_tokens: int | float | None,
@@ -20,28 +40,6 @@ def calculate_cost(
     mistral-small-latest	  $2/1M tokens	      $6/1M tokens
     mistral-medium-latest     $2.75/1M tokens	  $8.1/1M tokens
     """
-    pricing = {
-        "open-mistral-nemo": {"prompt": 0.000_000_3, "completion": 0.000_000_3},
-        "open-mistral-nemo-2407": {"prompt": 0.000_000_3, "completion": 0.000_000_3},
-        "mistral-large-latest": {"prompt": 0.000_003, "completion": 0.000_009},
-        "mistral-large-2407": {"prompt": 0.000_003, "completion": 0.000_009},
-        "open-mistral-7b": {"prompt": 0.000_000_25, "completion": 0.000_000_25},
-        "open-mixtral-8x7b": {"prompt": 0.000_000_7, "completion": 0.000_000_7},
-        "open-mixtral-8x22b": {"prompt": 0.000_002, "completion": 0.000_006},
-        "mistral-small-latest": {"prompt": 0.000_002, "completion": 0.000_006},
-        "mistral-medium-latest": {"prompt": 0.000_002_75, "completion": 0.000_008_1},
-    }
-
-    if input_tokens is None or output_tokens is None:
-        return None
-
-    try:
-        model_pricing = pricing[model]
-    except KeyError:
-        return None
-
-    prompt_cost = input_tokens * model_pricing["prompt"]
-    completion_cost = output_tokens * model_pricing["completion"]
-    total_cost = prompt_cost + completion_cost
-
-    return total_cost
+    return pricing_registry.calculate_cost(
+        "mistral", model, input_tokens, output_tokens
+    )
@@ -9,6 +9,7 @@ from mistralai.models.chat_completion import (
     ToolType,
 )
 
+from ...base._utils import get_tool_types_by_name
 from ..call_response_chunk import MistralCallResponseChunk
 from ..tool import MistralTool
 
@@ -17,19 +18,26 @@ def _handle_chunk(
     chunk: ChatCompletionStreamResponse,
     current_tool_call: ToolCall,
     current_tool_type: type[MistralTool] | None,
-    tool_types: list[type[MistralTool]] | None,
+    tool_types_by_name: dict[str, type[MistralTool]] | None,
+    arguments: list[str],
 ) -> tuple[
     MistralTool | None,
     ToolCall,
     type[MistralTool] | None,
 ]:
-    """Handles a chunk of the stream."""
-    if not tool_types or not (tool_calls := chunk.choices[0].delta.tool_calls):
+    """Handles a chunk of the stream.
+
+    The argument deltas of the current tool call are collected in `arguments` and only
+    joined into the tool call's arguments once the tool call is complete.
+    """
+    if not tool_types_by_name or not (tool_calls := chunk.choices[0].delta.tool_calls):
         return None, current_tool_call, current_tool_type
 
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id != "null" and tool_call.function is not None:
+        current_tool_call.function.arguments = "".join(arguments)
+        arguments.clear()
         previous_tool_call = current_tool_call.model_copy()
         previous_tool_type = current_tool_type
         current_tool_call = ToolCall(
@@ -40,11 +48,7 @@ def _handle_chunk(
             ),
             type=ToolType.function,
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
+        current_tool_type = tool_types_by_name.get(current_tool_call.function.name)
         if current_tool_type is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
@@ -58,7 +62,7 @@ def _handle_chunk(
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -68,13 +72,16 @@ def handle_stream(
     tool_types: list[type[MistralTool]] | None,
 ) -> Generator[tuple[MistralCallResponseChunk, MistralTool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ToolCall(
         id="", function=FunctionCall(arguments="", name=""), type=ToolType.function
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, []
     for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = "".join(arguments)
+                arguments.clear()
                 yield (
                     MistralCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -86,7 +93,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield MistralCallResponseChunk(chunk=chunk), tool
@@ -97,13 +105,16 @@ async def handle_stream_async(
     tool_types: list[type[MistralTool]] | None,
 ) -> AsyncGenerator[tuple[MistralCallResponseChunk, MistralTool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ToolCall(
         id="", function=FunctionCall(arguments="", name=""), type=ToolType.function
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = "".join(arguments)
+                arguments.clear()
                 yield (
                     MistralCallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -115,7 +126,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield MistralCallResponseChunk(chunk=chunk), tool
@@ -19,13 +19,21 @@ from mistralai.models.chat_completion import (
 )
 
 from ...base import BaseMessageParam, BaseTool, _utils
-from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
+from ...base._utils import (
+    AsyncCreateFn,
+    CreateFn,
+    get_async_create_fn,
+    get_create_fn,
+    get_default_client,
+)
 from ..call_kwargs import MistralCallKwargs
 from ..call_params import MistralCallParams
 from ..dynamic_config import MistralDynamicConfig
 from ..tool import MistralTool
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("MISTRAL_API_KEY",)
+
 
 @overload
 def setup_call(
@@ -113,7 +121,9 @@ def setup_call(
 
     if client is None:
         client = (
-            MistralAsyncClient() if inspect.iscoroutinefunction(fn) else MistralClient()
+            get_default_client(MistralAsyncClient, is_async=True, env_vars=_ENV_VARS)
+            if inspect.iscoroutinefunction(fn)
+            else get_default_client(MistralClient, env_vars=_ENV_VARS)
         )
     if isinstance(client, MistralAsyncClient):
         create_or_stream = get_async_create_fn(client.chat, client.chat_stream)
@@ -3,6 +3,7 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
 from typing import Any
 
 from mistralai.models.chat_completion import ChatCompletionResponse, ChatMessage
@@ -10,6 +11,7 @@ from mistralai.models.common import UsageInfo
 from pydantic import computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._utils import calculate_cost
 from .call_params import MistralCallParams
 from .dynamic_config import MistralDynamicConfig
@@ -95,13 +97,13 @@ class MistralCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> ChatMessage:
         """Returns the assistants's response as a message parameter."""
         return self.response.choices[0].message
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[MistralTool] | None:
         """Returns the tools for the 0th choice message.
 
@@ -112,17 +114,16 @@ class MistralCallResponse(
         if not self.tool_types or not tool_calls:
             return None
 
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools = []
         for tool_call in tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.function.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
+            if tool_type := tool_types_by_name.get(tool_call.function.name):
+                extracted_tools.append(tool_type.from_tool_call(tool_call))
 
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> MistralTool | None:
         """Returns the 0th tool for the 0th choice message.
 
@@ -1,10 +1,9 @@
 """Utility for converting `BaseMessageParam` to `ChatCompletionMessageParam`."""
 
-import base64
-
 from openai.types.chat import ChatCompletionMessageParam
 
 from ...base import BaseMessageParam
+from ...base._utils import encode_media_base64
 
 
 def convert_message_params(
@@ -32,7 +31,7 @@ def convert_message_params(
                             f"Unsupported image media type: {part.media_type}. OpenAI"
                             " currently only supports JPEG, PNG, GIF, and WebP images."
                         )
-                    data = base64.b64encode(part.image).decode("utf-8")
+                    data = encode_media_base64(part.image)
                     converted_content.append(
                         {
                             "type": "image_url",
@@ -55,7 +54,7 @@ def convert_message_params(
                         {
                             "input_audio": {
                                 "format": part.media_type.split("/")[-1],
-                                "data": base64.b64encode(part.audio).decode("utf-8"),
+                                "data": encode_media_base64(part.audio),
                             },
                             "type": "input_audio",
                         }
@@ -5,6 +5,7 @@ from collections.abc import AsyncGenerator, Generator
 from openai.types.chat import ChatCompletionChunk, ChatCompletionMessageToolCall
 from openai.types.chat.chat_completion_message_tool_call import Function
 
+from ...base._utils import get_tool_types_by_name
 from ..call_response_chunk import OpenAICallResponseChunk
 from ..tool import OpenAITool
 
@@ -13,15 +14,20 @@ def _handle_chunk(
     chunk: ChatCompletionChunk,
     current_tool_call: ChatCompletionMessageToolCall,
     current_tool_type: type[OpenAITool] | None,
-    tool_types: list[type[OpenAITool]] | None,
+    tool_types_by_name: dict[str, type[OpenAITool]] | None,
+    arguments: list[str],
 ) -> tuple[
     OpenAITool | None,
     ChatCompletionMessageToolCall,
     type[OpenAITool] | None,
 ]:
-    """Handles a chunk of the stream."""
+    """Handles a chunk of the stream.
+
+    The argument deltas of the current tool call are collected in `arguments` and only
+    joined into the tool call's arguments once the tool call is complete.
+    """
     if (
-        not tool_types
+        not tool_types_by_name
         or not chunk.choices
         or not (tool_calls := chunk.choices[0].delta.tool_calls)
     ):
@@ -30,6 +36,8 @@ def _handle_chunk(
     tool_call = tool_calls[0]
     # Reset on new tool
     if tool_call.id and tool_call.function is not None:
+        current_tool_call.function.arguments = "".join(arguments)
+        arguments.clear()
         previous_tool_call = current_tool_call.model_copy()
         previous_tool_type = current_tool_type
         current_tool_call = ChatCompletionMessageToolCall(
@@ -40,11 +48,7 @@ def _handle_chunk(
             ),
             type="function",
         )
-        current_tool_type = None
-        for tool_type in tool_types:
-            if tool_type._name() == tool_call.function.name:
-                current_tool_type = tool_type
-                break
+        current_tool_type = tool_types_by_name.get(current_tool_call.function.name)
         if current_tool_type is None:
             raise RuntimeError(
                 f"Unknown tool type in stream: {tool_call.function.name}"
@@ -62,7 +66,7 @@ def _handle_chunk(
 
     # Update arguments with each chunk
     if tool_call.function and tool_call.function.arguments:
-        current_tool_call.function.arguments += tool_call.function.arguments
+        arguments.append(tool_call.function.arguments)
 
     return None, current_tool_call, current_tool_type
 
@@ -72,13 +76,16 @@ def handle_stream(
     tool_types: list[type[OpenAITool]] | None,
 ) -> Generator[tuple[OpenAICallResponseChunk, OpenAITool | None], None, None]:
     """Iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, []
     for chunk in stream:
         if not tool_types or not chunk.choices or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = "".join(arguments)
+                arguments.clear()
                 yield (
                     OpenAICallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -90,7 +97,8 @@ def handle_stream(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield OpenAICallResponseChunk(chunk=chunk), tool
@@ -101,13 +109,16 @@ async def handle_stream_async(
     tool_types: list[type[OpenAITool]] | None,
 ) -> AsyncGenerator[tuple[OpenAICallResponseChunk, OpenAITool | None], None]:
     """Async iterator over the stream and constructs tools as they are streamed."""
+    tool_types_by_name = get_tool_types_by_name(tool_types) if tool_types else None
     current_tool_call = ChatCompletionMessageToolCall(
         id="", function=Function(arguments="", name=""), type="function"
     )
-    current_tool_type = None
+    current_tool_type, arguments = None, []
     async for chunk in stream:
         if not tool_types or not chunk.choices[0].delta.tool_calls:
             if current_tool_type:
+                current_tool_call.function.arguments = "".join(arguments)
+                arguments.clear()
                 yield (
                     OpenAICallResponseChunk(chunk=chunk),
                     current_tool_type.from_tool_call(current_tool_call),
@@ -119,7 +130,8 @@ async def handle_stream_async(
             chunk,
             current_tool_call,
             current_tool_type,
-            tool_types,
+            tool_types_by_name,
+            arguments,
         )
         if tool is not None:
             yield OpenAICallResponseChunk(chunk=chunk), tool
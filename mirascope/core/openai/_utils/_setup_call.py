@@ -14,13 +14,21 @@ from openai.types.chat import (
 )
 
 from ...base import BaseMessageParam, BaseTool, _utils
-from ...base._utils import AsyncCreateFn, CreateFn, get_async_create_fn, get_create_fn
+from ...base._utils import (
+    AsyncCreateFn,
+    CreateFn,
+    get_async_create_fn,
+    get_create_fn,
+    get_default_client,
+)
 from ..call_kwargs import OpenAICallKwargs
 from ..call_params import OpenAICallParams
 from ..dynamic_config import OpenAIDynamicConfig
 from ..tool import GenerateOpenAIStrictToolJsonSchema, OpenAITool
 from ._convert_message_params import convert_message_params
 
+_ENV_VARS = ("OPENAI_API_KEY", "OPENAI_ORG_ID", "OPENAI_PROJECT_ID", "OPENAI_BASE_URL")
+
 
 @overload
 def setup_call(
@@ -124,7 +132,11 @@ def setup_call(
     call_kwargs |= {"model": model, "messages": messages}
 
     if client is None:
-        client = AsyncOpenAI() if inspect.iscoroutinefunction(fn) else OpenAI()
+        client = (
+            get_default_client(AsyncOpenAI, is_async=True, env_vars=_ENV_VARS)
+            if inspect.iscoroutinefunction(fn)
+            else get_default_client(OpenAI, env_vars=_ENV_VARS)
+        )
     create = (
         get_async_create_fn(client.chat.completions.create)
         if isinstance(client, AsyncOpenAI)
@@ -4,6 +4,7 @@ usage docs: learn/calls.md#handling-responses
 """
 
 import base64
+from functools import cached_property
 
 from openai.types.chat import (
     ChatCompletion,
@@ -17,6 +18,7 @@ from openai.types.completion_usage import CompletionUsage
 from pydantic import SerializeAsAny, SkipValidation, computed_field
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._utils import calculate_cost
 from .call_params import OpenAICallParams
 from .dynamic_config import OpenAIDynamicConfig
@@ -113,10 +115,19 @@ class OpenAICallResponse(
     @property
     def cost(self) -> float | None:
         """Returns the cost of the call."""
-        return calculate_cost(self.input_tokens, self.output_tokens, self.model)
+        prompt_details = getattr(self.usage, "prompt_tokens_details", None)
+        completion_details = getattr(self.usage, "completion_tokens_details", None)
+        return calculate_cost(
+            self.input_tokens,
+            self.output_tokens,
+            self.model,
+            cached_input_tokens=getattr(prompt_details, "cached_tokens", None),
+            audio_input_tokens=getattr(prompt_details, "audio_tokens", None),
+            audio_output_tokens=getattr(completion_details, "audio_tokens", None),
+        )
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> SerializeAsAny[ChatCompletionAssistantMessageParam]:
         """Returns the assistants's response as a message parameter."""
         message_param = self.response.choices[0].message.model_dump(
@@ -127,7 +138,7 @@ class OpenAICallResponse(
         return ChatCompletionAssistantMessageParam(**message_param)
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[OpenAITool] | None:
         """Returns any available tool calls as their `OpenAITool` definition.
 
@@ -145,17 +156,16 @@ class OpenAICallResponse(
         if not self.tool_types or not tool_calls:
             return None
 
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools = []
         for tool_call in tool_calls:
-            for tool_type in self.tool_types:
-                if tool_call.function.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
+            if tool_type := tool_types_by_name.get(tool_call.function.name):
+                extracted_tools.append(tool_type.from_tool_call(tool_call))
 
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> OpenAITool | None:
         """Returns the 0th tool for the 0th choice message.
 
@@ -3,6 +3,17 @@
 from vertexai.generative_models import Content, Image, Part
 
 from ...base import BaseMessageParam
+from ...base._utils import get_image_type
+from ...base.media_loader import get_media_loader
+
+
+def _is_image_type(image: bytes, media_type: str) -> bool:
+    """Returns whether the `image` data is actually of the type `media_type`."""
+    try:
+        image_type = get_media_loader().derive(image, "image_type", get_image_type)
+    except ValueError:
+        return False
+    return media_type == f"image/{image_type}"
 
 
 def convert_message_params(
@@ -52,8 +63,14 @@ def convert_message_params(
                             "Vertex currently only supports JPEG, PNG, WebP, HEIC, "
                             "and HEIF images."
                         )
-                    image = Image.from_bytes(part.image)
-                    converted_content.append(Part.from_image(image))
+                    if _is_image_type(part.image, part.media_type):
+                        converted_content.append(
+                            Part.from_data(mime_type=part.media_type, data=part.image)
+                        )
+                    else:
+                        # Let Pillow detect the actual type of the data.
+                        image = Image.from_bytes(part.image)
+                        converted_content.append(Part.from_image(image))
                 elif part.type == "audio":
                     if part.media_type not in [
                         "audio/wav",
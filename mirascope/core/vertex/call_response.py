@@ -3,6 +3,8 @@
 usage docs: learn/calls.md#handling-responses
 """
 
+from functools import cached_property
+
 from google.cloud.aiplatform_v1beta1.types import (
     FunctionResponse,
     GenerateContentResponse,
@@ -11,6 +13,7 @@ from pydantic import computed_field
 from vertexai.generative_models import Content, GenerationResponse, Tool
 
 from ..base import BaseCallResponse
+from ..base._utils import get_tool_types_by_name
 from ._utils import calculate_cost
 from .call_params import VertexCallParams
 from .dynamic_config import VertexDynamicConfig
@@ -113,30 +116,29 @@ class VertexCallResponse(
         return calculate_cost(self.input_tokens, self.output_tokens, self.model)
 
     @computed_field
-    @property
+    @cached_property
     def message_param(self) -> Content:
         """Returns the models's response as a message parameter."""
         return Content(role="model", parts=self.response.candidates[0].content.parts)
 
     @computed_field
-    @property
+    @cached_property
     def tools(self) -> list[VertexTool] | None:
         """Returns the list of tools for the 0th candidate's 0th content part."""
         if self.tool_types is None:
             return None
 
+        tool_types_by_name = get_tool_types_by_name(self.tool_types)
         extracted_tools = []
         for part in self.response.candidates[0].content.parts:
             tool_call = part.function_call
-            for tool_type in self.tool_types:
-                if tool_call.name == tool_type._name():
-                    extracted_tools.append(tool_type.from_tool_call(tool_call))
-                    break
+            if tool_type := tool_types_by_name.get(tool_call.name):
+                extracted_tools.append(tool_type.from_tool_call(tool_call))
 
         return extracted_tools
 
     @computed_field
-    @property
+    @cached_property
     def tool(self) -> VertexTool | None:
         """Returns the 0th tool for the 0th candidate's 0th content part.
 
@@ -1,16 +1,32 @@
 """Integrations with third party libraries."""
 
-from contextlib import suppress
+import importlib
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 from ._middleware_factory import middleware_factory
 
-with suppress(ImportError):
-    from . import logfire as logfire
+if TYPE_CHECKING:
+    from . import langfuse, logfire, otel
 
-with suppress(ImportError):
-    from . import langfuse as langfuse
+# Integrations are imported on first access so that importing `mirascope` doesn't
+# import the SDK of every installed integration.
+_INTEGRATIONS = frozenset(["langfuse", "logfire", "otel"])
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _INTEGRATIONS:
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} ({e})"
+            ) from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_INTEGRATIONS})
 
-with suppress(ImportError):
-    from . import otel as otel
 
 __all__ = ["langfuse", "logfire", "middleware_factory", "otel"]
@@ -1,11 +1,19 @@
 """The `middleware_factory` method for handling the call response."""
 
 import inspect
-from collections.abc import AsyncGenerator, Awaitable, Callable, Generator
-from contextlib import AbstractContextManager, contextmanager
-from functools import wraps
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterator,
+)
+from contextlib import AbstractContextManager, AsyncExitStack, ExitStack, contextmanager
+from functools import cache, partial, wraps
 from typing import (
     Any,
+    NamedTuple,
     ParamSpec,
     TypeVar,
     cast,
@@ -36,9 +44,119 @@ AsyncFunc = Callable[
     ],
 ]
 _T = TypeVar("_T")
+_StreamT = TypeVar("_StreamT", bound=BaseStream | BaseStructuredStream)
 _R = TypeVar("_R")
 
 
+class _Hook(NamedTuple):
+    """A middleware to run once a stream has been iterated over.
+
+    `layer` is the middleware's `custom_decorator` applied to `_iterate` (or
+    `_aiterate`) so that the iteration runs inside of it, or `None` if the middleware
+    has no custom decorator.
+    """
+
+    layer: Callable[..., Any] | None
+    handler: Callable[..., Any] | None
+    fn: Callable[..., Any]
+    context: Any
+    context_manager: AbstractContextManager
+
+
+def _finish(hook: _Hook, stream: Any) -> None:  # noqa: ANN401
+    if hook.handler is not None:
+        hook.handler(stream, hook.fn, hook.context)
+    hook.context_manager.__exit__(None, None, None)
+
+
+async def _finish_async(hook: _Hook, stream: Any) -> None:  # noqa: ANN401
+    if hook.handler is not None:
+        await hook.handler(stream, hook.fn, hook.context)
+    hook.context_manager.__exit__(None, None, None)
+
+
+def _iterate(
+    stream: Any,  # noqa: ANN401
+    inner: Callable[[], Iterator[Any]],
+    hooks: tuple[_Hook, ...],
+) -> Generator[Any, None, None]:
+    """Yields from `inner` and then finishes `hooks` in order, even if one raises."""
+    with ExitStack() as stack:
+        for hook in reversed(hooks):
+            stack.callback(_finish, hook, stream)
+        yield from inner()
+
+
+def _aiterate(
+    stream: Any,  # noqa: ANN401
+    inner: Callable[[], AsyncIterator[Any]],
+    hooks: tuple[_Hook, ...],
+) -> AsyncGenerator[Any, None]:
+    """Yields from `inner` and then finishes `hooks` in order, even if one raises."""
+
+    async def generator() -> AsyncGenerator[Any, None]:
+        async with AsyncExitStack() as stack:
+            for hook in reversed(hooks):
+                stack.push_async_callback(_finish_async, hook, stream)
+            async for item in inner():
+                yield item
+
+    return generator()
+
+
+def _fuse(
+    stream: Any,  # noqa: ANN401
+    inner: Callable[[], Any],
+    iterate: Callable[..., Any],
+) -> Callable[[], Any]:
+    """Returns `inner` wrapped by every middleware hooked onto `stream`.
+
+    Consecutive middlewares without a custom decorator share a single wrapper, so
+    stacking them doesn't nest a generator per middleware.
+    """
+    group: list[_Hook] = []
+    for hook in stream._middleware_hooks:
+        if hook.layer is None:
+            group.append(hook)
+            continue
+        if group:
+            inner = partial(iterate, stream, inner, tuple(group))
+            group = []
+        inner = partial(hook.layer, stream, inner, (hook,))
+    return partial(iterate, stream, inner, tuple(group)) if group else inner
+
+
+@cache
+def _middleware_class(cls: type[_StreamT]) -> type[_StreamT]:
+    """Returns the (cached) subclass of `cls` that runs the hooked middlewares."""
+
+    class MiddlewareStream(cls):
+        _middleware_hooks: tuple[_Hook, ...] = ()
+
+        def __iter__(self) -> Iterator[Any]:
+            return _fuse(self, super().__iter__, _iterate)()
+
+        def __aiter__(self) -> AsyncIterator[Any]:
+            return _fuse(self, super().__aiter__, _aiterate)()
+
+    MiddlewareStream.__name__ = cls.__name__
+    MiddlewareStream.__qualname__ = cls.__qualname__
+    MiddlewareStream.__module__ = cls.__module__
+    return MiddlewareStream
+
+
+def _add_hook(result: BaseStream | BaseStructuredStream, hook: _Hook) -> None:
+    """Hooks a middleware onto `result` to run once it has been iterated over.
+
+    The class of `result` is swapped for a cached subclass of its original class, and
+    middlewares stacked onto the same stream are appended to its hooks rather than
+    wrapping the stream once more.
+    """
+    if "_middleware_hooks" not in vars(type(result)):
+        result.__class__ = _middleware_class(type(result))
+    result._middleware_hooks = (*result._middleware_hooks, hook)  # pyright: ignore [reportAttributeAccessIssue]
+
+
 @contextmanager
 def default_context_manager(
     fn: SyncFunc | AsyncFunc,
@@ -127,6 +245,9 @@ def middleware_factory(
     def decorator(
         fn: Callable[_P, _R | Awaitable[_R]],
     ) -> Callable[_P, _R | Awaitable[_R]]:
+        decorate = custom_decorator(fn) if custom_decorator else None
+        iterate = decorate(_iterate) if decorate else None
+        aiterate = decorate(_aiterate) if decorate else None
         if inspect.iscoroutinefunction(fn):
 
             @wraps(fn)
@@ -141,33 +262,12 @@ def middleware_factory(
                     await handle_call_response_async(result, fn, context)
                     context_manager.__exit__(None, None, None)
                 elif isinstance(result, BaseStream):
-                    original_class = type(result)
-                    original_aiter = result.__aiter__
-
-                    def new_stream_aiter(
-                        self: Any,  # noqa: ANN401
-                    ) -> AsyncGenerator[tuple[Any, Any | None], Any]:  # noqa: ANN401
-                        async def generator() -> (
-                            AsyncGenerator[tuple[Any, Any | None], Any]
-                        ):
-                            try:
-                                async for chunk, tool in original_aiter():
-                                    yield chunk, tool
-                            finally:
-                                if handle_stream_async is not None:
-                                    await handle_stream_async(result, fn, context)
-                                context_manager.__exit__(None, None, None)
-
-                        return generator()
-
-                    class MiddlewareAsyncStream(original_class):
-                        __aiter__ = (
-                            custom_decorator(fn)(new_stream_aiter)
-                            if custom_decorator
-                            else new_stream_aiter
-                        )
-
-                    result.__class__ = MiddlewareAsyncStream
+                    _add_hook(
+                        result,
+                        _Hook(
+                            aiterate, handle_stream_async, fn, context, context_manager
+                        ),
+                    )
                 elif (
                     isinstance(result, ResponseModel)
                     and handle_response_model_async is not None
@@ -175,42 +275,19 @@ def middleware_factory(
                     await handle_response_model_async(result, fn, context)
                     context_manager.__exit__(None, None, None)
                 elif isinstance(result, BaseStructuredStream):
-                    original_class = type(result)
-                    original_aiter = result.__aiter__
-
-                    def new_aiter(
-                        self: Any,  # noqa: ANN401
-                    ) -> AsyncGenerator[tuple[Any, Any | None], Any]:  # noqa: ANN401
-                        async def generator() -> (
-                            AsyncGenerator[tuple[Any, Any | None], Any]
-                        ):
-                            try:
-                                async for chunk in original_aiter():
-                                    yield chunk
-                            finally:
-                                if handle_structured_stream_async is not None:
-                                    await handle_structured_stream_async(
-                                        result, fn, context
-                                    )
-                                context_manager.__exit__(None, None, None)
-
-                        return generator()
-
-                    class MiddlewareAsyncStructuredStream(original_class):
-                        __aiter__ = (
-                            custom_decorator(fn)(new_aiter)
-                            if custom_decorator
-                            else new_aiter
-                        )
-
-                    result.__class__ = MiddlewareAsyncStructuredStream
+                    _add_hook(
+                        result,
+                        _Hook(
+                            aiterate,
+                            handle_structured_stream_async,
+                            fn,
+                            context,
+                            context_manager,
+                        ),
+                    )
                 return cast(_R, result)
 
-            return (
-                custom_decorator(fn)(wrapper_async)
-                if custom_decorator
-                else wrapper_async
-            )
+            return decorate(wrapper_async) if decorate else wrapper_async
         else:
 
             @wraps(fn)
@@ -225,28 +302,10 @@ def middleware_factory(
                     handle_call_response(result, fn, context)
                     context_manager.__exit__(None, None, None)
                 elif isinstance(result, BaseStream):
-                    original_class = type(result)
-                    original_iter = result.__iter__
-
-                    def new_stream_iter(
-                        self: Any,  # noqa: ANN401
-                    ) -> Generator[tuple[Any, Any | None], None, None]:  # noqa: ANN401
-                        # Create the context manager when user iterates over the stream
-                        try:
-                            yield from original_iter()
-                        finally:
-                            if handle_stream is not None:
-                                handle_stream(result, fn, context)
-                            context_manager.__exit__(None, None, None)
-
-                    class MiddlewareStream(original_class):
-                        __iter__ = (
-                            custom_decorator(fn)(new_stream_iter)
-                            if custom_decorator
-                            else new_stream_iter
-                        )
-
-                    result.__class__ = MiddlewareStream
+                    _add_hook(
+                        result,
+                        _Hook(iterate, handle_stream, fn, context, context_manager),
+                    )
                 elif (
                     isinstance(result, ResponseModel)
                     and handle_response_model is not None
@@ -254,35 +313,18 @@ def middleware_factory(
                     handle_response_model(result, fn, context)
                     context_manager.__exit__(None, None, None)
                 elif isinstance(result, BaseStructuredStream):
-                    original_class = type(result)
-                    original_iter = result.__iter__
-
-                    def new_iter(
-                        self: Any,  # noqa: ANN401
-                    ) -> Generator[
-                        Generator[tuple[Any, Any | None], None, None]
-                        | Generator[Any, None, None],
-                        Any,
-                        None,
-                    ]:  # noqa: ANN401
-                        # Create the context manager when user iterates over the stream
-                        try:
-                            yield from original_iter()
-                        finally:
-                            if handle_structured_stream is not None:
-                                handle_structured_stream(result, fn, context)
-                            context_manager.__exit__(None, None, None)
-
-                    class MiddlewareStructuredStream(original_class):
-                        __iter__ = (
-                            custom_decorator(fn)(new_iter)
-                            if custom_decorator
-                            else new_iter
-                        )
-
-                    result.__class__ = MiddlewareStructuredStream
+                    _add_hook(
+                        result,
+                        _Hook(
+                            iterate,
+                            handle_structured_stream,
+                            fn,
+                            context,
+                            context_manager,
+                        ),
+                    )
                 return cast(_R, result)
 
-            return custom_decorator(fn)(wrapper) if custom_decorator else wrapper
+            return decorate(wrapper) if decorate else wrapper
 
     return decorator
@@ -1,5 +1,17 @@
-from ._utils import configure
+from ._utils import (
+    PRODUCTION_PAYLOAD_POLICY,
+    PayloadPolicy,
+    configure,
+    dropped_records,
+)
 from ._with_hyperdx import with_hyperdx
 from ._with_otel import with_otel
 
-__all__ = ["configure", "with_hyperdx", "with_otel"]
+__all__ = [
+    "configure",
+    "dropped_records",
+    "PayloadPolicy",
+    "PRODUCTION_PAYLOAD_POLICY",
+    "with_hyperdx",
+    "with_otel",
+]
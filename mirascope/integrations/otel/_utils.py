@@ -1,14 +1,22 @@
 """Mirascope x OpenTelemetry Integration utils"""
 
+import hashlib
 import json
+import logging
+import random
+import threading
 from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any
+from time import time_ns
+from typing import Any, NamedTuple
 
 from opentelemetry.sdk.trace import SpanProcessor, TracerProvider
 from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
     ConsoleSpanExporter,
     SimpleSpanProcessor,
+    SpanExporter,
 )
 from opentelemetry.trace import (
     Tracer,
@@ -16,7 +24,7 @@ from opentelemetry.trace import (
     set_tracer_provider,
 )
 from opentelemetry.trace.span import Span
-from opentelemetry.util.types import Attributes, AttributeValue
+from opentelemetry.util.types import AttributeValue
 from pydantic import BaseModel
 
 from mirascope.core.base._utils._base_type import BaseType
@@ -26,36 +34,190 @@ from ...core.base.stream import BaseStream
 from ...core.base.structured_stream import BaseStructuredStream
 
 
+class PayloadPolicy(NamedTuple):
+    """How the prompts and completions of calls are recorded on their spans.
+
+    Attributes:
+        max_length: The maximum number of characters of a prompt or completion to
+            record. Longer payloads are truncated, and their length and SHA-256 hash
+            are recorded alongside them. `None` records payloads in full.
+        sample_rate: The fraction of calls whose prompts and completions are recorded.
+            The other calls only record the length and hash of their payloads.
+        deferred: Whether to serialize the responses onto their spans and end the
+            spans on a background thread instead of the thread making the call.
+        max_pending: The maximum number of deferred records waiting for the
+            background thread. Once it's reached, responses are not recorded onto
+            their spans (see `dropped_records`) and spans are ended right away.
+    """
+
+    max_length: int | None = None
+    sample_rate: float = 1.0
+    deferred: bool = False
+    max_pending: int = 10_000
+
+
+PRODUCTION_PAYLOAD_POLICY = PayloadPolicy(max_length=4096, deferred=True)
+
+_payload_policy = PayloadPolicy()
+_executor: ThreadPoolExecutor | None = None
+_pending = 0
+_dropped_records = 0
+_pending_lock = threading.Lock()
+
+logger = logging.getLogger(__name__)
+
+
 def configure(
     processors: Sequence[SpanProcessor] | None = None,
+    *,
+    exporter: SpanExporter | None = None,
+    production: bool = False,
+    payload_policy: PayloadPolicy | None = None,
 ) -> Tracer:
     """Configures the OpenTelemetry tracer, this function should only be called once.
 
     Args:
         processors: Optional[Sequence[SpanProcessor]]
-            The span processors to use, if None, a console exporter will be used.
+            The span processors to use, if None, `exporter` will be used.
+        exporter: Optional[SpanExporter]
+            The exporter to use when no `processors` are given, if None, a console
+            exporter will be used.
+        production: bool
+            Whether to export spans in batches on a background thread instead of one at
+            a time on the thread making the call, and to default to the
+            `PRODUCTION_PAYLOAD_POLICY`.
+        payload_policy: Optional[PayloadPolicy]
+            How to record the prompts and completions of calls, if None, they are
+            recorded in full on the thread making the call unless `production` is set.
 
     Returns:
         The configured tracer.
     """
+    global _payload_policy, _executor
     provider = TracerProvider()
     if processors is None:
-        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+        exporter = exporter if exporter is not None else ConsoleSpanExporter()
+        provider.add_span_processor(
+            BatchSpanProcessor(exporter)
+            if production
+            else SimpleSpanProcessor(exporter)
+        )
     else:
         for processor in processors:
             provider.add_span_processor(processor)
+    if payload_policy is None:
+        payload_policy = PRODUCTION_PAYLOAD_POLICY if production else PayloadPolicy()
+    _payload_policy = payload_policy
+    if payload_policy.deferred and _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mirascope-otel"
+        )
     # NOTE: Sets the global trace provider, should only be called once
     set_tracer_provider(provider)
     return get_tracer("otel")
 
 
+def _defer(record: Callable[..., None], *args: Any) -> None:  # noqa: ANN401
+    """Calls `record(*args, timestamp)`, on the background thread if it's enabled.
+
+    The background thread runs everything in order, so a span is only ended once
+    everything has been recorded onto it. The timestamp is the time at which `record`
+    was deferred so that events keep the time at which the call finished, or `None`
+    when `record` runs right away.
+    """
+    global _pending, _dropped_records
+    if _executor is None or not _payload_policy.deferred:
+        record(*args, None)
+        return
+    with _pending_lock:
+        full = _pending >= _payload_policy.max_pending
+        if not full:
+            _pending += 1
+        elif record is not _end_span:
+            _dropped_records += 1
+    if not full:
+        _executor.submit(_run_deferred, record, *args, time_ns())
+    elif record is _end_span:
+        # Spans are always ended so that they are still exported without payloads.
+        record(*args, time_ns())
+
+
+def _run_deferred(record: Callable[..., None], *args: Any) -> None:  # noqa: ANN401
+    global _pending
+    try:
+        record(*args)
+    except Exception:
+        logger.exception("Failed to record a deferred span")
+    finally:
+        with _pending_lock:
+            _pending -= 1
+
+
+def dropped_records() -> int:
+    """Returns the number of responses that weren't recorded onto their spans because
+    the background thread fell more than `PayloadPolicy.max_pending` records behind.
+    """
+    return _dropped_records
+
+
+def _end_span(span: Span, end_time: int | None) -> None:
+    span.end(end_time)
+
+
 @contextmanager
 def custom_context_manager(
     fn: Callable,
 ) -> Generator[Span, Any, None]:
     tracer = get_tracer("otel")
-    with tracer.start_as_current_span(f"{fn.__name__}") as span:
-        yield span
+    if _executor is None or not _payload_policy.deferred:
+        with tracer.start_as_current_span(f"{fn.__name__}") as span:
+            yield span
+        return
+    with tracer.start_as_current_span(f"{fn.__name__}", end_on_exit=False) as span:
+        try:
+            yield span
+        finally:
+            _defer(_end_span, span)
+
+
+def _payload_attributes(
+    key: str, payload: AttributeValue, capture: bool
+) -> dict[str, AttributeValue]:
+    """Returns the attributes recording `payload` according to the payload policy."""
+    max_length = _payload_policy.max_length
+    if not isinstance(payload, str):
+        return {key: payload} if capture else {}
+    if capture and (max_length is None or len(payload) <= max_length):
+        return {key: payload}
+    attributes: dict[str, AttributeValue] = {
+        f"{key}.length": len(payload),
+        f"{key}.sha256": hashlib.sha256(payload.encode()).hexdigest(),
+    }
+    if capture:
+        attributes[key] = payload[:max_length]
+    return attributes
+
+
+def _add_payload_events(
+    span: Span,
+    prompt: AttributeValue | None,
+    completion: AttributeValue,
+    timestamp: int | None,
+) -> None:
+    """Adds the prompt (if any) and completion events according to the policy."""
+    sample_rate = _payload_policy.sample_rate
+    capture = sample_rate >= 1 or random.random() < sample_rate
+    if prompt is not None:
+        span.add_event(
+            "gen_ai.content.prompt",
+            attributes=_payload_attributes("gen_ai.prompt", prompt, capture),
+            timestamp=timestamp,
+        )
+    span.add_event(
+        "gen_ai.content.completion",
+        attributes=_payload_attributes("gen_ai.completion", completion, capture),
+        timestamp=timestamp,
+    )
 
 
 def get_call_response_attributes(result: BaseCallResponse) -> dict[str, AttributeValue]:
@@ -83,20 +245,63 @@ def get_call_response_attributes(result: BaseCallResponse) -> dict[str, Attribut
     }
 
 
-def set_call_response_event_attributes(result: BaseCallResponse, span: Span) -> None:
-    prompt_attributes = {
-        "gen_ai.prompt": json.dumps(result.user_message_param),
-    }
-    completion_attributes: Attributes = {
-        "gen_ai.completion": json.dumps(result.message_param),
-    }
-    span.add_event(
-        "gen_ai.content.prompt",
-        attributes=prompt_attributes,
+def set_call_response_event_attributes(
+    result: BaseCallResponse, span: Span, timestamp: int | None = None
+) -> None:
+    _add_payload_events(
+        span,
+        json.dumps(result.user_message_param),
+        json.dumps(result.message_param),
+        timestamp,
     )
-    span.add_event(
-        "gen_ai.content.completion",
-        attributes=completion_attributes,
+
+
+def _record_call_response(
+    result: BaseCallResponse, span: Span, is_async: bool, timestamp: int | None
+) -> None:
+    attributes = get_call_response_attributes(result)
+    attributes["async"] = is_async
+    span.set_attributes(attributes)
+    set_call_response_event_attributes(result, span, timestamp)
+
+
+def _record_stream(
+    stream: BaseStream, span: Span, is_async: bool, timestamp: int | None
+) -> None:
+    _record_call_response(stream.construct_call_response(), span, is_async, timestamp)
+
+
+def _record_response_model(
+    result: BaseModel | BaseType, span: Span, is_async: bool, timestamp: int | None
+) -> None:
+    if isinstance(result, BaseModel):
+        response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
+        attributes = get_call_response_attributes(response)
+        attributes["async"] = is_async
+        span.set_attributes(attributes)
+        prompt = json.dumps(response.user_message_param)
+        completion = result.model_dump_json()
+    else:
+        span.set_attributes({"async": is_async})
+        prompt = None
+        completion = (
+            result if isinstance(result, str | int | float | bool) else str(result)
+        )
+    _add_payload_events(span, prompt, completion, timestamp)
+
+
+def _record_structured_stream(
+    result: BaseStructuredStream, span: Span, is_async: bool, timestamp: int | None
+) -> None:
+    attributes = get_call_response_attributes(result.stream.construct_call_response())
+    attributes["async"] = is_async
+    span.set_attributes(attributes)
+    if isinstance(result.constructed_response_model, BaseModel):
+        completion = result.constructed_response_model.model_dump_json()
+    else:
+        completion = result.constructed_response_model
+    _add_payload_events(
+        span, json.dumps(result.stream.user_message_param), completion, timestamp
     )
 
 
@@ -105,21 +310,13 @@ def handle_call_response(
 ) -> None:
     if span is None:
         return
-
-    attributes = get_call_response_attributes(result)
-    attributes["async"] = False
-    span.set_attributes(attributes)
-    set_call_response_event_attributes(result, span)
+    _defer(_record_call_response, result, span, False)
 
 
 def handle_stream(stream: BaseStream, fn: Callable, span: Span | None) -> None:
     if span is None:
         return
-    constructed_call_response = stream.construct_call_response()
-    attributes = get_call_response_attributes(constructed_call_response)
-    attributes["async"] = False
-    span.set_attributes(attributes)
-    set_call_response_event_attributes(constructed_call_response, span)
+    _defer(_record_stream, stream, span, False)
 
 
 def handle_response_model(
@@ -127,32 +324,7 @@ def handle_response_model(
 ) -> None:
     if span is None:
         return
-    if isinstance(result, BaseModel):
-        response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
-        attributes = get_call_response_attributes(response)
-        attributes["async"] = False
-        span.set_attributes(attributes)
-        prompt_attributes = {
-            "gen_ai.prompt": json.dumps(response.user_message_param),
-        }
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result.model_dump_json(),
-        }
-        span.add_event(
-            "gen_ai.content.prompt",
-            attributes=prompt_attributes,
-        )
-    else:
-        span.set_attributes({"async": False})
-        if not isinstance(result, str | int | float | bool):
-            result = str(result)
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result,
-        }
-    span.add_event(
-        "gen_ai.content.completion",
-        attributes=completion_attributes,
-    )
+    _defer(_record_response_model, result, span, False)
 
 
 def handle_structured_stream(
@@ -160,27 +332,7 @@ def handle_structured_stream(
 ) -> None:
     if span is None:
         return
-    attributes = get_call_response_attributes(result.stream.construct_call_response())
-    attributes["async"] = False
-    span.set_attributes(attributes)
-    prompt_attributes = {
-        "gen_ai.prompt": json.dumps(result.stream.user_message_param),
-    }
-    if isinstance(result.constructed_response_model, BaseModel):
-        completion = result.constructed_response_model.model_dump_json()
-    else:
-        completion = result.constructed_response_model
-    completion_attributes: Attributes = {
-        "gen_ai.completion": completion,
-    }
-    span.add_event(
-        "gen_ai.content.prompt",
-        attributes=prompt_attributes,
-    )
-    span.add_event(
-        "gen_ai.content.completion",
-        attributes=completion_attributes,
-    )
+    _defer(_record_structured_stream, result, span, False)
 
 
 async def handle_call_response_async(
@@ -188,11 +340,7 @@ async def handle_call_response_async(
 ) -> None:
     if span is None:
         return
-
-    attributes = get_call_response_attributes(result)
-    attributes["async"] = True
-    span.set_attributes(attributes)
-    set_call_response_event_attributes(result, span)
+    _defer(_record_call_response, result, span, True)
 
 
 async def handle_stream_async(
@@ -200,11 +348,7 @@ async def handle_stream_async(
 ) -> None:
     if span is None:
         return
-    constructed_call_response = stream.construct_call_response()
-    attributes = get_call_response_attributes(constructed_call_response)
-    attributes["async"] = True
-    span.set_attributes(attributes)
-    set_call_response_event_attributes(constructed_call_response, span)
+    _defer(_record_stream, stream, span, True)
 
 
 async def handle_response_model_async(
@@ -212,32 +356,7 @@ async def handle_response_model_async(
 ) -> None:
     if span is None:
         return
-    if isinstance(result, BaseModel):
-        response: BaseCallResponse = result._response  # pyright: ignore [reportAttributeAccessIssue]
-        attributes = get_call_response_attributes(response)
-        attributes["async"] = True
-        span.set_attributes(attributes)
-        prompt_attributes = {
-            "gen_ai.prompt": json.dumps(response.user_message_param),
-        }
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result.model_dump_json(),
-        }
-        span.add_event(
-            "gen_ai.content.prompt",
-            attributes=prompt_attributes,
-        )
-    else:
-        span.set_attributes({"async": True})
-        if not isinstance(result, str | int | float | bool):
-            result = str(result)
-        completion_attributes: Attributes = {
-            "gen_ai.completion": result,
-        }
-    span.add_event(
-        "gen_ai.content.completion",
-        attributes=completion_attributes,
-    )
+    _defer(_record_response_model, result, span, True)
 
 
 async def handle_structured_stream_async(
@@ -245,24 +364,4 @@ async def handle_structured_stream_async(
 ) -> None:
     if span is None:
         return
-    attributes = get_call_response_attributes(result.stream.construct_call_response())
-    attributes["async"] = True
-    span.set_attributes(attributes)
-    prompt_attributes = {
-        "gen_ai.prompt": json.dumps(result.stream.user_message_param),
-    }
-    if isinstance(result.constructed_response_model, BaseModel):
-        completion = result.constructed_response_model.model_dump_json()
-    else:
-        completion = result.constructed_response_model
-    completion_attributes: Attributes = {
-        "gen_ai.completion": completion,
-    }
-    span.add_event(
-        "gen_ai.content.prompt",
-        attributes=prompt_attributes,
-    )
-    span.add_event(
-        "gen_ai.content.completion",
-        attributes=completion_attributes,
-    )
+    _defer(_record_structured_stream, result, span, True)
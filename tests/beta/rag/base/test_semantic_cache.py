@@ -0,0 +1,180 @@
+"""Tests the `semantic_cache` module."""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from mirascope.beta.rag.base.embedders import BaseEmbedder
+from mirascope.beta.rag.base.embedding_response import BaseEmbeddingResponse
+from mirascope.beta.rag.base.semantic_cache import (
+    EmbeddingIndex,
+    SemanticResponseCache,
+)
+
+_VOCABULARY = ["reset", "password", "recommend", "book", "fantasy"]
+
+
+class FakeEmbeddingResponse(BaseEmbeddingResponse[list[list[float]]]):
+    @property
+    def embeddings(self) -> list[list[float]]:
+        return self.response
+
+
+class FakeEmbedder(BaseEmbedder[FakeEmbeddingResponse]):
+    """Embeds texts as the counts of the words of a small vocabulary."""
+
+    def embed(self, input: list[str]) -> FakeEmbeddingResponse:
+        embeddings = [
+            [float(text.lower().count(word)) for word in _VOCABULARY] for text in input
+        ]
+        return FakeEmbeddingResponse(response=embeddings, start_time=0, end_time=0)
+
+    async def embed_async(self, input: list[str]) -> FakeEmbeddingResponse:
+        return self.embed(input)
+
+
+def _openai_call(text: str, **call_params: object) -> tuple[list, dict]:
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant."},
+        {"role": "user", "content": text},
+    ]
+    return messages, {"model": "gpt-4o-mini", "messages": messages, **call_params}
+
+
+def _cohere_call(text: str, history: str) -> tuple[list, dict]:
+    messages = [
+        {"role": "USER", "message": history},
+        {"role": "CHATBOT", "message": "Sure."},
+        {"role": "USER", "message": text},
+    ]
+    return messages, {
+        "model": "command-r",
+        "message": text,
+        "chat_history": messages[:-1],
+    }
+
+
+def _lookup(cache: SemanticResponseCache, provider: str, call: tuple) -> object:
+    key, value = cache.lookup(provider, "model", *call, stream=False)
+    if value is None:
+        cache.set(key, f"response {cache.misses}")  # pyright: ignore [reportArgumentType]
+    return value
+
+
+def test_semantic_response_cache_paraphrase() -> None:
+    """Tests that paraphrased calls reuse the response of the original call."""
+    cache = SemanticResponseCache(FakeEmbedder(), threshold=0.9)
+    assert _lookup(cache, "openai", _openai_call("How do I reset my password?")) is None
+    assert len(cache.index) == 1
+    assert (
+        _lookup(cache, "openai", _openai_call("How can I reset my password?"))
+        == "response 1"
+    )
+    assert (
+        _lookup(cache, "openai", _openai_call("How do I reset my password?"))
+        == "response 1"
+    )
+    assert (cache.hits, cache.semantic_hits, cache.misses) == (2, 1, 1)
+
+    assert _lookup(cache, "openai", _openai_call("Recommend a fantasy book")) is None
+    assert _lookup(cache, "openai", ([], {"messages": []})) is None
+    assert len(cache.index) == 2
+
+    cache.clear()
+    assert (cache.hits, cache.semantic_hits, cache.misses, len(cache.index)) == (
+        0,
+        0,
+        0,
+        0,
+    )
+
+
+def test_semantic_response_cache_partitions() -> None:
+    """Tests that only calls with the same context reuse each other's responses."""
+    cache = SemanticResponseCache(FakeEmbedder(), threshold=0.9)
+    _lookup(cache, "openai", _openai_call("How do I reset my password?"))
+    call = _openai_call("How can I reset my password?", temperature=0.5)
+    assert _lookup(cache, "openai", call) is None
+    messages, call_kwargs = _openai_call("How can I reset my password?")
+    messages[0]["content"] = "You are a pirate."
+    assert _lookup(cache, "openai", (messages, call_kwargs)) is None
+    assert _lookup(cache, "groq", _openai_call("How can I reset my password?")) is None
+    key, value = cache.lookup(
+        "openai",
+        "model",
+        *_openai_call("How can I reset my password?"),
+        stream=False,
+        client=MagicMock(base_url="https://example.com"),
+    )
+    assert value is None
+
+
+def test_semantic_response_cache_cohere() -> None:
+    """Tests that Cohere calls are partitioned by their history, not their message."""
+    cache = SemanticResponseCache(FakeEmbedder(), threshold=0.9)
+    _lookup(cache, "cohere", _cohere_call("Reset my password", "Help me"))
+    assert (
+        _lookup(cache, "cohere", _cohere_call("Reset my password please", "Help me"))
+        == "response 1"
+    )
+    assert (
+        _lookup(cache, "cohere", _cohere_call("Reset my password", "Other history"))
+        is None
+    )
+
+
+@pytest.mark.asyncio
+async def test_semantic_response_cache_async() -> None:
+    """Tests that async lookups embed with the async embedder."""
+    cache = SemanticResponseCache(FakeEmbedder(), threshold=0.9)
+    key, value = await cache.lookup_async(
+        "openai", "model", *_openai_call("Reset my password"), stream=False
+    )
+    assert value is None
+    cache.set(key, "response")  # pyright: ignore [reportArgumentType]
+    _, value = await cache.lookup_async(
+        "openai", "model", *_openai_call("Please reset my password"), stream=False
+    )
+    assert value == "response"
+    assert cache.semantic_hits == 1
+
+
+def _vector(*values: float) -> np.ndarray:
+    vector = np.asarray(values, dtype=np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+@patch("mirascope.beta.rag.base.semantic_cache.time")
+def test_embedding_index_ttl(mock_time: MagicMock) -> None:
+    """Tests that entries expire once they are older than the TTL."""
+    mock_time.monotonic.return_value = 0
+    index = EmbeddingIndex(ttl=10)
+    index.add(_vector(1, 0), "partition", "a")
+    mock_time.monotonic.return_value = 5
+    index.add(_vector(1, 0.1), "partition", "b")
+    assert [key for key, _ in index.search(_vector(1, 0), "partition", 0.9)] == [
+        "a",
+        "b",
+    ]
+    assert index.search(_vector(1, 0), "other", 0.9) == []
+    assert index.search(_vector(0, 1), "partition", 0.9) == []
+
+    mock_time.monotonic.return_value = 10
+    assert [key for key, _ in index.search(_vector(1, 0), "partition", 0.9)] == ["b"]
+    mock_time.monotonic.return_value = 15
+    assert index.search(_vector(1, 0), "partition", 0.9) == []
+    assert len(index) == 0
+
+
+def test_embedding_index_max_size() -> None:
+    """Tests that the oldest entries are evicted once the index is full."""
+    index = EmbeddingIndex(max_size=20)
+    vectors = np.eye(100, dtype=np.float32)
+    for i in range(100):
+        index.add(vectors[i], "partition", str(i))
+        assert len(index) == min(i + 1, 20)
+    assert index.search(vectors[79], "partition", 0.9) == []
+    assert [key for key, _ in index.search(vectors[80], "partition", 0.9)] == ["80"]
+    assert [key for key, _ in index.search(vectors[99], "partition", 0.9)] == ["99"]
+    assert len(index._vectors) <= 2 * 21  # pyright: ignore [reportArgumentType]
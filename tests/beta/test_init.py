@@ -0,0 +1,34 @@
+"""Tests the lazy loading of the `mirascope.beta` submodules."""
+
+import subprocess
+import sys
+
+import pytest
+
+import mirascope.beta
+
+
+def test_openai_is_imported_lazily() -> None:
+    """Tests that importing `mirascope.beta.rag` doesn't import the realtime API."""
+    script = (
+        "import sys, mirascope.beta.rag.base.semantic_cache\n"
+        "print(sorted(m for m in sys.modules if m.startswith('mirascope.beta.openai')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_submodule_getattr() -> None:
+    """Tests that unknown and unavailable submodules raise an `AttributeError`."""
+    assert "openai" in dir(mirascope.beta)
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        mirascope.beta.unknown  # pyright: ignore [reportAttributeAccessIssue]  # noqa: B018
+    with (
+        pytest.MonkeyPatch.context() as monkeypatch,
+        pytest.raises(AttributeError, match="has no attribute 'openai'"),
+    ):
+        monkeypatch.setitem(sys.modules, "mirascope.beta.openai", None)
+        monkeypatch.delattr(mirascope.beta, "openai", raising=False)
+        mirascope.beta.openai  # noqa: B018
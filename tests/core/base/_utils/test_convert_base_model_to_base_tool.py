@@ -1,5 +1,8 @@
 """Tests the `_utils.convert_base_model_to_base_tool` module."""
 
+import gc
+import weakref
+
 from pydantic import BaseModel
 
 from mirascope.core.base._utils._convert_base_model_to_base_tool import (
@@ -26,3 +29,31 @@ def test_convert_base_model_to_base_tool() -> None:
         tool(title="The Name of the Wind", author="Patrick Rothfuss").call()  # type: ignore
         == "The Name of the Wind by Patrick Rothfuss"
     )
+
+
+def test_convert_base_model_to_base_tool_cache() -> None:
+    """Tests that `convert_base_model_to_base_tool` reuses previously converted types."""
+
+    class Book(BaseModel):
+        title: str
+
+    class OtherTool(BaseTool): ...
+
+    tool = convert_base_model_to_base_tool(Book, BaseTool)
+    assert convert_base_model_to_base_tool(Book, BaseTool) is tool
+    assert convert_base_model_to_base_tool(Book, OtherTool) is not tool
+
+
+def test_convert_base_model_to_base_tool_cache_releases_models() -> None:
+    """Tests that cached types don't keep their models alive."""
+
+    class Book(BaseModel):
+        title: str
+
+    tool = convert_base_model_to_base_tool(Book, BaseTool)
+    assert convert_base_model_to_base_tool(tool, BaseTool) is not tool
+    model_ref, tool_ref = weakref.ref(Book), weakref.ref(tool)
+    del Book, tool
+    gc.collect()
+    assert model_ref() is None
+    assert tool_ref() is None
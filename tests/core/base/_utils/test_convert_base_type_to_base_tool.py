@@ -2,6 +2,8 @@
 
 from typing import Annotated
 
+from pydantic import BaseModel
+
 from mirascope.core.base._utils._convert_base_type_to_base_tool import (
     convert_base_type_to_base_tool,
 )
@@ -19,3 +21,20 @@ def test_convert_base_type_to_base_tool() -> None:
     assert tool._name() == "str"
     assert tool._description() == DEFAULT_TOOL_DOCSTRING
     assert "value" in tool.model_fields
+
+
+def test_convert_base_type_to_base_tool_cached() -> None:
+    """Tests that converted types are cached per type and base."""
+    tool = convert_base_type_to_base_tool(list[int], BaseTool)
+    assert convert_base_type_to_base_tool(list[int], BaseTool) is tool
+    assert convert_base_type_to_base_tool(list[str], BaseTool) is not tool
+    assert convert_base_type_to_base_tool(list[int], BaseModel) is not tool
+
+
+def test_convert_base_type_to_base_tool_unhashable() -> None:
+    """Tests converting types that can't be hashed and therefore aren't cached."""
+    schema = Annotated[list[str], {"x": 1}]
+    tool = convert_base_type_to_base_tool(schema, BaseTool)  # type: ignore
+    assert tool._name() == "list"
+    assert "value" in tool.model_fields
+    assert convert_base_type_to_base_tool(schema, BaseTool) is not tool  # type: ignore
@@ -1,5 +1,8 @@
 """Tests the `_utils.convert_function_to_base_tool` module."""
 
+import gc
+import weakref
+
 import pytest
 
 from mirascope.core.base._utils._convert_function_to_base_tool import (
@@ -130,3 +133,55 @@ def test_convert_function_to_base_tool_missing_parameter_description() -> None:
 
     with pytest.raises(ValueError):
         convert_function_to_base_tool(format_book, BaseTool)
+
+
+def test_convert_function_to_base_tool_cache() -> None:
+    """Tests that `convert_function_to_base_tool` reuses previously converted types."""
+
+    def format_book(title: str) -> str:
+        """Returns the title nicely formatted."""
+        return title  # pragma: no cover
+
+    tool_type = convert_function_to_base_tool(format_book, BaseTool)
+    assert convert_function_to_base_tool(format_book, BaseTool) is tool_type
+    assert (
+        convert_function_to_base_tool(format_book, BaseTool, "Other docstring.")
+        is not tool_type
+    )
+    assert (
+        convert_function_to_base_tool(format_book, BaseTool, None, "namespace")
+        is not tool_type
+    )
+    assert (
+        convert_function_to_base_tool(format_book, BaseTool, use_cache=False)
+        is not tool_type
+    )
+
+
+def test_convert_function_to_base_tool_cache_releases_functions() -> None:
+    """Tests that cached types don't keep their functions alive."""
+
+    def format_book(title: str) -> str:
+        """Returns the title nicely formatted."""
+        return title  # pragma: no cover
+
+    tool_type = convert_function_to_base_tool(format_book, BaseTool)
+    fn_ref, tool_type_ref = weakref.ref(format_book), weakref.ref(tool_type)
+    del format_book, tool_type
+    gc.collect()
+    assert fn_ref() is None
+    assert tool_type_ref() is None
+
+
+def test_convert_function_to_base_tool_cache_bound_methods() -> None:
+    """Tests that bound methods are converted without being cached."""
+
+    class Library:
+        def format_book(self, title: str) -> str:
+            """Returns the title nicely formatted."""
+            return title  # pragma: no cover
+
+    library = Library()
+    tool_type = convert_function_to_base_tool(library.format_book, BaseTool)
+    assert tool_type._name() == "format_book"
+    assert convert_function_to_base_tool(library.format_book, BaseTool) is not tool_type
@@ -0,0 +1,72 @@
+"""Tests the `_utils._default_clients` module."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from mirascope.core.base._utils._default_clients import (
+    aclose_default_clients,
+    capture_default_clients,
+    close_default_clients,
+    get_default_client,
+)
+
+
+def test_get_default_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Tests that default sync clients are shared per key and configuration."""
+    close_default_clients()
+    factory = MagicMock(side_effect=lambda: MagicMock())
+    monkeypatch.setenv("TEST_API_KEY", "key")
+    client = get_default_client(factory, env_vars=("TEST_API_KEY",))
+    assert get_default_client(factory, env_vars=("TEST_API_KEY",)) is client
+    assert factory.call_count == 1
+
+    monkeypatch.setenv("TEST_API_KEY", "other")
+    other_client = get_default_client(factory, env_vars=("TEST_API_KEY",))
+    assert other_client is not client
+    assert get_default_client(factory, key="other", env_vars=("TEST_API_KEY",)) not in (
+        client,
+        other_client,
+    )
+    assert factory.call_count == 3
+
+    close_default_clients()
+    client.close.assert_called_once()
+    other_client.close.assert_called_once()
+    assert get_default_client(factory, env_vars=("TEST_API_KEY",)) is not other_client
+
+
+def test_get_default_client_async() -> None:
+    """Tests that default async clients are isolated per running event loop."""
+    factory = MagicMock(side_effect=lambda: AsyncMock())
+
+    async def get_clients() -> tuple[AsyncMock, AsyncMock]:
+        return (
+            get_default_client(factory, is_async=True),
+            get_default_client(factory, is_async=True),
+        )
+
+    first, second = asyncio.run(get_clients())
+    assert first is second
+    other, _ = asyncio.run(get_clients())
+    assert other is not first
+    assert get_default_client(factory, is_async=True) is not other
+
+    async def get_and_close() -> AsyncMock:
+        client = get_default_client(factory, is_async=True)
+        await aclose_default_clients()
+        assert get_default_client(factory, is_async=True) is not client
+        return client
+
+    asyncio.run(get_and_close()).close.assert_awaited_once()
+
+
+def test_capture_default_clients() -> None:
+    """Tests that the default clients returned within the block are captured."""
+    client = MagicMock()
+    with capture_default_clients() as clients:
+        assert get_default_client(lambda: client, key="captured") is client
+    assert clients == [client]
+    get_default_client(lambda: client, key="captured")
+    assert clients == [client]
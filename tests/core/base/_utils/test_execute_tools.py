@@ -0,0 +1,105 @@
+"""Tests the `_utils.execute_tools` module."""
+
+import asyncio
+import time
+
+import pytest
+
+from mirascope.core.base._utils._execute_tools import (
+    execute_tools,
+    execute_tools_async,
+)
+from mirascope.core.base.tool import BaseTool
+
+
+class SleepTool(BaseTool):
+    seconds: float
+
+    def call(self) -> str:
+        time.sleep(self.seconds)
+        return f"slept {self.seconds}"
+
+
+class AsyncSleepTool(BaseTool):
+    seconds: float
+
+    async def call(self) -> str:
+        await asyncio.sleep(self.seconds)
+        return f"awaited {self.seconds}"
+
+
+def test_execute_tools() -> None:
+    """Tests that tools are called concurrently and returned in call order."""
+    assert execute_tools([]) == []
+    tool = SleepTool(seconds=0)
+    assert execute_tools([tool]) == [(tool, "slept 0.0")]
+
+    tools = [SleepTool(seconds=0.2), AsyncSleepTool(seconds=0.1), SleepTool(seconds=0)]
+    start = time.perf_counter()
+    tools_and_outputs = execute_tools(tools)
+    assert time.perf_counter() - start < 0.3
+    assert tools_and_outputs == [
+        (tools[0], "slept 0.2"),
+        (tools[1], "awaited 0.1"),
+        (tools[2], "slept 0.0"),
+    ]
+
+    start = time.perf_counter()
+    execute_tools([SleepTool(seconds=0.1)] * 2, max_workers=1)
+    assert time.perf_counter() - start >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_execute_tools_single_async_tool_in_running_loop() -> None:
+    """Tests that a single async tool can be executed while a loop is running."""
+    tool = AsyncSleepTool(seconds=0)
+    assert execute_tools([tool]) == [(tool, "awaited 0.0")]
+
+
+def test_execute_tools_timeout() -> None:
+    """Tests that a tool that doesn't return within the timeout raises."""
+    tools = [SleepTool(seconds=0), SleepTool(seconds=0.5)]
+    with pytest.raises(TimeoutError, match="SleepTool"):
+        execute_tools(tools, timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_execute_tools_async() -> None:
+    """Tests that sync and async tools are called concurrently in call order."""
+    assert await execute_tools_async([]) == []
+    tools = [AsyncSleepTool(seconds=0.2), SleepTool(seconds=0.1)]
+    start = time.perf_counter()
+    tools_and_outputs = await execute_tools_async(tools)
+    assert time.perf_counter() - start < 0.3
+    assert tools_and_outputs == [(tools[0], "awaited 0.2"), (tools[1], "slept 0.1")]
+
+    start = time.perf_counter()
+    await execute_tools_async([AsyncSleepTool(seconds=0.1)] * 2, max_workers=1)
+    assert time.perf_counter() - start >= 0.2
+
+    with pytest.raises(TimeoutError, match="AsyncSleepTool"):
+        await execute_tools_async([AsyncSleepTool(seconds=0.5)], timeout=0.1)
+
+
+@pytest.mark.asyncio
+async def test_execute_tools_async_cancels_pending_tools() -> None:
+    """Tests that the tools still running when another tool fails are cancelled."""
+    cancelled = []
+
+    class FailingTool(BaseTool):
+        async def call(self) -> None:
+            raise ValueError("failed")
+
+    class CancellableTool(BaseTool):
+        async def call(self) -> None:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.append(self)
+                raise
+
+    tool = CancellableTool()
+    with pytest.raises(ValueError, match="failed"):
+        await execute_tools_async([tool, FailingTool()], timeout=10)
+    await asyncio.sleep(0)
+    assert cancelled == [tool]
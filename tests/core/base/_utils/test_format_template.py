@@ -2,7 +2,11 @@
 
 from unittest.mock import MagicMock, patch
 
-from mirascope.core.base._utils._format_template import format_template
+from mirascope.core.base._utils._format_template import (
+    CompiledFormatTemplate,
+    compile_format_template,
+    format_template,
+)
 
 
 @patch(
@@ -61,3 +65,26 @@ def test_format_template_with_list_format_spec() -> None:
         formatted_template
         == "Recommend books from one of the following genres:\nfantasy\nscifi"
     )
+
+
+def test_compile_format_template() -> None:
+    """Tests that `compile_format_template` compiles each template once."""
+    compile_format_template.cache_clear()
+    template = """
+    Recommend a {genre} book. Previous picks:
+    {previous:list}
+    """
+    compiled = compile_format_template(template)
+    assert compiled == CompiledFormatTemplate(
+        "Recommend a {genre} book. Previous picks:\n{previous}",
+        [("genre", ""), ("previous", "list")],
+    )
+    assert compile_format_template(template) is compiled
+    assert (
+        compiled.render({"genre": "fantasy", "previous": ["Dune", "Mistborn"]})
+        == "Recommend a fantasy book. Previous picks:\nDune\nMistborn"
+    )
+    assert format_template(template, {"genre": "scifi", "previous": []}) == (
+        "Recommend a scifi book. Previous picks:"
+    )
+    assert compile_format_template.cache_info().misses == 1
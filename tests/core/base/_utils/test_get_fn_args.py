@@ -1,6 +1,12 @@
 """Tests the `_utils.get_fn_args` module."""
 
-from mirascope.core.base._utils._get_fn_args import get_fn_args
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from mirascope.core.base._utils._get_fn_args import _binders, get_fn_args
 
 
 def test_get_fn_args() -> None:
@@ -45,3 +51,74 @@ def test_get_fn_args() -> None:
         "d": {"5": "6"},
         "e": 7,
     }
+
+
+def _bind_with_inspect(
+    fn: Callable, args: tuple[object, ...], kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    signature = inspect.signature(fn)
+    bound_args = signature.bind_partial(*args, **kwargs)
+    bound_args.apply_defaults()
+    fn_args = {}
+    for name, value in bound_args.arguments.items():
+        if signature.parameters[name].kind == inspect.Parameter.VAR_KEYWORD:
+            fn_args.update(value)
+        else:
+            fn_args[name] = value
+    return fn_args
+
+
+def _fn(a: int, /, b: str = "b", *args: int, c: int, d: int = 4, **kwargs) -> None:
+    """Dummy fn."""
+
+
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [
+        ((), {}),
+        ((1,), {"c": 3}),
+        ((1, "2", 5, 6), {"c": 3, "d": 5, "e": 7}),
+        ((1,), {"a": 2, "b": "2"}),
+        ((), {"b": "2", "d": 5}),
+    ],
+)
+def test_get_fn_args_matches_inspect(
+    args: tuple[object, ...], kwargs: dict[str, Any]
+) -> None:
+    """Tests that `get_fn_args` binds arguments exactly like `inspect` does."""
+    fn_args = get_fn_args(_fn, args, kwargs)
+    assert fn_args == _bind_with_inspect(_fn, args, kwargs)
+    assert list(fn_args) == list(_bind_with_inspect(_fn, args, kwargs))
+
+
+def test_get_fn_args_errors() -> None:
+    """Tests that `get_fn_args` raises the same errors as `inspect`."""
+
+    def fn(a: int, /, b: str) -> None:
+        """Dummy fn."""
+
+    with pytest.raises(TypeError, match="too many positional arguments"):
+        get_fn_args(fn, (1, "2", 3), {})
+    with pytest.raises(TypeError, match="multiple values for argument 'b'"):
+        get_fn_args(fn, (1, "2"), {"b": "3"})
+    with pytest.raises(TypeError, match="unexpected keyword argument 'c'"):
+        get_fn_args(fn, (1,), {"c": 3})
+    with pytest.raises(TypeError):
+        get_fn_args(fn, (), {"a": 1})
+
+
+def test_get_fn_args_caches_binder() -> None:
+    """Tests that the signature of each function is only inspected once."""
+
+    class Librarian:
+        def recommend(self, genre: str) -> None:
+            """Dummy method."""
+
+    librarian = Librarian()
+    assert get_fn_args(librarian.recommend, ("fantasy",), {}) == {"genre": "fantasy"}
+    binder = _binders.get(librarian.recommend)
+    assert binder is not None
+    assert get_fn_args(librarian.recommend, (), {"genre": "scifi"}) == {
+        "genre": "scifi"
+    }
+    assert _binders.get(librarian.recommend) is binder
@@ -0,0 +1,25 @@
+"""Tests the `_utils.get_tool_types_by_name` module."""
+
+from mirascope.core.base._utils._get_tool_types_by_name import get_tool_types_by_name
+from mirascope.core.base.tool import BaseTool
+
+
+def test_get_tool_types_by_name() -> None:
+    """Tests the `get_tool_types_by_name` function."""
+
+    class FormatBook(BaseTool):
+        title: str
+
+    class GetWeather(BaseTool):
+        location: str
+
+    class DuplicateFormatBook(BaseTool):
+        @classmethod
+        def _name(cls) -> str:
+            return "FormatBook"
+
+    assert get_tool_types_by_name([FormatBook, GetWeather, DuplicateFormatBook]) == {
+        "FormatBook": FormatBook,
+        "GetWeather": GetWeather,
+    }
+    assert get_tool_types_by_name([]) == {}
@@ -0,0 +1,70 @@
+"""Tests the `_utils.incremental_item_extractor` module."""
+
+import json
+
+import pytest
+from pydantic import BaseModel, ValidationError
+
+from mirascope.core.base._utils._incremental_item_extractor import (
+    IncrementalItemExtractor,
+)
+
+
+class Book(BaseModel):
+    title: str
+    genre: str
+
+
+BOOKS = [{"title": f"Book {i}", "genre": "fantasy"} for i in range(5)]
+
+
+def _stream(
+    extractor: IncrementalItemExtractor, text: str, chunk_size: int
+) -> list[list]:
+    return [
+        extractor.feed(text[i : i + chunk_size])
+        for i in range(0, len(text), chunk_size)
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 1000])
+def test_incremental_item_extractor_array(chunk_size: int) -> None:
+    """Tests extracting the items of a `{"value": [...]}` array."""
+    text = json.dumps({"value": BOOKS})
+    extractor = IncrementalItemExtractor(Book, {})
+    fed = _stream(extractor, text, chunk_size)
+    assert [item for items in fed for item in items] == [
+        Book.model_validate(book) for book in BOOKS
+    ]
+    extractor.complete()
+
+    # Each item is extracted as soon as its closing brace arrives.
+    end = text.index("}") + 1
+    assert fed[(end - 1) // chunk_size][0] == Book.model_validate(BOOKS[0])
+
+
+def test_incremental_item_extractor_objects() -> None:
+    """Tests extracting items streamed as separate top-level objects."""
+    text = "Here you go:\n" + "\n".join(json.dumps(book) for book in BOOKS)
+    extractor = IncrementalItemExtractor(Book, {"genre": "scifi"})
+    items = [item for items in _stream(extractor, text, 7) for item in items]
+    assert items == [Book(title=book["title"], genre="scifi") for book in BOOKS]
+    extractor.complete()
+
+
+def test_incremental_item_extractor_base_type() -> None:
+    """Tests extracting base type items."""
+    extractor = IncrementalItemExtractor(int, {})
+    assert extractor.feed('{"value": [1, 2') == [1]
+    assert extractor.feed("3, 4") == [23]
+    assert extractor.feed("]}") == [4]
+    with pytest.raises(ValidationError):
+        extractor.feed('{"value": ["a"]}')
+
+
+def test_incremental_item_extractor_incomplete() -> None:
+    """Tests that an output that ends partway through an object raises an error."""
+    extractor = IncrementalItemExtractor(Book, {})
+    extractor.feed('{"value": [{"title": "A", "genre": "B"}, {"title": "C"')
+    with pytest.raises(ValueError, match="ended unexpectedly"):
+        extractor.complete()
@@ -0,0 +1,86 @@
+"""Tests the `_utils.incremental_json_parser` module."""
+
+import json
+
+import jiter
+import pytest
+
+from mirascope.core.base._utils._incremental_json_parser import IncrementalJsonParser
+
+DOCUMENT = {
+    "title": 'The "Name" of the Wind\\',
+    "unicode": "é😀\n\t",
+    "numbers": [0, -12, 3.5, 1e20, -0.25e-3, 123456789012345678901234567890],
+    "literals": [True, False, None],
+    "nested": {"empty": {}, "list": [[], [{"a": "b"}]]},
+}
+
+
+@pytest.mark.parametrize("ensure_ascii", [True, False])
+@pytest.mark.parametrize("chunk_size", [1, 3, 7])
+def test_incremental_json_parser_matches_jiter(
+    ensure_ascii: bool, chunk_size: int
+) -> None:
+    """Tests that every partial value matches `jiter`'s partial parsing."""
+    text = json.dumps(DOCUMENT, ensure_ascii=ensure_ascii, indent=2)
+    parser = IncrementalJsonParser()
+    for i in range(0, len(text), chunk_size):
+        parser.feed(text[i : i + chunk_size])
+        expected = jiter.from_json(
+            text[: i + chunk_size].encode(), partial_mode="trailing-strings"
+        )
+        assert json.dumps(parser.value) == json.dumps(expected)
+    assert parser.done
+    assert parser.value == DOCUMENT
+
+
+def test_incremental_json_parser_surrounding_text() -> None:
+    """Tests that text around the root object is ignored."""
+    parser = IncrementalJsonParser()
+    parser.feed("Here is the ")
+    assert not parser.started and parser.value is None
+    parser.feed('JSON: {"a": 1')
+    assert parser.started and not parser.done
+    assert parser.value == {"a": 1}
+    parser.feed('} and {"b": 2}')
+    assert parser.done
+    assert parser.value == {"a": 1}
+
+
+def test_incremental_json_parser_open_path() -> None:
+    """Tests that `open_path` points at the value currently being parsed."""
+    parser = IncrementalJsonParser()
+    parser.feed('{"a": "x", "b": [{"c": 1}, {"d": "y')
+    assert parser.value == {"a": "x", "b": [{"c": 1}, {"d": "y"}]}
+    assert parser.open_path == ["b", 1, "d"]
+    parser.feed('"}, ')
+    assert parser.value == {"a": "x", "b": [{"c": 1}, {"d": "y"}]}
+    assert parser.open_path == ["b"]
+    parser.feed("1.")
+    assert parser.value == {"a": "x", "b": [{"c": 1}, {"d": "y"}]}
+    assert parser.open_path == ["b"]
+    parser.feed("5")
+    assert parser.value == {"a": "x", "b": [{"c": 1}, {"d": "y"}, 1.5]}
+    assert parser.open_path == ["b", 2]
+    parser.feed("]}")
+    assert parser.value == {"a": "x", "b": [{"c": 1}, {"d": "y"}, 1.5]}
+    assert parser.open_path == []
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"a" 1}', '{"a": 1 "b"}', "{1: 2}", '{"a": tru}', '{"a": 1-}', '{"a": "\\x"}'],
+)
+def test_incremental_json_parser_invalid(text: str) -> None:
+    """Tests that invalid JSON raises a `ValueError`."""
+    parser = IncrementalJsonParser()
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        parser.feed(text)
+
+
+def test_incremental_json_parser_consumed() -> None:
+    """Tests that `feed` returns how much of the chunk it consumed."""
+    parser = IncrementalJsonParser()
+    assert parser.feed('{"a": ') == 6
+    assert parser.feed('1}\n{"b": 2}') == 2
+    assert parser.feed("{}") == 0
@@ -0,0 +1,125 @@
+"""Tests the `_utils.incremental_tool_return_extractor` module."""
+
+import json
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError, field_validator
+
+from mirascope.core.base._utils._extract_tool_return import extract_tool_return
+from mirascope.core.base._utils._incremental_tool_return_extractor import (
+    IncrementalToolReturnExtractor,
+)
+
+
+class Author(BaseModel):
+    first_name: str
+    last_name: str
+
+
+class Book(BaseModel):
+    title: str
+    pages: int
+
+
+class Library(BaseModel):
+    name: str = Field(..., max_length=100)
+    owner: Author
+    books: list[Book]
+    tags: list[str]
+    genre: str
+
+
+def _stream(
+    extractor: IncrementalToolReturnExtractor, text: str, chunk_size: int = 5
+) -> list:
+    partials = []
+    for i in range(0, len(text), chunk_size):
+        extractor.feed(text[i : i + chunk_size])
+        if extractor.started:
+            partials.append(extractor.partial())
+    return partials
+
+
+def test_incremental_tool_return_extractor() -> None:
+    """Tests that partial models match re-validating the accumulated output."""
+    library = Library(
+        name="Library",
+        owner=Author(first_name="Patrick", last_name="Rothfuss"),
+        books=[Book(title="The Name of the Wind", pages=662)] * 3,
+        tags=["fantasy", "magic"],
+        genre="fantasy",
+    )
+    text = "Sure! " + library.model_dump_json()
+    extractor = IncrementalToolReturnExtractor(Library, {"genre": "scifi"})
+    partials = _stream(extractor, text)
+    assert len(partials) == len(range(5, len(text), 5))
+    for i, output in enumerate(partials):
+        json_output = text[text.index("{") : (i + 2) * 5]
+        if not json_output:
+            continue
+        try:
+            expected = extract_tool_return(
+                Library, json_output, True, {"genre": "scifi"}
+            )
+        except ValidationError:
+            # Incomplete books are partial models rather than validation errors.
+            assert output.books and output.books[-1].pages is None  # pyright: ignore [reportOptionalSubscript]
+            continue
+        assert output.model_dump(warnings=False) == expected.model_dump(warnings=False)
+        assert output.model_fields_set == expected.model_fields_set
+    assert extractor.complete() == library.model_copy(update={"genre": "scifi"})
+
+
+def test_incremental_tool_return_extractor_partial_records() -> None:
+    """Tests that lists of models yield partial records and reuse complete ones."""
+    extractor = IncrementalToolReturnExtractor(Library, {})
+    extractor.feed('{"books": [{"title": "A", "pages": 1}, {"title": "B')
+    first = extractor.partial()
+    assert first.books[0] == Book(title="A", pages=1)  # pyright: ignore [reportOptionalSubscript]
+    assert first.books[1].model_dump() == {"title": "B", "pages": None}  # pyright: ignore [reportOptionalSubscript]
+    extractor.feed('", "pages": 2}')
+    second = extractor.partial()
+    assert second.books == [Book(title="A", pages=1), Book(title="B", pages=2)]
+    assert second.books[0] is first.books[0]  # pyright: ignore [reportOptionalSubscript]
+
+    extractor.feed(', {"title": 3}]')
+    with pytest.raises(ValidationError):
+        extractor.partial()
+
+
+def test_incremental_tool_return_extractor_fallback() -> None:
+    """Tests models that can't be validated field by field."""
+
+    class Validated(BaseModel):
+        title: str
+
+        @field_validator("title")
+        @classmethod
+        def upper(cls, value: str) -> str:
+            return value.upper()
+
+    extractor = IncrementalToolReturnExtractor(Validated, {})
+    assert [output.title for output in _stream(extractor, '{"title": "abc"}', 3)] == [
+        None,
+        None,
+        None,
+        "A",
+        "ABC",
+        "ABC",
+    ]
+    assert extractor.complete() == Validated(title="abc")
+
+    extractor = IncrementalToolReturnExtractor(list[int], {})
+    partials = _stream(extractor, json.dumps({"value": [1, 2, 3]}), 4)
+    assert partials[-1] == [1, 2, 3]
+    assert extractor.complete() == [1, 2, 3]
+
+
+def test_incremental_tool_return_extractor_incomplete() -> None:
+    """Tests completing a stream whose output was never closed."""
+    extractor = IncrementalToolReturnExtractor(Book, {})
+    with pytest.raises(ValueError):
+        extractor.complete()
+    extractor.feed('{"title": "A", "pages": 1')
+    with pytest.raises(ValueError):
+        extractor.complete()
@@ -4,7 +4,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mirascope.core.base._utils._parse_content_template import parse_content_template
+from mirascope.core.base._utils._parse_content_template import (
+    _compile_parts,
+    parse_content_template,
+)
 from mirascope.core.base.message_param import (
     AudioPart,
     BaseMessageParam,
@@ -27,9 +30,7 @@ def test_parse_content_template() -> None:
     assert parse_content_template("user", template, values) == expected
 
 
-@patch(
-    "mirascope.core.base._utils._parse_content_template.open", new_callable=MagicMock
-)
+@patch("mirascope.core.base.media_loader.open", new_callable=MagicMock)
 @patch("urllib.request.urlopen", new_callable=MagicMock)
 def test_parse_content_template_images(
     mock_urlopen: MagicMock, mock_open: MagicMock
@@ -101,9 +102,7 @@ def test_parse_content_template_images(
         parse_content_template("user", template, {"urls": None})
 
 
-@patch(
-    "mirascope.core.base._utils._parse_content_template.open", new_callable=MagicMock
-)
+@patch("mirascope.core.base.media_loader.open", new_callable=MagicMock)
 @patch("urllib.request.urlopen", new_callable=MagicMock)
 def test_parse_content_template_audio(
     mock_urlopen: MagicMock, mock_open: MagicMock
@@ -172,3 +171,20 @@ def test_parse_content_template_cache_control() -> None:
 
     expected.role = "system"
     assert parse_content_template("system", "{:cache_control}", {}) == expected
+
+
+def test_parse_content_template_compiles_once() -> None:
+    """Test that the parts of a content template are only parsed once."""
+    _compile_parts.cache_clear()
+    template = "{:cache_control} Recommend a {genre} book."
+    for genre in ["fantasy", "scifi"]:
+        assert parse_content_template("user", template, {"genre": genre}) == (
+            BaseMessageParam(
+                role="user",
+                content=[
+                    CacheControlPart(type="cache_control", cache_type="ephemeral"),
+                    TextPart(type="text", text=f"Recommend a {genre} book."),
+                ],
+            )
+        )
+    assert _compile_parts.cache_info().misses == 1
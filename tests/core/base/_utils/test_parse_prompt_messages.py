@@ -4,7 +4,15 @@ from unittest.mock import MagicMock, call, patch
 
 import pytest
 
-from mirascope.core.base._utils._parse_prompt_messages import parse_prompt_messages
+from mirascope.core.base._utils._parse_prompt_messages import (
+    _compile_role_segments,
+    load_prompt_media_async,
+    parse_prompt_messages,
+    parse_prompt_messages_async,
+    preloaded_media,
+)
+from mirascope.core.base.media_loader import MediaLoader
+from mirascope.core.base.message_param import BaseMessageParam, ImagePart
 
 
 @patch(
@@ -18,7 +26,7 @@ def test_parse_prompt_messages(mock_parse_content_template: MagicMock) -> None:
 
     messages = parse_prompt_messages(roles=["user"], template="prompt", attrs={})
     assert messages == [empty_user_message]
-    mock_parse_content_template.assert_called_once_with("user", "prompt", {})
+    mock_parse_content_template.assert_called_once_with("user", "prompt", {}, {})
     mock_parse_content_template.reset_mock()
 
     prompt_template = """
@@ -30,7 +38,7 @@ def test_parse_prompt_messages(mock_parse_content_template: MagicMock) -> None:
     )
     assert messages == [empty_user_message, empty_user_message]
     mock_parse_content_template.assert_has_calls(
-        [call("system", "", {}), call("user", "This is a user message.", {})]
+        [call("system", "", {}, {}), call("user", "This is a user message.", {}, {})]
     )
 
     prompt_template = """
@@ -49,8 +57,8 @@ def test_parse_prompt_messages(mock_parse_content_template: MagicMock) -> None:
     assert messages == [empty_user_message] * 6
     mock_parse_content_template.assert_has_calls(
         [
-            call("system", "This is a system message.", attrs),
-            call("user", "This is a user message.", attrs),
+            call("system", "This is a system message.", attrs, {}),
+            call("user", "This is a user message.", attrs, {}),
         ]
     )
 
@@ -70,3 +78,113 @@ def test_parse_prompt_messages_invalid_messages() -> None:
             template="MESSAGES: {messages}",
             attrs={"messages": "not a list"},
         )
+
+
+def test_parse_prompt_messages_compiles_once() -> None:
+    """Test that the role segments of a prompt template are only parsed once."""
+    _compile_role_segments.cache_clear()
+    prompt_template = """
+    SYSTEM: You are a librarian.
+    MESSAGES: {history}
+    USER: Recommend a {genre} book.
+    """
+    history = [BaseMessageParam(role="assistant", content="Hi!")]
+    for genre in ["fantasy", "scifi"]:
+        messages = parse_prompt_messages(
+            roles=["system", "user", "assistant"],
+            template=prompt_template,
+            attrs={"history": history, "genre": genre},
+        )
+        assert messages == [
+            BaseMessageParam(role="system", content="You are a librarian."),
+            *history,
+            BaseMessageParam(role="user", content=f"Recommend a {genre} book."),
+        ]
+    assert _compile_role_segments.cache_info().misses == 1
+
+
+_MEDIA_TEMPLATE = """
+SYSTEM: Compare to {reference:image}.
+USER: Describe {urls:images} and {raw:image}.
+"""
+
+
+def _image_part(data: bytes) -> ImagePart:
+    return ImagePart(type="image", media_type="image/png", image=data, detail=None)
+
+
+@patch("mirascope.core.base._utils._parse_content_template.get_image_type")
+def test_parse_prompt_messages_media(mock_get_image_type: MagicMock) -> None:
+    """Test that the media of every message is loaded at once."""
+    mock_get_image_type.return_value = "png"
+    loader = MediaLoader()
+    attrs = {"reference": "a.png", "urls": ["b.png", "a.png"], "raw": b"raw"}
+    with patch.object(
+        loader,
+        "load_all",
+        side_effect=lambda sources: {source: source.encode() for source in sources},
+    ) as mock_load_all:
+        messages = loader(parse_prompt_messages)(
+            roles=["system", "user"], template=_MEDIA_TEMPLATE, attrs=attrs
+        )
+        mock_load_all.assert_called_once()
+
+        mock_load_all.reset_mock()
+        token = preloaded_media.set({"a.png": b"preloaded", "b.png": b"b.png"})
+        try:
+            preloaded_messages = loader(parse_prompt_messages)(
+                roles=["system", "user"], template=_MEDIA_TEMPLATE, attrs=attrs
+            )
+        finally:
+            preloaded_media.reset(token)
+        mock_load_all.assert_not_called()
+
+    assert messages[0].content[1] == _image_part(b"a.png")  # pyright: ignore [reportIndexIssue]
+    images = [part.image for part in messages[1].content if part.type == "image"]  # pyright: ignore [reportAttributeAccessIssue]
+    assert images == [b"b.png", b"a.png", b"raw"]
+    assert preloaded_messages[0].content[1] == _image_part(b"preloaded")  # pyright: ignore [reportIndexIssue]
+
+
+@pytest.mark.asyncio
+@patch("mirascope.core.base._utils._parse_content_template.get_image_type")
+async def test_parse_prompt_messages_async(mock_get_image_type: MagicMock) -> None:
+    """Test that the media of a prompt is loaded without blocking the event loop."""
+    mock_get_image_type.return_value = "png"
+    loader = MediaLoader()
+    attrs = {"reference": "a.png", "urls": ["b.png"], "raw": b"raw"}
+
+    async def load_all_async(sources: list[str]) -> dict[str, bytes]:
+        return {source: source.encode() for source in sources}
+
+    with (
+        patch.object(loader, "load_all_async", side_effect=load_all_async),
+        patch.object(loader, "load_all") as mock_load_all,
+    ):
+        messages = await loader(parse_prompt_messages_async)(
+            roles=["system", "user"],
+            template=_MEDIA_TEMPLATE,
+            attrs=attrs,
+            dynamic_config={"computed_fields": {"extra": "field"}},
+        )
+        mock_load_all.assert_not_called()
+        assert messages[0].content[1] == _image_part(b"a.png")  # pyright: ignore [reportIndexIssue]
+        assert await loader(parse_prompt_messages_async)(
+            roles=["user"], template="Hi", attrs={}
+        ) == [BaseMessageParam(role="user", content="Hi")]
+
+        def fn() -> None: ...
+
+        fn._prompt_template = _MEDIA_TEMPLATE  # pyright: ignore [reportFunctionMemberAccess]
+        assert await loader(load_prompt_media_async)(fn, attrs, None) == {
+            "a.png": b"a.png",
+            "b.png": b"b.png",
+        }
+        assert await loader(load_prompt_media_async)(
+            fn, {}, {"computed_fields": attrs}
+        ) == {"a.png": b"a.png", "b.png": b"b.png"}
+        assert await load_prompt_media_async(fn, attrs, {"messages": ["m"]}) == {}
+        assert await load_prompt_media_async(fn, {}, None) == {}
+
+    def no_template() -> None: ...
+
+    assert await load_prompt_media_async(no_template, {}, None) == {}
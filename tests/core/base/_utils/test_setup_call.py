@@ -112,3 +112,42 @@ def test_setup_call_with_custom_messages() -> None:
     assert custom_messages == messages
     assert tool_types is None
     assert call_kwargs == {}
+
+
+def test_setup_call_reuses_static_tools() -> None:
+    """Tests that `setup_call` converts the decorator's static tools only once."""
+
+    class FormatBook(BaseTool):
+        title: str
+        author: str
+
+        def call(self) -> None:
+            """Format book tool call method."""
+
+        @classmethod
+        def tool_schema(cls):
+            return {"type": "function", "name": cls._name()}
+
+    def format_book(title: str, author: str) -> None:
+        """Format book tool."""
+
+    @prompt_template("Recommend a {genre} book.")
+    def fn(genre: str) -> None: ...  # pragma: no cover
+
+    tools = [FormatBook, format_book]
+    _, _, tool_types, call_kwargs = setup_call(
+        fn, {"genre": "fantasy"}, None, tools, FormatBook, {}
+    )
+    _, _, next_tool_types, next_call_kwargs = setup_call(
+        fn, {"genre": "fantasy"}, None, tools, FormatBook, {}
+    )
+    assert tool_types and next_tool_types
+    assert tool_types is not next_tool_types
+    assert all(a is b for a, b in zip(tool_types, next_tool_types, strict=True))
+    assert call_kwargs["tools"] is not next_call_kwargs["tools"]  # pyright: ignore [reportTypedDictNotRequiredAccess]
+    assert call_kwargs == next_call_kwargs
+
+    _, _, dynamic_tool_types, _ = setup_call(
+        fn, {"genre": "fantasy"}, {"tools": []}, tools, FormatBook, {}
+    )
+    assert dynamic_tool_types is None
@@ -0,0 +1,65 @@
+"""Tests the `_utils.SourceCache` class."""
+
+import gc
+import weakref
+
+from mirascope.core.base._utils._source_cache import SourceCache
+
+
+def test_source_cache() -> None:
+    """Tests getting and setting values in the `SourceCache`."""
+    cache: SourceCache[str] = SourceCache("test")
+
+    def fn() -> None: ...  # pragma: no cover
+
+    assert cache.get(fn, "key") is None
+    assert cache.set(fn, "key", "a") == "a"
+    assert cache.get(fn, "key") == "a"
+    assert cache.get(fn, "other") is None
+
+    cache.clear(fn)
+    assert cache.get(fn, "key") is None
+    cache.clear(fn)
+
+
+def test_source_cache_subclasses() -> None:
+    """Tests that subclasses of a cached class don't share its entries."""
+    cache: SourceCache[str] = SourceCache("test")
+
+    class Base: ...
+
+    class Sub(Base): ...
+
+    cache.set(Base, None, "base")
+    assert cache.get(Sub) is None
+    cache.set(Sub, None, "sub")
+    assert cache.get(Base) == "base"
+    assert cache.get(Sub) == "sub"
+
+
+def test_source_cache_releases_sources() -> None:
+    """Tests that values referencing their source don't keep it alive."""
+    cache: SourceCache[type] = SourceCache("test")
+
+    class Source: ...
+
+    cache.set(Source, None, type("Derived", (Source,), {}))
+    source_ref = weakref.ref(Source)
+    del Source
+    gc.collect()
+    assert source_ref() is None
+
+
+def test_source_cache_uncacheable_sources() -> None:
+    """Tests that bound methods and sources without attributes aren't cached."""
+    cache: SourceCache[str] = SourceCache("test")
+
+    class Library:
+        def recommend(self) -> None: ...  # pragma: no cover
+
+    library = Library()
+    assert cache.set(library.recommend, None, "method") == "method"
+    assert cache.get(library.recommend) is None
+
+    assert cache.set(len, None, "builtin") == "builtin"
+    assert cache.get(len) is None
@@ -0,0 +1,60 @@
+"""Tests the `_utils.WeakLRUCache` class."""
+
+import gc
+
+from mirascope.core.base._utils._weak_lru_cache import WeakLRUCache
+
+
+def test_weak_lru_cache() -> None:
+    """Tests getting and setting values in the `WeakLRUCache`."""
+    cache: WeakLRUCache[str] = WeakLRUCache(maxsize=2)
+
+    def fn_a() -> None: ...  # pragma: no cover
+
+    def fn_b() -> None: ...  # pragma: no cover
+
+    def fn_c() -> None: ...  # pragma: no cover
+
+    assert cache.get(fn_a, "key") is None
+    assert cache.set(fn_a, "key", "a") == "a"
+    assert cache.get(fn_a, "key") == "a"
+    assert cache.get(fn_a, "other") is None
+
+    cache.set(fn_b, "key", "b")
+    cache.get(fn_a, "key")  # marks `fn_a` as most recently used
+    cache.set(fn_c, "key", "c")
+    assert len(cache) == 2
+    assert cache.get(fn_b, "key") is None
+    assert cache.get(fn_a, "key") == "a"
+    assert cache.get(fn_c, "key") == "c"
+
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_weak_lru_cache_drops_collected_sources() -> None:
+    """Tests that entries are removed once their source is garbage collected."""
+    cache: WeakLRUCache[str] = WeakLRUCache()
+
+    def fn() -> None: ...  # pragma: no cover
+
+    cache.set(fn, None, "value")
+    assert len(cache) == 1
+    del fn
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_weak_lru_cache_bound_methods_and_unreferenceable_sources() -> None:
+    """Tests caching bound methods and sources that can't be weakly referenced."""
+    cache: WeakLRUCache[str] = WeakLRUCache()
+
+    class Library:
+        def recommend(self) -> None: ...  # pragma: no cover
+
+    library = Library()
+    cache.set(library.recommend, None, "method")
+    assert cache.get(library.recommend) == "method"
+
+    cache.set(1, None, "int")
+    assert cache.get(1) == "int"
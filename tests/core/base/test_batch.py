@@ -0,0 +1,165 @@
+"""Tests the `batch` module."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from mirascope.core.base.batch import BatchResult, batch, batch_async
+
+
+def _recommend(genre: str, *, delay: float = 0) -> str:
+    time.sleep(delay)
+    if genre == "error":
+        raise ValueError("error")
+    return f"{genre} book"
+
+
+async def _recommend_async(genre: str, *, delay: float = 0) -> str:
+    await asyncio.sleep(delay)
+    if genre == "error":
+        raise ValueError("error")
+    return f"{genre} book"
+
+
+def test_batch() -> None:
+    """Tests running a sync function over a batch of inputs."""
+    inputs = [("fantasy",), {"genre": "error"}, {"genre": "scifi", "delay": 0.1}]
+    results = list(batch(_recommend, inputs, max_concurrency=2))
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.args for result in results] == inputs
+    assert [result.output for result in results] == ["fantasy book", None, "scifi book"]
+    assert results[0].error is None
+    assert isinstance(results[1].error, ValueError)
+
+    inputs = [{"genre": "slow", "delay": 0.2}, ("fast",)]
+    results = list(batch(_recommend, inputs, ordered=False))
+    assert [result.output for result in results] == ["fast book", "slow book"]
+
+    results = list(batch(_recommend_async, [("fantasy",)]))
+    assert results == [BatchResult(index=0, args=("fantasy",), output="fantasy book")]
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        next(batch(_recommend, [], max_concurrency=0))
+
+
+def test_batch_max_concurrency() -> None:
+    """Tests that only `max_concurrency` calls are in flight at once."""
+    running, max_running, lock = 0, 0, threading.Lock()
+    read = []
+
+    def call(i: int) -> int:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return i
+
+    def inputs():
+        for i in range(20):
+            read.append(i)
+            yield (i,)
+
+    results = batch(call, inputs(), max_concurrency=4)
+    assert next(results).output == 0
+    assert len(read) < 20
+    assert [result.output for result in results] == list(range(1, 20))
+    assert max_running == 4
+
+
+def test_batch_ordered_buffer() -> None:
+    """Tests that a slow input stops new calls once `max_concurrency` are buffered."""
+    read, read_while_slow = [], []
+
+    def call(i: int) -> int:
+        if i == 0:
+            time.sleep(0.2)
+            read_while_slow.append(len(read))
+        return i
+
+    def inputs():
+        for i in range(20):
+            read.append(i)
+            yield (i,)
+
+    results = batch(call, inputs(), max_concurrency=2)
+    assert [result.output for result in results] == list(range(20))
+    assert read_while_slow == [3]
+
+
+@pytest.mark.asyncio
+async def test_batch_async() -> None:
+    """Tests running an async function over a batch of inputs."""
+    inputs = [{"genre": "fantasy", "delay": 0.1}, ("error",), ("scifi",)]
+    results = [result async for result in batch_async(_recommend_async, inputs)]
+    assert [result.index for result in results] == [0, 1, 2]
+    assert [result.output for result in results] == ["fantasy book", None, "scifi book"]
+    assert isinstance(results[1].error, ValueError)
+
+    results = [
+        result
+        async for result in batch_async(
+            _recommend_async, inputs, max_concurrency=1, ordered=False
+        )
+    ]
+    assert [result.index for result in results] == [0, 1, 2]
+
+    results = [
+        result async for result in batch_async(_recommend, inputs[::-1], ordered=False)
+    ]
+    assert results[-1].index == 2
+
+    results = [
+        result
+        async for result in batch_async(lambda: _recommend_async("fantasy"), [()])
+    ]
+    assert results[0].output == "fantasy book"
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        await anext(batch_async(_recommend_async, [], max_concurrency=0))
+
+
+@pytest.mark.asyncio
+async def test_batch_async_cancels_pending() -> None:
+    """Tests that pending calls are cancelled when the batch is closed early."""
+    cancelled = asyncio.Event()
+
+    async def call(delay: float) -> float:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return delay
+
+    results = batch_async(call, [(0,), (10,)], ordered=False)
+    assert (await anext(results)).output == 0
+    await results.aclose()
+    await asyncio.wait_for(cancelled.wait(), 1)
+
+
+@pytest.mark.asyncio
+async def test_batch_async_ordered_buffer() -> None:
+    """Tests that a slow input stops new calls once `max_concurrency` are buffered."""
+    read, read_while_slow = [], []
+
+    async def call(i: int) -> int:
+        if i == 0:
+            await asyncio.sleep(0.1)
+            read_while_slow.append(len(read))
+        return i
+
+    def inputs():
+        for i in range(20):
+            read.append(i)
+            yield (i,)
+
+    results = [
+        result async for result in batch_async(call, inputs(), max_concurrency=2)
+    ]
+    assert [result.output for result in results] == list(range(20))
+    assert read_while_slow == [3]
@@ -127,6 +127,7 @@ def test_call_factory_structured_stream(
         "json_mode": False,
         "client": MagicMock(),
         "call_params": MagicMock(),
+        "iterable": False,
     }
     _ = call(stream=True, **structured_stream_kwargs)
     mock_structured_stream_factory.assert_called_once_with(
@@ -151,3 +152,12 @@ def test_call_decorator_invalid_output_parser_with_stream(
         ValueError, match="Cannot use `output_parser` with `stream=True`"
     ):
         call("model", stream=True, output_parser=MagicMock())
+
+
+def test_call_decorator_invalid_iterable(mock_call_factory_kwargs: dict) -> None:
+    """Tests a ValueError is raised if `iterable` is used without a structured stream."""
+    call = call_factory(**mock_call_factory_kwargs)
+    with pytest.raises(ValueError, match="Cannot use `iterable` without"):
+        call("model", stream=True, iterable=True)  # pyright: ignore [reportCallIssue]
+    with pytest.raises(ValueError, match="Cannot use `iterable` without"):
+        call("model", response_model=MagicMock, iterable=True)  # pyright: ignore [reportCallIssue]
@@ -1,8 +1,12 @@
 """Tests the `call_response` module."""
 
+from functools import cached_property
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from mirascope.core.base.call_response import BaseCallResponse
+from mirascope.core.base.tool import BaseTool
 
 
 def test_base_call_response() -> None:
@@ -32,3 +36,78 @@ def test_base_call_response() -> None:
     assert call_response.serialize_tool_types([tool], info=MagicMock()) == [
         {"type": "function", "name": "mock_tool"}
     ]
+
+
+def test_base_call_response_model_copy() -> None:
+    """Tests that memoized properties are recomputed on copies."""
+
+    class MyCallResponse(BaseCallResponse):
+        @property
+        def content(self) -> str:
+            return self.response
+
+        @cached_property
+        def tools(self) -> list:
+            return [self.response]
+
+    patch.multiple(MyCallResponse, __abstractmethods__=set()).start()
+    call_response = MyCallResponse(
+        metadata={},
+        response="original",
+        tool_types=None,
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )  # type: ignore
+    tools = call_response.tools
+    assert call_response.tools is tools
+    copied = call_response.model_copy(update={"response": "updated"})
+    assert copied.tools == ["updated"]
+    assert call_response.tools is tools
+
+
+@pytest.mark.asyncio
+async def test_base_call_response_execute_tools() -> None:
+    """Tests executing the tools of a call response."""
+
+    class MyTool(BaseTool):
+        def call(self) -> str:
+            return "output"
+
+    tool = MyTool()
+
+    class MyCallResponse(BaseCallResponse):
+        @property
+        def tools(self) -> list | None:
+            return [tool] if self.response else None
+
+        @classmethod
+        def tool_message_params(cls, tools_and_outputs: list) -> list:
+            return [output for _, output in tools_and_outputs]
+
+    patch.multiple(MyCallResponse, __abstractmethods__=set()).start()
+    call_response = MyCallResponse(
+        metadata={},
+        response="tool",
+        tool_types=None,
+        prompt_template="",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+        user_message_param=None,
+        start_time=0,
+        end_time=0,
+    )  # type: ignore
+    assert call_response.execute_tools() == ["output"]
+    assert await call_response.execute_tools_async(timeout=1) == ["output"]
+    call_response.response = ""
+    assert call_response.execute_tools() == []
+    assert await call_response.execute_tools_async() == []
@@ -7,6 +7,7 @@ import pytest
 from pydantic import BaseModel, ValidationError
 
 from mirascope.core.base._extract import extract_factory
+from mirascope.core.base.timings import CallTimings
 
 
 @pytest.fixture()
@@ -109,7 +110,8 @@ async def test_extract_factory_async(
 ) -> None:
     """Tests the `extract_factory` method on an async function."""
     mock_create_decorator = MagicMock()
-    mock_create_inner = AsyncMock()
+    timings = CallTimings()
+    mock_create_inner = AsyncMock(return_value=MagicMock(timings=timings))
     mock_create_decorator.return_value = mock_create_inner
     mock_create_factory.return_value = mock_create_decorator
     mock_extract_tool_return.return_value = MyBaseModel()
@@ -151,6 +153,8 @@ async def test_extract_factory_async(
         {},
     )
     assert output == mock_extract_tool_return.return_value
+    assert output._timings is timings  # pyright: ignore [reportAttributeAccessIssue]
+    assert list(timings.phases) == ["bind_args", "validation"]
 
     mock_extract_tool_return.side_effect = ValidationError.from_exception_data(
         title="", line_errors=[], input_type="json"
@@ -0,0 +1,135 @@
+"""Tests the `media_cache` module."""
+
+import os
+import sys
+import urllib.error
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mirascope.core.base.media_cache import MediaCache, MediaValidators
+from mirascope.core.base.media_loader import MediaLoader
+
+
+def test_media_cache_load_file(tmp_path: Path) -> None:
+    """Tests that files are cached until they are modified."""
+    cache = MediaCache()
+    path = tmp_path / "image.png"
+    path.write_bytes(b"image")
+    read = MagicMock(side_effect=lambda source, validators: (b"image", validators))
+
+    data = cache.load(str(path), read)
+    assert data == b"image"
+    assert cache.load(str(path), read) is data
+    assert cache.load(path.as_uri(), read) is data
+    read.assert_called_once_with(str(path), MediaValidators())
+
+    path.write_bytes(b"other")
+    os.utime(path, ns=(0, 0))
+    read.side_effect = lambda source, validators: (b"other", validators)
+    assert cache.load(str(path), read) == b"other"
+    assert read.call_count == 2
+
+    assert cache.load("data:image/png;base64,aW1hZ2U=", read) == b"other"
+    assert cache.load(str(tmp_path / "missing.png"), read) == b"other"
+    assert read.call_count == 4
+
+
+def test_media_cache_load_url() -> None:
+    """Tests that URLs are revalidated with their validators."""
+    cache = MediaCache()
+    validators = MediaValidators(etag='"1"')
+    read = MagicMock(return_value=(b"image", validators))
+    data = cache.load("https://example.com/image.png", read)
+    assert data == b"image"
+
+    read.return_value = (None, validators)
+    assert cache.load("https://example.com/image.png", read) is data
+    read.assert_called_with("https://example.com/image.png", validators)
+
+    read.return_value = (b"other", MediaValidators(etag='"2"'))
+    assert cache.load("https://example.com/image.png", read) == b"other"
+
+    read.reset_mock()
+    read.return_value = (b"image", MediaValidators())
+    data = cache.load("https://example.com/static.png", read)
+    assert cache.load("https://example.com/static.png", read) is data
+    read.assert_called_once()
+
+
+def test_media_cache_derive() -> None:
+    """Tests that derived values are computed once per content."""
+    cache = MediaCache()
+    derive = MagicMock(side_effect=lambda data: data.decode())
+    data = cache.load("https://a.com/image.png", lambda s, v: (b"image", v))
+    assert cache.load("https://b.com/image.png", lambda s, v: (b"image", v)) is data
+
+    assert cache.derive(data, "text", derive) == "image"
+    assert cache.derive(data, "text", derive) == "image"
+    assert cache.derive(bytes(bytearray(b"image")), "text", derive) == "image"
+    derive.assert_called_once_with(data)
+    assert cache.size == len(b"image") * 2
+
+    cache.clear()
+    assert cache.size == 0
+    assert cache.derive(data, "text", derive) == "image"
+    assert derive.call_count == 2
+
+    cache = MediaCache(max_size=1_000)
+    data = cache.load("https://a.com/image.png", lambda s, v: (b"image", v))
+    other = cache.load("https://b.com/other.png", lambda s, v: (b"other", v))
+    cache.derive(data, "parts", lambda data: list(range(1_000)))
+    assert cache.size == len(other)
+    cache = MediaCache()
+    data = cache.load("https://a.com/image.png", lambda s, v: (b"image", v))
+    parts = cache.derive(data, "parts", lambda data: list(range(1_000)))
+    assert cache.size == len(data) + sys.getsizeof(parts)
+
+
+def test_media_cache_eviction(tmp_path: Path) -> None:
+    """Tests that the least recently used media is evicted, and spilled to disk."""
+    read = MagicMock(
+        side_effect=lambda source, validators: (source[-1:].encode() * 4, validators)
+    )
+    cache = MediaCache(max_size=8)
+    cache.load("https://example.com/a", read)
+    cache.load("https://example.com/b", read)
+    cache.load("https://example.com/a", read)
+    cache.load("https://example.com/c", read)
+    assert read.call_count == 3
+    cache.load("https://example.com/b", read)
+    assert read.call_count == 4
+
+    read.reset_mock()
+    cache = MediaCache(max_size=8, directory=tmp_path / "media")
+    for source in ["a", "b", "c", "a"]:
+        assert cache.load(f"https://example.com/{source}", read) == source.encode() * 4
+    assert read.call_count == 3
+    assert len(list((tmp_path / "media").iterdir())) == 2
+
+
+@patch("urllib.request.urlopen", new_callable=MagicMock)
+def test_media_loader_cache(mock_urlopen: MagicMock, tmp_path: Path) -> None:
+    """Tests that media loaders load media and derive values with their cache."""
+    response = mock_urlopen.return_value.__enter__.return_value
+    response.read.return_value = b"image"
+    response.headers = {"ETag": '"1"'}
+    loader = MediaLoader(cache=MediaCache())
+
+    data = loader.load("https://example.com/image.png")
+    mock_urlopen.side_effect = urllib.error.HTTPError(
+        "https://example.com/image.png", 304, "Not Modified", MagicMock(), None
+    )
+    assert loader.load("https://example.com/image.png") is data
+    request = mock_urlopen.call_args.args[0]
+    assert request.get_header("If-none-match") == '"1"'
+
+    path = tmp_path / "image.png"
+    path.write_bytes(b"image")
+    assert loader.load(str(path)) is data
+
+    derive = MagicMock(return_value="aW1hZ2U=")
+    assert loader.derive(data, "base64", derive) == "aW1hZ2U="
+    assert loader.derive(data, "base64", derive) == "aW1hZ2U="
+    derive.assert_called_once()
+    assert MediaLoader().derive(data, "base64", derive) == "aW1hZ2U="
+    assert derive.call_count == 2
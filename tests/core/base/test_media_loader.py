@@ -0,0 +1,97 @@
+"""Tests the `media_loader` module."""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base.media_loader import (
+    MediaLoader,
+    current_media_loader,
+    get_media_loader,
+)
+
+
+@patch("urllib.request.urlopen", new_callable=MagicMock)
+def test_media_loader_load(mock_urlopen: MagicMock, tmp_path: Path) -> None:
+    """Tests loading media from bytes, URLs, and file paths."""
+    mock_urlopen.return_value.__enter__.return_value.read.return_value = b"url"
+    path = tmp_path / "image.png"
+    path.write_bytes(b"file")
+
+    assert MediaLoader().load(b"bytes") == b"bytes"
+    assert MediaLoader().load(str(path)) == b"file"
+    assert MediaLoader().load("https://example.com/image.png") == b"url"
+    mock_urlopen.assert_called_once_with("https://example.com/image.png")
+    MediaLoader(timeout=5).load("https://example.com/image.png")
+    mock_urlopen.assert_called_with("https://example.com/image.png", timeout=5)
+
+    with pytest.raises(ValueError, match="Failed to load or encode data from"):
+        MediaLoader().load(str(tmp_path / "missing.png"))
+
+
+def test_media_loader_load_all() -> None:
+    """Tests that sources are loaded concurrently, each only once."""
+    loader = MediaLoader(max_concurrency=2)
+    barrier = threading.Barrier(2, timeout=5)
+    loaded = []
+
+    def load(source: str) -> bytes:
+        loaded.append(source)
+        barrier.wait()
+        return source.encode()
+
+    with patch.object(loader, "load", side_effect=load):
+        assert loader.load_all(["a", "b", "a"]) == {"a": b"a", "b": b"b"}
+    assert sorted(loaded) == ["a", "b"]
+
+    with patch.object(loader, "load", side_effect=lambda source: b"") as mock_load:
+        assert loader.load_all(["a"]) == {"a": b""}
+        assert MediaLoader(max_concurrency=1).load_all([]) == {}
+        mock_load.assert_called_once_with("a")
+
+
+@pytest.mark.asyncio
+async def test_media_loader_load_all_async() -> None:
+    """Tests that sources are loaded concurrently up to `max_concurrency`."""
+    loader = MediaLoader(max_concurrency=2)
+    running, max_running = 0, 0
+    lock = threading.Lock()
+
+    def load(source: str) -> bytes:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return source.encode()
+
+    with patch.object(loader, "load", side_effect=load):
+        media = await loader.load_all_async(["a", "b", "c", "a"])
+    assert media == {"a": b"a", "b": b"b", "c": b"c"}
+    assert max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_media_loader_decorator() -> None:
+    """Tests that decorated functions load media with the media loader."""
+    loader = MediaLoader(max_concurrency=16)
+
+    @loader
+    def fn() -> MediaLoader:
+        return get_media_loader()
+
+    @loader
+    async def fn_async() -> MediaLoader:
+        await asyncio.sleep(0)
+        return get_media_loader()
+
+    assert fn() is loader
+    assert await fn_async() is loader
+    assert current_media_loader.get() is None
+    assert get_media_loader() is not loader
@@ -1,5 +1,8 @@
 """Tests that `partial` works to make all fields optional."""
 
+import gc
+import weakref
+
 from pydantic import BaseModel
 
 from mirascope.core.base._partial import partial
@@ -71,3 +74,26 @@ def test_deepest_partial() -> None:
         partial(DeepestModel).model_json_schema()
         == PartialDeepestModel.model_json_schema()
     )
+
+
+def test_partial_cached() -> None:
+    """Tests that `partial` returns the same class for the same model."""
+    partial_model = partial(DeepestModel)
+    assert partial(DeepestModel) is partial_model
+    assert partial_model.model_fields["shallow"].annotation == (
+        partial(ShallowModel) | None
+    )
+
+
+def test_partial_cache_releases_models() -> None:
+    """Tests that cached partial classes don't keep their models alive."""
+
+    class Book(BaseModel):
+        title: str
+
+    partial_model = partial(Book)
+    model_ref, partial_model_ref = weakref.ref(Book), weakref.ref(partial_model)
+    del Book, partial_model
+    gc.collect()
+    assert model_ref() is None
+    assert partial_model_ref() is None
@@ -0,0 +1,87 @@
+"""Tests the `pricing` module."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mirascope.core.base.pricing import ModelPricing, PricingRegistry
+
+
+def test_pricing_registry_resolve() -> None:
+    """Tests that models resolve by name, alias, and undated name."""
+    registry = PricingRegistry()
+    registry.register(
+        "provider",
+        {
+            "model": ModelPricing(1.0, 2.0),
+            "model-2024-01-01": ModelPricing(3.0, 4.0),
+        },
+    )
+    registry.register_alias("provider", "alias", "model")
+
+    assert registry.resolve("provider", "model") == ModelPricing(1.0, 2.0)
+    assert registry.resolve("provider", "model-2024-01-01") == ModelPricing(3.0, 4.0)
+    assert registry.resolve("provider", "alias") == ModelPricing(1.0, 2.0)
+    assert registry.resolve("provider", "model-2024-08-06") == ModelPricing(1.0, 2.0)
+    assert registry.resolve("provider", "model@20240806") == ModelPricing(1.0, 2.0)
+    assert registry.resolve("provider", "vendor.model-20240806-v1:0") == ModelPricing(
+        1.0, 2.0
+    )
+    assert registry.resolve("provider", "other") is None
+    assert registry.resolve("other", "model") is None
+
+    registry.register("provider", {"model": ModelPricing(5.0, 6.0)}, override=True)
+    assert registry.resolve("provider", "model-2024-08-06") == ModelPricing(5.0, 6.0)
+
+
+def test_pricing_registry_load(tmp_path: Path) -> None:
+    """Tests loading price overrides from a file."""
+    registry = PricingRegistry()
+    registry.register("provider", {"model": ModelPricing(1.0, 2.0)})
+    path = tmp_path / "prices.json"
+    path.write_text(
+        json.dumps(
+            {
+                "provider": {
+                    "model": {"input": 3.0, "output": 4.0, "cached_input": 1.0},
+                    "deployment": "model",
+                }
+            }
+        )
+    )
+    registry.load(path)
+    assert registry.resolve("provider", "deployment") == ModelPricing(3.0, 4.0, 1.0)
+
+    path.write_text(json.dumps({"provider": {"model": {"price": 1.0}}}))
+    with pytest.raises(ValueError, match="Invalid prices"):
+        registry.load(path)
+
+
+def test_pricing_registry_calculate_cost() -> None:
+    """Tests calculating costs with cached input and audio tokens."""
+    registry = PricingRegistry()
+    registry.register(
+        "provider",
+        {
+            "model": ModelPricing(1.0, 2.0, cached_input=0.5),
+            "audio": ModelPricing(1.0, 2.0, audio_input=10.0, audio_output=20.0),
+        },
+    )
+    assert registry.calculate_cost("provider", "model", None, 1) is None
+    assert registry.calculate_cost("provider", "unknown", 1, 1) is None
+    assert registry.calculate_cost("provider", "model", 10, 5) == 20.0
+    assert (
+        registry.calculate_cost("provider", "model", 10, 5, cached_input_tokens=4)
+        == 18.0
+    )
+    assert (
+        registry.calculate_cost("provider", "audio", 10, 5, cached_input_tokens=4)
+        == 20.0
+    )
+    assert (
+        registry.calculate_cost(
+            "provider", "audio", 10, 5, audio_input_tokens=2, audio_output_tokens=1
+        )
+        == 8.0 + 20.0 + 8.0 + 20.0
+    )
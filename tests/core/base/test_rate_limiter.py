@@ -0,0 +1,375 @@
+"""Tests the `rate_limiter` module."""
+
+import asyncio
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base._utils import get_default_client
+from mirascope.core.base.rate_limiter import (
+    RateLimiter,
+    current_rate_limiter,
+    estimate_tokens,
+)
+from mirascope.core.base.stream import stream_factory
+
+
+def test_estimate_tokens() -> None:
+    """Tests estimating the number of input tokens of messages."""
+    messages = [
+        {"role": "system", "content": "a" * 100},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": "b" * 100},
+                {"type": "image_url", "image_url": {"url": "data:image/png;base64,"}},
+            ],
+        },
+        MagicMock(),
+    ]
+    assert estimate_tokens(messages) == (6 + 100 + 4 + 100 + 4 + 9) // 4 + 3 * 4
+
+
+@patch("mirascope.core.base.rate_limiter.time")
+def test_rate_limiter_paces_requests(mock_time: MagicMock) -> None:
+    """Tests that requests wait once the requests per minute budget runs out."""
+    mock_time.monotonic.return_value = 0
+    rate_limiter = RateLimiter()
+    rate_limiter.set_limits("openai", requests_per_minute=2)
+    delays = [
+        rate_limiter.acquire("openai", "gpt-4o-mini", None, []).delay for _ in range(4)
+    ]
+    assert delays == [0, 0, 30, 60]
+    assert [call.args for call in mock_time.sleep.call_args_list] == [(30,), (60,)]
+
+    mock_time.monotonic.return_value = 120
+    assert rate_limiter.acquire("openai", "gpt-4o-mini", None, []).delay == 0
+    assert rate_limiter.acquire("anthropic", "claude", None, []).delay == 0
+
+
+@patch("mirascope.core.base.rate_limiter.time")
+def test_rate_limiter_tokens(mock_time: MagicMock) -> None:
+    """Tests that token reservations are estimated and reconciled with the usage."""
+    mock_time.monotonic.return_value = 0
+    rate_limiter = RateLimiter(estimate_tokens=lambda messages: 60)
+    rate_limiter.set_limits("openai", tokens_per_minute=120)
+    first = rate_limiter.acquire("openai", "gpt-4o-mini", None, [])
+    assert (first.tokens, first.delay) == (60, 0)
+    first.reconcile(10, 10)
+    assert first.tokens == 20
+    assert rate_limiter.acquire("openai", "gpt-4o-mini", None, []).delay == 0
+    # 120 - 20 - 60 - 60 tokens left, which takes 10 seconds to refill at 2 per second.
+    assert rate_limiter.acquire("openai", "gpt-4o-mini", None, []).delay == 10
+
+    reservation = rate_limiter.acquire("openai", "gpt-4o-mini", None, [])
+    reservation.reconcile(None, None)
+    assert reservation.tokens == 60
+
+    mock_time.monotonic.return_value = 100
+    reservation = rate_limiter.acquire("openai", "gpt-4o-mini", None, [])
+    reservation.release()
+    assert reservation.tokens == 0
+    assert rate_limiter.acquire("openai", "gpt-4o-mini", None, []).delay == 0
+    assert rate_limiter.acquire("openai", "gpt-4o-mini", None, []).delay == 0
+    RateLimiter().acquire("openai", "gpt-4o-mini", None, []).release()
+
+
+@patch("mirascope.core.base.rate_limiter.time")
+def test_rate_limiter_tokens_above_budget(mock_time: MagicMock) -> None:
+    """Tests that estimates above the budget only reserve and give back the budget."""
+    mock_time.monotonic.return_value = 0
+    rate_limiter = RateLimiter(estimate_tokens=lambda messages: 5000)
+    rate_limiter.set_limits("openai", tokens_per_minute=1000)
+    rate_limiter.acquire("openai", "gpt-4o-mini", None, []).release()
+    budget = rate_limiter._budgets[("openai", "gpt-4o-mini", None)][1]
+    assert budget is not None
+    budget.level = 500
+    reservation = rate_limiter.acquire("openai", "gpt-4o-mini", None, [])
+    assert reservation.tokens == 1000
+    assert budget.level == -500
+    reservation.reconcile(50, 50)
+    assert budget.level == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cancel", ["sync", "async"])
+async def test_rate_limiter_acquire_interrupted(cancel: str) -> None:
+    """Tests that reservations are released when waiting for them is interrupted."""
+    rate_limiter = RateLimiter(estimate_tokens=lambda messages: 60)
+    rate_limiter.set_limits("openai", tokens_per_minute=60)
+    rate_limiter.acquire("openai", "gpt-4o-mini", None, [])
+    budget = rate_limiter._budgets[("openai", "gpt-4o-mini", None)][1]
+    assert budget is not None
+    level = budget.level
+    if cancel == "sync":
+        with (
+            patch("mirascope.core.base.rate_limiter.time.sleep") as mock_sleep,
+            pytest.raises(KeyboardInterrupt),
+        ):
+            mock_sleep.side_effect = KeyboardInterrupt
+            rate_limiter.acquire("openai", "gpt-4o-mini", None, [])
+    else:
+        task = asyncio.create_task(
+            rate_limiter.acquire_async("openai", "gpt-4o-mini", None, [])
+        )
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert budget.level == pytest.approx(level, abs=1)
+
+
+def test_rate_limiter_limits() -> None:
+    """Tests that the most specific limits apply to each model and API key."""
+    rate_limiter = RateLimiter()
+    rate_limiter.set_limits("openai", requests_per_minute=1)
+    rate_limiter.set_limits("openai", "gpt-4o", requests_per_minute=2)
+    rate_limiter.set_limits("openai", api_key="key", tokens_per_minute=3)
+    rate_limiter.set_limits("openai", "gpt-4o", api_key="key", requests_per_minute=4)
+    client = MagicMock(api_key="key")
+    budgets = {
+        (model, key): rate_limiter._get_budgets("openai", model, key)
+        for model in ["gpt-4o", "gpt-4o-mini"]
+        for key in ["key", None]
+    }
+    assert budgets[("gpt-4o", "key")][0].capacity == 4  # pyright: ignore [reportOptionalMemberAccess]
+    assert budgets[("gpt-4o", None)][0].capacity == 2  # pyright: ignore [reportOptionalMemberAccess]
+    assert budgets[("gpt-4o-mini", "key")][1].capacity == 3  # pyright: ignore [reportOptionalMemberAccess]
+    assert budgets[("gpt-4o-mini", None)][0].capacity == 1  # pyright: ignore [reportOptionalMemberAccess]
+    rate_limiter.acquire("openai", "gpt-4o", client, [])
+    assert budgets[("gpt-4o", "key")][0].level == 3  # pyright: ignore [reportOptionalMemberAccess]
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_decorator() -> None:
+    """Tests that decorated functions make their calls with the rate limiter."""
+    rate_limiter = RateLimiter()
+
+    @rate_limiter
+    def fn() -> RateLimiter | None:
+        return current_rate_limiter.get()
+
+    @rate_limiter
+    async def fn_async() -> RateLimiter | None:
+        await asyncio.sleep(0)
+        return current_rate_limiter.get()
+
+    assert fn() is rate_limiter
+    assert await fn_async() is rate_limiter
+    assert current_rate_limiter.get() is None
+
+    with patch("mirascope.core.base.rate_limiter.asyncio") as mock_asyncio:
+        mock_asyncio.sleep = MagicMock(return_value=asyncio.sleep(0))
+        rate_limiter.set_limits("openai", requests_per_minute=1)
+        await rate_limiter.acquire_async("openai", "gpt-4o-mini", None, [])
+        reservation = await rate_limiter.acquire_async(
+            "openai", "gpt-4o-mini", None, []
+        )
+        mock_asyncio.sleep.assert_called_once_with(reservation.delay)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_calls(
+    mock_setup_call: MagicMock, mock_setup_call_async: MagicMock
+) -> None:
+    """Tests that calls and streams acquire and reconcile reservations."""
+    rate_limiter = MagicMock(spec=RateLimiter)
+    rate_limiter.acquire_async.return_value = rate_limiter.acquire.return_value
+    reservation = rate_limiter.acquire.return_value
+    response_type = MagicMock()
+    client = MagicMock()
+
+    def fn() -> None: ...
+
+    async def fn_async() -> None: ...
+
+    create_decorator = partial(
+        create_factory(TCallResponse=response_type, setup_call=mock_setup_call),
+        model="model",
+        tools=None,
+        output_parser=None,
+        json_mode=False,
+        client=client,
+        call_params={},
+    )
+    token = current_rate_limiter.set(rate_limiter)
+    try:
+        output = create_decorator(fn)()
+        messages = mock_setup_call.return_value[2]
+        rate_limiter.acquire.assert_called_once_with(
+            response_type._provider, "model", client, messages
+        )
+        reservation.reconcile.assert_called_once_with(
+            output.input_tokens,  # pyright: ignore [reportAttributeAccessIssue]
+            output.output_tokens,  # pyright: ignore [reportAttributeAccessIssue]
+        )
+
+        create_decorator = partial(
+            create_factory(
+                TCallResponse=response_type, setup_call=mock_setup_call_async
+            ),
+            model="model",
+            tools=None,
+            output_parser=None,
+            json_mode=False,
+            client=client,
+            call_params={},
+        )
+        await create_decorator(fn_async)()
+        rate_limiter.acquire_async.assert_called_once()
+
+        chunk = MagicMock(input_tokens=3, output_tokens=None)
+
+        async def handle_stream_async(*args):
+            yield chunk, None
+
+        stream_decorator = partial(
+            stream_factory(
+                TCallResponse=response_type,
+                TStream=MagicMock,
+                setup_call=mock_setup_call,
+                handle_stream=lambda *args: iter([(chunk, None)]),
+                handle_stream_async=handle_stream_async,
+            ),
+            model="model",
+            tools=None,
+            json_mode=False,
+            client=client,
+            call_params={},
+        )
+        reservation.reset_mock()
+        stream = stream_decorator(fn)()
+    finally:
+        current_rate_limiter.reset(token)
+
+    assert list(stream.stream) == [(chunk, None)]  # pyright: ignore [reportArgumentType]
+    reservation.reconcile.assert_called_once_with(3, 0)
+
+    stream_decorator = partial(
+        stream_factory(
+            TCallResponse=response_type,
+            TStream=MagicMock,
+            setup_call=mock_setup_call_async,
+            handle_stream=MagicMock(),
+            handle_stream_async=handle_stream_async,
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=client,
+        call_params={},
+    )
+    reservation.reset_mock()
+    token = current_rate_limiter.set(rate_limiter)
+    try:
+        stream = await stream_decorator(fn_async)()
+    finally:
+        current_rate_limiter.reset(token)
+    assert [chunk async for chunk in stream.stream] == [(chunk, None)]  # pyright: ignore [reportAttributeAccessIssue]
+    reservation.reconcile.assert_called_once_with(3, 0)
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_default_client_and_failed_calls() -> None:
+    """Tests that calls use the default client's API key and release failed calls."""
+    rate_limiter = MagicMock(spec=RateLimiter)
+    rate_limiter.acquire_async.return_value = rate_limiter.acquire.return_value
+    reservation = rate_limiter.acquire.return_value
+    response_type = MagicMock(_provider="openai")
+    default_client = MagicMock(api_key="default")
+
+    def create(**kwargs):
+        raise ValueError("failed")
+
+    async def create_async(**kwargs):
+        raise ValueError("failed")
+
+    def setup_call(**kwargs):
+        get_default_client(lambda: default_client, key="test-default-client")
+        return create, "template", [], None, {}
+
+    def setup_call_async(**kwargs):
+        get_default_client(lambda: default_client, key="test-default-client")
+        return create_async, "template", [], None, {}
+
+    def fn() -> None: ...
+
+    async def fn_async() -> None: ...
+
+    create_decorator = partial(
+        create_factory(TCallResponse=response_type, setup_call=setup_call),
+        model="model",
+        tools=None,
+        output_parser=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    stream_decorator = partial(
+        stream_factory(
+            TCallResponse=response_type,
+            TStream=MagicMock,
+            setup_call=setup_call,
+            handle_stream=MagicMock(),
+            handle_stream_async=MagicMock(),
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    token = current_rate_limiter.set(rate_limiter)
+    try:
+        with pytest.raises(ValueError, match="failed"):
+            create_decorator(fn)()
+        rate_limiter.acquire.assert_called_once_with(
+            "openai", "model", default_client, []
+        )
+        reservation.release.assert_called_once()
+
+        reservation.reset_mock()
+        with pytest.raises(ValueError, match="failed"):
+            list(stream_decorator(fn)().stream)  # pyright: ignore [reportArgumentType]
+        reservation.release.assert_called_once()
+
+        create_decorator = partial(
+            create_factory(TCallResponse=response_type, setup_call=setup_call_async),
+            model="model",
+            tools=None,
+            output_parser=None,
+            json_mode=False,
+            client=None,
+            call_params={},
+        )
+        reservation.reset_mock()
+        with pytest.raises(ValueError, match="failed"):
+            await create_decorator(fn_async)()
+        rate_limiter.acquire_async.assert_called_once_with(
+            "openai", "model", default_client, []
+        )
+        reservation.release.assert_called_once()
+
+        stream_decorator = partial(
+            stream_factory(
+                TCallResponse=response_type,
+                TStream=MagicMock,
+                setup_call=setup_call_async,
+                handle_stream=MagicMock(),
+                handle_stream_async=MagicMock(),
+            ),
+            model="model",
+            tools=None,
+            json_mode=False,
+            client=None,
+            call_params={},
+        )
+        reservation.reset_mock()
+        stream = await stream_decorator(fn_async)()
+        with pytest.raises(ValueError, match="failed"):
+            [chunk async for chunk in stream.stream]  # pyright: ignore [reportAttributeAccessIssue]
+        reservation.release.assert_called_once()
+    finally:
+        current_rate_limiter.reset(token)
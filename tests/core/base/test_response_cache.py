@@ -0,0 +1,304 @@
+"""Tests the `response_cache` module."""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from functools import partial
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base.response_cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    current_response_cache,
+)
+from mirascope.core.base.stream import stream_factory
+from mirascope.core.gemini import GeminiTool
+
+
+@patch("mirascope.core.base.response_cache.time")
+def test_memory_cache_backend(mock_time: MagicMock) -> None:
+    """Tests that the memory backend evicts the least recently used and expired values."""
+    mock_time.monotonic.return_value = 0
+    backend = MemoryCacheBackend(max_size=2, ttl=10)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1
+    backend.set("c", 3)
+    assert backend.get("b") is None
+    assert (backend.get("a"), backend.get("c")) == (1, 3)
+
+    mock_time.monotonic.return_value = 10
+    assert backend.get("a") is None
+    assert backend._values.keys() == {"c"}
+    backend.clear()
+    assert backend.get("c") is None
+
+
+@patch("mirascope.core.base.response_cache.time")
+def test_sqlite_cache_backend(mock_time: MagicMock, tmp_path: Path) -> None:
+    """Tests that the SQLite backend persists values until they expire."""
+    mock_time.time.return_value = 0
+    path = tmp_path / "cache.sqlite"
+    backend = SQLiteCacheBackend(path, ttl=10)
+    backend.set("a", {"content": "cached"})
+    SQLiteCacheBackend(path).set("b", [1, 2])
+    assert SQLiteCacheBackend(path).get("a") == {"content": "cached"}
+    assert backend.get("missing") is None
+
+    with pytest.warns(UserWarning, match="can't be pickled"):
+        backend.set("c", threading.Lock())
+    assert backend.get("c") is None
+
+    mock_time.time.return_value = 10
+    assert backend.get("a") is None
+    assert SQLiteCacheBackend(path).get("b") == [1, 2]
+    backend.clear()
+    assert SQLiteCacheBackend(path).get("b") is None
+
+
+def test_response_cache_key() -> None:
+    """Tests that keys only depend on the contents of the call."""
+
+    class Schema(BaseModel):
+        name: str
+
+    cache = ResponseCache()
+    call_kwargs = {
+        "messages": [{"role": "user", "content": "Hi"}],
+        "tools": [Schema(name="tool")],
+        "image": b"bytes",
+        "stop": {"a", "b"},
+        "other": object,
+    }
+    key = cache.key("openai", "gpt-4o-mini", call_kwargs, stream=False)
+    assert key == cache.key(
+        "openai", "gpt-4o-mini", dict(reversed(call_kwargs.items())), stream=False
+    )
+    assert key != cache.key("openai", "gpt-4o-mini", call_kwargs, stream=True)
+    assert key != cache.key("openai", "gpt-4o", call_kwargs, stream=False)
+    assert key != cache.key(
+        "openai", "gpt-4o-mini", {**call_kwargs, "image": b"other"}, stream=False
+    )
+    assert key != cache.key(
+        "openai", "gpt-4o-mini", call_kwargs, stream=False, endpoint="https://a.com"
+    )
+
+
+def test_response_cache_key_by_content() -> None:
+    """Tests that values are keyed by their content or not cached at all."""
+
+    class Color(Enum):
+        RED = "red"
+
+    @dataclass
+    class Point:
+        x: int
+
+    class Message:
+        def to_dict(self) -> dict:
+            return {"content": "Hi"}
+
+    cache = ResponseCache()
+    call_kwargs = {"color": Color.RED, "point": Point(x=1), "message": Message()}
+    assert cache.key("openai", "gpt-4o-mini", call_kwargs, False) == cache.key(
+        "openai",
+        "gpt-4o-mini",
+        {"color": "red", "point": {"x": 1}, "message": {"content": "Hi"}},
+        False,
+    )
+
+    class FormatBook(GeminiTool):
+        """Returns the title of a book."""
+
+        title: str
+
+    class FormatAuthor(GeminiTool):
+        """Returns the name of an author."""
+
+        name: str
+
+    tool = FormatBook.tool_schema()
+    key = cache.key("gemini", "gemini-1.5-flash", {"tools": [tool]}, False)
+    assert key == cache.key(
+        "gemini", "gemini-1.5-flash", {"tools": [FormatBook.tool_schema()]}, False
+    )
+    assert key == cache.key(
+        "gemini", "gemini-1.5-flash", {"tools": [tool.to_proto()]}, False
+    )
+    protos = [
+        type(tool.to_proto()).pb(t.to_proto()) for t in (tool, FormatBook.tool_schema())
+    ]
+    assert cache.key("gemini", "gemini-1.5-flash", {"tools": protos[:1]}, False) == (
+        cache.key("gemini", "gemini-1.5-flash", {"tools": protos[1:]}, False)
+    )
+    assert key != cache.key(
+        "gemini", "gemini-1.5-flash", {"tools": [FormatAuthor.tool_schema()]}, False
+    )
+
+    for value in [object(), lambda: None]:
+        with pytest.raises(TypeError, match="cache key"):
+            cache.key("openai", "gpt-4o-mini", {"value": value}, False)
+        with pytest.warns(UserWarning, match="can't be keyed"):
+            assert cache.lookup(
+                "openai", "gpt-4o-mini", [], {"value": value}, False
+            ) == (None, None)
+    assert cache.misses == 2
+
+
+@pytest.mark.asyncio
+async def test_response_cache_key_by_endpoint() -> None:
+    """Tests that calls to different endpoints don't share responses."""
+    cache = ResponseCache()
+    client = MagicMock(base_url="https://api.openai.com/v1/")
+    key, _ = cache.lookup("openai", "gpt-4o-mini", [], {}, False, client)
+    assert key == cache.key(
+        "openai", "gpt-4o-mini", {}, False, endpoint="https://api.openai.com/v1/"
+    )
+    assert key != cache.lookup("openai", "gpt-4o-mini", [], {}, False)[0]
+    other_client = MagicMock(spec=["endpoint"], endpoint="https://azure.com")
+    other_key, _ = await cache.lookup_async(
+        "openai", "gpt-4o-mini", [], {}, False, other_client
+    )
+    assert other_key not in (key, None)
+
+
+@pytest.mark.asyncio
+async def test_response_cache_decorator() -> None:
+    """Tests that decorated functions make their calls with the cache."""
+    cache = ResponseCache()
+
+    @cache
+    def fn() -> ResponseCache | None:
+        return current_response_cache.get()
+
+    @cache
+    async def fn_async() -> ResponseCache | None:
+        await asyncio.sleep(0)
+        return current_response_cache.get()
+
+    assert fn() is cache
+    assert await fn_async() is cache
+    assert current_response_cache.get() is None
+
+    assert cache.get("key") is None
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.clear()
+    assert (cache.hits, cache.misses, cache.get("key")) == (0, 0, None)
+
+
+def _setup_call(create: MagicMock | AsyncMock) -> MagicMock:
+    return MagicMock(
+        return_value=(
+            create,
+            None,
+            [{"role": "user", "content": "Hi"}],
+            [],
+            {"messages": [{"role": "user", "content": "Hi"}]},
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_response_cache_calls() -> None:
+    """Tests that calls reuse the cached responses of identical calls."""
+    cache = ResponseCache()
+    response_type = MagicMock(_provider="provider")
+    create, create_async = MagicMock(), AsyncMock()
+
+    def fn() -> None: ...
+
+    async def fn_async() -> None: ...
+
+    def decorate(create: MagicMock | AsyncMock, fn):  # noqa: ANN001, ANN202
+        return cache(
+            create_factory(TCallResponse=response_type, setup_call=_setup_call(create))(
+                fn,
+                model="model",
+                tools=None,
+                output_parser=None,
+                json_mode=False,
+                client=None,
+                call_params={},
+            )
+        )
+
+    decorate(create, fn)()
+    decorate(create, fn)()
+    create.assert_called_once_with(
+        stream=False, messages=[{"role": "user", "content": "Hi"}]
+    )
+    assert response_type.call_args.kwargs["response"] is create.return_value
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    create_async.return_value = create.return_value
+    await decorate(create_async, fn_async)()
+    create_async.assert_not_called()
+    assert response_type.call_args.kwargs["response"] is create.return_value
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_response_cache_streams() -> None:
+    """Tests that streams replay the cached chunks of identical streams."""
+    cache = ResponseCache()
+    response_type = MagicMock(_provider="provider")
+    chunks = ["a", "b"]
+    create = MagicMock(side_effect=lambda **kwargs: iter(chunks))
+
+    async def stream_async():  # noqa: ANN202
+        for chunk in chunks:
+            yield chunk
+
+    create_async = AsyncMock(side_effect=lambda **kwargs: stream_async())
+
+    def handle_stream(stream, tool_types):  # noqa: ANN001, ANN202
+        for chunk in stream:
+            yield MagicMock(content=chunk, input_tokens=None), None
+
+    async def handle_stream_async(stream, tool_types):  # noqa: ANN001, ANN202
+        async for chunk in stream:
+            yield MagicMock(content=chunk, input_tokens=None), None
+
+    def fn() -> None: ...
+
+    async def fn_async() -> None: ...
+
+    def decorate(create, fn):  # noqa: ANN001, ANN202
+        return cache(
+            partial(
+                stream_factory(
+                    TCallResponse=response_type,
+                    TStream=MagicMock,
+                    setup_call=_setup_call(create),
+                    handle_stream=handle_stream,
+                    handle_stream_async=handle_stream_async,
+                ),
+                model="model",
+                tools=None,
+                json_mode=False,
+                client=None,
+                call_params={},
+            )(fn)
+        )
+
+    streamed = [chunk.content for chunk, _ in decorate(create, fn)().stream]
+    replayed = [chunk.content for chunk, _ in decorate(create, fn)().stream]
+    assert streamed == replayed == chunks
+    create.assert_called_once()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    cache.clear()
+    for _ in range(2):
+        stream = (await decorate(create_async, fn_async)()).stream
+        assert [chunk.content async for chunk, _ in stream] == chunks
+    create_async.assert_called_once()
+    assert (cache.hits, cache.misses) == (1, 1)
@@ -1,5 +1,7 @@
 """Tests the `stream` module."""
 
+import asyncio
+import threading
 from functools import partial
 from typing import cast
 from unittest.mock import MagicMock, patch
@@ -7,6 +9,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from mirascope.core.base.stream import BaseStream, stream_factory
+from mirascope.core.base.tool import BaseTool
 
 
 @pytest.fixture()
@@ -228,3 +231,163 @@ async def test_base_stream(mock_get_possible_user_message_param: MagicMock) -> N
 
     assert stream.tool_message_params(tools_and_outputs)
     mock_tool_message_params.assert_called_once_with(tools_and_outputs)
+
+    assert stream.tools == [mock_tool]
+    assert await stream.execute_tools_async()
+    mock_tool_message_params.assert_called_with(tools_and_outputs)
+    assert stream.execute_tools(max_workers=1)
+    mock_tool_message_params.assert_called_with(tools_and_outputs)
+    stream.tools = []
+    assert stream.execute_tools() == []
+    assert await stream.execute_tools_async() == []
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+def test_base_stream_content() -> None:
+    """Tests that the `BaseStream` content is joined from its chunks when read."""
+    chunks = []
+    for content in ["Hello", ", ", "world", "!"]:
+        chunk = MagicMock()
+        chunk.content = content
+        chunks.append((chunk, None))
+    stream = BaseStream(
+        stream=(t for t in chunks),
+        metadata={},
+        tool_types=[],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    assert stream.content == ""
+    iterator = iter(stream)
+    next(iterator)
+    next(iterator)
+    assert stream.content == "Hello, "
+    assert list(iterator) == chunks[2:]
+    assert stream.content == "Hello, world!"
+    stream.content = "overwritten"
+    assert stream.content == "overwritten"
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_base_stream_execute_tools_eagerly() -> None:
+    """Tests that tools are called as soon as they're streamed when opted in."""
+    called = threading.Event()
+    called_during_stream = []
+
+    class MyTool(BaseTool):
+        def call(self) -> str:
+            called.set()
+            return "output"
+
+    class MyAsyncTool(BaseTool):
+        async def call(self) -> str:
+            called.set()
+            return "async output"
+
+    chunk = MagicMock()
+    chunk.content = "content"
+    call_response_type = MagicMock()
+    call_response_type.tool_message_params = lambda tools_and_outputs: [
+        output for _, output in tools_and_outputs
+    ]
+    tool, async_tool = MyTool(), MyAsyncTool()
+
+    def generator():
+        yield chunk, tool
+        called_during_stream.append(called.wait(1))
+        yield chunk, None
+
+    stream = BaseStream(
+        stream=generator(),
+        metadata={},
+        tool_types=[],
+        call_response_type=call_response_type,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    assert stream.execute_tools_eagerly(max_workers=1) is stream
+    assert len(list(stream)) == 2
+    assert called_during_stream == [True]
+    assert len(stream.tool_futures) == 1
+    assert stream.execute_tools(timeout=1) == ["output"]
+    assert await stream.execute_tools_async() == ["output"]
+
+    called.clear()
+
+    async def async_generator():
+        yield chunk, async_tool
+        await asyncio.sleep(0)
+        called_during_stream.append(called.is_set())
+        yield chunk, tool
+
+    stream.stream = async_generator()
+    assert len([chunk async for chunk in stream]) == 2
+    assert called_during_stream == [True, True]
+    assert await stream.execute_tools_async(timeout=1) == ["async output", "output"]
+    with pytest.raises(ValueError, match="execute_tools_async"):
+        stream.execute_tools()
+
+
+@patch.multiple(BaseStream, __abstractmethods__=set())
+@pytest.mark.asyncio
+async def test_base_stream_execute_tools_eagerly_abandoned() -> None:
+    """Tests that eager tools that haven't started are cancelled on an early break."""
+    release = threading.Event()
+
+    class MyTool(BaseTool):
+        def call(self) -> str:
+            release.wait(1)
+            return "output"
+
+    class MyAsyncTool(BaseTool):
+        async def call(self) -> str:
+            await asyncio.sleep(1)
+            return "async output"  # pragma: no cover
+
+    chunk = MagicMock()
+    chunk.content = "content"
+    stream = BaseStream(
+        stream=((chunk, MyTool()) for _ in range(3)),
+        metadata={},
+        tool_types=[],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+    stream.execute_tools_eagerly(max_workers=1)
+    iterator = iter(stream)
+    next(iterator)
+    next(iterator)
+    iterator.close()
+    release.set()
+    running, queued = stream.tool_futures
+    assert running.result(timeout=1) == "output"
+    assert queued.cancelled()
+
+    async def async_generator():
+        yield chunk, MyAsyncTool()
+        yield chunk, None  # pragma: no cover
+
+    stream.stream = async_generator()
+    async_iterator = aiter(stream)
+    await anext(async_iterator)
+    await async_iterator.aclose()  # pyright: ignore [reportAttributeAccessIssue]
+    await asyncio.sleep(0)
+    assert stream.tool_futures[0].cancelled()
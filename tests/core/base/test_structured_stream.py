@@ -4,6 +4,7 @@ from functools import partial
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel
 
 from mirascope.core.base.structured_stream import (
     BaseStructuredStream,
@@ -167,7 +168,8 @@ async def test_structured_stream_factory_async(
 
 
 @patch(
-    "mirascope.core.base.structured_stream.extract_tool_return", new_callable=MagicMock
+    "mirascope.core.base._utils._incremental_tool_return_extractor.extract_tool_return",
+    new_callable=MagicMock,
 )
 @pytest.mark.asyncio
 async def test_base_structured_stream(mock_extract_tool_return: MagicMock) -> None:
@@ -197,14 +199,83 @@ async def test_base_structured_stream(mock_extract_tool_return: MagicMock) -> No
     for i, output in enumerate(structured_stream):
         assert output == "tool"
         mock_extract_tool_return.assert_called_once_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
+            MagicMock, {"title": "title"}, i == 0, {}
         )
         mock_extract_tool_return.reset_mock()
     i = 0
     async for output in structured_stream:
         assert output == "tool"
         mock_extract_tool_return.assert_called_with(
-            MagicMock, '{"title": "title"}', i == 0, {}
+            MagicMock, {"title": "title"}, i == 0, {}
         )
         mock_extract_tool_return.reset_mock()
         i += 1
+
+
+class Book(BaseModel):
+    title: str
+
+
+@patch(
+    "mirascope.core.base.structured_stream.setup_extract_tool", new_callable=MagicMock
+)
+@patch("mirascope.core.base.structured_stream.stream_factory", new_callable=MagicMock)
+def test_structured_stream_factory_iterable(
+    mock_stream_factory: MagicMock,
+    mock_setup_extract_tool: MagicMock,
+    mock_setup_call: MagicMock,
+    mock_structured_stream_decorator_kwargs: dict,
+) -> None:
+    """Tests that `iterable=True` extracts a list of `response_model` items."""
+    decorator = structured_stream_factory(
+        TCallResponse=MagicMock,
+        TCallResponseChunk=MagicMock,
+        TStream=MagicMock,
+        TToolType=MagicMock,
+        setup_call=mock_setup_call,
+        get_json_output=MagicMock(),
+    )
+
+    def fn() -> None:
+        """Recommend some books."""
+
+    mock_structured_stream_decorator_kwargs["response_model"] = Book
+    structured_stream: BaseStructuredStream = decorator(
+        fn, **mock_structured_stream_decorator_kwargs, iterable=True
+    )()
+    assert structured_stream.iterable
+    mock_setup_extract_tool.assert_called_once_with(list[Book], MagicMock)
+
+
+@pytest.mark.asyncio
+async def test_base_structured_stream_iterable() -> None:
+    """Tests that an iterable `BaseStructuredStream` yields each item once."""
+    contents = ['{"value": [{"title": "A"}', ', {"title"', ': "B"}, {"title": "C"}]}']
+    chunks = []
+    for content in contents:
+        chunk = MagicMock()
+        chunk.content = content
+        chunk.model = None
+        chunks.append((chunk, None))
+    chunks[0][0].model = "updated_model"
+
+    base_stream = MagicMock()
+    base_stream.__iter__.return_value = iter(chunks)
+
+    async def generator(self):
+        for chunk in chunks:
+            yield chunk
+
+    base_stream.__aiter__ = generator
+    structured_stream = BaseStructuredStream(
+        stream=base_stream,
+        response_model=Book,
+        fields_from_call_args={},
+        iterable=True,
+    )
+    expected = [Book(title="A"), Book(title="B"), Book(title="C")]
+    assert list(structured_stream) == expected
+    assert structured_stream.constructed_response_model == expected
+    assert base_stream.model == "updated_model"
+    assert [book async for book in structured_stream] == expected
+    assert structured_stream.constructed_response_model == expected
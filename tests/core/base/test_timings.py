@@ -0,0 +1,128 @@
+"""Tests the `timings` module."""
+
+from functools import partial
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base._utils import bind_context_var
+from mirascope.core.base._utils._setup_call import setup_call
+from mirascope.core.base.prompt import prompt_template
+from mirascope.core.base.stream import stream_factory
+from mirascope.core.base.timings import CallTimings, current_timings, measure
+from mirascope.core.base.tool import BaseTool
+
+
+@patch("mirascope.core.base.timings.time.perf_counter_ns")
+def test_call_timings(mock_perf_counter_ns: MagicMock) -> None:
+    """Tests that nested phases are excluded from the phases they're measured in."""
+    mock_perf_counter_ns.side_effect = [0, 10, 40, 50, 55, 100]
+    timings = CallTimings()
+    with timings.measure("outer"):
+        with timings.measure("inner"):
+            pass
+        with timings.measure("inner"):
+            pass
+    timings.add("other", 5)
+
+    assert timings.phases == {"inner": 35, "outer": 65, "other": 5}
+    assert timings["inner"] == 35
+    assert timings["missing"] == 0
+    assert timings.total_ns == 105
+    assert timings.as_ms() == {"inner": 35e-6, "outer": 65e-6, "other": 5e-6}
+    assert repr(timings).startswith("CallTimings(inner=0.000ms")
+
+
+def test_measure() -> None:
+    """Tests that `measure` only records phases within a timed call."""
+    with measure("phase"):
+        pass
+    timings = CallTimings()
+    token = current_timings.set(timings)
+    try:
+        with measure("phase"):
+            pass
+    finally:
+        current_timings.reset(token)
+    assert list(timings.phases) == ["phase"]
+
+
+def test_call_timings_factories(mock_setup_call: MagicMock) -> None:
+    """Tests that calls and streams record the timings of their phases."""
+
+    @partial(
+        create_factory(TCallResponse=MagicMock(), setup_call=mock_setup_call),
+        model="model",
+        tools=None,
+        output_parser=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    def fn() -> None: ...
+
+    output = fn()
+    assert list(output._timings.phases) == [
+        "bind_args",
+        "dynamic_config",
+        "message_conversion",
+        "request",
+        "response_parsing",
+    ]
+
+    stream_decorator = partial(
+        stream_factory(
+            TCallResponse=MagicMock(),
+            TStream=MagicMock,
+            setup_call=mock_setup_call,
+            handle_stream=lambda *args: iter([(MagicMock(), None)]),
+            handle_stream_async=MagicMock(),
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    stream = stream_decorator(lambda: None)()
+    assert "request" not in stream.timings.phases
+    assert len(list(stream.stream)) == 1  # pyright: ignore [reportArgumentType]
+    assert list(stream.timings.phases) == [
+        "bind_args",
+        "dynamic_config",
+        "message_conversion",
+        "request",
+    ]
+
+
+def test_call_timings_setup_call(tmp_path: Path) -> None:
+    """Tests that the phases within the setup of a call are recorded."""
+    image = tmp_path / "image.png"
+    image.write_bytes(b"\x89PNG\r\n\x1a\n")
+
+    class FormatBook(BaseTool):
+        title: str
+
+        def call(self) -> None: ...  # pragma: no cover
+
+        @classmethod
+        def tool_schema(cls) -> dict:
+            return {"name": cls._name()}
+
+    @prompt_template("Recommend a {genre} book. {image:image}")
+    def fn(genre: str, image: str) -> None: ...  # pragma: no cover
+
+    timings = CallTimings()
+    bind_context_var(setup_call, current_timings, timings)(
+        fn,
+        {"genre": "fantasy", "image": str(image)},
+        None,
+        [FormatBook],
+        BaseTool,
+        {},  # type: ignore
+    )
+    assert set(timings.phases) == {
+        "media_loading",
+        "template_rendering",
+        "tool_schemas",
+    }
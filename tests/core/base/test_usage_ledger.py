@@ -0,0 +1,200 @@
+"""Tests the `usage_ledger` module."""
+
+import asyncio
+from functools import partial
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mirascope.core.base._create import create_factory
+from mirascope.core.base.stream import stream_factory
+from mirascope.core.base.usage_ledger import (
+    BudgetExceededError,
+    Usage,
+    UsageLedger,
+    current_usage_ledger,
+)
+
+
+@patch("mirascope.core.base.usage_ledger.time")
+def test_usage_ledger_record(mock_time: MagicMock) -> None:
+    """Tests aggregating usage in total, per model, per tag, and per window."""
+    mock_time.time.return_value = 10
+    ledger = UsageLedger(window=60, max_windows=2)
+    ledger.record("openai", "gpt-4o-mini", 10, 20, 0.5, {"a", "b"})
+    ledger.record("openai", "gpt-4o", 1, 2, None, {"a"})
+    mock_time.time.return_value = 70
+    ledger.record("anthropic", "claude", None, 5, 1.0)
+
+    assert ledger.total() == Usage(3, 11, 27, 1.5, 1)
+    assert ledger.by_model() == {
+        ("openai", "gpt-4o-mini"): Usage(1, 10, 20, 0.5),
+        ("openai", "gpt-4o"): Usage(1, 1, 2, 0.0, 1),
+        ("anthropic", "claude"): Usage(1, 0, 5, 1.0),
+    }
+    assert ledger.by_tag() == {
+        "a": Usage(2, 11, 22, 0.5, 1),
+        "b": Usage(1, 10, 20, 0.5),
+    }
+    assert ledger.by_window() == {0: Usage(2, 11, 22, 0.5, 1), 60: Usage(1, 0, 5, 1.0)}
+    assert ledger.current_window() == Usage(1, 0, 5, 1.0)
+
+    mock_time.time.return_value = 130
+    ledger.record("openai", "gpt-4o", 1, 1, 0.0)
+    assert list(ledger.by_window()) == [60, 120]
+    assert ledger.current_window() == Usage(1, 1, 1, 0.0)
+
+    response = MagicMock(
+        _provider="openai",
+        model="gpt-4o",
+        input_tokens=1,
+        output_tokens=1,
+        cost=0.25,
+        metadata={"tags": {"c"}},
+    )
+    ledger.record_response(response)
+    assert ledger.by_tag()["c"] == Usage(1, 1, 1, 0.25)
+
+    ledger.clear()
+    assert ledger.total() == Usage()
+    assert ledger.current_window() == Usage()
+
+
+@patch("mirascope.core.base.usage_ledger.time")
+def test_usage_ledger_check(mock_time: MagicMock) -> None:
+    """Tests that budgets are enforced per window."""
+    mock_time.time.return_value = 0
+    UsageLedger().check()
+    ledger = UsageLedger(window=60, budget=1.0, tag_budgets={"a": 0.5})
+    ledger.check({"a", "b"})
+    ledger.record("openai", "gpt-4o", 1, 1, 0.5, {"a"})
+    ledger.check({"b"})
+    with pytest.raises(BudgetExceededError, match="for tag 'a'") as exc_info:
+        ledger.check({"a"})
+    assert (exc_info.value.spent, exc_info.value.budget) == (0.5, 0.5)
+
+    ledger.record("openai", "gpt-4o", 1, 1, 0.5, {"b"})
+    with pytest.raises(BudgetExceededError, match="for all calls"):
+        ledger.check()
+
+    mock_time.time.return_value = 60
+    ledger.check({"a"})
+    ledger.record("openai", "unpriced", 1, 1, None, {"a"})
+    ledger.check({"a"})
+    assert ledger.current_window().unpriced_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_usage_ledger_decorator() -> None:
+    """Tests that decorated functions make their calls with the ledger."""
+    ledger = UsageLedger()
+
+    @ledger
+    def fn() -> UsageLedger | None:
+        return current_usage_ledger.get()
+
+    @ledger
+    async def fn_async() -> UsageLedger | None:
+        await asyncio.sleep(0)
+        return current_usage_ledger.get()
+
+    assert fn() is ledger
+    assert await fn_async() is ledger
+    assert current_usage_ledger.get() is None
+
+
+@pytest.mark.asyncio
+async def test_usage_ledger_calls(
+    mock_setup_call: MagicMock, mock_setup_call_async: MagicMock
+) -> None:
+    """Tests that calls and streams check the budgets and record their usage."""
+    ledger = MagicMock(spec=UsageLedger)
+    response_type = MagicMock()
+
+    @partial(
+        create_factory(TCallResponse=response_type, setup_call=mock_setup_call),
+        model="model",
+        tools=None,
+        output_parser=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    def fn() -> None: ...
+
+    @partial(
+        create_factory(TCallResponse=response_type, setup_call=mock_setup_call_async),
+        model="model",
+        tools=None,
+        output_parser=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    async def fn_async() -> None: ...
+
+    token = current_usage_ledger.set(ledger)
+    try:
+        output = fn()
+        ledger.check.assert_called_once_with(())
+        ledger.record_response.assert_called_once_with(output)
+        await fn_async()
+        assert ledger.record_response.call_count == 2
+    finally:
+        current_usage_ledger.reset(token)
+
+    chunk = MagicMock(input_tokens=3, output_tokens=None)
+
+    async def handle_stream_async(*args):  # noqa: ANN002, ANN202
+        yield chunk, None
+
+    stream_decorator = partial(
+        stream_factory(
+            TCallResponse=response_type,
+            TStream=MagicMock,
+            setup_call=mock_setup_call,
+            handle_stream=lambda *args: iter([(chunk, None)]),
+            handle_stream_async=handle_stream_async,
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+    ledger.reset_mock()
+    token = current_usage_ledger.set(ledger)
+    try:
+        stream = stream_decorator(lambda: None)()
+    finally:
+        current_usage_ledger.reset(token)
+    ledger.check.assert_not_called()
+    assert list(stream.stream) == [(chunk, None)]  # pyright: ignore [reportArgumentType]
+    ledger.check.assert_called_once_with(())
+    ledger.record_response.assert_called_once_with(stream)
+
+    stream_decorator = partial(
+        stream_factory(
+            TCallResponse=response_type,
+            TStream=MagicMock,
+            setup_call=mock_setup_call_async,
+            handle_stream=MagicMock(),
+            handle_stream_async=handle_stream_async,
+        ),
+        model="model",
+        tools=None,
+        json_mode=False,
+        client=None,
+        call_params={},
+    )
+
+    async def stream_fn() -> None: ...
+
+    ledger.reset_mock()
+    token = current_usage_ledger.set(ledger)
+    try:
+        stream = await stream_decorator(stream_fn)()
+    finally:
+        current_usage_ledger.reset(token)
+    assert [chunk async for chunk in stream.stream] == [(chunk, None)]  # pyright: ignore [reportAttributeAccessIssue]
+    ledger.record_response.assert_called_once_with(stream)
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -6,9 +7,9 @@ from types_aiobotocore_bedrock_runtime import (
 )
 
 from mirascope.core.bedrock._utils._setup_call import (
+    _AsyncClientProvider,
     _extract_async_stream_fn,
     _extract_sync_stream_fn,
-    _get_async_client,
     setup_call,
 )
 from mirascope.core.bedrock.tool import BedrockTool
@@ -22,17 +23,29 @@ def mock_base_setup_call() -> MagicMock:
 
 
 @pytest.mark.asyncio
-async def test_get_async_client():
-    mock_session = MagicMock()
-
+@patch("mirascope.core.bedrock._utils._setup_call.get_session")
+async def test_async_client_provider(mock_get_session: MagicMock):
+    mock_session = mock_get_session.return_value
     mock_client = MagicMock(spec=AsyncBedrockRuntimeClient)
-    mock_session.create_client.return_value.__aenter__.return_value = mock_client
-
-    client = await _get_async_client(mock_session)
-
-    assert isinstance(client, MagicMock)
-    assert client == mock_client
+    mock_client.converse = AsyncMock(return_value="response")
+    mock_client.converse_stream = AsyncMock(return_value="stream")
+    mock_context = mock_session.create_client.return_value
+    mock_context.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_context.__aexit__ = AsyncMock(return_value=None)
+
+    provider = _AsyncClientProvider()
+    assert await provider.converse(modelId="model") == "response"
+    assert await provider.converse_stream(modelId="model") == "stream"
+    assert await provider.get_client() is mock_client
     mock_session.create_client.assert_called_once_with("bedrock-runtime")
+    mock_client.converse.assert_awaited_once_with(modelId="model")
+    mock_client.converse_stream.assert_awaited_once_with(modelId="model")
+
+    await provider.close()
+    mock_context.__aexit__.assert_awaited_once()
+    await provider.close()
+    assert await provider.get_client() is mock_client
+    assert mock_session.create_client.call_count == 2
 
 
 def test_extract_sync_stream_fn():
@@ -268,11 +281,11 @@ def test_setup_call_with_tools(
     assert call_kwargs["toolConfig"] == {"tools": [{"name": "test_tool"}]}
 
 
-@patch("mirascope.core.bedrock._utils._setup_call._get_async_client")
+@patch("mirascope.core.bedrock._utils._setup_call.get_session")
 @patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
 def test_setup_call_client_creation(
     mock_utils: MagicMock,
-    mock_get_async_client: AsyncMock,
+    mock_get_session: MagicMock,
     mock_base_setup_call: MagicMock,
 ) -> None:
     mock_utils.setup_call = mock_base_setup_call
@@ -308,7 +321,7 @@ def test_setup_call_client_creation(
         call_params={},
         extract=False,
     )
-    mock_get_async_client.assert_called_once()
+    mock_get_session.assert_not_called()
 
     # Test when client is provided
     mock_client = MagicMock()
@@ -323,4 +336,50 @@ def test_setup_call_client_creation(
         call_params={},
         extract=False,
     )
-    assert mock_get_async_client.call_count == 1
+    mock_get_session.assert_not_called()
+
+
+@patch("mirascope.core.bedrock._utils._setup_call.get_session")
+@patch("mirascope.core.bedrock._utils._setup_call._utils", new_callable=MagicMock)
+def test_setup_call_async_client_per_loop(
+    mock_utils: MagicMock,
+    mock_get_session: MagicMock,
+    mock_base_setup_call: MagicMock,
+) -> None:
+    mock_utils.setup_call = mock_base_setup_call
+    mock_base_setup_call.return_value[1] = [
+        {"role": "user", "content": [{"text": "user test"}]},
+    ]
+    mock_base_setup_call.return_value[3] = {}
+    mock_client = MagicMock(spec=AsyncBedrockRuntimeClient)
+    mock_client.converse = AsyncMock(return_value="response")
+    mock_context = mock_get_session.return_value.create_client.return_value
+    mock_context.__aenter__ = AsyncMock(return_value=mock_client)
+    mock_context.__aexit__ = AsyncMock(return_value=None)
+
+    async def async_fn(): ...
+
+    async def run() -> None:
+        for _ in range(2):
+            create, _, _, _, call_kwargs = setup_call(
+                model="anthropic.claude-v2",
+                client=None,
+                fn=async_fn,
+                fn_args={},
+                dynamic_config=None,
+                tools=None,
+                json_mode=False,
+                call_params={},
+                extract=False,
+            )
+            assert await create(**call_kwargs) == "response"
+
+    asyncio.run(run())
+    assert mock_client.converse.await_count == 2
+    mock_get_session.return_value.create_client.assert_called_once_with(
+        "bedrock-runtime"
+    )
+    mock_context.__aexit__.assert_awaited_once()
+
+    asyncio.run(run())
+    assert mock_get_session.return_value.create_client.call_count == 2
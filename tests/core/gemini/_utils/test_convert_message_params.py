@@ -104,3 +104,25 @@ def test_convert_message_params(mock_image_open: MagicMock) -> None:
                 )
             ]
         )
+
+
+@patch("PIL.Image.open", new_callable=MagicMock)
+def test_convert_message_params_inline_image(mock_image_open: MagicMock) -> None:
+    """Tests that images of their media type are passed through without decoding."""
+    image = b"\x89PNG\r\n\x1a\nimage"
+    converted_message_params = convert_message_params(
+        [
+            BaseMessageParam(
+                role="user",
+                content=[
+                    ImagePart(
+                        type="image", media_type="image/png", image=image, detail=None
+                    )
+                ],
+            )
+        ]
+    )
+    assert converted_message_params == [
+        {"role": "user", "parts": [{"mime_type": "image/png", "data": image}]}
+    ]
+    mock_image_open.assert_not_called()
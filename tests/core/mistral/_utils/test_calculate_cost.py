@@ -8,3 +8,4 @@ def test_calculate_cost() -> None:
     assert calculate_cost(None, None, model="mistral-large-latest") is None
     assert calculate_cost(1, 1, model="unknown") is None
     assert calculate_cost(1, 1, model="mistral-large-latest") == 1.2e-5
+    assert calculate_cost(1, 1, model="mistral-large-2411") == 1.2e-5
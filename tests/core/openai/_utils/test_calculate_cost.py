@@ -1,5 +1,7 @@
 """Tests the `openai._utils.calculate_cost` function."""
 
+import pytest
+
 from mirascope.core.openai._utils._calculate_cost import calculate_cost
 
 
@@ -8,3 +10,14 @@ def test_calculate_cost() -> None:
     assert calculate_cost(None, None, model="gpt-4o-mini") is None
     assert calculate_cost(1, 1, model="unknown") is None
     assert calculate_cost(1, 1, model="gpt-4o-mini") == 0.00000075
+    assert calculate_cost(1, 1, model="gpt-4o-mini-2025-01-01") == 0.00000075
+    assert calculate_cost(
+        10, 1, model="gpt-4o-mini", cached_input_tokens=4
+    ) == pytest.approx(6 * 0.000_000_15 + 4 * 0.000_000_075 + 0.000_000_6)
+    assert calculate_cost(
+        10,
+        5,
+        model="gpt-4o-audio-preview",
+        audio_input_tokens=2,
+        audio_output_tokens=1,
+    ) == pytest.approx(8 * 0.000_002_5 + 2 * 0.000_1 + 4 * 0.000_01 + 0.000_2)
@@ -117,7 +117,8 @@ def test_openai_call_response_with_tools() -> None:
     )
     tools = call_response.tools
     tool = call_response.tool
-    assert tools and len(tools) == 1 and tools[0] == tool
+    assert tools and len(tools) == 1 and tools[0] is tool
+    assert call_response.tools is tools
     assert isinstance(tool, FormatBook)
     assert tool.title == "The Name of the Wind"
     assert tool.author == "Patrick Rothfuss"
@@ -133,6 +134,7 @@ def test_openai_call_response_with_tools() -> None:
     ]
 
     completion.choices[0].message.refusal = "refusal message"
+    call_response = call_response.model_copy()
     with pytest.raises(ValueError, match="refusal message"):
         tool = call_response.tools
 
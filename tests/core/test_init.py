@@ -0,0 +1,43 @@
+"""Tests the lazy loading of the `mirascope.core` providers."""
+
+import subprocess
+import sys
+
+import pytest
+
+import mirascope.core
+
+
+def test_providers_are_imported_lazily() -> None:
+    """Tests that importing `mirascope` doesn't import any provider or integration."""
+    script = (
+        "import sys, mirascope, mirascope.core\n"
+        "print(sorted(m for m in sys.modules if m.startswith(("
+        "'mirascope.core.', 'mirascope.integrations.')) and "
+        "not m.startswith(('mirascope.core.base', 'mirascope.integrations._'))))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_provider_getattr() -> None:
+    """Tests that providers are imported on first access."""
+    from mirascope.core import openai
+
+    assert mirascope.core.openai is openai
+    assert "openai" in dir(mirascope.core)
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        mirascope.core.unknown  # pyright: ignore [reportAttributeAccessIssue]  # noqa: B018
+
+
+def test_provider_getattr_missing_sdk() -> None:
+    """Tests that providers whose SDK isn't installed raise an `AttributeError`."""
+    with (
+        pytest.MonkeyPatch.context() as monkeypatch,
+        pytest.raises(AttributeError, match="has no attribute 'groq'"),
+    ):
+        monkeypatch.delattr(mirascope.core, "groq", raising=False)
+        monkeypatch.setitem(sys.modules, "mirascope.core.groq", None)
+        mirascope.core.groq  # noqa: B018
@@ -111,3 +111,32 @@ def test_convert_message_params(mock_image_open: MagicMock) -> None:
                 )
             ]
         )
+
+
+@patch("PIL.Image.open", new_callable=MagicMock)
+def test_convert_message_params_inline_image(mock_image_open: MagicMock) -> None:
+    """Tests that images of their media type are passed through without decoding."""
+    converted_message_params = convert_message_params(
+        [
+            BaseMessageParam(
+                role="user",
+                content=[
+                    ImagePart(
+                        type="image",
+                        media_type="image/png",
+                        image=b"\x89PNG\r\n\x1a\n",
+                        detail=None,
+                    )
+                ],
+            )
+        ]
+    )
+    assert [p.to_dict() for p in converted_message_params] == [
+        {
+            "parts": [
+                {"inline_data": {"data": "iVBORw0KGgo=", "mime_type": "image/png"}}
+            ],
+            "role": "user",
+        }
+    ]
+    mock_image_open.assert_not_called()
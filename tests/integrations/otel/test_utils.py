@@ -1,4 +1,7 @@
+import hashlib
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import cast
 from unittest.mock import MagicMock, patch
 
@@ -102,6 +105,129 @@ def test_configure_with_processors(
     mock_get_tracer.assert_called_once_with("otel")
 
 
+@pytest.fixture
+def payload_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Restores the payload policy and background thread after the test."""
+    monkeypatch.setattr(_utils, "_payload_policy", _utils._payload_policy)
+    monkeypatch.setattr(_utils, "_executor", _utils._executor)
+    monkeypatch.setattr(_utils, "_pending", 0)
+    monkeypatch.setattr(_utils, "_dropped_records", 0)
+
+
+@patch("mirascope.integrations.otel._utils.get_tracer", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.set_tracer_provider", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.TracerProvider", new_callable=MagicMock)
+@patch("mirascope.integrations.otel._utils.BatchSpanProcessor", new_callable=MagicMock)
+def test_configure_production(
+    mock_batch_span_processor: MagicMock,
+    mock_tracer_provider: MagicMock,
+    mock_set_tracer_provider: MagicMock,
+    mock_get_tracer: MagicMock,
+    payload_policy: None,
+) -> None:
+    """Tests the `configure` function in production mode."""
+    exporter = MagicMock()
+    _utils.configure(exporter=exporter, production=True)
+    mock_batch_span_processor.assert_called_once_with(exporter)
+    mock_tracer_provider.return_value.add_span_processor.assert_called_once_with(
+        mock_batch_span_processor.return_value
+    )
+    assert _utils._payload_policy == _utils.PRODUCTION_PAYLOAD_POLICY
+    assert _utils._executor is not None
+
+    policy = _utils.PayloadPolicy(sample_rate=0.5)
+    _utils.configure(exporter=exporter, production=True, payload_policy=policy)
+    assert _utils._payload_policy is policy
+
+
+def test_payload_attributes(payload_policy: None) -> None:
+    """Tests that large and unsampled payloads are truncated and hashed."""
+    hello_hash = hashlib.sha256(b"hello").hexdigest()
+    assert _utils._payload_attributes("key", "hello", True) == {"key": "hello"}
+    assert _utils._payload_attributes("key", 1, True) == {"key": 1}
+    assert _utils._payload_attributes("key", 1, False) == {}
+    assert _utils._payload_attributes("key", "hello", False) == {
+        "key.length": 5,
+        "key.sha256": hello_hash,
+    }
+    _utils._payload_policy = _utils.PayloadPolicy(max_length=2)
+    assert _utils._payload_attributes("key", "hi", True) == {"key": "hi"}
+    assert _utils._payload_attributes("key", "hello", True) == {
+        "key": "he",
+        "key.length": 5,
+        "key.sha256": hello_hash,
+    }
+
+
+@patch("mirascope.integrations.otel._utils.random.random", return_value=0.75)
+def test_add_payload_events_sampled(
+    mock_random: MagicMock, payload_policy: None
+) -> None:
+    """Tests that only sampled calls record their full payloads."""
+    span = MagicMock()
+    _utils._payload_policy = _utils.PayloadPolicy(sample_rate=0.5)
+    _utils._add_payload_events(span, None, "completion", 1)
+    span.add_event.assert_called_once_with(
+        "gen_ai.content.completion",
+        attributes=_utils._payload_attributes("gen_ai.completion", "completion", False),
+        timestamp=1,
+    )
+    mock_random.return_value = 0.25
+    _utils._add_payload_events(span, "prompt", "completion", None)
+    assert span.add_event.call_args_list[1][1]["attributes"] == {
+        "gen_ai.prompt": "prompt"
+    }
+
+
+@patch("mirascope.integrations.otel._utils.get_tracer", new_callable=MagicMock)
+def test_deferred(mock_get_tracer: MagicMock, payload_policy: None) -> None:
+    """Tests recording responses and ending spans on the background thread."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    _utils._executor = executor
+    _utils._payload_policy = _utils.PayloadPolicy(deferred=True)
+    span = MagicMock()
+    start_as_current_span = mock_get_tracer.return_value.start_as_current_span
+    start_as_current_span.return_value.__enter__.return_value = span
+    result = MagicMock(user_message_param={"role": "user"}, message_param={})
+
+    with _utils.custom_context_manager(MagicMock(__name__="fn")):
+        _utils.handle_call_response(result, MagicMock(), span)
+    executor.shutdown(wait=True)
+
+    start_as_current_span.assert_called_once_with("fn", end_on_exit=False)
+    (end_time,) = span.end.call_args[0]
+    timestamp = span.add_event.call_args[1]["timestamp"]
+    assert timestamp <= end_time
+    assert span.add_event.call_args_list[0][1]["attributes"] == {
+        "gen_ai.prompt": json.dumps({"role": "user"})
+    }
+
+
+def test_deferred_overflow(
+    payload_policy: None, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Tests that records are dropped once the background thread falls behind."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    _utils._executor = executor
+    _utils._payload_policy = _utils.PayloadPolicy(deferred=True, max_pending=1)
+    blocked, span = threading.Event(), MagicMock()
+    record = MagicMock(side_effect=lambda *args: blocked.wait())
+
+    _utils._defer(record, "first")
+    _utils._defer(record, "second")
+    _utils._defer(_utils._end_span, span)
+    assert _utils.dropped_records() == 1
+    span.end.assert_called_once()
+    blocked.set()
+
+    _utils._payload_policy = _utils.PayloadPolicy(deferred=True, max_pending=2)
+    _utils._defer(MagicMock(side_effect=ValueError("failed")), "third")
+    executor.shutdown(wait=True)
+    assert [call.args[0] for call in record.call_args_list] == ["first"]
+    assert _utils._pending == 0
+    assert "Failed to record a deferred span" in caplog.text
+
+
 def test_get_call_response_attributes() -> None:
     """Tests the `get_call_response_attributes` function."""
     call_response = MyCallResponse(
@@ -204,7 +330,7 @@ def test_handle_call_response(
     assert set_attributes.call_count == 1
     mock_get_call_response_attributes.assert_called_once_with(result)
     assert mock_get_call_response_attributes.return_value["async"] is False
-    mock_set_call_response_event_attributes.assert_called_once_with(result, span)
+    mock_set_call_response_event_attributes.assert_called_once_with(result, span, None)
 
 
 @patch(
@@ -237,7 +363,7 @@ async def test_handle_call_response_async(
     assert set_attributes.call_count == 1
     mock_get_call_response_attributes.assert_called_once_with(result)
     assert mock_get_call_response_attributes.return_value["async"] is True
-    mock_set_call_response_event_attributes.assert_called_once_with(result, span)
+    mock_set_call_response_event_attributes.assert_called_once_with(result, span, None)
 
 
 @patch(
@@ -271,7 +397,7 @@ def test_handle_stream(
     )
     assert mock_get_call_response_attributes.return_value["async"] is False
     mock_set_call_response_event_attributes.assert_called_once_with(
-        mock_construct_call_response(), span
+        mock_construct_call_response(), span, None
     )
 
 
@@ -307,7 +433,7 @@ async def test_handle_stream_async(
     )
     assert mock_get_call_response_attributes.return_value["async"] is True
     mock_set_call_response_event_attributes.assert_called_once_with(
-        mock_construct_call_response(), span
+        mock_construct_call_response(), span, None
     )
 
 
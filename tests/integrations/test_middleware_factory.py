@@ -1,3 +1,4 @@
+from contextlib import contextmanager
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -297,3 +298,109 @@ async def test_middleware_factory_structured_stream_async() -> None:
     )(async_fn)
     async for chunk in await decorate():
         assert chunk.model_dump() == my_foo.model_dump()
+
+
+def _make_stream(stream_cls: type[BaseStream], chunks: list) -> BaseStream:
+    return stream_cls(
+        stream=(t for t in chunks),
+        metadata={},
+        tool_types=[],
+        call_response_type=MagicMock,
+        model="model",
+        prompt_template="prompt_template",
+        fn_args={},
+        dynamic_config=None,
+        messages=[],
+        call_params={},
+        call_kwargs={},
+    )  # type: ignore
+
+
+def test_middleware_factory_stacked_stream() -> None:
+    """Tests that stacked middlewares share one cached subclass and run in order."""
+    patch.multiple(BaseStream, __abstractmethods__=set()).start()
+
+    class MyStream(BaseStream): ...
+
+    mock_chunk = MagicMock(content="content", model=None)
+    calls = []
+
+    @contextmanager
+    def context_manager(fn):
+        yield "context"
+        calls.append("exit")
+
+    def custom_decorator(fn):
+        def decorator(inner):
+            def wrapped(*args, **kwargs):
+                calls.append("decorator")
+                return inner(*args, **kwargs)
+
+            return wrapped
+
+        return decorator
+
+    def handler(name: str):
+        def handle_stream(result, fn, context) -> None:
+            assert context == "context"
+            calls.append(name)
+
+        return handle_stream
+
+    def sync_fn() -> BaseStream:
+        return _make_stream(MyStream, [(mock_chunk, None)])
+
+    decorated = sync_fn
+    for name in ["inner", "middle"]:
+        decorated = middleware_factory(
+            custom_context_manager=context_manager, handle_stream=handler(name)
+        )(decorated)
+    decorated = middleware_factory(
+        custom_context_manager=context_manager,
+        custom_decorator=custom_decorator,
+        handle_stream=handler("outer"),
+    )(decorated)
+
+    first, second = decorated(), decorated()
+    assert calls == ["decorator", "decorator"]
+    calls.clear()
+    assert type(first) is type(second)
+    assert type(first).__name__ == "MyStream"
+    assert isinstance(first, MyStream)
+    assert len(first._middleware_hooks) == 3  # pyright: ignore [reportAttributeAccessIssue]
+    assert [chunk.content for chunk, _ in first] == ["content"]
+    assert calls == ["decorator", "inner", "exit", "middle", "exit", "outer", "exit"]
+
+
+@pytest.mark.asyncio
+async def test_middleware_factory_stacked_stream_async() -> None:
+    """Tests that stacked middlewares all run even if one of them raises."""
+    patch.multiple(BaseStream, __abstractmethods__=set()).start()
+
+    class MyStream(BaseStream): ...
+
+    mock_chunk = MagicMock(content="content", model=None)
+    calls = []
+
+    async def generator():
+        yield mock_chunk, None
+
+    async def async_fn() -> BaseStream:
+        stream = _make_stream(MyStream, [])
+        stream.stream = generator()
+        return stream
+
+    async def handle_stream_raises(result, fn, context) -> None:
+        raise ValueError("handler")
+
+    async def handle_stream_async(result, fn, context) -> None:
+        calls.append("outer")
+
+    decorated = middleware_factory(handle_stream_async=handle_stream_raises)(async_fn)
+    decorated = middleware_factory(handle_stream_async=handle_stream_async)(decorated)
+
+    result = await decorated()
+    with pytest.raises(ValueError, match="handler"):
+        async for chunk, _ in result:
+            assert chunk.content == "content"
+    assert calls == ["outer"]